@@ -0,0 +1,116 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the append and read cost of the circular buffer used for observation histories.
+
+The script compares the mirrored-ring :class:`~isaaclab.utils.buffers.CircularBuffer` (copying and zero-copy
+reads) against the previous implementation, which rolled and transposed a copy of the full ring on every read.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_circular_buffer.py --device cuda:0 \\
+        --history_lengths 2 5 10 --batch_sizes 1024 4096 8192
+
+"""
+
+import argparse
+import time
+import torch
+
+from isaaclab.utils.buffers import CircularBuffer
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the circular buffer used for observation histories.")
+parser.add_argument("--device", type=str, default="cuda:0" if torch.cuda.is_available() else "cpu")
+parser.add_argument("--history_lengths", type=int, nargs="+", default=[2, 5, 10, 25], help="History lengths to test.")
+parser.add_argument("--batch_sizes", type=int, nargs="+", default=[1024, 4096, 8192], help="Batch sizes to test.")
+parser.add_argument("--data_dim", type=int, default=48, help="Dimension of the appended data.")
+parser.add_argument("--num_steps", type=int, default=500, help="Number of timed append and read steps.")
+parser.add_argument("--num_warmup", type=int, default=50, help="Number of warm-up steps before timing.")
+args_cli = parser.parse_args()
+
+
+class LegacyCircularBuffer:
+    """Reference implementation of the previous circular buffer layout.
+
+    The data is stored as (max_len, batch_size, ...) and the ordered history is obtained by cloning,
+    rolling and transposing the complete ring.
+    """
+
+    def __init__(self, max_len: int, batch_size: int, device: str):
+        self._max_len = max_len
+        self._batch_size = batch_size
+        self._device = device
+        self._num_pushes = torch.zeros(batch_size, dtype=torch.long, device=device)
+        self._pointer = -1
+        self._buffer: torch.Tensor = None  # type: ignore
+
+    def append(self, data: torch.Tensor):
+        if self._buffer is None:
+            self._buffer = torch.empty((self._max_len, *data.shape), dtype=data.dtype, device=self._device)
+        self._pointer = (self._pointer + 1) % self._max_len
+        self._buffer[self._pointer] = data
+        is_first_push = self._num_pushes == 0
+        if torch.any(is_first_push):
+            self._buffer[:, is_first_push] = data[is_first_push]
+        self._num_pushes += 1
+
+    @property
+    def buffer(self) -> torch.Tensor:
+        buf = self._buffer.clone()
+        buf = torch.roll(buf, shifts=self._max_len - self._pointer - 1, dims=0)
+        return torch.transpose(buf, dim0=0, dim1=1)
+
+
+def _synchronize(device: str):
+    """Wait for all kernels on the device to finish."""
+    if "cuda" in device:
+        torch.cuda.synchronize(device)
+
+
+def benchmark(buffer, read_fn, data: torch.Tensor, device: str) -> float:
+    """Measure the average time of one append followed by one flattened read.
+
+    Returns:
+        The average time per step in microseconds.
+    """
+    batch_size = data.shape[0]
+    for _ in range(args_cli.num_warmup):
+        buffer.append(data)
+        read_fn(buffer).reshape(batch_size, -1)
+    _synchronize(device)
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        buffer.append(data)
+        read_fn(buffer).reshape(batch_size, -1)
+    _synchronize(device)
+    return (time.perf_counter() - start_time) / args_cli.num_steps * 1e6
+
+
+def main():
+    """Run the benchmark over all history lengths and batch sizes."""
+    device = args_cli.device
+    variants = {
+        "legacy (roll)": (LegacyCircularBuffer, lambda buf: buf.buffer),
+        "mirrored (copy)": (CircularBuffer, lambda buf: buf.buffer),
+        "mirrored (view)": (CircularBuffer, lambda buf: buf.buffer_view),
+    }
+    print(f"[INFO]: Benchmarking circular buffer on device '{device}' with data dimension {args_cli.data_dim}.")
+    header = f"{'history':>8} {'batch':>8} " + " ".join(f"{name:>18}" for name in variants)
+    print(header)
+    print("-" * len(header))
+    for history_length in args_cli.history_lengths:
+        for batch_size in args_cli.batch_sizes:
+            data = torch.rand(batch_size, args_cli.data_dim, device=device)
+            timings = []
+            for buffer_cls, read_fn in variants.values():
+                buffer = buffer_cls(max_len=history_length, batch_size=batch_size, device=device)
+                timings.append(benchmark(buffer, read_fn, data, device))
+            row = f"{history_length:>8} {batch_size:>8} " + " ".join(f"{t:>15.2f} us" for t in timings)
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
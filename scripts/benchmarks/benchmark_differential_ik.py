@@ -0,0 +1,120 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark the throughput and accuracy of the inverse-kinematics methods of the differential IK controller.
+
+The script solves random Jacobians for all methods of :class:`~isaaclab.controllers.DifferentialIKController`
+and both solvers of the damped least-squares method. The previous damped least-squares implementation, which
+inverted the damped system explicitly, is used as the reference.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_differential_ik.py --device cuda:0 \\
+        --num_envs 1024 4096 16384 --num_joints 7
+
+"""
+
+import argparse
+import time
+import torch
+
+from isaaclab.controllers import DifferentialIKController, DifferentialIKControllerCfg
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the inverse-kinematics methods of the differential IK.")
+parser.add_argument("--device", type=str, default="cuda:0" if torch.cuda.is_available() else "cpu")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[1024, 4096, 16384], help="Numbers of envs to test.")
+parser.add_argument("--num_joints", type=int, default=7, help="Number of joints of the Jacobians.")
+parser.add_argument("--command_type", type=str, default="pose", choices=["position", "pose"], help="Command type.")
+parser.add_argument("--lambda_val", type=float, default=0.01, help="Damping coefficient of the DLS method.")
+parser.add_argument("--num_steps", type=int, default=500, help="Number of timed solves.")
+parser.add_argument("--num_warmup", type=int, default=50, help="Number of warm-up solves before timing.")
+args_cli = parser.parse_args()
+
+
+def legacy_dls(delta_pose: torch.Tensor, jacobian: torch.Tensor, lambda_val: float) -> torch.Tensor:
+    """Reference implementation of the previous damped least-squares method with an explicit inverse."""
+    jacobian_T = torch.transpose(jacobian, dim0=1, dim1=2)
+    lambda_matrix = (lambda_val**2) * torch.eye(n=jacobian.shape[1], device=jacobian.device)
+    delta_joint_pos = jacobian_T @ torch.inverse(jacobian @ jacobian_T + lambda_matrix) @ delta_pose.unsqueeze(-1)
+    return delta_joint_pos.squeeze(-1)
+
+
+def _synchronize(device: str):
+    """Wait for all kernels on the device to finish."""
+    if "cuda" in device:
+        torch.cuda.synchronize(device)
+
+
+def benchmark(solve_fn, device: str) -> float:
+    """Measure the average time of one solve.
+
+    Returns:
+        The average time per solve in microseconds.
+    """
+    for _ in range(args_cli.num_warmup):
+        solve_fn()
+    _synchronize(device)
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        solve_fn()
+    _synchronize(device)
+    return (time.perf_counter() - start_time) / args_cli.num_steps * 1e6
+
+
+def _residual(jacobian: torch.Tensor, delta_joint_pos: torch.Tensor, delta_pose: torch.Tensor) -> float:
+    """Computes the mean relative residual of the solutions."""
+    residual = (jacobian @ delta_joint_pos.unsqueeze(-1)).squeeze(-1) - delta_pose
+    return (residual.norm(dim=-1) / delta_pose.norm(dim=-1)).mean().item()
+
+
+def main():
+    """Run the benchmark over all numbers of environments."""
+    device = args_cli.device
+    num_rows = 3 if args_cli.command_type == "position" else 6
+    variants = {
+        "pinv": ("pinv", "cholesky"),
+        "svd": ("svd", "cholesky"),
+        "trans": ("trans", "cholesky"),
+        "dls (cholesky)": ("dls", "cholesky"),
+        "dls (warp)": ("dls", "warp"),
+    }
+    print(
+        f"[INFO]: Benchmarking differential IK on device '{device}' with {num_rows} x {args_cli.num_joints} Jacobians."
+    )
+    print("[INFO]: The residual is the mean of |J dq - dx| / |dx| and the deviation is the maximum of |dq - dq_ref|.")
+    header = f"{'envs':>8} {'method':>16} {'time':>14} {'residual':>12} {'deviation':>12}"
+    print(header)
+    print("-" * len(header))
+    for num_envs in args_cli.num_envs:
+        generator = torch.Generator().manual_seed(0)
+        jacobian = torch.randn(num_envs, num_rows, args_cli.num_joints, generator=generator).to(device)
+        delta_pose = 0.1 * torch.randn(num_envs, num_rows, generator=generator).to(device)
+        # reference solution
+        reference = legacy_dls(delta_pose, jacobian, args_cli.lambda_val)
+        timing = benchmark(lambda: legacy_dls(delta_pose, jacobian, args_cli.lambda_val), device)
+        residual = _residual(jacobian, reference, delta_pose)
+        print(f"{num_envs:>8} {'dls (legacy)':>16} {timing:>11.2f} us {residual:>12.2e}")
+        # controller methods
+        for name, (ik_method, dls_solver) in variants.items():
+            cfg = DifferentialIKControllerCfg(
+                command_type=args_cli.command_type,
+                ik_method=ik_method,
+                ik_params={"lambda_val": args_cli.lambda_val} if ik_method == "dls" else None,
+                dls_solver=dls_solver,
+            )
+            controller = DifferentialIKController(cfg, num_envs=num_envs, device=device)
+            delta_joint_pos = controller._compute_delta_joint_pos(delta_pose, jacobian)
+            timing = benchmark(lambda: controller._compute_delta_joint_pos(delta_pose, jacobian), device)
+            residual = _residual(jacobian, delta_joint_pos, delta_pose)
+            row = f"{num_envs:>8} {name:>16} {timing:>11.2f} us {residual:>12.2e}"
+            # only the damped least-squares methods solve the same problem as the reference
+            if ik_method == "dls":
+                row += f" {(delta_joint_pos - reference).abs().max().item():>12.2e}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
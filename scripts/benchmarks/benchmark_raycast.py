@@ -0,0 +1,178 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Script to benchmark ray-casting against a warp mesh on the CPU.
+
+The script sweeps the number of rays and the size of the mesh and compares ray-casting on a single thread
+against ray-casting in chunks of rays on multiple threads with :func:`~isaaclab.utils.warp.raycast_mesh`.
+It then does the same for the fused kernel of the ray-caster sensor, which transforms the rays of each sensor
+into the world frame and ray-casts them, and which is split into chunks of sensors on the CPU.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p scripts/benchmarks/benchmark_raycast.py --num_rays 1024 16384 262144 \\
+        --mesh_resolutions 0.5 0.1 0.02 --num_threads 1 4 8 --num_envs 64 1024 4096
+
+"""
+
+import argparse
+import numpy as np
+import time
+import torch
+
+import warp as wp
+
+from isaaclab.utils.warp import convert_to_warp_mesh, launch_ray_chunks, raycast_mesh
+from isaaclab.utils.warp.kernels import raycast_sensor_kernel
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark ray-casting against a warp mesh on the CPU.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to ray-cast on.")
+parser.add_argument(
+    "--num_rays", type=int, nargs="+", default=[1024, 16384, 131072, 1048576], help="Numbers of rays to test."
+)
+parser.add_argument(
+    "--mesh_resolutions",
+    type=float,
+    nargs="+",
+    default=[0.5, 0.1, 0.02],
+    help="Horizontal resolutions (in m) of the terrain mesh to test. A finer resolution gives a larger mesh.",
+)
+parser.add_argument("--num_threads", type=int, nargs="+", default=[1, 4, 8], help="Numbers of threads to test.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[64, 1024, 4096], help="Numbers of ray-caster sensors to test."
+)
+parser.add_argument("--num_rays_per_env", type=int, default=187, help="Number of rays per sensor.")
+parser.add_argument("--terrain_size", type=float, default=20.0, help="Side length of the square terrain (in m).")
+parser.add_argument("--return_normal", action="store_true", default=False, help="Also compute the normals.")
+parser.add_argument("--num_steps", type=int, default=20, help="Number of timed ray-casts.")
+parser.add_argument("--num_warmup", type=int, default=3, help="Number of ray-casts before timing.")
+args_cli = parser.parse_args()
+
+
+def create_mesh(resolution: float, device: str):
+    """Create a rough terrain mesh with the given horizontal resolution.
+
+    Returns:
+        The warp mesh and the number of its faces.
+    """
+    num_points = int(args_cli.terrain_size / resolution) + 1
+    rng = np.random.default_rng(0)
+    # vertices of a grid with random heights
+    x, y = np.meshgrid(np.arange(num_points) * resolution, np.arange(num_points) * resolution, indexing="ij")
+    z = rng.uniform(-0.1, 0.1, size=x.shape)
+    vertices = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+    # two triangles per cell of the grid
+    ids = np.arange(num_points * num_points).reshape(num_points, num_points)[:-1, :-1].reshape(-1, 1)
+    triangles = np.concatenate([
+        np.hstack([ids, ids + num_points + 1, ids + 1]),
+        np.hstack([ids, ids + num_points, ids + num_points + 1]),
+    ])
+    return convert_to_warp_mesh(vertices, triangles, device=device), len(triangles)
+
+
+def benchmark(ray_starts: torch.Tensor, ray_directions: torch.Tensor, mesh, num_threads: int) -> float:
+    """Measure the average time of one ray-cast.
+
+    Returns:
+        The average time per ray-cast in milliseconds.
+    """
+    for _ in range(args_cli.num_warmup):
+        raycast_mesh(ray_starts, ray_directions, mesh, return_normal=args_cli.return_normal, num_threads=num_threads)
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        raycast_mesh(ray_starts, ray_directions, mesh, return_normal=args_cli.return_normal, num_threads=num_threads)
+    return (time.perf_counter() - start_time) / args_cli.num_steps * 1e3
+
+
+def benchmark_sensor(inputs: list, dim: tuple[int, int], device: str, num_threads: int) -> float:
+    """Measure the average time of one update of the ray-caster sensors with the fused sensor kernel.
+
+    Returns:
+        The average time per update in milliseconds.
+    """
+    for _ in range(args_cli.num_warmup):
+        launch_ray_chunks(raycast_sensor_kernel, dim, inputs, [5], device, num_threads=num_threads)
+    wp.synchronize_device(device)
+    start_time = time.perf_counter()
+    for _ in range(args_cli.num_steps):
+        launch_ray_chunks(raycast_sensor_kernel, dim, inputs, [5], device, num_threads=num_threads)
+    wp.synchronize_device(device)
+    return (time.perf_counter() - start_time) / args_cli.num_steps * 1e3
+
+
+def create_sensor_inputs(mesh, num_envs: int, device: str, generator: torch.Generator) -> list:
+    """Create the inputs of the fused sensor kernel for sensors at random positions above the terrain.
+
+    The sensors cast vertical rays from a grid below them in the world alignment mode.
+    """
+    num_rays = args_cli.num_rays_per_env
+    # sensor poses
+    pos_w = torch.rand(num_envs, 3, generator=generator) * args_cli.terrain_size
+    pos_w[:, 2] = 10.0
+    quat_w = torch.zeros(num_envs, 4)
+    quat_w[:, 0] = 1.0
+    # rays in the sensor frame
+    ray_starts = torch.zeros(num_envs, num_rays, 3)
+    ray_starts[..., :2] = torch.rand(num_rays, 2, generator=generator) - 0.5
+    ray_directions = torch.zeros_like(ray_starts)
+    ray_directions[..., 2] = -1.0
+    ray_hits_w = torch.zeros_like(ray_starts)
+    return [
+        mesh.id,
+        0,
+        wp.empty((0,), dtype=wp.uint64, device=device),
+        wp.empty((0,), dtype=wp.vec3, device=device),
+        wp.empty((0,), dtype=wp.quat, device=device),
+        wp.array(np.arange(num_envs, dtype=np.int32), dtype=wp.int32, device=device),
+        wp.from_torch(pos_w.to(device), dtype=wp.vec3),
+        wp.from_torch(quat_w.to(device), dtype=wp.vec4),
+        wp.zeros(num_envs, dtype=wp.vec3, device=device),
+        wp.from_torch(ray_starts.to(device), dtype=wp.vec3),
+        wp.from_torch(ray_directions.to(device), dtype=wp.vec3),
+        wp.from_torch(ray_hits_w.to(device), dtype=wp.vec3),
+        0,
+        1e6,
+        1,
+        0,
+    ]
+
+
+def main():
+    """Run the benchmark over all mesh sizes and numbers of rays."""
+    device = args_cli.device
+    print(f"[INFO]: Benchmarking ray-casting on device '{device}' with a {args_cli.terrain_size} m terrain.")
+    header = f"{'faces':>10} {'rays':>10} " + " ".join(f"{f'{n} threads':>14}" for n in args_cli.num_threads)
+    print(header)
+    print("-" * len(header))
+    generator = torch.Generator().manual_seed(0)
+    for resolution in args_cli.mesh_resolutions:
+        mesh, num_faces = create_mesh(resolution, device)
+        for num_rays in args_cli.num_rays:
+            # downward rays at random positions above the terrain
+            ray_starts = torch.rand(1, num_rays, 3, generator=generator) * args_cli.terrain_size
+            ray_starts[..., 2] = 10.0
+            ray_directions = torch.zeros_like(ray_starts)
+            ray_directions[..., 2] = -1.0
+            ray_starts, ray_directions = ray_starts.to(device), ray_directions.to(device)
+            timings = [benchmark(ray_starts, ray_directions, mesh, n) for n in args_cli.num_threads]
+            print(f"{num_faces:>10} {num_rays:>10} " + " ".join(f"{t:>11.3f} ms" for t in timings))
+
+    # fused sensor kernel
+    print(f"[INFO]: Benchmarking the ray-caster sensor kernel with {args_cli.num_rays_per_env} rays per sensor.")
+    header = f"{'faces':>10} {'sensors':>10} " + " ".join(f"{f'{n} threads':>14}" for n in args_cli.num_threads)
+    print(header)
+    print("-" * len(header))
+    for resolution in args_cli.mesh_resolutions:
+        mesh, num_faces = create_mesh(resolution, device)
+        for num_envs in args_cli.num_envs:
+            inputs = create_sensor_inputs(mesh, num_envs, device, generator)
+            dim = (num_envs, args_cli.num_rays_per_env)
+            timings = [benchmark_sensor(inputs, dim, device, n) for n in args_cli.num_threads]
+            print(f"{num_faces:>10} {num_envs:>10} " + " ".join(f"{t:>11.3f} ms" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -40,6 +40,10 @@ Args:
     log_dir: Directory to save logs.
     normalize_training_actions: Whether to normalize actions in the training data.
 
+Besides HDF5 datasets, the script supports memory-mapped datasets created with
+:class:`isaaclab.utils.datasets.MemmapDatasetFileHandler` (for example, converted with
+``scripts/tools/convert_hdf5_to_memmap.py``). These are read with :class:`MemmapSequenceDataset`.
+
 This file has been modified from the original robomimic version to integrate with IsaacLab.
 """
 
@@ -68,7 +72,7 @@ import time
 import torch
 import traceback
 from collections import OrderedDict
-from torch.utils.data import DataLoader
+from torch.utils.data import DataLoader, Dataset
 
 import psutil
 
@@ -82,11 +86,216 @@ from robomimic.algo import algo_factory
 from robomimic.config import Config, config_factory
 from robomimic.utils.log_utils import DataLogger, PrintLogger
 
+from isaaclab.utils.datasets import MemmapDatasetFileHandler
+
 # Isaac Lab imports (needed so that environment is registered)
 import isaaclab_tasks  # noqa: F401
 import isaaclab_tasks.manager_based.manipulation.pick_place  # noqa: F401
 
 
+class MemmapSequenceDataset(Dataset):
+    """Sequence dataset that reads samples from a memory-mapped dataset.
+
+    This is the counterpart of robomimic's :class:`SequenceDataset` for datasets stored with
+    :class:`~isaaclab.utils.datasets.MemmapDatasetFileHandler`. It returns the same samples (including the
+    padding of frame stacks and sequences), but gathers them directly from the memory-mapped arrays of the
+    keys. This avoids the per-episode group lookups and the decompression of the HDF5 datasets.
+    """
+
+    def __init__(
+        self,
+        dataset_path: str,
+        obs_keys: tuple[str, ...],
+        dataset_keys: tuple[str, ...],
+        frame_stack: int = 1,
+        seq_length: int = 1,
+        pad_frame_stack: bool = True,
+        pad_seq_length: bool = True,
+        load_next_obs: bool = False,
+        filter_by_attribute: str | None = None,
+    ):
+        """Initializes the dataset.
+
+        Args:
+            dataset_path: Path to the memory-mapped dataset.
+            obs_keys: The observation keys to load.
+            dataset_keys: The non-observation keys to load (for example, "actions").
+            frame_stack: The number of stacked frames of the observations. Defaults to 1.
+            seq_length: The length of the sequences. Defaults to 1.
+            pad_frame_stack: Whether to pad the frame stack at the beginning of the episodes. Defaults to True.
+            pad_seq_length: Whether to pad the sequences at the end of the episodes. Defaults to True.
+            load_next_obs: Whether to load the next observations. Defaults to False.
+            filter_by_attribute: The filter key of the episodes to use. Defaults to None (all episodes).
+        """
+        self.dataset_path = dataset_path
+        self.obs_keys = tuple(obs_keys)
+        self.dataset_keys = tuple(dataset_keys)
+        self.n_frame_stack = frame_stack
+        self.seq_length = seq_length
+        self.pad_frame_stack = pad_frame_stack
+        self.pad_seq_length = pad_seq_length
+        self.load_next_obs = load_next_obs
+
+        file_handler = MemmapDatasetFileHandler()
+        file_handler.open(dataset_path)
+        if filter_by_attribute is not None:
+            demos = file_handler.get_filter_key(filter_by_attribute)
+        else:
+            demos = list(file_handler.get_episode_names())
+        episode_indices = {name: index for index, name in enumerate(file_handler.get_episode_names())}
+        self.demos = demos
+        self._demo_episode_indices = [episode_indices[demo] for demo in demos]
+        self.keys = set(file_handler.get_keys())
+        self.offsets = {key: file_handler.get_episode_offsets(key) for key in self.keys}
+        file_handler.close()
+
+        # map each sample to its episode and its index within the episode
+        sample_episodes, sample_indices = [], []
+        for episode_index in self._demo_episode_indices:
+            demo_length = self._get_length("actions", episode_index)
+            num_sequences = demo_length
+            if not pad_frame_stack:
+                num_sequences -= frame_stack - 1
+            if not pad_seq_length:
+                num_sequences -= seq_length - 1
+            num_sequences = max(num_sequences, 0)
+            demo_index_offset = 0 if pad_frame_stack else frame_stack - 1
+            sample_episodes.append(np.full(num_sequences, episode_index, dtype=np.int64))
+            sample_indices.append(np.arange(num_sequences, dtype=np.int64) + demo_index_offset)
+        self._sample_episodes = np.concatenate(sample_episodes) if demos else np.empty(0, dtype=np.int64)
+        self._sample_indices = np.concatenate(sample_indices) if demos else np.empty(0, dtype=np.int64)
+
+        # memory maps of the keys (opened lazily in each data loader worker)
+        self._arrays = None
+
+    def __getstate__(self):
+        # do not pickle the memory maps, which would copy the data
+        state = self.__dict__.copy()
+        state["_arrays"] = None
+        return state
+
+    def __len__(self) -> int:
+        return len(self._sample_episodes)
+
+    def __repr__(self) -> str:
+        return (
+            f"MemmapSequenceDataset (\n\tpath={self.dataset_path}\n\tobs_keys={self.obs_keys}\n\tseq_length="
+            f"{self.seq_length}\n\tframe_stack={self.n_frame_stack}\n\tnum_demos={len(self.demos)}\n\t"
+            f"num_sequences={len(self)}\n)"
+        )
+
+    def __getitem__(self, index: int) -> dict:
+        episode_index = self._sample_episodes[index]
+        index_in_demo = self._sample_indices[index]
+        num_frames_to_stack = self.n_frame_stack - 1
+
+        meta = dict()
+        for key in self.dataset_keys:
+            meta[key] = self._get_sequence(key, episode_index, index_in_demo, num_frames_to_stack).astype(np.float32)
+        meta["obs"] = ObsUtils.process_obs_dict({
+            key: self._get_sequence(f"obs/{key}", episode_index, index_in_demo, num_frames_to_stack)
+            for key in self.obs_keys
+        })
+        if self.load_next_obs:
+            meta["next_obs"] = ObsUtils.process_obs_dict({
+                key: self._get_sequence(f"next_obs/{key}", episode_index, index_in_demo, num_frames_to_stack)
+                for key in self.obs_keys
+            })
+        return meta
+
+    def get_dataset_sampler(self):
+        """Return the sampler of the data loader (None to sample uniformly)."""
+        return None
+
+    def get_obs_normalization_stats(self) -> dict:
+        """Compute the mean and standard deviation of the observations over the dataset."""
+        self._open_arrays()
+        stats = dict()
+        for key in self.obs_keys:
+            offsets = self.offsets[f"obs/{key}"]
+            array = self._arrays[f"obs/{key}"]
+            data = np.concatenate([array[offsets[i] : offsets[i + 1]] for i in self._demo_episode_indices])
+            data = data.astype(np.float32)
+            data = ObsUtils.process_obs(data, obs_key=key)
+            stats[key] = {
+                "mean": data.mean(axis=0, keepdims=True),
+                "std": np.sqrt(data.var(axis=0, keepdims=True) + 1e-3),
+            }
+        return stats
+
+    def _open_arrays(self):
+        """Open the memory maps of the keys."""
+        if self._arrays is None:
+            file_handler = MemmapDatasetFileHandler()
+            file_handler.open(self.dataset_path)
+            self._arrays = {key: file_handler.get_array(key) for key in self.keys}
+            file_handler.close()
+
+    def _get_length(self, key: str, episode_index: int) -> int:
+        """Return the number of steps of a key in an episode."""
+        offsets = self.offsets[key]
+        return int(offsets[episode_index + 1] - offsets[episode_index])
+
+    def _get_sequence(self, key: str, episode_index: int, index_in_demo: int, num_frames_to_stack: int) -> np.ndarray:
+        """Gather the (padded) sequence of a key that starts at the given index of an episode."""
+        if key not in self.keys:
+            # missing keys (for example, rewards and dones) are filled with zeros as in robomimic
+            return np.zeros((num_frames_to_stack + self.seq_length, 1), dtype=np.float32)
+        self._open_arrays()
+        start = self.offsets[key][episode_index]
+        length = self._get_length(key, episode_index)
+        # clip the indices to the episode to repeat the first and last steps as padding
+        indices = np.arange(index_in_demo - num_frames_to_stack, index_in_demo + self.seq_length)
+        return self._arrays[key][start + np.clip(indices, 0, length - 1)]
+
+
+def load_memmap_data_for_training(config: Config, obs_keys: tuple[str, ...]) -> tuple[Dataset, Dataset | None]:
+    """Create the training and validation datasets for a memory-mapped dataset.
+
+    This mirrors :func:`robomimic.utils.train_utils.load_data_for_training`.
+    """
+    dataset_kwargs = dict(
+        dataset_path=os.path.expanduser(config.train.data),
+        obs_keys=obs_keys,
+        dataset_keys=config.train.dataset_keys,
+        frame_stack=config.train.frame_stack,
+        seq_length=config.train.seq_length,
+        pad_frame_stack=config.train.pad_frame_stack,
+        pad_seq_length=config.train.pad_seq_length,
+        load_next_obs=config.train.hdf5_load_next_obs,
+    )
+    train_dataset = MemmapSequenceDataset(filter_by_attribute=config.train.hdf5_filter_key, **dataset_kwargs)
+    valid_dataset = None
+    if config.experiment.validate:
+        valid_dataset = MemmapSequenceDataset(
+            filter_by_attribute=config.train.hdf5_validation_filter_key, **dataset_kwargs
+        )
+    return train_dataset, valid_dataset
+
+
+def get_memmap_shape_metadata(dataset_path: str, all_obs_keys: tuple[str, ...]) -> dict:
+    """Get the shape metadata of a memory-mapped dataset.
+
+    This mirrors :func:`robomimic.utils.file_utils.get_shape_metadata_from_dataset`.
+    """
+    file_handler = MemmapDatasetFileHandler()
+    file_handler.open(dataset_path)
+    shape_meta = dict()
+    shape_meta["ac_dim"] = file_handler.get_array("actions").shape[1]
+    all_shapes = OrderedDict()
+    for key in sorted(all_obs_keys):
+        initial_shape = file_handler.get_array(f"obs/{key}").shape[1:]
+        all_shapes[key] = ObsUtils.get_processed_shape(
+            obs_modality=ObsUtils.OBS_KEYS_TO_MODALITIES[key], input_shape=initial_shape
+        )
+    file_handler.close()
+    shape_meta["all_shapes"] = all_shapes
+    shape_meta["all_obs_keys"] = list(all_shapes.keys())
+    shape_meta["use_images"] = any(ObsUtils.key_is_obs_modality(key, "rgb") for key in all_shapes)
+    shape_meta["use_depths"] = any(ObsUtils.key_is_obs_modality(key, "depth") for key in all_shapes)
+    return shape_meta
+
+
 def normalize_hdf5_actions(config: Config, log_dir: str) -> str:
     """Normalizes actions in hdf5 dataset to [-1, 1] range.
 
@@ -168,13 +377,23 @@ def train(config: Config, device: str, log_dir: str, ckpt_dir: str, video_dir: s
     dataset_path = os.path.expanduser(config.train.data)
     if not os.path.exists(dataset_path):
         raise FileNotFoundError(f"Dataset at provided path {dataset_path} not found!")
+    # memory-mapped datasets are stored as directories
+    use_memmap_dataset = os.path.isdir(dataset_path)
 
     # load basic metadata from training file
     print("\n============= Loaded Environment Metadata =============")
-    env_meta = FileUtils.get_env_metadata_from_dataset(dataset_path=config.train.data)
-    shape_meta = FileUtils.get_shape_metadata_from_dataset(
-        dataset_path=config.train.data, all_obs_keys=config.all_obs_keys, verbose=True
-    )
+    if use_memmap_dataset:
+        file_handler = MemmapDatasetFileHandler()
+        file_handler.open(dataset_path)
+        env_meta = dict(file_handler.get_env_args())
+        env_meta.setdefault("env_kwargs", dict())
+        file_handler.close()
+        shape_meta = get_memmap_shape_metadata(dataset_path, all_obs_keys=config.all_obs_keys)
+    else:
+        env_meta = FileUtils.get_env_metadata_from_dataset(dataset_path=config.train.data)
+        shape_meta = FileUtils.get_shape_metadata_from_dataset(
+            dataset_path=config.train.data, all_obs_keys=config.all_obs_keys, verbose=True
+        )
 
     if config.experiment.env is not None:
         env_meta["env_name"] = config.experiment.env
@@ -222,7 +441,10 @@ def train(config: Config, device: str, log_dir: str, ckpt_dir: str, video_dir: s
     print("")
 
     # load training data
-    trainset, validset = TrainUtils.load_data_for_training(config, obs_keys=shape_meta["all_obs_keys"])
+    if use_memmap_dataset:
+        trainset, validset = load_memmap_data_for_training(config, obs_keys=shape_meta["all_obs_keys"])
+    else:
+        trainset, validset = TrainUtils.load_data_for_training(config, obs_keys=shape_meta["all_obs_keys"])
     train_sampler = trainset.get_dataset_sampler()
     print("\n============= Training Dataset =============")
     print(trainset)
@@ -393,6 +615,8 @@ def main(args: argparse.Namespace):
     log_dir, ckpt_dir, video_dir = TrainUtils.get_exp_dir(config)
 
     if args.normalize_training_actions:
+        if os.path.isdir(config.train.data):
+            raise ValueError("Normalizing the training actions is only supported for HDF5 datasets.")
         config.train.data = normalize_hdf5_actions(config, log_dir)
 
     # get torch device
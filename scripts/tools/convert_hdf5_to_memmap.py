@@ -0,0 +1,47 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to convert an HDF5 demonstration dataset to the memory-mapped dataset format.
+
+The memory-mapped format stores the data of each key over all episodes in one contiguous array. Please refer to
+:class:`isaaclab.utils.datasets.MemmapDatasetFileHandler` for more details on the format.
+
+required arguments:
+    --input_file         Path to the input HDF5 file.
+
+optional arguments:
+    --output_file        Path to the output dataset directory. (default: input file with the extension ".memmap")
+"""
+
+import argparse
+import os
+
+from isaaclab.utils.datasets import convert_hdf5_to_memmap
+
+parser = argparse.ArgumentParser(description="Convert an HDF5 dataset to the memory-mapped dataset format.")
+parser.add_argument("--input_file", type=str, required=True, help="Path to the input HDF5 dataset file.")
+parser.add_argument(
+    "--output_file",
+    type=str,
+    default=None,
+    help="Path to the output dataset directory. Defaults to the input file with the extension '.memmap'.",
+)
+
+args_cli = parser.parse_args()
+
+
+def main():
+    if not os.path.exists(args_cli.input_file):
+        raise FileNotFoundError(f"The dataset file {args_cli.input_file} does not exist.")
+    output_file = args_cli.output_file
+    if output_file is None:
+        output_file = os.path.splitext(args_cli.input_file)[0]
+    output_file = convert_hdf5_to_memmap(args_cli.input_file, output_file)
+    print(f"Converted dataset saved to {output_file}")
+
+
+if __name__ == "__main__":
+    main()
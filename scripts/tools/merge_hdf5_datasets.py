@@ -3,45 +3,324 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+"""
+Script to merge a set of HDF5 demonstration datasets.
+
+The episodes of the input files are renumbered as ``data/demo_N`` in the output file(s). Unless a different
+compression is requested, the episodes are copied with the raw chunks of their datasets, i.e. without
+decompressing and recompressing the data. The aggregate attributes of the output (``total`` number of samples,
+number of successful episodes and the environment arguments) are recomputed for the merged episodes.
+
+The output can be split into multiple shards with a balanced number of samples, for example for distributed
+training. The shards are written in parallel worker processes, while a single output file is written serially
+(writing parts of it in parallel and concatenating them afterwards would write every episode twice).
+
+required arguments:
+    --input_files        Paths to the HDF5 files to merge.
+
+optional arguments:
+    --output_file        Path to the merged output file. (default: merged_dataset.hdf5)
+    --num_shards         Number of output files to split the episodes into. (default: 1)
+    --num_workers        Number of worker processes for writing the shards. (default: 1)
+    --success_only       Only keep the episodes with the "success" attribute set to True.
+    --min_num_samples    Only keep the episodes with at least this number of samples.
+    --max_num_samples    Only keep the episodes with at most this number of samples.
+    --deduplicate_seeds  Only keep the first episode of each seed.
+    --compression        Re-encode the datasets with the given codec. (default: keep the codec of the inputs)
+"""
+
 import argparse
 import h5py
+import heapq
+import json
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+
+@dataclass
+class EpisodeInfo:
+    """Location and attributes of an episode in an input file."""
+
+    file_path: str
+    """Path to the input file of the episode."""
+    name: str
+    """Name of the episode group in the input file."""
+    num_samples: int
+    """Number of samples of the episode."""
+    success: bool | None
+    """Whether the episode is successful. None if the attribute is not set."""
+    seed: int | None
+    """Seed of the episode. None if the attribute is not set."""
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Merge a set of HDF5 datasets.")
+    parser.add_argument(
+        "--input_files",
+        type=str,
+        nargs="+",
+        default=[],
+        help="A list of paths to HDF5 files to merge.",
+    )
+    parser.add_argument("--output_file", type=str, default="merged_dataset.hdf5", help="File path to merged output.")
+    parser.add_argument(
+        "--num_shards",
+        type=int,
+        default=1,
+        help="Number of output files. If larger than one, the shard index is appended to the output file name.",
+    )
+    parser.add_argument("--num_workers", type=int, default=1, help="Number of worker processes for writing the shards.")
+    parser.add_argument("--success_only", action="store_true", default=False, help="Only keep successful episodes.")
+    parser.add_argument("--min_num_samples", type=int, default=None, help="Minimum number of samples per episode.")
+    parser.add_argument("--max_num_samples", type=int, default=None, help="Maximum number of samples per episode.")
+    parser.add_argument(
+        "--deduplicate_seeds", action="store_true", default=False, help="Only keep the first episode of each seed."
+    )
+    parser.add_argument(
+        "--compression",
+        type=str,
+        default=None,
+        choices=["gzip", "lzf", "none"],
+        help="Re-encode the datasets with the given codec. By default, the compressed chunks are copied as they are.",
+    )
+    return parser.parse_args()
+
+
+def _natural_sort_key(name: str) -> tuple:
+    """Sort key to order episode names by their index (demo_2 before demo_10)."""
+    return tuple(int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name))
+
+
+def scan_episodes(input_files: list[str]) -> tuple[dict, list[EpisodeInfo]]:
+    """Read the attributes of the episodes in the input files.
+
+    Args:
+        input_files: Paths to the input files.
+
+    Returns:
+        The environment arguments of the first input file and the episodes in the order of the input files.
+    """
+    env_args = None
+    episodes = []
+    for file_path in input_files:
+        with h5py.File(file_path, "r") as f:
+            file_env_args = json.loads(f["data"].attrs["env_args"]) if "env_args" in f["data"].attrs else {}
+            if env_args is None:
+                env_args = file_env_args
+            elif file_env_args.get("env_name") != env_args.get("env_name"):
+                print(
+                    f"[WARN]: The environment '{file_env_args.get('env_name')}' of the dataset {file_path} does not"
+                    f" match the environment '{env_args.get('env_name')}' of the first dataset."
+                )
+            for name in sorted(f["data"].keys(), key=_natural_sort_key):
+                attrs = f["data"][name].attrs
+                episodes.append(
+                    EpisodeInfo(
+                        file_path=file_path,
+                        name=name,
+                        num_samples=int(attrs.get("num_samples", 0)),
+                        success=bool(attrs["success"]) if "success" in attrs else None,
+                        seed=int(attrs["seed"]) if "seed" in attrs else None,
+                    )
+                )
+    return env_args if env_args is not None else {}, episodes
+
+
+def filter_episodes(
+    episodes: list[EpisodeInfo],
+    success_only: bool = False,
+    min_num_samples: int | None = None,
+    max_num_samples: int | None = None,
+    deduplicate_seeds: bool = False,
+) -> list[EpisodeInfo]:
+    """Select the episodes to merge.
+
+    Args:
+        episodes: The episodes to select from.
+        success_only: Whether to only keep the successful episodes. Defaults to False.
+        min_num_samples: The minimum number of samples of an episode. Defaults to None.
+        max_num_samples: The maximum number of samples of an episode. Defaults to None.
+        deduplicate_seeds: Whether to only keep the first episode of each seed. Episodes without a seed
+            are always kept. Defaults to False.
+
+    Returns:
+        The selected episodes in their original order.
+    """
+    selected_episodes = []
+    seen_seeds = set()
+    for episode in episodes:
+        if success_only and not episode.success:
+            continue
+        if min_num_samples is not None and episode.num_samples < min_num_samples:
+            continue
+        if max_num_samples is not None and episode.num_samples > max_num_samples:
+            continue
+        if deduplicate_seeds and episode.seed is not None:
+            if episode.seed in seen_seeds:
+                continue
+            seen_seeds.add(episode.seed)
+        selected_episodes.append(episode)
+    return selected_episodes
+
+
+def split_episodes(episodes: list[EpisodeInfo], num_splits: int) -> list[list[EpisodeInfo]]:
+    """Split the episodes into groups with a balanced number of samples.
+
+    Each episode is assigned to the group with the fewest samples so far. The order of the episodes is kept
+    within each group.
+    """
+    splits = [[] for _ in range(num_splits)]
+    heap = [(0, index) for index in range(num_splits)]
+    for episode in episodes:
+        total, index = heapq.heappop(heap)
+        splits[index].append(episode)
+        heapq.heappush(heap, (total + episode.num_samples, index))
+    return splits
+
+
+def _copy_reencoded(source: h5py.Group, target: h5py.Group, dataset_kwargs: dict):
+    """Recursively copy the datasets and attributes of a group with the given dataset options."""
+    target.attrs.update(source.attrs)
+    for key, value in source.items():
+        if isinstance(value, h5py.Group):
+            _copy_reencoded(value, target.create_group(key), dataset_kwargs)
+        else:
+            kwargs = dataset_kwargs if value.ndim > 0 and value.size > 0 else {}
+            dataset = target.create_dataset(key, data=value[()], **kwargs)
+            dataset.attrs.update(value.attrs)
+
+
+def write_dataset(
+    output_file: str, env_args: dict, episodes: list[EpisodeInfo], compression: str | None = None
+) -> tuple[int, int]:
+    """Write the episodes to an output file.
+
+    Args:
+        output_file: Path to the output file.
+        env_args: The environment arguments of the output file.
+        episodes: The episodes to write. They are renamed to ``demo_N`` in the given order.
+        compression: The codec to re-encode the datasets with ("gzip", "lzf" or "none"). Defaults to None,
+            in which case the raw chunks of the datasets are copied.
+
+    Returns:
+        The total number of samples and the number of successful episodes in the output file.
+    """
+    if compression is None:
+        dataset_kwargs = None
+    elif compression == "none":
+        dataset_kwargs = {}
+    else:
+        dataset_kwargs = {"compression": compression}
+
+    total = 0
+    num_success = 0
+    input_file = None
+    input_file_path = None
+    with h5py.File(output_file, "w") as output:
+        data_group = output.create_group("data")
+        for index, episode in enumerate(episodes):
+            # keep the input file open for consecutive episodes of the same file
+            if input_file_path != episode.file_path:
+                if input_file is not None:
+                    input_file.close()
+                input_file = h5py.File(episode.file_path, "r")
+                input_file_path = episode.file_path
+            source = input_file["data"][episode.name]
+            if dataset_kwargs is None:
+                input_file.copy(source, data_group, f"demo_{index}")
+            else:
+                _copy_reencoded(source, data_group.create_group(f"demo_{index}"), dataset_kwargs)
+            total += episode.num_samples
+            num_success += int(bool(episode.success))
+        if input_file is not None:
+            input_file.close()
+        data_group.attrs["env_args"] = json.dumps(env_args)
+        data_group.attrs["total"] = total
+        data_group.attrs["num_success"] = num_success
+    return total, num_success
+
 
-parser = argparse.ArgumentParser(description="Merge a set of HDF5 datasets.")
-parser.add_argument(
-    "--input_files",
-    type=str,
-    nargs="+",
-    default=[],
-    help="A list of paths to HDF5 files to merge.",
-)
-parser.add_argument("--output_file", type=str, default="merged_dataset.hdf5", help="File path to merged output.")
+def merge_datasets(
+    input_files: list[str],
+    output_file: str,
+    num_shards: int = 1,
+    num_workers: int = 1,
+    success_only: bool = False,
+    min_num_samples: int | None = None,
+    max_num_samples: int | None = None,
+    deduplicate_seeds: bool = False,
+    compression: str | None = None,
+) -> list[str]:
+    """Merge the episodes of the input files into one or more output files.
 
-args_cli = parser.parse_args()
+    Please refer to :func:`filter_episodes` and :func:`write_dataset` for the description of the arguments.
 
+    Returns:
+        The paths to the output files.
 
-def merge_datasets():
-    for filepath in args_cli.input_files:
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"The dataset file {filepath} does not exist.")
+    Raises:
+        FileNotFoundError: If an input file does not exist.
+        ValueError: If the number of shards or workers is less than one.
+    """
+    for file_path in input_files:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The dataset file {file_path} does not exist.")
+    if num_shards < 1 or num_workers < 1:
+        raise ValueError(f"The number of shards ({num_shards}) and workers ({num_workers}) should be positive.")
 
-    with h5py.File(args_cli.output_file, "w") as output:
-        episode_idx = 0
-        copy_attributes = True
+    env_args, episodes = scan_episodes(input_files)
+    episodes = filter_episodes(episodes, success_only, min_num_samples, max_num_samples, deduplicate_seeds)
 
-        for filepath in args_cli.input_files:
+    # resolve the files written by the workers
+    base, ext = os.path.splitext(output_file)
+    ext = ext if ext else ".hdf5"
+    if num_shards > 1:
+        output_files = [f"{base}_shard_{index}{ext}" for index in range(num_shards)]
+        splits = split_episodes(episodes, num_shards)
+    else:
+        # note: a single output file is written serially, since writing parts of it in parallel and
+        #   concatenating them afterwards would write every episode twice
+        output_files = [f"{base}{ext}"]
+        splits = [episodes]
 
-            with h5py.File(filepath, "r") as input:
-                for episode, data in input["data"].items():
-                    input.copy(f"data/{episode}", output, f"data/demo_{episode_idx}")
-                    episode_idx += 1
+    # write the files
+    if num_workers > 1 and len(output_files) > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(write_dataset, file_path, env_args, split, compression)
+                for file_path, split in zip(output_files, splits)
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for file_path, split in zip(output_files, splits):
+            write_dataset(file_path, env_args, split, compression)
+    return output_files
 
-                if copy_attributes:
-                    output["data"].attrs["env_args"] = input["data"].attrs["env_args"]
-                    copy_attributes = False
 
-    print(f"Merged dataset saved to {args_cli.output_file}")
+def main():
+    """Merge the datasets given by the command line arguments."""
+    args = parse_args()
+    output_files = merge_datasets(
+        args.input_files,
+        args.output_file,
+        num_shards=args.num_shards,
+        num_workers=args.num_workers,
+        success_only=args.success_only,
+        min_num_samples=args.min_num_samples,
+        max_num_samples=args.max_num_samples,
+        deduplicate_seeds=args.deduplicate_seeds,
+        compression=args.compression,
+    )
+    for file_path in output_files:
+        with h5py.File(file_path, "r") as f:
+            num_episodes = len(f["data"])
+            total = f["data"].attrs["total"]
+        print(f"Merged dataset saved to {file_path} ({num_episodes} episodes, {total} samples)")
 
 
 if __name__ == "__main__":
-    merge_datasets()
+    main()
@@ -22,7 +22,12 @@ parser.add_argument(
     default=[],
     help="A list of episode indices to be replayed. Keep empty to replay all in the dataset file.",
 )
-parser.add_argument("--dataset_file", type=str, default="datasets/dataset.hdf5", help="Dataset file to be replayed.")
+parser.add_argument(
+    "--dataset_file",
+    type=str,
+    default="datasets/dataset.hdf5",
+    help="Dataset file to be replayed. Either an HDF5 file or a memory-mapped dataset directory.",
+)
 parser.add_argument(
     "--validate_states",
     action="store_true",
@@ -62,7 +67,7 @@ import os
 import torch
 
 from isaaclab.devices import Se3Keyboard, Se3KeyboardCfg
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler, MemmapDatasetFileHandler
 
 if args_cli.enable_pinocchio:
     import isaaclab_tasks.manager_based.manipulation.pick_place  # noqa: F401
@@ -120,7 +125,11 @@ def main():
     # Load dataset
     if not os.path.exists(args_cli.dataset_file):
         raise FileNotFoundError(f"The dataset file {args_cli.dataset_file} does not exist.")
-    dataset_file_handler = HDF5DatasetFileHandler()
+    # memory-mapped datasets are stored as directories
+    if os.path.isdir(args_cli.dataset_file):
+        dataset_file_handler = MemmapDatasetFileHandler()
+    else:
+        dataset_file_handler = HDF5DatasetFileHandler()
     dataset_file_handler.open(args_cli.dataset_file)
     env_name = dataset_file_handler.get_env_name()
     episode_count = dataset_file_handler.get_num_episodes()
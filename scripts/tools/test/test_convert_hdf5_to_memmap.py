@@ -0,0 +1,66 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the HDF5 to memory-mapped dataset conversion script.
+
+The script is an offline tool, so it is run in a separate process without launching the simulator.
+"""
+
+import h5py
+import json
+import numpy as np
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+from isaaclab.utils.datasets import MemmapDatasetFileHandler
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "convert_hdf5_to_memmap.py")
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory with an HDF5 dataset."""
+    temp_dir = tempfile.TemporaryDirectory()
+    with h5py.File(os.path.join(temp_dir.name, "dataset.hdf5"), "w") as f:
+        data_group = f.create_group("data")
+        data_group.attrs["env_args"] = json.dumps({"env_name": "test_env_name", "type": 2})
+        data_group.attrs["total"] = 9
+        for index, length in enumerate([4, 5]):
+            episode_group = data_group.create_group(f"demo_{index}")
+            episode_group.attrs["num_samples"] = length
+            episode_group.create_dataset("actions", data=np.full((length, 2), index, dtype=np.float32))
+            episode_group.create_dataset("obs/joint_pos", data=np.arange(3 * length, dtype=np.float32).reshape(-1, 3))
+    yield temp_dir.name
+    temp_dir.cleanup()
+
+
+def test_import_without_simulator():
+    """Test that the dataset utilities are imported without the simulator modules."""
+    code = (
+        "import sys; import isaaclab.utils.datasets;"
+        " loaded = [name for name in sys.modules if name.split('.')[0] in ('omni', 'carb', 'isaacsim', 'pxr')];"
+        " assert not loaded, loaded"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_convert(temp_dir):
+    """Test converting a dataset with the script outside the simulator."""
+    input_file = os.path.join(temp_dir, "dataset.hdf5")
+    result = subprocess.run([sys.executable, SCRIPT_PATH, "--input_file", input_file], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+    file_handler = MemmapDatasetFileHandler()
+    file_handler.open(os.path.join(temp_dir, "dataset.memmap"))
+    assert list(file_handler.get_episode_names()) == ["demo_0", "demo_1"]
+    assert file_handler.get_env_name() == "test_env_name"
+    np.testing.assert_array_equal(file_handler.get_episode_offsets("actions"), [0, 4, 9])
+    np.testing.assert_array_equal(file_handler.get_array("actions")[4:], np.ones((5, 2), dtype=np.float32))
+    file_handler.close()
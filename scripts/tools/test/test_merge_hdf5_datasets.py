@@ -0,0 +1,96 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Test cases for the HDF5 dataset merge script."""
+
+import h5py
+import json
+import numpy as np
+import os
+import tempfile
+
+import pytest
+
+from scripts.tools.merge_hdf5_datasets import merge_datasets
+
+
+def create_dataset(file_path: str, seeds: list[int], successes: list[bool], num_samples: list[int]):
+    """Create an HDF5 dataset with dummy episodes."""
+    with h5py.File(file_path, "w") as f:
+        data_group = f.create_group("data")
+        data_group.attrs["env_args"] = json.dumps({"env_name": "test_env_name", "type": 2})
+        data_group.attrs["total"] = sum(num_samples)
+        for index, (seed, success, length) in enumerate(zip(seeds, successes, num_samples)):
+            episode_group = data_group.create_group(f"demo_{index}")
+            episode_group.attrs["seed"] = seed
+            episode_group.attrs["success"] = success
+            episode_group.attrs["num_samples"] = length
+            episode_group.create_dataset(
+                "actions", data=np.full((length, 2), seed, dtype=np.float32), compression="gzip"
+            )
+            episode_group.create_dataset("obs/joint_pos", data=np.zeros((length, 3)), compression="gzip")
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory with two input datasets."""
+    temp_dir = tempfile.TemporaryDirectory()
+    create_dataset(os.path.join(temp_dir.name, "a.hdf5"), [0, 1, 2], [True, False, True], [4, 5, 6])
+    create_dataset(os.path.join(temp_dir.name, "b.hdf5"), [2, 3], [True, True], [7, 8])
+    yield temp_dir.name
+    temp_dir.cleanup()
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+@pytest.mark.parametrize("compression", [None, "lzf"])
+def test_merge(temp_dir, num_workers, compression):
+    """Test merging all episodes into a single file."""
+    input_files = [os.path.join(temp_dir, "a.hdf5"), os.path.join(temp_dir, "b.hdf5")]
+    output_file = os.path.join(temp_dir, "merged.hdf5")
+    output_files = merge_datasets(input_files, output_file, num_workers=num_workers, compression=compression)
+
+    assert output_files == [output_file]
+    with h5py.File(output_file, "r") as f:
+        assert len(f["data"]) == 5
+        assert f["data"].attrs["total"] == 30
+        assert f["data"].attrs["num_success"] == 4
+        assert json.loads(f["data"].attrs["env_args"])["env_name"] == "test_env_name"
+        # check that the episodes keep their order and data
+        assert [int(f[f"data/demo_{index}"].attrs["seed"]) for index in range(5)] == [0, 1, 2, 2, 3]
+        np.testing.assert_array_equal(f["data/demo_4/actions"][()], np.full((8, 2), 3, dtype=np.float32))
+        expected_compression = "gzip" if compression is None else compression
+        assert f["data/demo_4/obs/joint_pos"].compression == expected_compression
+    # check that no other files are written
+    assert sorted(os.listdir(temp_dir)) == ["a.hdf5", "b.hdf5", "merged.hdf5"]
+
+
+def test_merge_filter_and_deduplicate(temp_dir):
+    """Test filtering and deduplicating the episodes."""
+    input_files = [os.path.join(temp_dir, "a.hdf5"), os.path.join(temp_dir, "b.hdf5")]
+    output_file = os.path.join(temp_dir, "merged.hdf5")
+    merge_datasets(input_files, output_file, success_only=True, max_num_samples=7, deduplicate_seeds=True)
+
+    with h5py.File(output_file, "r") as f:
+        assert [int(f[f"data/demo_{index}"].attrs["seed"]) for index in range(len(f["data"]))] == [0, 2]
+        assert f["data"].attrs["total"] == 10
+
+
+def test_merge_shards(temp_dir):
+    """Test splitting the merged episodes into shards."""
+    input_files = [os.path.join(temp_dir, "a.hdf5"), os.path.join(temp_dir, "b.hdf5")]
+    output_file = os.path.join(temp_dir, "merged.hdf5")
+    output_files = merge_datasets(input_files, output_file, num_shards=2, num_workers=2)
+
+    assert output_files == [os.path.join(temp_dir, f"merged_shard_{index}.hdf5") for index in range(2)]
+    totals = []
+    num_episodes = 0
+    for file_path in output_files:
+        with h5py.File(file_path, "r") as f:
+            totals.append(int(f["data"].attrs["total"]))
+            num_episodes += len(f["data"])
+    # check that all episodes are written and the samples are balanced
+    assert num_episodes == 5
+    assert sum(totals) == 30
+    assert abs(totals[0] - totals[1]) <= 8
@@ -33,5 +33,5 @@ from .actuator_cfg import (
     ImplicitActuatorCfg,
     RemotizedPDActuatorCfg,
 )
-from .actuator_net import ActuatorNetLSTM, ActuatorNetMLP
+from .actuator_net import ActuatorNetLSTM, ActuatorNetMLP, ActuatorNetMLPGroup
 from .actuator_pd import DCMotor, DelayedPDActuator, IdealPDActuator, ImplicitActuator, RemotizedPDActuator
@@ -15,7 +15,7 @@ Currently, the following models are supported:
 from __future__ import annotations
 
 import torch
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING
 
 from isaaclab.utils.assets import read_file
@@ -24,6 +24,7 @@ from isaaclab.utils.types import ArticulationActions
 from .actuator_pd import DCMotor
 
 if TYPE_CHECKING:
+    from .actuator_base import ActuatorBase
     from .actuator_cfg import ActuatorNetLSTMCfg, ActuatorNetMLPCfg
 
 
@@ -111,6 +112,10 @@ class ActuatorNetMLP(DCMotor):
     and velocities which are used to provide input to the neural network. The model is loaded
     as a TorchScript.
 
+    The history is stored in a ring buffer, where the latest entry is written at a moving pointer
+    instead of shifting the complete history at every step. The entries selected by
+    :attr:`ActuatorNetMLPCfg.input_idx` are gathered into a persistent input buffer of the network.
+
     Note:
         Only the desired joint positions are used as inputs to the network.
 
@@ -126,12 +131,33 @@ class ActuatorNetMLP(DCMotor):
         file_bytes = read_file(self.cfg.network_file)
         self.network = torch.jit.load(file_bytes, map_location=self._device).eval()
 
-        # create buffers for MLP history
-        history_length = max(self.cfg.input_idx) + 1
-        self._joint_pos_error_history = torch.zeros(
-            self._num_envs, history_length, self.num_joints, device=self._device
-        )
-        self._joint_vel_history = torch.zeros(self._num_envs, history_length, self.num_joints, device=self._device)
+        # resolve the order of the inputs
+        if self.cfg.input_order == "pos_vel":
+            self._pos_channel, self._vel_channel = 0, 1
+        elif self.cfg.input_order == "vel_pos":
+            self._pos_channel, self._vel_channel = 1, 0
+        else:
+            raise ValueError(
+                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
+            )
+
+        # create ring buffer for MLP history
+        # note: the channels (joint position errors and velocities) are ordered as the inputs of the network
+        input_idx = list(self.cfg.input_idx)
+        self._history_length = max(input_idx) + 1
+        self._history = torch.zeros(self._num_envs, self.num_joints, 2, self._history_length, device=self._device)
+        # slot of the latest entry in the ring buffer
+        self._history_pointer = self._history_length - 1
+        # slots of the entries selected by the input indices for each position of the pointer
+        pointers = torch.arange(self._history_length, device=self._device).unsqueeze(1)
+        self._input_slots = (pointers - torch.tensor(input_idx, device=self._device)) % self._history_length
+        # create buffers for network inputs
+        scales = [0.0, 0.0]
+        scales[self._pos_channel], scales[self._vel_channel] = self.cfg.pos_scale, self.cfg.vel_scale
+        self._input_scale = torch.tensor(scales, device=self._device).repeat_interleave(len(input_idx))
+        self.network_input = torch.zeros(self._num_envs * self.num_joints, 2 * len(input_idx), device=self._device)
+        # torques computed by the fused inference of an actuator group (see :class:`ActuatorNetMLPGroup`)
+        self._fused_torques: torch.Tensor | None = None
 
     """
     Operations.
@@ -139,42 +165,19 @@ class ActuatorNetMLP(DCMotor):
 
     def reset(self, env_ids: Sequence[int]):
         # reset the history for the specified environments
-        self._joint_pos_error_history[env_ids] = 0.0
-        self._joint_vel_history[env_ids] = 0.0
+        self._history[env_ids] = 0.0
 
     def compute(
         self, control_action: ArticulationActions, joint_pos: torch.Tensor, joint_vel: torch.Tensor
     ) -> ArticulationActions:
-        # move history queue by 1 and update top of history
-        # -- positions
-        self._joint_pos_error_history = self._joint_pos_error_history.roll(1, 1)
-        self._joint_pos_error_history[:, 0] = control_action.joint_positions - joint_pos
-        # -- velocity
-        self._joint_vel_history = self._joint_vel_history.roll(1, 1)
-        self._joint_vel_history[:, 0] = joint_vel
-        # save current joint vel for dc-motor clipping
-        self._joint_vel[:] = joint_vel
-
-        # compute network inputs
-        # -- positions
-        pos_input = torch.cat([self._joint_pos_error_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        pos_input = pos_input.view(self._num_envs * self.num_joints, -1)
-        # -- velocity
-        vel_input = torch.cat([self._joint_vel_history[:, i].unsqueeze(2) for i in self.cfg.input_idx], dim=2)
-        vel_input = vel_input.view(self._num_envs * self.num_joints, -1)
-        # -- scale and concatenate inputs
-        if self.cfg.input_order == "pos_vel":
-            network_input = torch.cat([pos_input * self.cfg.pos_scale, vel_input * self.cfg.vel_scale], dim=1)
-        elif self.cfg.input_order == "vel_pos":
-            network_input = torch.cat([vel_input * self.cfg.vel_scale, pos_input * self.cfg.pos_scale], dim=1)
+        # run network inference unless the torques were computed by a fused inference
+        if self._fused_torques is None:
+            self.update_network_input(control_action.joint_positions, joint_pos, joint_vel)
+            with torch.inference_mode():
+                torques = self.network(self.network_input)
         else:
-            raise ValueError(
-                f"Invalid input order for MLP actuator net: {self.cfg.input_order}. Must be 'pos_vel' or 'vel_pos'."
-            )
-
-        # run network inference
-        with torch.inference_mode():
-            torques = self.network(network_input).view(self._num_envs, self.num_joints)
+            torques = self._fused_torques
+            self._fused_torques = None
         self.computed_effort = torques.view(self._num_envs, self.num_joints) * self.cfg.torque_scale
 
         # clip the computed effort based on the motor limits
@@ -185,3 +188,86 @@ class ActuatorNetMLP(DCMotor):
         control_action.joint_positions = None
         control_action.joint_velocities = None
         return control_action
+
+    def update_network_input(self, joint_pos_target: torch.Tensor, joint_pos: torch.Tensor, joint_vel: torch.Tensor):
+        """Appends the joint state to the history and gathers the network inputs from it.
+
+        Args:
+            joint_pos_target: The desired joint positions. Shape is (num_envs, num_joints).
+            joint_pos: The current joint positions. Shape is (num_envs, num_joints).
+            joint_vel: The current joint velocities. Shape is (num_envs, num_joints).
+        """
+        # move the pointer by 1 and update top of history
+        self._history_pointer = (self._history_pointer + 1) % self._history_length
+        self._history[:, :, self._pos_channel, self._history_pointer] = joint_pos_target - joint_pos
+        self._history[:, :, self._vel_channel, self._history_pointer] = joint_vel
+        # save current joint vel for dc-motor clipping
+        self._joint_vel[:] = joint_vel
+
+        # gather and scale network inputs
+        torch.index_select(
+            self._history,
+            3,
+            self._input_slots[self._history_pointer],
+            out=self.network_input.view(self._num_envs, self.num_joints, 2, -1),
+        )
+        self.network_input.mul_(self._input_scale)
+
+
+class ActuatorNetMLPGroup:
+    """Fused network inference of MLP actuators that share the same network file.
+
+    The network inputs of the actuators are views into a single input buffer, which is evaluated with a single
+    inference call in :meth:`compute`. The torques are then consumed by the next call to
+    :meth:`ActuatorNetMLP.compute` of each actuator.
+    """
+
+    def __init__(self, actuators: list[ActuatorNetMLP]):
+        """Initialize the group.
+
+        Args:
+            actuators: The actuators of the group. They must share the same network file and number of inputs.
+        """
+        self.actuators = actuators
+        self.network = actuators[0].network
+        # create the shared input buffer and replace the input buffers of the actuators with views into it
+        self._num_rows = [actuator.network_input.shape[0] for actuator in actuators]
+        self.network_input = torch.cat([actuator.network_input for actuator in actuators], dim=0)
+        for actuator, network_input in zip(actuators, self.network_input.split(self._num_rows)):
+            actuator.network_input = network_input
+
+    @classmethod
+    def from_actuators(cls, actuators: Iterable[ActuatorBase]) -> list[ActuatorNetMLPGroup]:
+        """Creates the groups of MLP actuators that share the same network file.
+
+        Args:
+            actuators: The actuators to group. Actuators that are not :class:`ActuatorNetMLP` are ignored.
+
+        Returns:
+            The groups with at least two actuators.
+        """
+        groups: dict[tuple, list[ActuatorNetMLP]] = dict()
+        for actuator in actuators:
+            if isinstance(actuator, ActuatorNetMLP):
+                key = (str(actuator.cfg.network_file), str(actuator._device), actuator.network_input.shape[1])
+                groups.setdefault(key, []).append(actuator)
+        return [cls(group) for group in groups.values() if len(group) > 1]
+
+    def compute(self, joint_pos_target: torch.Tensor, joint_pos: torch.Tensor, joint_vel: torch.Tensor):
+        """Updates the histories of the actuators and computes their torques with a single inference.
+
+        Args:
+            joint_pos_target: The desired positions of all joints of the articulation. Shape is (num_envs, num_joints).
+            joint_pos: The current positions of all joints of the articulation. Shape is (num_envs, num_joints).
+            joint_vel: The current velocities of all joints of the articulation. Shape is (num_envs, num_joints).
+        """
+        for actuator in self.actuators:
+            joint_ids = actuator.joint_indices
+            actuator.update_network_input(
+                joint_pos_target[:, joint_ids], joint_pos[:, joint_ids], joint_vel[:, joint_ids]
+            )
+        # run network inference
+        with torch.inference_mode():
+            torques = self.network(self.network_input)
+        for actuator, actuator_torques in zip(self.actuators, torques.split(self._num_rows)):
+            actuator._fused_torques = actuator_torques
@@ -22,7 +22,7 @@ from pxr import PhysxSchema, UsdPhysics
 import isaaclab.sim as sim_utils
 import isaaclab.utils.math as math_utils
 import isaaclab.utils.string as string_utils
-from isaaclab.actuators import ActuatorBase, ActuatorBaseCfg, ImplicitActuator
+from isaaclab.actuators import ActuatorBase, ActuatorBaseCfg, ActuatorNetMLPGroup, ImplicitActuator
 from isaaclab.utils.types import ArticulationActions
 
 from ..asset_base import AssetBase
@@ -1727,6 +1727,9 @@ class Articulation(AssetBase):
                 self._data.default_joint_dynamic_friction_coeff[:, actuator.joint_indices] = actuator.dynamic_friction
                 self._data.default_joint_viscous_friction_coeff[:, actuator.joint_indices] = actuator.viscous_friction
 
+        # group the actuator networks that share the same network file for a fused inference
+        self._actuator_net_groups = ActuatorNetMLPGroup.from_actuators(self.actuators.values())
+
         # perform some sanity checks to ensure actuators are prepared correctly
         total_act_joints = sum(actuator.num_joints for actuator in self.actuators.values())
         if total_act_joints != (self.num_joints - self.num_fixed_tendons):
@@ -1809,6 +1812,9 @@ class Articulation(AssetBase):
         The actions are first processed using actuator models. Depending on the robot configuration,
         the actuator models compute the joint level simulation commands and sets them into the PhysX buffers.
         """
+        # run the fused inference of the actuator networks shared by multiple groups
+        for actuator_net_group in self._actuator_net_groups:
+            actuator_net_group.compute(self._data.joint_pos_target, self._data.joint_pos, self._data.joint_vel)
         # process actions per group
         for actuator in self.actuators.values():
             # prepare input for actuator model based on cached data
@@ -36,6 +36,9 @@ class DifferentialIKController:
     - "trans": Transpose of matrix
     - "dls": Damped version of Moore-Penrose pseudo-inverse (also called Levenberg-Marquardt)
 
+    The damped least-squares system is solved with a batched Cholesky factorization instead of an explicit
+    inverse. For small Jacobians, it can also be solved with a fused warp kernel by setting
+    :attr:`DifferentialIKControllerCfg.dls_solver` to ``"warp"``.
 
     .. caution::
         The controller does not assume anything about the frames of the current and desired end-effector pose,
@@ -68,6 +71,16 @@ class DifferentialIKController:
         self.ee_quat_des = torch.zeros(self.num_envs, 4, device=self._device)
         # -- input command
         self._command = torch.zeros(self.num_envs, self.action_dim, device=self._device)
+        # -- damping matrix of the damped least-squares method (created on first use)
+        self._lambda_matrix: torch.Tensor | None = None
+        self._lambda_val: float | None = None
+        # solvers for the different inverse-kinematics methods
+        self._ik_solvers = {
+            "pinv": self._solve_pinv,
+            "svd": self._solve_svd,
+            "trans": self._solve_trans,
+            "dls": self._solve_dls,
+        }
 
     """
     Properties.
@@ -189,52 +202,89 @@ class DifferentialIKController:
             jacobian: The geometric jacobian matrix in shape (N, 3, num_joints) or (N, 6, num_joints).
 
         Returns:
-            The desired delta in joint space. Shape is (N, num-jointsß).
+            The desired delta in joint space. Shape is (N, num-joints).
         """
         if self.cfg.ik_params is None:
             raise RuntimeError(f"Inverse-kinematics parameters for method '{self.cfg.ik_method}' is not defined!")
         # compute the delta in joint-space
-        if self.cfg.ik_method == "pinv":  # Jacobian pseudo-inverse
-            # parameters
-            k_val = self.cfg.ik_params["k_val"]
-            # computation
-            jacobian_pinv = torch.linalg.pinv(jacobian)
-            delta_joint_pos = k_val * jacobian_pinv @ delta_pose.unsqueeze(-1)
-            delta_joint_pos = delta_joint_pos.squeeze(-1)
-        elif self.cfg.ik_method == "svd":  # adaptive SVD
-            # parameters
-            k_val = self.cfg.ik_params["k_val"]
-            min_singular_value = self.cfg.ik_params["min_singular_value"]
-            # computation
-            # U: 6xd, S: dxd, V: d x num-joint
-            U, S, Vh = torch.linalg.svd(jacobian)
-            S_inv = 1.0 / S
-            S_inv = torch.where(S > min_singular_value, S_inv, torch.zeros_like(S_inv))
-            jacobian_pinv = (
-                torch.transpose(Vh, dim0=1, dim1=2)[:, :, :6]
-                @ torch.diag_embed(S_inv)
-                @ torch.transpose(U, dim0=1, dim1=2)
-            )
-            delta_joint_pos = k_val * jacobian_pinv @ delta_pose.unsqueeze(-1)
-            delta_joint_pos = delta_joint_pos.squeeze(-1)
-        elif self.cfg.ik_method == "trans":  # Jacobian transpose
-            # parameters
-            k_val = self.cfg.ik_params["k_val"]
-            # computation
-            jacobian_T = torch.transpose(jacobian, dim0=1, dim1=2)
-            delta_joint_pos = k_val * jacobian_T @ delta_pose.unsqueeze(-1)
-            delta_joint_pos = delta_joint_pos.squeeze(-1)
-        elif self.cfg.ik_method == "dls":  # damped least squares
-            # parameters
-            lambda_val = self.cfg.ik_params["lambda_val"]
-            # computation
-            jacobian_T = torch.transpose(jacobian, dim0=1, dim1=2)
-            lambda_matrix = (lambda_val**2) * torch.eye(n=jacobian.shape[1], device=self._device)
-            delta_joint_pos = (
-                jacobian_T @ torch.inverse(jacobian @ jacobian_T + lambda_matrix) @ delta_pose.unsqueeze(-1)
-            )
-            delta_joint_pos = delta_joint_pos.squeeze(-1)
-        else:
+        solver = self._ik_solvers.get(self.cfg.ik_method)
+        if solver is None:
             raise ValueError(f"Unsupported inverse-kinematics method: {self.cfg.ik_method}")
-
+        return solver(delta_pose, jacobian)
+
+    def _solve_pinv(self, delta_pose: torch.Tensor, jacobian: torch.Tensor) -> torch.Tensor:
+        """Computes the change in joint position with the Moore-Penrose pseudo-inverse of the Jacobian."""
+        # parameters
+        k_val = self.cfg.ik_params["k_val"]
+        # computation
+        jacobian_pinv = torch.linalg.pinv(jacobian)
+        delta_joint_pos = k_val * jacobian_pinv @ delta_pose.unsqueeze(-1)
+        return delta_joint_pos.squeeze(-1)
+
+    def _solve_svd(self, delta_pose: torch.Tensor, jacobian: torch.Tensor) -> torch.Tensor:
+        """Computes the change in joint position with the adaptive SVD of the Jacobian.
+
+        Singular values below the minimum singular value are suppressed. Only the reduced SVD is computed,
+        which supports Jacobians with any number of rows.
+        """
+        # parameters
+        k_val = self.cfg.ik_params["k_val"]
+        min_singular_value = self.cfg.ik_params["min_singular_value"]
+        # computation
+        # U: M x K, S: K, Vh: K x num-joints, where K = min(M, num-joints)
+        U, S, Vh = torch.linalg.svd(jacobian, full_matrices=False)
+        S_inv = torch.where(S > min_singular_value, 1.0 / S, torch.zeros_like(S))
+        # apply the pseudo-inverse from right to left to avoid forming it
+        delta_singular = S_inv * (torch.transpose(U, dim0=1, dim1=2) @ delta_pose.unsqueeze(-1)).squeeze(-1)
+        delta_joint_pos = torch.transpose(Vh, dim0=1, dim1=2) @ delta_singular.unsqueeze(-1)
+        return k_val * delta_joint_pos.squeeze(-1)
+
+    def _solve_trans(self, delta_pose: torch.Tensor, jacobian: torch.Tensor) -> torch.Tensor:
+        """Computes the change in joint position with the transpose of the Jacobian."""
+        # parameters
+        k_val = self.cfg.ik_params["k_val"]
+        # computation
+        jacobian_T = torch.transpose(jacobian, dim0=1, dim1=2)
+        delta_joint_pos = k_val * jacobian_T @ delta_pose.unsqueeze(-1)
+        return delta_joint_pos.squeeze(-1)
+
+    def _solve_dls(self, delta_pose: torch.Tensor, jacobian: torch.Tensor) -> torch.Tensor:
+        r"""Computes the change in joint position with the damped least-squares method.
+
+        The system :math:`(\mathbf{J} \mathbf{J}^T + \lambda^2 \mathbf{I}) \mathbf{y} = \Delta \mathbf{x}` is
+        solved with a Cholesky factorization and the change in joint position is :math:`\mathbf{J}^T \mathbf{y}`.
+        For the environments where the system cannot be factorized (which can only happen for a zero damping
+        coefficient), the change in joint position is zero.
+        """
+        # parameters
+        lambda_val = self.cfg.ik_params["lambda_val"]
+        # computation with the fused warp kernel
+        if self.cfg.dls_solver == "warp":
+            # lazy import to only initialize warp if needed
+            from isaaclab.utils.warp import solve_dls_ik
+
+            return solve_dls_ik(jacobian, delta_pose, lambda_val).to(delta_pose.dtype)
+        # computation with the batched cholesky factorization
+        jacobian_T = torch.transpose(jacobian, dim0=1, dim1=2)
+        L, info = torch.linalg.cholesky_ex(jacobian @ jacobian_T + self._get_lambda_matrix(jacobian.shape[1]))
+        delta_joint_pos = (jacobian_T @ torch.cholesky_solve(delta_pose.unsqueeze(-1), L)).squeeze(-1)
+        delta_joint_pos[info != 0] = 0.0
         return delta_joint_pos
+
+    def _get_lambda_matrix(self, num_rows: int) -> torch.Tensor:
+        """Returns the damping matrix of the damped least-squares method.
+
+        The matrix is cached and only re-created if the number of rows of the Jacobian or the damping
+        coefficient changes.
+
+        Args:
+            num_rows: The number of rows of the Jacobian.
+
+        Returns:
+            The damping matrix. Shape is (num_rows, num_rows).
+        """
+        lambda_val = self.cfg.ik_params["lambda_val"]
+        if self._lambda_matrix is None or self._lambda_matrix.shape[0] != num_rows or self._lambda_val != lambda_val:
+            self._lambda_matrix = (lambda_val**2) * torch.eye(n=num_rows, device=self._device)
+            self._lambda_val = lambda_val
+        return self._lambda_matrix
@@ -50,12 +50,22 @@ class DifferentialIKControllerCfg:
         - "lambda_val": Damping coefficient (default: 0.01).
     """
 
+    dls_solver: Literal["cholesky", "warp"] = "cholesky"
+    """Solver for the linear system of the damped least-squares method ("dls"). Defaults to "cholesky".
+
+    - "cholesky": Batched Cholesky factorization in torch.
+    - "warp": Fused warp kernel with one thread per environment. It is faster for small Jacobians (at most
+      6 rows), for instance, of robot arms with many environments. The computations are done in single precision.
+    """
+
     def __post_init__(self):
         # check valid input
         if self.command_type not in ["position", "pose"]:
             raise ValueError(f"Unsupported inverse-kinematics command: {self.command_type}.")
         if self.ik_method not in ["pinv", "svd", "trans", "dls"]:
             raise ValueError(f"Unsupported inverse-kinematics method: {self.ik_method}.")
+        if self.dls_solver not in ["cholesky", "warp"]:
+            raise ValueError(f"Unsupported damped least-squares solver: {self.dls_solver}.")
         # default parameters for different inverse kinematics approaches.
         default_ik_params = {
             "pinv": {"k_val": 1.0},
@@ -23,6 +23,11 @@ if TYPE_CHECKING:
 class OperationalSpaceController:
     """Operational-space controller.
 
+    The inverses of the joint-space and operational-space mass matrices are never formed explicitly. Instead, the
+    controller solves the linear systems with batched Cholesky factorizations and reuses them between the
+    task-space and null-space terms. The factorization of the joint-space mass matrix can additionally be reused
+    over multiple calls with :attr:`OperationalSpaceControllerCfg.mass_matrix_update_period`.
+
     Reference:
 
     1. `A unified approach for motion and force control of robot manipulators: The operational space formulation <http://dx.doi.org/10.1109/JRA.1987.1087068>`_
@@ -41,6 +46,7 @@ class OperationalSpaceController:
 
         Raises:
             ValueError: When invalid control command is provided.
+            ValueError: When the mass matrix update period is smaller than 1.
         """
         # store inputs
         self.cfg = cfg
@@ -59,6 +65,8 @@ class OperationalSpaceController:
             else:
                 raise ValueError(f"Invalid control command: {command_type}.")
         self.target_dim = sum(self.target_list)
+        if self.cfg.mass_matrix_update_period < 1:
+            raise ValueError(f"Invalid mass matrix update period: {self.cfg.mass_matrix_update_period}.")
 
         # create buffers
         # -- selection matrices, which might be defined in the task reference frame different from the root frame
@@ -82,10 +90,10 @@ class OperationalSpaceController:
         self.desired_ee_pose_b = None
         self.desired_ee_wrench_task = None
         self.desired_ee_wrench_b = None
-        # -- buffer for operational space mass matrix
-        self._os_mass_matrix_b = torch.zeros(self.num_envs, 6, 6, device=self._device)
-        # -- Placeholder for the inverse of joint space mass matrix
-        self._mass_matrix_inv = None
+        # -- Placeholder for the Cholesky factor of the joint space mass matrix
+        self._mass_matrix_chol = None
+        # -- number of calls to compute() since the last factorization of the joint space mass matrix
+        self._num_mass_matrix_chol_reuses = 0
         # -- motion control gains
         self._motion_p_gains_task = torch.diag_embed(
             torch.ones(self.num_envs, 6, device=self._device)
@@ -169,6 +177,8 @@ class OperationalSpaceController:
         self.desired_ee_pose_task = None
         self.desired_ee_wrench_b = None
         self.desired_ee_wrench_task = None
+        # force a new factorization of the mass matrix at the next call
+        self._mass_matrix_chol = None
 
     def set_command(
         self,
@@ -383,8 +393,8 @@ class OperationalSpaceController:
             ValueError: When closed-loop force control is enabled but the current end-effector force is not provided.
             ValueError: When gravity compensation is enabled but the gravity vector is not provided.
             ValueError: When null-space control is enabled but the system is not redundant.
-            ValueError: When dynamically consistent pseudo-inverse is enabled but the mass matrix inverse is not
-                provided.
+            ValueError: When dynamically consistent pseudo-inverse is enabled but the mass matrix is not provided
+                or motion control is disabled.
             ValueError: When null-space control is enabled but the current joint positions and velocities are not
                 provided.
             ValueError: When target joint positions are provided for null-space control but their dimensions do not
@@ -399,6 +409,8 @@ class OperationalSpaceController:
         num_DoF = jacobian_b.shape[2]
         # create joint effort vector
         joint_efforts = torch.zeros(self.num_envs, num_DoF, device=self._device)
+        # transpose of the pseudo-inverse of the Jacobian for null-space control
+        jacobian_pinv_transpose = None
 
         # compute joint efforts for motion-control
         if self.desired_ee_pose_b is not None:
@@ -426,22 +438,36 @@ class OperationalSpaceController:
                 # check input is provided
                 if mass_matrix is None:
                     raise ValueError("Mass matrix is required for inertial decoupling.")
-                # Compute operational space mass matrix
-                self._mass_matrix_inv = torch.inverse(mass_matrix)
+                # Compute M^(-1) J^T with the Cholesky factorization of the joint space mass matrix
+                mass_matrix_inv_jacobian_T = torch.cholesky_solve(
+                    jacobian_b.mT, self._factorize_mass_matrix(mass_matrix)
+                )
+                # (Generalized) operational space command forces
+                # F = (J M^(-1) J^T)^(-1) * \ddot(x_des) = M_task * \ddot(x_des)
                 if self.cfg.partial_inertial_dynamics_decoupling:
-                    # Fill in the translational and rotational parts of the inertia separately, ignoring their coupling
-                    self._os_mass_matrix_b[:, 0:3, 0:3] = torch.inverse(
-                        jacobian_b[:, 0:3] @ self._mass_matrix_inv @ jacobian_b[:, 0:3].mT
-                    )
-                    self._os_mass_matrix_b[:, 3:6, 3:6] = torch.inverse(
-                        jacobian_b[:, 3:6] @ self._mass_matrix_inv @ jacobian_b[:, 3:6].mT
+                    # Solve for the translational and rotational parts of the inertia separately, ignoring their coupling
+                    os_command_forces_b = torch.cat(
+                        (
+                            self._solve_spd(
+                                jacobian_b[:, 0:3] @ mass_matrix_inv_jacobian_T[..., 0:3], des_ee_acc_b[:, 0:3]
+                            ),
+                            self._solve_spd(
+                                jacobian_b[:, 3:6] @ mass_matrix_inv_jacobian_T[..., 3:6], des_ee_acc_b[:, 3:6]
+                            ),
+                        ),
+                        dim=1,
                     )
                 else:
-                    # Calculate the operational space mass matrix fully accounting for the couplings
-                    self._os_mass_matrix_b[:] = torch.inverse(jacobian_b @ self._mass_matrix_inv @ jacobian_b.mT)
-                # (Generalized) operational space command forces
-                # F = (J M^(-1) J^T)^(-1) * \ddot(x_des) = M_task * \ddot(x_des)
-                os_command_forces_b = self._os_mass_matrix_b @ des_ee_acc_b
+                    # Solve with the operational space mass matrix fully accounting for the couplings
+                    # note: the dynamically consistent pseudo-inverse M_task J M^(-1) of the null-space control is
+                    #   solved with the same factorization as the command forces
+                    rhs = des_ee_acc_b
+                    if self.cfg.nullspace_control != "none":
+                        rhs = torch.cat((des_ee_acc_b, mass_matrix_inv_jacobian_T.mT), dim=-1)
+                    solution = self._solve_spd(jacobian_b @ mass_matrix_inv_jacobian_T, rhs)
+                    os_command_forces_b = solution[..., :1]
+                    if self.cfg.nullspace_control != "none":
+                        jacobian_pinv_transpose = solution[..., 1:]
             else:
                 # Task-space impedance control: command forces = \ddot(x_des).
                 # Please note that the definition of task-space impedance control varies in literature.
@@ -495,12 +521,15 @@ class OperationalSpaceController:
             # Calculate the pseudo-inverse of the Jacobian
             if self.cfg.inertial_dynamics_decoupling and not self.cfg.partial_inertial_dynamics_decoupling:
                 # Dynamically consistent pseudo-inverse allows decoupling of null space and task space
-                if self._mass_matrix_inv is None or mass_matrix is None:
-                    raise ValueError("Mass matrix inverse is required for dynamically consistent pseudo-inverse")
-                jacobian_pinv_transpose = self._os_mass_matrix_b @ jacobian_b @ self._mass_matrix_inv
+                # note: it is computed together with the operational space command forces
+                if jacobian_pinv_transpose is None or mass_matrix is None:
+                    raise ValueError(
+                        "Mass matrix and motion control are required for dynamically consistent pseudo-inverse."
+                    )
             else:
                 # Moore-Penrose pseudo-inverse if full inertia matrix is not available (e.g., no/partial decoupling)
-                jacobian_pinv_transpose = torch.pinverse(jacobian_b).mT
+                # J^+^T = (J J^T)^(-1) J for Jacobians with full row rank
+                jacobian_pinv_transpose = self._solve_spd(jacobian_b @ jacobian_b.mT, jacobian_b)
 
             # Calculate the null-space projector
             nullspace_jacobian_transpose = (
@@ -546,3 +575,52 @@ class OperationalSpaceController:
                 raise ValueError(f"Invalid null-space control method: {self.cfg.nullspace_control}.")
 
         return joint_efforts
+
+    """
+    Helper functions.
+    """
+
+    def _factorize_mass_matrix(self, mass_matrix: torch.Tensor) -> torch.Tensor:
+        """Computes the Cholesky factor of the joint-space mass matrix.
+
+        The factor is cached and only re-computed every :attr:`OperationalSpaceControllerCfg.mass_matrix_update_period`
+        calls, after a reset, or when the number of DoFs changes.
+
+        Args:
+            mass_matrix: The joint-space mass matrix. Shape is (``num_envs``, ``num_DoF``, ``num_DoF``).
+
+        Returns:
+            The lower-triangular Cholesky factor. Shape is (``num_envs``, ``num_DoF``, ``num_DoF``).
+        """
+        if (
+            self._mass_matrix_chol is None
+            or self._mass_matrix_chol.shape != mass_matrix.shape
+            or self._num_mass_matrix_chol_reuses >= self.cfg.mass_matrix_update_period - 1
+        ):
+            # note: the mass matrix is symmetric positive-definite
+            self._mass_matrix_chol = torch.linalg.cholesky_ex(mass_matrix)[0]
+            self._num_mass_matrix_chol_reuses = 0
+        else:
+            self._num_mass_matrix_chol_reuses += 1
+        return self._mass_matrix_chol
+
+    def _solve_spd(self, matrix: torch.Tensor, rhs: torch.Tensor) -> torch.Tensor:
+        """Solves batched linear systems with symmetric positive semi-definite matrices.
+
+        The systems are solved with a Cholesky factorization. For the singular systems, for instance, of Jacobians
+        at kinematic singularities, the pseudo-inverse of the matrix is used instead.
+
+        Args:
+            matrix: The matrices of the systems. Shape is (``num_envs``, M, M).
+            rhs: The right-hand sides of the systems. Shape is (``num_envs``, M, K).
+
+        Returns:
+            The solutions of the systems. Shape is (``num_envs``, M, K).
+        """
+        L, info = torch.linalg.cholesky_ex(matrix)
+        solution = torch.cholesky_solve(rhs, L)
+        # fall back to the pseudo-inverse for the singular systems
+        failed = info != 0
+        if failed.any():
+            solution[failed] = torch.linalg.pinv(matrix[failed], hermitian=True) @ rhs[failed]
+        return solution
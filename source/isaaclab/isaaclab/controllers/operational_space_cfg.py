@@ -38,6 +38,18 @@ class OperationalSpaceControllerCfg:
     partial_inertial_dynamics_decoupling: bool = False
     """Whether to ignore the inertial coupling between the translational & rotational motions."""
 
+    mass_matrix_update_period: int = 1
+    """The number of calls to :meth:`OperationalSpaceController.compute` over which the factorization of the
+    joint-space mass matrix is reused. Defaults to 1, in which case the mass matrix is factorized at every call.
+
+    The mass matrix changes slowly with the joint positions. When the controller runs at every physics step of a
+    decimated environment, setting this to the decimation refreshes the factorization once per environment step.
+    The factorization is also refreshed on :meth:`OperationalSpaceController.reset`. The Jacobian is always
+    taken from the current call.
+
+    Note: Used only when :obj:`inertial_dynamics_decoupling` is True.
+    """
+
     gravity_compensation: bool = False
     """Whether to perform gravity compensation."""
 
@@ -8,6 +8,8 @@
 This package provides integration between Pink inverse kinematics solver and IsaacLab.
 """
 
+from .batched_dls_ik import BatchedDLSIKController
+from .batched_pink_ik import BatchedPinkIKController
 from .null_space_posture_task import NullSpacePostureTask
 from .pink_ik import PinkIKController
 from .pink_ik_cfg import PinkIKControllerCfg
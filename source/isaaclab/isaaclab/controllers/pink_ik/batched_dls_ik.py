@@ -0,0 +1,254 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Batched damped least-squares IK for the tasks of the Pink IK controller.
+
+This module solves the frame, posture and damping tasks of a :class:`PinkIKControllerCfg` for all environments
+at once with batched linear algebra in torch. It does not need the robot model of Pinocchio, since the poses and
+Jacobians of the frames are given by the simulation.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+from typing import TYPE_CHECKING
+
+from pink.tasks import DampingTask, FrameTask
+
+from isaaclab.utils.math import compute_pose_error
+
+from .null_space_posture_task import NullSpacePostureTask
+
+if TYPE_CHECKING:
+    from .pink_ik_cfg import PinkIKControllerCfg
+
+
+class BatchedDLSIKController:
+    r"""Batched damped least-squares (DLS) IK controller for the tasks of the Pink IK controller.
+
+    The controller minimizes the same weighted sum of task residuals as the quadratic program of Pink, but
+    without inequality constraints. This reduces each step to the normal equations
+
+    .. math::
+
+        \left( \sum_i \mathbf{J}_i^T \mathbf{W}_i^2 \mathbf{J}_i + \mu_i \| \mathbf{W}_i \mathbf{e}_i \|^2 \mathbf{I}
+        \right) \Delta \mathbf{q} = \sum_i \alpha_i \mathbf{J}_i^T \mathbf{W}_i^2 \mathbf{e}_i
+
+    where :math:`\mathbf{J}_i`, :math:`\mathbf{e}_i`, :math:`\mathbf{W}_i`, :math:`\alpha_i` and :math:`\mu_i` are
+    the Jacobian, error, cost, gain and Levenberg-Marquardt damping of the i-th task. The system is symmetric
+    positive-definite and is solved for all environments with a batched Cholesky factorization. The joint
+    position limits are enforced by clamping the target joint positions.
+
+    The following tasks are supported:
+
+    - :class:`pink.tasks.FrameTask`: The pose of a frame. The pose error is computed with
+      :func:`~isaaclab.utils.math.compute_pose_error` in the frame of the given poses and Jacobians.
+    - :class:`NullSpacePostureTask`: The posture of the controlled joints, projected into the null space of the
+      Jacobians of the controlled frames.
+    - :class:`pink.tasks.DampingTask`: A penalty on the change of the joint positions.
+
+    Note:
+        Pink weighs the errors of frame tasks in the local frame of the frame. This controller weighs them in the
+        frame of the given poses. Both are the same if the position and orientation costs are the same along
+        all axes, which is the case for the tasks created with scalar costs.
+    """
+
+    def __init__(self, cfg: PinkIKControllerCfg, num_envs: int, device: str):
+        """Initialize the controller.
+
+        Args:
+            cfg: The configuration of the Pink IK controller. The joint names must be set.
+            num_envs: The number of environments.
+            device: The device to use for computations.
+
+        Raises:
+            ValueError: If the joint names are not set, or if a task is not supported.
+        """
+        if cfg.joint_names is None:
+            raise ValueError("The joint names of the Pink IK controller configuration must be set.")
+        self.cfg = cfg
+        self.num_envs = num_envs
+        self._device = device
+        num_joints = len(cfg.joint_names)
+
+        # parse the tasks
+        frame_tasks: list[FrameTask] = []
+        self._posture_task: NullSpacePostureTask | None = None
+        self._damping = 1e-6
+        for task in cfg.variable_input_tasks + cfg.fixed_input_tasks:
+            if isinstance(task, FrameTask):
+                frame_tasks.append(task)
+            elif isinstance(task, NullSpacePostureTask):
+                if self._posture_task is not None:
+                    raise ValueError("The batched DLS IK controller supports at most one NullSpacePostureTask.")
+                self._posture_task = task
+            elif isinstance(task, DampingTask):
+                self._damping += float(np.max(task.cost)) ** 2
+            else:
+                raise ValueError(f"Unsupported task for the batched DLS IK controller: {task}.")
+        self.num_frame_tasks = len(frame_tasks)
+
+        # names of the frames whose poses and jacobians are needed
+        # note: the frame tasks come first, followed by the other frames of the null-space projection
+        self.frame_names = [task.frame for task in frame_tasks]
+        if self._posture_task is not None:
+            for frame_name in self._posture_task.controlled_frames:
+                if frame_name not in self.frame_names:
+                    self.frame_names.append(frame_name)
+
+        # weights of the frame tasks
+        self._frame_costs = torch.tensor(np.array([task.cost for task in frame_tasks]), device=device).view(-1, 6)
+        self._frame_costs = self._frame_costs.float()
+        self._frame_gains = torch.tensor([task.gain for task in frame_tasks], device=device)
+        self._frame_lm_damping = torch.tensor([task.lm_damping for task in frame_tasks], device=device)
+        # weights of the posture task
+        if self._posture_task is not None:
+            self._posture_frame_ids = [
+                self.frame_names.index(frame_name) for frame_name in self._posture_task.controlled_frames
+            ]
+            self._posture_joint_mask = torch.tensor(
+                [name in self._posture_task.controlled_joints for name in cfg.joint_names], device=device
+            ).float()
+
+        # targets of the tasks
+        self.frame_target_pos = torch.zeros(num_envs, self.num_frame_tasks, 3, device=device)
+        self.frame_target_quat = torch.zeros(num_envs, self.num_frame_tasks, 4, device=device)
+        self.frame_target_quat[..., 0] = 1.0
+        self.posture_target = torch.zeros(num_envs, num_joints, device=device)
+        self.joint_pos_limits: torch.Tensor | None = None
+        # buffer for the identity matrix of the joint space
+        self._eye = torch.eye(num_joints, device=device)
+
+    """
+    Operations.
+    """
+
+    def set_frame_targets(self, pos: torch.Tensor, quat: torch.Tensor, env_ids: torch.Tensor | None = None):
+        """Set the target poses of the frame tasks.
+
+        Args:
+            pos: The target positions. Shape is (len(env_ids), F, 3), where F is the number of frame tasks
+                to set. The frame tasks are ordered as in the variable input tasks, followed by the fixed
+                input tasks.
+            quat: The target orientations (w, x, y, z). Shape is (len(env_ids), F, 4).
+            env_ids: The environment indices. Defaults to None, in which case all environments are set.
+        """
+        if env_ids is None:
+            env_ids = slice(None)
+        num_frames = pos.shape[1]
+        self.frame_target_pos[env_ids, :num_frames] = pos
+        self.frame_target_quat[env_ids, :num_frames] = quat
+
+    def set_posture_target(self, joint_pos: torch.Tensor, env_ids: torch.Tensor | None = None):
+        """Set the target joint positions of the null-space posture task.
+
+        Args:
+            joint_pos: The target joint positions. Shape is (len(env_ids), num_joints).
+            env_ids: The environment indices. Defaults to None, in which case all environments are set.
+        """
+        if env_ids is None:
+            env_ids = slice(None)
+        self.posture_target[env_ids] = joint_pos
+
+    def set_joint_pos_limits(self, limits: torch.Tensor | None):
+        """Set the joint position limits used to clamp the target joint positions.
+
+        Args:
+            limits: The lower and upper joint position limits. Shape is (num_envs, num_joints, 2). If None,
+                the target joint positions are not clamped.
+        """
+        self.joint_pos_limits = limits
+
+    def compute(
+        self, frame_pos: torch.Tensor, frame_quat: torch.Tensor, jacobians: torch.Tensor, joint_pos: torch.Tensor
+    ) -> torch.Tensor:
+        """Computes the target joint positions that reduce the errors of the tasks.
+
+        The poses and Jacobians of the frames must be given in the same frame as the targets of the frame tasks.
+
+        Args:
+            frame_pos: The current positions of the frames in :attr:`frame_names`. Shape is (N, K, 3), where N is
+                the number of environments and K is the number of frames.
+            frame_quat: The current orientations (w, x, y, z) of the frames. Shape is (N, K, 4).
+            jacobians: The Jacobians of the frames with respect to the joints. Shape is (N, K, 6, num_joints).
+            joint_pos: The current joint positions. Shape is (N, num_joints).
+
+        Returns:
+            The target joint positions. Shape is (N, num_joints). For the environments where the system cannot
+            be factorized, the current joint positions are returned.
+        """
+        num_envs = joint_pos.shape[0]
+        # system of the damping tasks
+        hessian = self._damping * self._eye.repeat(num_envs, 1, 1)
+        gradient = torch.zeros_like(joint_pos)
+        # add the frame tasks
+        if self.num_frame_tasks > 0:
+            F = self.num_frame_tasks
+            pos_error, rot_error = compute_pose_error(
+                frame_pos[:, :F].reshape(-1, 3),
+                frame_quat[:, :F].reshape(-1, 4),
+                self.frame_target_pos.reshape(-1, 3),
+                self.frame_target_quat.reshape(-1, 4),
+                rot_error_type="axis_angle",
+            )
+            error = torch.cat((pos_error, rot_error), dim=-1).view(num_envs, F, 6)
+            # weighted jacobians and errors of the tasks: (N, F, 6, J) and (N, F, 6)
+            weighted_jacobian = self._frame_costs[None, :, :, None] * jacobians[:, :F]
+            weighted_error = self._frame_costs * error
+            hessian += torch.einsum("nfij,nfik->njk", weighted_jacobian, weighted_jacobian)
+            gradient += torch.einsum(
+                "nfij,nfi->nj", weighted_jacobian, self._frame_gains[None, :, None] * weighted_error
+            )
+            # Levenberg-Marquardt damping: mu * ||W e||^2
+            lm_damping = (self._frame_lm_damping * weighted_error.square().sum(dim=-1)).sum(dim=-1)
+            hessian += lm_damping[:, None, None] * self._eye
+        # add the null-space posture task
+        if self._posture_task is not None:
+            cost = float(np.max(self._posture_task.cost))
+            error = self._posture_joint_mask * (self.posture_target - joint_pos)
+            projector = self._compute_null_space_projector(jacobians[:, self._posture_frame_ids])
+            weighted_projector = cost * projector
+            weighted_error = cost * error
+            hessian += weighted_projector.transpose(1, 2) @ weighted_projector
+            gradient += torch.einsum("nij,ni->nj", weighted_projector, self._posture_task.gain * weighted_error)
+            lm_damping = self._posture_task.lm_damping * weighted_error.square().sum(dim=-1)
+            hessian += lm_damping[:, None, None] * self._eye
+
+        # solve the system with a batched Cholesky factorization
+        L, info = torch.linalg.cholesky_ex(hessian)
+        delta_joint_pos = torch.cholesky_solve(gradient.unsqueeze(-1), L)[..., 0]
+        delta_joint_pos[info != 0] = 0.0
+        joint_pos_des = joint_pos + delta_joint_pos
+        # clamp the target joint positions to the limits
+        if self.joint_pos_limits is not None:
+            joint_pos_des = torch.clamp(joint_pos_des, self.joint_pos_limits[..., 0], self.joint_pos_limits[..., 1])
+        return joint_pos_des
+
+    """
+    Helper functions.
+    """
+
+    def _compute_null_space_projector(self, jacobians: torch.Tensor) -> torch.Tensor:
+        r"""Computes the projector into the null space of the stacked Jacobians.
+
+        The projector is :math:`\mathbf{I} - \mathbf{J}^T (\mathbf{J} \mathbf{J}^T + \epsilon \mathbf{I})^{-1}
+        \mathbf{J}`, which approximates :math:`\mathbf{I} - \mathbf{J}^+ \mathbf{J}` with a small damping
+        :math:`\epsilon` for singular configurations.
+
+        Args:
+            jacobians: The Jacobians of the controlled frames. Shape is (N, C, 6, num_joints).
+
+        Returns:
+            The null-space projector. Shape is (N, num_joints, num_joints).
+        """
+        if jacobians.shape[1] == 0:
+            return self._eye.repeat(jacobians.shape[0], 1, 1)
+        jacobian = jacobians.flatten(1, 2)
+        jacobian_T = jacobian.transpose(1, 2)
+        eye = torch.eye(jacobian.shape[1], device=self._device)
+        # note: failed factorizations propagate NaNs, which are caught by the factorization in compute()
+        L, _ = torch.linalg.cholesky_ex(jacobian @ jacobian_T + 1e-6 * eye)
+        return self._eye - jacobian_T @ torch.cholesky_solve(jacobian, L)
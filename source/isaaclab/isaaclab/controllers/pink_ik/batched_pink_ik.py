@@ -0,0 +1,139 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Batched Pink IK controller for multiple environments.
+
+This module solves the Pink IK problems of multiple environments with one host transfer of the inputs and
+outputs per step. The quadratic programs of the environments are distributed over a persistent thread pool.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import os
+import torch
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from pink.tasks import FrameTask
+
+from isaaclab.assets import ArticulationCfg
+
+from .pink_ik import PinkIKController
+
+if TYPE_CHECKING:
+    from .pink_ik_cfg import PinkIKControllerCfg
+
+
+class BatchedPinkIKController:
+    """Pink IK controller for a batch of environments.
+
+    Each environment has its own :class:`PinkIKController`, which holds the robot model, the tasks and the
+    warm-start of the quadratic solver. The environments are split into contiguous shards, which are solved
+    in parallel by a persistent thread pool (see :attr:`PinkIKControllerCfg.num_workers`).
+
+    The targets of the frame tasks and the joint positions are copied to the host once for all environments,
+    and the target joint positions are copied back to the device as a single stacked tensor.
+    """
+
+    def __init__(self, cfg: PinkIKControllerCfg, robot_cfg: ArticulationCfg, num_envs: int, device: str):
+        """Initialize the batched Pink IK controller.
+
+        Args:
+            cfg: The configuration for the Pink IK controller. It is copied for each environment.
+            robot_cfg: The robot articulation configuration containing initial joint positions and robot
+                specifications.
+            num_envs: The number of environments.
+            device: The device of the input and output tensors (e.g., 'cuda:0', 'cpu').
+        """
+        self.cfg = cfg
+        self.num_envs = num_envs
+        self.device = device
+        # create the controllers of the environments
+        self.controllers = [
+            PinkIKController(cfg=cfg.copy(), robot_cfg=robot_cfg, device=device) for _ in range(num_envs)
+        ]
+        # indices of the frame tasks in the variable input tasks
+        self._frame_task_ids = [
+            index for index, task in enumerate(cfg.variable_input_tasks) if isinstance(task, FrameTask)
+        ]
+
+        # split the environments into one shard per worker
+        num_workers = cfg.num_workers if cfg.num_workers is not None else (os.cpu_count() or 1)
+        num_workers = max(1, min(num_workers, num_envs))
+        self._shards = [shard.tolist() for shard in np.array_split(np.arange(num_envs), num_workers)]
+        self._executor = None
+        if num_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="pink_ik")
+
+    def __del__(self):
+        """Shut down the thread pool."""
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown(wait=False)
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        """Reset the warm-start of the quadratic solvers.
+
+        Args:
+            env_ids: The environment indices to reset. Defaults to None, in which case all environments are reset.
+        """
+        if env_ids is None:
+            env_ids = range(self.num_envs)
+        for env_id in env_ids:
+            self.controllers[int(env_id)].reset()
+
+    def set_frame_targets(self, positions: torch.Tensor, rotations: torch.Tensor):
+        """Set the targets of the frame tasks of all environments.
+
+        The targets are expressed in the base link frame of the robot and ordered as the frame tasks in
+        :attr:`PinkIKControllerCfg.variable_input_tasks`.
+
+        Args:
+            positions: The target positions. Shape is (num_frame_tasks, num_envs, 3).
+            rotations: The target rotation matrices. Shape is (num_frame_tasks, num_envs, 3, 3).
+        """
+        # copy the targets of all environments to the host at once
+        positions = positions.detach().cpu().numpy().astype(np.float64)
+        rotations = rotations.detach().cpu().numpy().astype(np.float64)
+        for env_index, controller in enumerate(self.controllers):
+            for frame_index, task_index in enumerate(self._frame_task_ids):
+                task = controller.cfg.variable_input_tasks[task_index]
+                target = task.transform_target_to_world
+                target.translation = positions[frame_index, env_index]
+                target.rotation = rotations[frame_index, env_index]
+                task.set_target(target)
+
+    def compute(self, curr_joint_pos: torch.Tensor, dt: float) -> torch.Tensor:
+        """Compute the target joint positions of all environments.
+
+        Args:
+            curr_joint_pos: The current joint positions. Shape is (num_envs, num_joints).
+            dt: The time step for computing joint position changes in seconds.
+
+        Returns:
+            The target joint positions. Shape is (num_envs, num_joints). For the environments where the IK solver
+            fails, the current joint positions are returned.
+        """
+        # copy the joint positions of all environments to the host at once
+        curr_joint_pos_np = curr_joint_pos.detach().cpu().numpy()
+        target_joint_pos = np.empty_like(curr_joint_pos_np, dtype=np.float32)
+
+        def _solve_shard(env_ids: list[int]):
+            for env_index in env_ids:
+                target_joint_pos[env_index] = self.controllers[env_index].solve(curr_joint_pos_np[env_index], dt)
+
+        if self._executor is None:
+            _solve_shard(self._shards[0])
+        else:
+            # note: result() re-raises the exceptions of the workers
+            for future in [self._executor.submit(_solve_shard, shard) for shard in self._shards]:
+                future.result()
+        # copy the target joint positions to the device at once
+        return torch.from_numpy(target_joint_pos).to(self.device)
@@ -116,6 +116,13 @@ class PinkIKController:
         self.cfg = cfg
         self.device = device
 
+        # The joint velocities of the last solution, which warm-start the quadratic solver
+        self._last_velocity: np.ndarray | None = None
+
+    def reset(self):
+        """Reset the warm-start of the quadratic solver."""
+        self._last_velocity = None
+
     def update_null_space_joint_targets(self, curr_joint_pos: np.ndarray):
         """Update the null space joint targets.
 
@@ -149,6 +156,24 @@ class PinkIKController:
             The target joint positions as a tensor of shape (num_joints,) on the specified device.
             If the IK solver fails, returns the current joint positions unchanged to maintain stability.
         """
+        return torch.tensor(self.solve(curr_joint_pos, dt), device=self.device, dtype=torch.float32)
+
+    def solve(self, curr_joint_pos: np.ndarray, dt: float) -> np.ndarray:
+        """Compute the target joint positions on the host.
+
+        This is the same as :meth:`compute`, but the target joint positions are returned as a numpy array.
+        This allows gathering the solutions of multiple controllers before a single copy to the device.
+        If :attr:`PinkIKControllerCfg.warm_start` is True, the quadratic solver starts from the joint
+        velocities of the last solution.
+
+        Args:
+            curr_joint_pos: The current joint positions of shape (num_joints,).
+            dt: The time step for computing joint position changes in seconds.
+
+        Returns:
+            The target joint positions of shape (num_joints,). If the IK solver fails, returns the current
+            joint positions unchanged to maintain stability.
+        """
         # Initialize joint positions for Pink, change from isaac_lab to pink/pinocchio joint ordering.
         joint_positions_pink = curr_joint_pos[self.isaac_lab_to_pink_ordering]
 
@@ -163,6 +188,7 @@ class PinkIKController:
                 dt,
                 solver="osqp",
                 safety_break=self.cfg.fail_on_joint_limit_violation,
+                initvals=self._last_velocity if self.cfg.warm_start else None,
             )
             Delta_q = velocity * dt
         except (AssertionError, Exception) as e:
@@ -178,21 +204,10 @@ class PinkIKController:
                 from isaaclab.ui.xr_widgets import XRVisualization
 
                 XRVisualization.push_event("ik_error", {"error": e})
-            return torch.tensor(curr_joint_pos, device=self.device, dtype=torch.float32)
-
-        # Discard the first 6 values (for root and universal joints)
-        pink_joint_angle_changes = Delta_q
-
-        # Reorder the joint angle changes back to Isaac Lab conventions
-        joint_vel_isaac_lab = torch.tensor(
-            pink_joint_angle_changes[self.pink_to_isaac_lab_ordering],
-            device=self.device,
-            dtype=torch.float,
-        )
-
-        # Add the velocity changes to the current joint positions to get the target joint positions
-        target_joint_pos = torch.add(
-            joint_vel_isaac_lab, torch.tensor(curr_joint_pos, device=self.device, dtype=torch.float32)
-        )
+            self._last_velocity = None
+            return np.asarray(curr_joint_pos, dtype=np.float32)
+        self._last_velocity = velocity
 
-        return target_joint_pos
+        # Reorder the joint angle changes back to Isaac Lab conventions and add them to the current joint
+        # positions to get the target joint positions
+        return np.asarray(curr_joint_pos + Delta_q[self.pink_to_isaac_lab_ordering], dtype=np.float32)
@@ -63,5 +63,13 @@ class PinkIKControllerCfg:
     will handle the error by setting the last joint positions. If False, the solver will ignore joint limit violations and return the
     closest solution found."""
 
+    warm_start: bool = True
+    """If True, the quadratic solver of each step starts from the joint velocities of the last solution."""
+
+    num_workers: int | None = None
+    """The number of threads that solve the IK of the environments in parallel in the
+    :class:`BatchedPinkIKController`. Defaults to None, in which case the number of CPUs (at most the number of
+    environments) is used. If 1, the environments are solved sequentially on the calling thread."""
+
     xr_enabled: bool = False
     """If True, the Pink IK controller will send information to the XRVisualization."""
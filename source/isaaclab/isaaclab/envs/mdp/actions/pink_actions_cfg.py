@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from dataclasses import MISSING
+from typing import Literal
 
 from isaaclab.controllers.pink_ik import PinkIKControllerCfg
 from isaaclab.managers.action_manager import ActionTerm, ActionTermCfg
@@ -35,6 +36,17 @@ class PinkInverseKinematicsActionCfg(ActionTermCfg):
     controller: PinkIKControllerCfg = MISSING
     """Configuration for the Pink IK controller that will be used to solve the inverse kinematics."""
 
+    ik_solver: Literal["pink", "dls"] = "pink"
+    """The solver for the tasks of the controller. Defaults to "pink".
+
+    * ``"pink"``: The quadratic program of Pink is solved for each environment on the CPU
+      (see :class:`~isaaclab.controllers.pink_ik.BatchedPinkIKController`).
+    * ``"dls"``: The tasks are solved for all environments at once as a damped least-squares problem on the
+      device of the simulation, with the Jacobians of the articulation
+      (see :class:`~isaaclab.controllers.pink_ik.BatchedDLSIKController`). Only frame, null-space posture and
+      damping tasks are supported. The joint limits are enforced by clamping the target joint positions.
+    """
+
     target_eef_link_names: dict[str, str] = MISSING
     """Dictionary mapping task names to controlled link names for the Pink IK controller.
 
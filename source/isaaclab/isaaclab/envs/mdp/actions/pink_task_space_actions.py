@@ -14,7 +14,7 @@ from pink.tasks import FrameTask
 
 import isaaclab.utils.math as math_utils
 from isaaclab.assets.articulation import Articulation
-from isaaclab.controllers.pink_ik import PinkIKController
+from isaaclab.controllers.pink_ik import BatchedDLSIKController, BatchedPinkIKController
 from isaaclab.managers.action_manager import ActionTerm
 
 if TYPE_CHECKING:
@@ -55,13 +55,23 @@ class PinkInverseKinematicsAction(ActionTerm):
         self._joint_ids = self._pink_controlled_joint_ids + self._hand_joint_ids
         self._joint_names = self._pink_controlled_joint_names + self._hand_joint_names
 
-        # Initialize the Pink IK controller
+        # Initialize the IK controller
+        # note: the controller solves the IK of all environments with one host transfer per step
         assert env.num_envs > 0, "Number of environments specified are less than 1."
-        self._ik_controllers = []
-        for _ in range(env.num_envs):
-            self._ik_controllers.append(
-                PinkIKController(cfg=self.cfg.controller.copy(), robot_cfg=env.scene.cfg.robot, device=self.device)
+        if self.cfg.ik_solver == "pink":
+            self._ik_controller = BatchedPinkIKController(
+                cfg=self.cfg.controller, robot_cfg=env.scene.cfg.robot, num_envs=env.num_envs, device=self.device
             )
+            # The Pink IK controllers of the environments
+            self._ik_controllers = self._ik_controller.controllers
+        elif self.cfg.ik_solver == "dls":
+            self._ik_controller = BatchedDLSIKController(
+                cfg=self.cfg.controller, num_envs=env.num_envs, device=self.device
+            )
+            self._ik_controllers = []
+            self._initialize_dls_ik_controller()
+        else:
+            raise ValueError(f"Unsupported IK solver for the Pink IK action: '{self.cfg.ik_solver}'.")
 
         # Create tensors to store raw and processed actions
         self._raw_actions = torch.zeros(self.num_envs, self.action_dim, device=self.device)
@@ -118,9 +128,7 @@ class PinkInverseKinematicsAction(ActionTerm):
     def action_dim(self) -> int:
         """Dimension of the action space (based on number of tasks and pose dimension)."""
         # Count only FrameTask instances in variable_input_tasks
-        frame_tasks_count = sum(
-            1 for task in self._ik_controllers[0].cfg.variable_input_tasks if isinstance(task, FrameTask)
-        )
+        frame_tasks_count = sum(1 for task in self.cfg.controller.variable_input_tasks if isinstance(task, FrameTask))
         return frame_tasks_count * self.pose_dim + self.hand_joint_dim
 
     @property
@@ -183,8 +191,8 @@ class PinkInverseKinematicsAction(ActionTerm):
 
         # Get the controlled_frame pose wrt to the env origin frame
         all_controlled_frames_in_env_origin = []
-        # The contrllers for all envs are the same, hence just using the first one to get the number of variable_input_tasks
-        for task_index in range(len(self._ik_controllers[0].cfg.variable_input_tasks)):
+        # The tasks for all envs are the same, hence just using the configuration to get the number of variable_input_tasks
+        for task_index in range(len(self.cfg.controller.variable_input_tasks)):
             controlled_frame_in_env_origin_pos = actions_clone[
                 :, task_index * self.pose_dim : task_index * self.pose_dim + self.position_dim
             ]
@@ -207,24 +215,29 @@ class PinkInverseKinematicsAction(ActionTerm):
             controlled_frame_in_base_link_frame
         )
 
-        # Loop through each task and set the target
-        for env_index, ik_controller in enumerate(self._ik_controllers):
-            for task_index, task in enumerate(ik_controller.cfg.variable_input_tasks):
-                if isinstance(task, FrameTask):
-                    target = task.transform_target_to_world
-                    target.translation = controlled_frame_in_base_link_frame_pos[task_index, env_index, :].cpu().numpy()
-                    target.rotation = controlled_frame_in_base_link_frame_mat[task_index, env_index, :].cpu().numpy()
-                    task.set_target(target)
+        # Set the targets of the frame tasks of all environments
+        frame_task_ids = [
+            task_index
+            for task_index, task in enumerate(self.cfg.controller.variable_input_tasks)
+            if isinstance(task, FrameTask)
+        ]
+        target_pos = controlled_frame_in_base_link_frame_pos[frame_task_ids]
+        target_mat = controlled_frame_in_base_link_frame_mat[frame_task_ids]
+        if self.cfg.ik_solver == "dls":
+            target_quat = math_utils.quat_from_matrix(target_mat)
+            self._ik_controller.set_frame_targets(target_pos.transpose(0, 1), target_quat.transpose(0, 1))
+        else:
+            self._ik_controller.set_frame_targets(target_pos, target_mat)
 
     def apply_actions(self):
         # start_time = time.time()  # Capture the time before the step
         """Apply the computed joint positions based on the inverse kinematics solution."""
-        all_envs_joint_pos_des = []
-        for env_index, ik_controller in enumerate(self._ik_controllers):
-            curr_joint_pos = self._asset.data.joint_pos[:, self._pink_controlled_joint_ids].cpu().numpy()[env_index]
-            joint_pos_des = ik_controller.compute(curr_joint_pos, self._sim_dt)
-            all_envs_joint_pos_des.append(joint_pos_des)
-        all_envs_joint_pos_des = torch.stack(all_envs_joint_pos_des)
+        curr_joint_pos = self._asset.data.joint_pos[:, self._pink_controlled_joint_ids]
+        if self.cfg.ik_solver == "dls":
+            frame_pos, frame_quat, jacobians = self._compute_frame_poses_and_jacobians()
+            all_envs_joint_pos_des = self._ik_controller.compute(frame_pos, frame_quat, jacobians, curr_joint_pos)
+        else:
+            all_envs_joint_pos_des = self._ik_controller.compute(curr_joint_pos, self._sim_dt)
 
         # Combine IK joint positions with hand joint positions
         all_envs_joint_pos_des = torch.cat((all_envs_joint_pos_des, self._target_hand_joint_positions), dim=1)
@@ -239,3 +252,75 @@ class PinkInverseKinematicsAction(ActionTerm):
             env_ids: A list of environment IDs to reset. If None, all environments are reset.
         """
         self._raw_actions[env_ids] = torch.zeros(self.action_dim, device=self.device)
+        # reset the warm-start of the IK solvers
+        if self.cfg.ik_solver == "pink":
+            self._ik_controller.reset(env_ids)
+
+    """
+    Helper functions.
+    """
+
+    def _initialize_dls_ik_controller(self):
+        """Resolves the frames of the batched DLS IK controller and sets the initial targets of its tasks.
+
+        The frames of the Pink tasks are named after the links in the URDF file. They are matched to the bodies of
+        the articulation with the same name or, otherwise, with the longest name that ends the frame name. For
+        instance, the frame ``GR1T2_fourier_hand_6dof_left_hand_pitch_link`` matches the body ``left_hand_pitch_link``.
+
+        Raises:
+            ValueError: If a frame does not match any body of the articulation.
+        """
+        body_names = self._asset.data.body_names
+        self._base_link_idx = body_names.index(self.cfg.controller.base_link_name)
+        self._frame_body_ids = []
+        for frame_name in self._ik_controller.frame_names:
+            if frame_name in body_names:
+                self._frame_body_ids.append(body_names.index(frame_name))
+                continue
+            matches = [name for name in body_names if frame_name.endswith(name)]
+            if len(matches) == 0:
+                raise ValueError(
+                    f"The frame '{frame_name}' of the Pink IK tasks does not match any body of the articulation:"
+                    f" {body_names}."
+                )
+            self._frame_body_ids.append(body_names.index(max(matches, key=len)))
+        # if fixed-base then the jacobian for the base is not computed
+        if self._asset.is_fixed_base:
+            self._jacobi_frame_body_ids = [body_idx - 1 for body_idx in self._frame_body_ids]
+            self._jacobi_joint_ids = self._pink_controlled_joint_ids
+        else:
+            self._jacobi_frame_body_ids = self._frame_body_ids
+            self._jacobi_joint_ids = [i + 6 for i in self._pink_controlled_joint_ids]
+
+        # hold the current poses of the frames and the default joint positions
+        frame_pos, frame_quat, _ = self._compute_frame_poses_and_jacobians()
+        num_frame_tasks = self._ik_controller.num_frame_tasks
+        self._ik_controller.set_frame_targets(frame_pos[:, :num_frame_tasks], frame_quat[:, :num_frame_tasks])
+        self._ik_controller.set_posture_target(self._asset.data.default_joint_pos[:, self._pink_controlled_joint_ids])
+        self._ik_controller.set_joint_pos_limits(
+            self._asset.data.soft_joint_pos_limits[:, self._pink_controlled_joint_ids]
+        )
+
+    def _compute_frame_poses_and_jacobians(self) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Computes the poses and Jacobians of the frames of the batched DLS IK controller in the base link frame.
+
+        Returns:
+            The positions, orientations (w, x, y, z) and Jacobians of the frames. Shapes are (N, K, 3), (N, K, 4)
+            and (N, K, 6, num_joints), where K is the number of frames.
+        """
+        num_frames = len(self._frame_body_ids)
+        base_pos_w = self._asset.data.body_link_pos_w[:, self._base_link_idx]
+        base_quat_w = self._asset.data.body_link_quat_w[:, self._base_link_idx]
+        # compute the poses of the frames in the base link frame
+        frame_pos_b, frame_quat_b = math_utils.subtract_frame_transforms(
+            base_pos_w.repeat_interleave(num_frames, dim=0),
+            base_quat_w.repeat_interleave(num_frames, dim=0),
+            self._asset.data.body_link_pos_w[:, self._frame_body_ids].reshape(-1, 3),
+            self._asset.data.body_link_quat_w[:, self._frame_body_ids].reshape(-1, 4),
+        )
+        # rotate the jacobians of the frames into the base link frame
+        jacobians = self._asset.root_physx_view.get_jacobians()[:, self._jacobi_frame_body_ids]
+        jacobians = jacobians[..., self._jacobi_joint_ids]
+        base_rot_matrix = math_utils.matrix_from_quat(math_utils.quat_inv(base_quat_w)).unsqueeze(1)
+        jacobians = torch.cat((base_rot_matrix @ jacobians[:, :, :3], base_rot_matrix @ jacobians[:, :, 3:]), dim=2)
+        return frame_pos_b.view(-1, num_frames, 3), frame_quat_b.view(-1, num_frames, 4), jacobians
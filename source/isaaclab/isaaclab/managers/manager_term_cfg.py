@@ -240,6 +240,37 @@ class ObservationGroupCfg:
     ObservationGroupCfg.history_length is set.
     """
 
+    fuse_history: bool = False
+    """Whether to store the history of all observation terms in the group in a single buffer. Defaults to False.
+
+    If True, the post-processed observation terms are written into one preallocated buffer of shape
+    (num_envs, history_length, D), where D is the sum of the term dimensions. A single append and a single read
+    then serve the whole group, and the history is copied once instead of concatenating the terms at every step.
+    The history is copied into a new tensor, or into the output buffers if :attr:`num_output_buffers` is positive,
+    so that the returned tensor is not modified by later updates of the history.
+
+    This mode requires :attr:`history_length` to be set to a positive value, :attr:`concatenate_terms` to be True,
+    :attr:`concatenate_dim` to be -1 and all observation terms to be of shape (num_envs, obs_term_dim).
+
+    .. attention::
+        If :attr:`flatten_history_dim` is True, the flattened observation is ordered by time first and by term
+        second, i.e. ``[term_1(t-H+1), term_2(t-H+1), ..., term_1(t), term_2(t)]``. This differs from the
+        default ordering where the full history of each term is placed one after the other. If the history
+        dimension is not flattened, the output is identical to the default mode.
+    """
+
+    num_output_buffers: int = 0
+    """Number of persistent output buffers for the concatenated observation of the group. Defaults to 0.
+
+    If 0, a new tensor is allocated for the concatenated observation at every call to
+    :meth:`~isaaclab.managers.ObservationManager.compute_group`. Otherwise, the observation manager preallocates
+    this number of tensors of the group's shape and writes the post-processed terms directly into them, cycling
+    through the buffers at every call. The returned tensor is thus overwritten after the given number of calls.
+    For example, setting this value to 2 allows consumers to keep the observation of the previous call.
+
+    This mode requires :attr:`concatenate_terms` to be True.
+    """
+
 
 ##
 # Event manager
@@ -110,6 +110,29 @@ class ObservationManager(ManagerBase):
             else:
                 self._group_obs_dim[group_name] = group_term_dims
 
+        # create persistent output buffers for concatenated groups (if enabled)
+        # note: the term slices are computed along the concatenation dimension of the group
+        self._group_obs_output_buffers: dict[str, list[torch.Tensor]] = dict()
+        self._group_obs_output_index: dict[str, int] = dict()
+        self._group_obs_term_output_slices: dict[str, list[tuple[int, int]]] = dict()
+        for group_name, num_buffers in self._group_obs_num_output_buffers.items():
+            if num_buffers == 0:
+                continue
+            self._group_obs_output_buffers[group_name] = [
+                torch.zeros((self._env.num_envs, *self._group_obs_dim[group_name]), device=self._env.device)
+                for _ in range(num_buffers)
+            ]
+            self._group_obs_output_index[group_name] = -1
+            # compute the offset and length of each term along the concatenation dimension
+            concatenate_dim = self._group_obs_concatenate_dim[group_name]
+            term_dim = concatenate_dim - 1 if concatenate_dim > 0 else concatenate_dim
+            term_slices = list()
+            start = 0
+            for dims in self._group_obs_term_dim[group_name]:
+                term_slices.append((start, int(dims[term_dim])))
+                start += int(dims[term_dim])
+            self._group_obs_term_output_slices[group_name] = term_slices
+
         # Stores the latest observations.
         self._obs_buffer: dict[str, torch.Tensor | dict[str, torch.Tensor]] | None = None
 
@@ -166,6 +189,17 @@ class ObservationManager(ManagerBase):
                     terms.append((group_name + "-" + name, term[env_idx].cpu().tolist()))
                 continue
 
+            # the fused history is ordered by time first: gather each term's history from the buffer
+            if group_name in self._group_obs_fused_history_buffer:
+                history_length = self._group_obs_fused_history_buffer[group_name].max_length
+                data = obs_buffer[group_name][env_idx].reshape(history_length, -1)
+                for name, term_slice in zip(
+                    self._group_obs_term_names[group_name],
+                    self._group_obs_fused_history_slices[group_name],
+                ):
+                    terms.append((group_name + "-" + name, data[:, term_slice].flatten().cpu().tolist()))
+                continue
+
             idx = 0
             # add info for each term
             data = obs_buffer[group_name]
@@ -302,6 +336,9 @@ class ObservationManager(ManagerBase):
             for term_name in self._group_obs_term_names[group_name]:
                 if term_name in self._group_obs_term_history_buffer[group_name]:
                     self._group_obs_term_history_buffer[group_name][term_name].reset(batch_ids=env_ids)
+        # reset groups with a single history buffer
+        for circular_buffer in self._group_obs_fused_history_buffer.values():
+            circular_buffer.reset(batch_ids=env_ids)
         # call all modifiers that are classes
         for mod in self._group_obs_class_instances:
             mod.reset(env_ids=env_ids)
@@ -383,11 +420,26 @@ class ObservationManager(ManagerBase):
         group_obs = dict.fromkeys(group_term_names, None)
         # read attributes for each term
         obs_terms = zip(group_term_names, self._group_obs_term_cfgs[group_name])
+        # check if the history of all terms is stored in a single buffer
+        fuse_history = group_name in self._group_obs_fused_history_buffer
+        # obtain the persistent output buffer of the group (if any)
+        group_output = self._next_group_output_buffer(group_name)
 
         # evaluate terms: compute, add noise, clip, scale, custom modifiers
-        for term_name, term_cfg in obs_terms:
+        for term_idx, (term_name, term_cfg) in enumerate(obs_terms):
             # compute term's value
-            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params).clone()
+            obs: torch.Tensor = term_cfg.func(self._env, **term_cfg.params)
+            # terms without history are written directly into the output buffer and post-processed in-place there.
+            # otherwise, the value is cloned to not modify the source data with in-place operations.
+            # note: modifiers are not guaranteed to be out-of-place, so we always clone for them.
+            term_output = None
+            if group_output is not None and not fuse_history and term_cfg.history_length == 0:
+                term_output = group_output.narrow(
+                    self._group_obs_concatenate_dim[group_name],
+                    *self._group_obs_term_output_slices[group_name][term_idx],
+                )
+            if term_output is None or term_cfg.modifiers is not None:
+                obs = obs.clone()
             # apply post-processing
             if term_cfg.modifiers is not None:
                 for modifier in term_cfg.modifiers:
@@ -396,12 +448,18 @@ class ObservationManager(ManagerBase):
                 obs = term_cfg.noise.func(obs, term_cfg.noise)
             elif isinstance(term_cfg.noise, noise.NoiseModelCfg) and term_cfg.noise.func is not None:
                 obs = term_cfg.noise.func(obs)
+            if term_output is not None:
+                obs = term_output.copy_(obs)
             if term_cfg.clip:
                 obs = obs.clip_(min=term_cfg.clip[0], max=term_cfg.clip[1])
             if term_cfg.scale is not None:
                 obs = obs.mul_(term_cfg.scale)
+            # Write the term into the group's history data if the history of the group is fused
+            if fuse_history:
+                term_slice = self._group_obs_fused_history_slices[group_name][term_idx]
+                self._group_obs_fused_history_data[group_name][:, term_slice] = obs
             # Update the history buffer if observation term has history enabled
-            if term_cfg.history_length > 0:
+            elif term_cfg.history_length > 0:
                 circular_buffer = self._group_obs_term_history_buffer[group_name][term_name]
                 if update_history:
                     circular_buffer.append(obs)
@@ -415,13 +473,41 @@ class ObservationManager(ManagerBase):
                     )
                     circular_buffer.append(obs)
 
+                # when the terms are concatenated, the history is copied into the output by the concatenation.
+                # we can thus use the zero-copy view of the buffer. Otherwise, the history must be copied
+                # since the returned tensors would be modified by the next append.
+                if self._group_obs_concatenate[group_name]:
+                    history = circular_buffer.buffer_view
+                else:
+                    history = circular_buffer.buffer
                 if term_cfg.flatten_history_dim:
-                    group_obs[term_name] = circular_buffer.buffer.reshape(self._env.num_envs, -1)
+                    group_obs[term_name] = history.reshape(self._env.num_envs, -1)
                 else:
-                    group_obs[term_name] = circular_buffer.buffer
+                    group_obs[term_name] = history
             else:
                 group_obs[term_name] = obs
 
+        # read the history of all the terms in the group at once
+        # note: the history is a view of the ring buffer, which is overwritten by the next append.
+        #   it is thus copied into the output buffer or into a new tensor.
+        if fuse_history:
+            history = self._compute_group_fused_history(group_name, update_history)
+            if group_output is not None:
+                return group_output.copy_(history)
+            return history.clone()
+
+        # write the remaining terms into the output buffer
+        if group_output is not None:
+            for term_idx, (term_name, term_cfg) in enumerate(
+                zip(group_term_names, self._group_obs_term_cfgs[group_name])
+            ):
+                if term_cfg.history_length > 0:
+                    group_output.narrow(
+                        self._group_obs_concatenate_dim[group_name],
+                        *self._group_obs_term_output_slices[group_name][term_idx],
+                    ).copy_(group_obs[term_name])
+            return group_output
+
         # concatenate all observations in the group together
         if self._group_obs_concatenate[group_name]:
             # set the concatenate dimension, account for the batch dimension if positive dimension is given
@@ -456,6 +542,54 @@ class ObservationManager(ManagerBase):
     Helper functions.
     """
 
+    def _next_group_output_buffer(self, group_name: str) -> torch.Tensor | None:
+        """Cycles to the next persistent output buffer of a group.
+
+        Args:
+            group_name: The name of the group.
+
+        Returns:
+            The output buffer to write the observations of the group into. None if the group does not have
+            persistent output buffers.
+        """
+        if group_name not in self._group_obs_output_buffers:
+            return None
+        output_buffers = self._group_obs_output_buffers[group_name]
+        self._group_obs_output_index[group_name] = (self._group_obs_output_index[group_name] + 1) % len(output_buffers)
+        return output_buffers[self._group_obs_output_index[group_name]]
+
+    def _compute_group_fused_history(self, group_name: str, update_history: bool) -> torch.Tensor:
+        """Updates and reads the single history buffer of a group.
+
+        Args:
+            group_name: The name of the group with a fused history buffer.
+            update_history: Whether the latest observation of the group should be appended to the history.
+
+        Returns:
+            The history of the group as a view of the history buffer. The shape is (num_envs, history_length * D)
+            if the history dimension is flattened, otherwise it is (num_envs, history_length, D). The view is only
+            valid until the next append to the history.
+        """
+        circular_buffer = self._group_obs_fused_history_buffer[group_name]
+        group_data = self._group_obs_fused_history_data[group_name]
+        if update_history:
+            circular_buffer.append(group_data)
+        elif circular_buffer._buffer is None:
+            # because circular buffer only exits after the simulation steps,
+            # this guards history buffer from corruption by external calls before simulation start
+            circular_buffer = CircularBuffer(
+                max_len=circular_buffer.max_length,
+                batch_size=circular_buffer.batch_size,
+                device=circular_buffer.device,
+            )
+            circular_buffer.append(group_data)
+        # read the history without copying
+        # note: all terms in the group share the history settings of the group
+        history = circular_buffer.buffer_view
+        if self._group_obs_term_cfgs[group_name][0].flatten_history_dim:
+            history = history.reshape(self._env.num_envs, -1)
+        return history
+
     def _prepare_terms(self):
         """Prepares a list of observation terms functions."""
         # create buffers to store information for each observation group
@@ -466,8 +600,13 @@ class ObservationManager(ManagerBase):
         self._group_obs_class_term_cfgs: dict[str, list[ObservationTermCfg]] = dict()
         self._group_obs_concatenate: dict[str, bool] = dict()
         self._group_obs_concatenate_dim: dict[str, int] = dict()
+        self._group_obs_num_output_buffers: dict[str, int] = dict()
 
         self._group_obs_term_history_buffer: dict[str, dict] = dict()
+        # buffers for groups that store the history of all their terms in a single buffer
+        self._group_obs_fused_history_buffer: dict[str, CircularBuffer] = dict()
+        self._group_obs_fused_history_data: dict[str, torch.Tensor] = dict()
+        self._group_obs_fused_history_slices: dict[str, list[slice]] = dict()
         # create a list to store classes instances, e.g., for modifiers and noise models
         # we store it as a separate list to only call reset on them and prevent unnecessary calls
         self._group_obs_class_instances: list[modifiers.ModifierBase | noise.NoiseModel] = list()
@@ -507,6 +646,32 @@ class ObservationManager(ManagerBase):
             self._group_obs_concatenate_dim[group_name] = (
                 group_cfg.concatenate_dim + 1 if group_cfg.concatenate_dim >= 0 else group_cfg.concatenate_dim
             )
+            # check that the group can use persistent output buffers
+            if group_cfg.num_output_buffers < 0 or (
+                group_cfg.num_output_buffers > 0 and not group_cfg.concatenate_terms
+            ):
+                raise ValueError(
+                    f"Observation group '{group_name}' has an invalid number of output buffers:"
+                    f" {group_cfg.num_output_buffers}. The value should be non-negative and output buffers can only be"
+                    " used if 'concatenate_terms' is True in the group configuration."
+                )
+            self._group_obs_num_output_buffers[group_name] = group_cfg.num_output_buffers
+            # check that the group can use a single history buffer for all its terms
+            if group_cfg.fuse_history:
+                if not group_cfg.history_length or group_cfg.history_length < 1:
+                    raise ValueError(
+                        f"Observation group '{group_name}' has 'fuse_history' enabled but no group history length."
+                        " Please set 'history_length' to a positive value in the group configuration."
+                    )
+                if not group_cfg.concatenate_terms or group_cfg.concatenate_dim != -1:
+                    raise ValueError(
+                        f"Observation group '{group_name}' has 'fuse_history' enabled but its terms are not"
+                        " concatenated along the last dimension. Please set 'concatenate_terms' to True and"
+                        " 'concatenate_dim' to -1 in the group configuration."
+                    )
+            # term slices into the fused history buffer (if enabled)
+            fused_history_slices: list[slice] = list()
+            fused_history_dtype: torch.dtype | None = None
             # check if config is dict already
             if isinstance(group_cfg, dict):
                 group_cfg_items = group_cfg.items()
@@ -521,6 +686,8 @@ class ObservationManager(ManagerBase):
                     "history_length",
                     "flatten_history_dim",
                     "concatenate_dim",
+                    "fuse_history",
+                    "num_output_buffers",
                 ]:
                     continue
                 # check for non config
@@ -546,7 +713,8 @@ class ObservationManager(ManagerBase):
                 self._group_obs_term_cfgs[group_name].append(term_cfg)
 
                 # call function the first time to fill up dimensions
-                obs_dims = tuple(term_cfg.func(self._env, **term_cfg.params).shape)
+                term_obs = term_cfg.func(self._env, **term_cfg.params)
+                obs_dims = tuple(term_obs.shape)
 
                 # if scale is set, check if single float or tuple
                 if term_cfg.scale is not None:
@@ -626,10 +794,22 @@ class ObservationManager(ManagerBase):
                     self._group_obs_class_instances.append(term_cfg.noise.func)
 
                 # create history buffers and calculate history term dimensions
-                if term_cfg.history_length > 0:
+                if group_cfg.fuse_history:
+                    # the history of the term is stored in the group's buffer: only compute its slice
+                    if len(obs_dims) != 2:
+                        raise ValueError(
+                            f"Observation term '{term_name}' in group '{group_name}' has shape {obs_dims[1:]}, but"
+                            " 'fuse_history' only supports terms of shape (num_envs, obs_term_dim)."
+                        )
+                    start = fused_history_slices[-1].stop if fused_history_slices else 0
+                    fused_history_slices.append(slice(start, start + obs_dims[1]))
+                    if fused_history_dtype is None:
+                        fused_history_dtype = term_obs.dtype
+                elif term_cfg.history_length > 0:
                     group_entry_history_buffer[term_name] = CircularBuffer(
                         max_len=term_cfg.history_length, batch_size=self._env.num_envs, device=self._env.device
                     )
+                if term_cfg.history_length > 0:
                     old_dims = list(obs_dims)
                     old_dims.insert(1, term_cfg.history_length)
                     obs_dims = tuple(old_dims)
@@ -645,3 +825,14 @@ class ObservationManager(ManagerBase):
                     term_cfg.func.reset()
             # add history buffers for each group
             self._group_obs_term_history_buffer[group_name] = group_entry_history_buffer
+            # create a single history buffer for all the terms in the group
+            if group_cfg.fuse_history and fused_history_slices:
+                self._group_obs_fused_history_buffer[group_name] = CircularBuffer(
+                    max_len=group_cfg.history_length, batch_size=self._env.num_envs, device=self._env.device
+                )
+                self._group_obs_fused_history_data[group_name] = torch.zeros(
+                    (self._env.num_envs, fused_history_slices[-1].stop),
+                    dtype=fused_history_dtype,
+                    device=self._env.device,
+                )
+                self._group_obs_fused_history_slices[group_name] = fused_history_slices
@@ -14,7 +14,7 @@ from prettytable import PrettyTable
 from typing import TYPE_CHECKING
 
 from isaaclab.utils import configclass
-from isaaclab.utils.datasets import EpisodeData, HDF5DatasetFileHandler
+from isaaclab.utils.datasets import AsyncDatasetWriter, EpisodeData, EpisodeDataBuffer, HDF5DatasetFileHandler
 
 from .manager_base import ManagerBase, ManagerTermBase
 from .manager_term_cfg import RecorderTermCfg
@@ -50,6 +50,20 @@ class RecorderManagerBaseCfg:
     export_in_record_pre_reset: bool = True
     """Whether to export episodes in the record_pre_reset call."""
 
+    export_async: bool = False
+    """Whether to write the exported episodes to the dataset files on a background thread. Defaults to False.
+
+    If True, the exported episodes are staged into pinned host memory and written by a
+    :class:`~isaaclab.utils.datasets.AsyncDatasetWriter`, so that the serialization and compression of the
+    data does not stall the environment step. The pending episodes are written when the manager is closed.
+    """
+
+    export_async_queue_size: int = 64
+    """The maximum number of pending write operations when :attr:`export_async` is True. Defaults to 64.
+
+    If the queue is full, the environment step blocks until the background thread catches up.
+    """
+
 
 class RecorderTerm(ManagerTermBase):
     """Base class for recorder terms.
@@ -159,10 +173,14 @@ class RecorderManager(ManagerBase):
         if not isinstance(cfg, RecorderManagerBaseCfg):
             raise TypeError("Configuration for the recorder manager is not of type RecorderManagerBaseCfg.")
 
-        # create episode data buffer indexed by environment id
+        # create episode data indexed by environment id
+        # note: the episode data holds the metadata of the episodes (e.g. success) and the data that is
+        #   added directly to it. The data recorded by the terms is stored in the columnar episode buffer.
         self._episodes: dict[int, EpisodeData] = dict()
         for env_id in range(env.num_envs):
             self._episodes[env_id] = EpisodeData()
+        # create columnar buffer for the recorded data of all environments
+        self._episode_buffer = EpisodeDataBuffer(env.num_envs, env.device)
 
         env_name = getattr(env.cfg, "env_name", None)
 
@@ -180,6 +198,11 @@ class RecorderManager(ManagerBase):
                 os.path.join(cfg.dataset_export_dir_path, f"{cfg.dataset_filename}_failed"), env_name=env_name
             )
 
+        # create the background writer for the dataset files (if enabled)
+        self._dataset_writer = None
+        if cfg.export_async and self._dataset_file_handler is not None:
+            self._dataset_writer = AsyncDatasetWriter(max_queue_size=cfg.export_async_queue_size)
+
         self._exported_successful_episode_count = {}
         self._exported_failed_episode_count = {}
 
@@ -206,11 +229,17 @@ class RecorderManager(ManagerBase):
         if len(self.active_terms) == 0:
             return
 
-        if self._dataset_file_handler is not None:
-            self._dataset_file_handler.close()
+        # write the pending episodes before closing the files
+        # note: the files are closed even if a pending write failed
+        try:
+            if self._dataset_writer is not None:
+                self._dataset_writer.close()
+        finally:
+            if self._dataset_file_handler is not None:
+                self._dataset_file_handler.close()
 
-        if self._failed_episode_dataset_file_handler is not None:
-            self._failed_episode_dataset_file_handler.close()
+            if self._failed_episode_dataset_file_handler is not None:
+                self._failed_episode_dataset_file_handler.close()
 
     """
     Properties.
@@ -253,6 +282,15 @@ class RecorderManager(ManagerBase):
             return self._exported_failed_episode_count.get(env_id, 0)
         return sum(self._exported_failed_episode_count.values())
 
+    @property
+    def dataset_writer(self) -> AsyncDatasetWriter | None:
+        """The background writer for the dataset files.
+
+        None if :attr:`RecorderManagerBaseCfg.export_async` is False or if no episodes are exported.
+        The writer can be used to query the backpressure of the export, e.g. the number of pending writes.
+        """
+        return getattr(self, "_dataset_writer", None)
+
     """
     Operations.
     """
@@ -282,6 +320,7 @@ class RecorderManager(ManagerBase):
 
         for env_id in env_ids:
             self._episodes[env_id] = EpisodeData()
+        self._episode_buffer.reset(env_ids)
 
         # nothing to log here
         return {}
@@ -289,13 +328,42 @@ class RecorderManager(ManagerBase):
     def get_episode(self, env_id: int) -> EpisodeData:
         """Returns the episode data for the given environment id.
 
+        Args:
+            env_id: The environment id.
+
+        Note:
+            The values recorded through :meth:`add_to_episodes` are stored in
+            :attr:`~isaaclab.utils.datasets.EpisodeData.data` as tensors of shape (num_steps, ...) instead of
+            lists of per-step tensors.
+
+        Returns:
+            The episode data for the given environment id. The recorded data are copies that remain valid after
+            the episode is exported or reset.
+        """
+        if env_id not in self._episodes:
+            return EpisodeData()
+        # write a copy of the recorded data into the episode
+        self._episode_buffer.update_episode(self._episodes[env_id], env_id, clone=True)
+        return self._episodes[env_id]
+
+    def get_episode_view(self, env_id: int) -> EpisodeData:
+        """Returns the episode data for the given environment id without copying the recorded data.
+
+        Unlike :meth:`get_episode`, the recorded data are views into the storage of the manager, which is reused
+        by the next episodes. They are thus only valid until the next step is recorded or the episode is exported
+        or reset. This is meant for consumers that copy the data right away, such as the export to a dataset file.
+
         Args:
             env_id: The environment id.
 
         Returns:
             The episode data for the given environment id.
         """
-        return self._episodes.get(env_id, EpisodeData())
+        if env_id not in self._episodes:
+            return EpisodeData()
+        # write views of the recorded data into the episode
+        self._episode_buffer.update_episode(self._episodes[env_id], env_id)
+        return self._episodes[env_id]
 
     def add_to_episodes(self, key: str, value: torch.Tensor | dict, env_ids: Sequence[int] | None = None):
         """Adds the given key-value pair to the episodes for the given environment ids.
@@ -315,8 +383,6 @@ class RecorderManager(ManagerBase):
         # resolve environment ids
         if key is None:
             return
-        if env_ids is None:
-            env_ids = list(range(self._env.num_envs))
         if isinstance(env_ids, torch.Tensor):
             env_ids = env_ids.tolist()
 
@@ -325,11 +391,8 @@ class RecorderManager(ManagerBase):
                 self.add_to_episodes(f"{key}/{sub_key}", sub_value, env_ids)
             return
 
-        for value_index, env_id in enumerate(env_ids):
-            if env_id not in self._episodes:
-                self._episodes[env_id] = EpisodeData()
-                self._episodes[env_id].env_id = env_id
-            self._episodes[env_id].add(key, value[value_index])
+        # write the values of all environments into the columnar storage
+        self._episode_buffer.add(key, value, env_ids)
 
     def set_success_to_episodes(self, env_ids: Sequence[int] | None, success_values: torch.Tensor):
         """Sets the task success values to the episodes for the given environment ids.
@@ -348,8 +411,10 @@ class RecorderManager(ManagerBase):
         if isinstance(env_ids, torch.Tensor):
             env_ids = env_ids.tolist()
 
+        # read the success values with a single transfer
+        success_values = success_values.view(-1).tolist()
         for value_index, env_id in enumerate(env_ids):
-            self._episodes[env_id].success = success_values[value_index].item()
+            self._episodes[env_id].success = success_values[value_index]
 
     def record_pre_step(self) -> None:
         """Trigger recorder terms for pre-step functions."""
@@ -461,12 +526,20 @@ class RecorderManager(ManagerBase):
         # Export episode data through dataset exporter
         need_to_flush = False
 
+        # gather the recorded data of the episodes
+        # note: the data is only copied for the background writer, since the storage is reused after the export
+        for env_id in env_ids:
+            if self._dataset_writer is not None:
+                self.get_episode(env_id)
+            else:
+                self.get_episode_view(env_id)
+
         if any(env_id in self._episodes and not self._episodes[env_id].is_empty() for env_id in env_ids):
             ep_meta = self.get_ep_meta()
             if self._dataset_file_handler is not None:
-                self._dataset_file_handler.add_env_args(ep_meta)
+                self._submit_to_file_handler(self._dataset_file_handler.add_env_args, ep_meta)
             if self._failed_episode_dataset_file_handler is not None:
-                self._failed_episode_dataset_file_handler.add_env_args(ep_meta)
+                self._submit_to_file_handler(self._failed_episode_dataset_file_handler.add_env_args, ep_meta)
 
         for env_id in env_ids:
             if env_id in self._episodes and not self._episodes[env_id].is_empty():
@@ -484,7 +557,10 @@ class RecorderManager(ManagerBase):
                     else:
                         target_dataset_file_handler = self._failed_episode_dataset_file_handler
                 if target_dataset_file_handler is not None:
-                    target_dataset_file_handler.write_episode(self._episodes[env_id])
+                    if self._dataset_writer is not None:
+                        self._dataset_writer.submit_episode(target_dataset_file_handler, self._episodes[env_id])
+                    else:
+                        target_dataset_file_handler.write_episode(self._episodes[env_id])
                     need_to_flush = True
                 # Update episode count
                 if episode_succeeded:
@@ -495,17 +571,25 @@ class RecorderManager(ManagerBase):
                     self._exported_failed_episode_count[env_id] = self._exported_failed_episode_count.get(env_id, 0) + 1
             # Reset the episode buffer for the given environment after export
             self._episodes[env_id] = EpisodeData()
+        self._episode_buffer.reset(env_ids)
 
         if need_to_flush:
             if self._dataset_file_handler is not None:
-                self._dataset_file_handler.flush()
+                self._submit_to_file_handler(self._dataset_file_handler.flush)
             if self._failed_episode_dataset_file_handler is not None:
-                self._failed_episode_dataset_file_handler.flush()
+                self._submit_to_file_handler(self._failed_episode_dataset_file_handler.flush)
 
     """
     Helper functions.
     """
 
+    def _submit_to_file_handler(self, func, *args):
+        """Calls the operation of a dataset file handler directly or through the background writer."""
+        if self._dataset_writer is not None:
+            self._dataset_writer.submit(func, *args)
+        else:
+            func(*args)
+
     def _prepare_terms(self):
         """Prepares a list of recorder terms."""
         # check if config is dict already
@@ -521,6 +605,8 @@ class RecorderManager(ManagerBase):
                 "dataset_export_dir_path",
                 "dataset_export_mode",
                 "export_in_record_pre_reset",
+                "export_async",
+                "export_async_queue_size",
             ]:
                 continue
             # check if term config is None
@@ -35,6 +35,11 @@ class RewardManager(ManagerBase):
         of the environment. This is done to ensure that the computed reward terms are balanced with
         respect to the chosen time-step interval in the environment.
 
+    The raw values of all terms are written into a single buffer of shape (num_envs, num_terms). The weighted
+    sum, the per-term step rewards and the episodic sums are then computed with a fixed number of batched
+    operations over a persistent weight vector, independent of the number of terms. All buffers are allocated
+    once at construction.
+
     """
 
     _env: ManagerBasedRLEnv
@@ -55,15 +60,26 @@ class RewardManager(ManagerBase):
         # call the base class constructor (this will parse the terms config)
         super().__init__(cfg, env)
         # prepare extra info to store individual reward term information
+        # note: the episodic sums of the terms are views into the columns of a single buffer
+        self._episode_sums_buf = torch.zeros(
+            (self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device
+        )
         self._episode_sums = dict()
-        for term_name in self._term_names:
-            self._episode_sums[term_name] = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
+        for term_idx, term_name in enumerate(self._term_names):
+            self._episode_sums[term_name] = self._episode_sums_buf[:, term_idx]
         # create buffer for managing reward per environment
         self._reward_buf = torch.zeros(self.num_envs, dtype=torch.float, device=self.device)
 
+        # Buffer which stores the raw (unweighted) value of each term for each environment
+        self._term_values = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
         # Buffer which stores the current step reward for each term for each environment
         self._step_reward = torch.zeros((self.num_envs, len(self._term_names)), dtype=torch.float, device=self.device)
 
+        # weights of the terms as a tensor for batched computation
+        # note: we keep a copy of the weights on the host to detect changes to the term configurations
+        self._term_weights_list = [float(term_cfg.weight) for term_cfg in self._term_cfgs]
+        self._term_weights = torch.tensor(self._term_weights_list, dtype=torch.float, device=self.device)
+
     def __str__(self) -> str:
         """Returns: A string representation for reward manager."""
         msg = f"<RewardManager> contains {len(self._term_names)} active terms.\n"
@@ -137,23 +153,25 @@ class RewardManager(ManagerBase):
         Returns:
             The net reward signal of shape (num_envs,).
         """
-        # reset computation
-        self._reward_buf[:] = 0.0
-        # iterate over all the reward terms
-        for term_idx, (name, term_cfg) in enumerate(zip(self._term_names, self._term_cfgs)):
+        # iterate over all the reward terms and store their raw values
+        for term_idx, term_cfg in enumerate(self._term_cfgs):
+            # update the weight vector if the weight was modified
+            if term_cfg.weight != self._term_weights_list[term_idx]:
+                self._set_term_weight(term_idx, term_cfg.weight)
             # skip if weight is zero (kind of a micro-optimization)
             if term_cfg.weight == 0.0:
-                self._step_reward[:, term_idx] = 0.0
+                self._term_values[:, term_idx] = 0.0
                 continue
             # compute term's value
-            value = term_cfg.func(self._env, **term_cfg.params) * term_cfg.weight * dt
-            # update total reward
-            self._reward_buf += value
-            # update episodic sum
-            self._episode_sums[name] += value
+            self._term_values[:, term_idx] = term_cfg.func(self._env, **term_cfg.params)
 
-            # Update current reward for this step.
-            self._step_reward[:, term_idx] = value / dt
+        # Update current reward for this step: r_i = w_i * f_i
+        torch.mul(self._term_values, self._term_weights, out=self._step_reward)
+        # update total reward: (sum_i w_i * f_i) * dt
+        torch.sum(self._step_reward, dim=1, out=self._reward_buf)
+        self._reward_buf.mul_(dt)
+        # update episodic sums
+        self._episode_sums_buf.add_(self._step_reward, alpha=dt)
 
         return self._reward_buf
 
@@ -174,7 +192,10 @@ class RewardManager(ManagerBase):
         if term_name not in self._term_names:
             raise ValueError(f"Reward term '{term_name}' not found.")
         # set the configuration
-        self._term_cfgs[self._term_names.index(term_name)] = cfg
+        term_idx = self._term_names.index(term_name)
+        self._term_cfgs[term_idx] = cfg
+        # update the weight vector
+        self._set_term_weight(term_idx, cfg.weight)
 
     def get_term_cfg(self, term_name: str) -> RewardTermCfg:
         """Gets the configuration for the specified term.
@@ -213,6 +234,16 @@ class RewardManager(ManagerBase):
     Helper functions.
     """
 
+    def _set_term_weight(self, term_idx: int, weight: float):
+        """Sets the weight of a term in the weight vector.
+
+        Args:
+            term_idx: The index of the reward term.
+            weight: The new weight of the reward term.
+        """
+        self._term_weights_list[term_idx] = float(weight)
+        self._term_weights[term_idx] = float(weight)
+
     def _prepare_terms(self):
         # check if config is dict already
         if isinstance(self.cfg, dict):
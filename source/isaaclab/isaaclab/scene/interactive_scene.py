@@ -30,7 +30,7 @@ from isaaclab.assets import (
     SurfaceGripper,
     SurfaceGripperCfg,
 )
-from isaaclab.sensors import ContactSensorCfg, FrameTransformerCfg, SensorBase, SensorBaseCfg
+from isaaclab.sensors import ContactSensorCfg, FrameTransformerCfg, RayCasterCfg, SensorBase, SensorBaseCfg
 from isaaclab.sim import SimulationContext
 from isaaclab.sim.utils import get_current_stage_id
 from isaaclab.terrains import TerrainImporter, TerrainImporterCfg
@@ -768,6 +768,15 @@ class InteractiveScene:
                     for filter_prim_path in asset_cfg.filter_prim_paths_expr:
                         updated_filter_prim_paths_expr.append(filter_prim_path.format(ENV_REGEX_NS=self.env_regex_ns))
                     asset_cfg.filter_prim_paths_expr = updated_filter_prim_paths_expr
+                elif isinstance(asset_cfg, RayCasterCfg):
+                    asset_cfg.mesh_prim_paths = [
+                        mesh_prim_path.format(ENV_REGEX_NS=self.env_regex_ns)
+                        for mesh_prim_path in asset_cfg.mesh_prim_paths
+                    ]
+                    asset_cfg.dynamic_mesh_prim_paths = [
+                        mesh_prim_path.format(ENV_REGEX_NS=self.env_regex_ns)
+                        for mesh_prim_path in asset_cfg.dynamic_mesh_prim_paths
+                    ]
 
                 self._sensors[asset_name] = asset_cfg.class_type(asset_cfg)
             elif isinstance(asset_cfg, AssetBaseCfg):
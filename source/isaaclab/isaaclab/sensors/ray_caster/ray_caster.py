@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import numpy as np
 import re
 import torch
+import trimesh
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
@@ -16,14 +18,16 @@ import omni.physics.tensors.impl.api as physx
 import warp as wp
 from isaacsim.core.prims import XFormPrim
 from isaacsim.core.simulation_manager import SimulationManager
-from pxr import UsdGeom, UsdPhysics
+from pxr import Usd, UsdGeom, UsdPhysics
 
 import isaaclab.sim as sim_utils
 import isaaclab.utils.math as math_utils
 from isaaclab.markers import VisualizationMarkers
 from isaaclab.terrains.trimesh.utils import make_plane
-from isaaclab.utils.math import convert_quat, quat_apply, quat_apply_yaw
-from isaaclab.utils.warp import convert_to_warp_mesh, raycast_mesh
+from isaaclab.terrains.utils import compute_elevation_map
+from isaaclab.utils.math import convert_quat, quat_apply
+from isaaclab.utils.warp import convert_to_warp_mesh, launch_ray_chunks, raycast_dynamic_meshes, raycast_mesh
+from isaaclab.utils.warp.kernels import raycast_sensor_kernel, sample_height_map_sensor_kernel
 
 from ..sensor_base import SensorBase
 from .ray_caster_data import RayCasterData
@@ -31,6 +35,9 @@ from .ray_caster_data import RayCasterData
 if TYPE_CHECKING:
     from .ray_caster_cfg import RayCasterCfg
 
+RAY_ALIGNMENTS = {"world": 0, "yaw": 1, "base": 2}
+"""The alignment modes of the rays and their identifiers in the ray-casting kernel."""
+
 
 class RayCaster(SensorBase):
     """A ray-casting sensor.
@@ -43,9 +50,10 @@ class RayCaster(SensorBase):
     converted to warp meshes and stored in the `warp_meshes` list. The ray-caster then ray-casts against
     these warp meshes using the ray pattern provided in the configuration.
 
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
+    The static meshes are merged into a single warp mesh. Moving meshes are ray-cast against as instances:
+    the geometry of each matched prim is read once in its local frame and a bounding volume hierarchy (BVH)
+    is built over the world-frame bounding boxes of the instances. At every update, the BVH is refit with
+    the current poses of the prims and each ray is only cast against the meshes of the instances it intersects.
     """
 
     cfg: RayCasterCfg
@@ -73,6 +81,10 @@ class RayCaster(SensorBase):
         self._data = RayCasterData()
         # the warp meshes used for raycasting.
         self.meshes: dict[str, wp.Mesh] = {}
+        # the warp meshes of the instances of the moving meshes.
+        self.dynamic_meshes: dict[str, list[wp.Mesh]] = {}
+        # the fraction of the sensors that were not ray-cast at the last update
+        self._skipped_ratio = 0.0
 
     def __str__(self) -> str:
         """Returns: A string containing information about the instance."""
@@ -81,6 +93,7 @@ class RayCaster(SensorBase):
             f"\tview type            : {self._view.__class__}\n"
             f"\tupdate period (s)    : {self.cfg.update_period}\n"
             f"\tnumber of meshes     : {len(self.meshes)}\n"
+            f"\tnumber of instances  : {sum(len(meshes) for meshes in self.dynamic_meshes.values())}\n"
             f"\tnumber of sensors    : {self._view.count}\n"
             f"\tnumber of rays/sensor: {self.num_rays}\n"
             f"\ttotal number of rays : {self.num_rays * self._view.count}"
@@ -101,6 +114,16 @@ class RayCaster(SensorBase):
         # return the data
         return self._data
 
+    @property
+    def skipped_ratio(self) -> float:
+        """The fraction of the updated sensors that were not ray-cast at the last update.
+
+        A sensor is not ray-cast if it did not move more than :attr:`RayCasterCfg.update_threshold` since it was
+        last ray-cast. Its hits are then kept from the last update. The ratio is always zero if the threshold
+        is not set.
+        """
+        return self._skipped_ratio
+
     """
     Operations.
     """
@@ -123,6 +146,8 @@ class RayCaster(SensorBase):
         self.ray_cast_drift[env_ids] = math_utils.sample_uniform(
             ranges[:, 0], ranges[:, 1], (num_envs_ids, 3), device=self.device
         )
+        # ray-cast the sensors at the next updates since the drift changed
+        self._num_stale_updates[env_ids] = self._num_refresh_updates
 
     """
     Implementation.
@@ -161,12 +186,11 @@ class RayCaster(SensorBase):
 
     def _initialize_warp_meshes(self):
         # check number of mesh prims provided
-        if len(self.cfg.mesh_prim_paths) != 1:
-            raise NotImplementedError(
-                f"RayCaster currently only supports one mesh prim. Received: {len(self.cfg.mesh_prim_paths)}"
-            )
+        if len(self.cfg.mesh_prim_paths) == 0 and len(self.cfg.dynamic_mesh_prim_paths) == 0:
+            raise RuntimeError("No mesh prim paths provided for ray-casting! Please check the mesh prim paths.")
 
         # read prims to ray-cast
+        points_list, indices_list = list(), list()
         for mesh_prim_path in self.cfg.mesh_prim_paths:
             # check if the prim is a plane - handle PhysX plane as a special case
             # if a plane exists then we need to create an infinite mesh that is a plane
@@ -182,32 +206,120 @@ class RayCaster(SensorBase):
                 # check if valid
                 if mesh_prim is None or not mesh_prim.IsValid():
                     raise RuntimeError(f"Invalid mesh prim path: {mesh_prim_path}")
-                # cast into UsdGeomMesh
-                mesh_prim = UsdGeom.Mesh(mesh_prim)
-                # read the vertices and faces
-                points = np.asarray(mesh_prim.GetPointsAttr().Get())
-                transform_matrix = np.array(omni.usd.get_world_transform_matrix(mesh_prim)).T
-                points = np.matmul(points, transform_matrix[:3, :3].T)
-                points += transform_matrix[:3, 3]
-                indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
-                wp_mesh = convert_to_warp_mesh(points, indices, device=self.device)
+                # read the vertices and faces in the world frame
+                points, indices = _read_geometry_prim(mesh_prim)
                 # print info
                 omni.log.info(
                     f"Read mesh prim: {mesh_prim.GetPath()} with {len(points)} vertices and {len(indices)} faces."
                 )
             else:
                 mesh = make_plane(size=(2e6, 2e6), height=0.0, center_zero=True)
-                wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
+                points, indices = mesh.vertices, mesh.faces.reshape(-1)
                 # print info
                 omni.log.info(f"Created infinite plane mesh prim: {mesh_prim.GetPath()}.")
-            # add the warp mesh to the list
-            self.meshes[mesh_prim_path] = wp_mesh
-
-        # throw an error if no meshes are found
-        if all([mesh_prim_path not in self.meshes for mesh_prim_path in self.cfg.mesh_prim_paths]):
-            raise RuntimeError(
-                f"No meshes found for ray-casting! Please check the mesh prim paths: {self.cfg.mesh_prim_paths}"
-            )
+            # add the mesh to the list
+            points_list.append(np.asarray(points, dtype=np.float32))
+            indices_list.append(np.asarray(indices, dtype=np.int32).reshape(-1))
+
+        # merge the static meshes into a single warp mesh
+        # note: the static meshes never move. A single mesh avoids ray-casting each of them separately.
+        self._static_mesh: wp.Mesh | None = None
+        if len(points_list) > 0:
+            offsets = np.cumsum([0] + [len(points) for points in points_list[:-1]])
+            points = np.concatenate(points_list)
+            indices = np.concatenate([indices + offset for indices, offset in zip(indices_list, offsets)])
+            self._static_mesh = convert_to_warp_mesh(points, indices, device=self.device)
+            for mesh_prim_path in self.cfg.mesh_prim_paths:
+                self.meshes[mesh_prim_path] = self._static_mesh
+
+        # read the moving meshes
+        self._initialize_dynamic_meshes()
+
+    def _initialize_dynamic_meshes(self):
+        """Reads the geometry of the moving meshes and builds the BVH over their instances.
+
+        The geometry of each matched prim is stored in the frame of the prim. Prims with identical geometry
+        share the same warp mesh. At every update, the bounding boxes of the instances are moved with the
+        poses of the prims and the BVH is refit (see :meth:`_update_dynamic_meshes`).
+        """
+        self.dynamic_meshes = {}
+        self._dynamic_mesh_views = list()
+        self._dynamic_bvh: wp.Bvh | None = None
+        if len(self.cfg.dynamic_mesh_prim_paths) == 0:
+            # note: the ray-casting kernel expects valid arrays even if there are no instances
+            self._dynamic_mesh_ids = wp.empty((0,), dtype=wp.uint64, device=self.device)
+            self._dynamic_mesh_pos_wp = wp.empty((0,), dtype=wp.vec3, device=self.device)
+            self._dynamic_mesh_quat_wp = wp.empty((0,), dtype=wp.quat, device=self.device)
+            return
+
+        # warp meshes with the same geometry are shared between instances
+        unique_meshes: dict[str, wp.Mesh] = {}
+        centers, half_extents = list(), list()
+        for prim_path_expr in self.cfg.dynamic_mesh_prim_paths:
+            prim = sim_utils.find_first_matching_prim(prim_path_expr)
+            if prim is None:
+                raise RuntimeError(f"Failed to find a prim at path expression: {prim_path_expr}")
+            # create view to track the poses of the prims
+            if prim.HasAPI(UsdPhysics.RigidBodyAPI):
+                view = self._physics_sim_view.create_rigid_body_view(prim_path_expr.replace(".*", "*"))
+            else:
+                view = XFormPrim(prim_path_expr, reset_xform_properties=False)
+            self._dynamic_mesh_views.append(view)
+            # read the geometry of each prim in its frame
+            # note: the prims are read in the order of the view since the poses are read from it
+            pos_w, quat_w = self._get_dynamic_mesh_poses(view)
+            rot_w = math_utils.matrix_from_quat(convert_quat(quat_w, to="wxyz")).cpu().numpy()
+            meshes = list()
+            for prim_path, prim_pos_w, prim_rot_w in zip(view.prim_paths, pos_w.cpu().numpy(), rot_w):
+                geometry_prims = sim_utils.get_all_matching_child_prims(
+                    prim_path, lambda prim: prim.GetTypeName() in ["Mesh", "Cube", "Sphere"]
+                )
+                if len(geometry_prims) == 0:
+                    raise RuntimeError(f"No meshes found for ray-casting under the prim: {prim_path}")
+                points_list, indices_list, num_points = list(), list(), 0
+                for geometry_prim in geometry_prims:
+                    points, indices = _read_geometry_prim(geometry_prim)
+                    points_list.append(points)
+                    indices_list.append(indices + num_points)
+                    num_points += len(points)
+                # express the points in the frame of the prim
+                points = np.matmul(np.concatenate(points_list) - prim_pos_w, prim_rot_w).astype(np.float32)
+                indices = np.concatenate(indices_list).astype(np.int32)
+                # create the warp mesh or reuse the one with the same geometry
+                key = hashlib.md5(points.tobytes() + indices.tobytes()).hexdigest()
+                if key not in unique_meshes:
+                    unique_meshes[key] = convert_to_warp_mesh(points, indices, device=self.device)
+                    omni.log.info(
+                        f"Read dynamic mesh prim: {prim_path} with {len(points)} vertices and {len(indices)} faces."
+                    )
+                meshes.append(unique_meshes[key])
+                # store the bounding box in the frame of the prim
+                lower, upper = points.min(axis=0), points.max(axis=0)
+                centers.append(0.5 * (upper + lower))
+                half_extents.append(0.5 * (upper - lower))
+            self.dynamic_meshes[prim_path_expr] = meshes
+
+        # create buffers for the instances
+        num_instances = len(centers)
+        self._dynamic_mesh_ids = wp.array(
+            [mesh.id for meshes in self.dynamic_meshes.values() for mesh in meshes], dtype=wp.uint64, device=self.device
+        )
+        self._dynamic_mesh_centers = torch.tensor(np.array(centers), dtype=torch.float32, device=self.device)
+        self._dynamic_mesh_half_extents = torch.tensor(np.array(half_extents), dtype=torch.float32, device=self.device)
+        # note: the orientations are stored as (x, y, z, w) for the ray-casting kernels
+        self._dynamic_mesh_pos_w = torch.zeros(num_instances, 3, device=self.device)
+        self._dynamic_mesh_quat_w = torch.zeros(num_instances, 4, device=self.device)
+        self._dynamic_mesh_lowers = torch.zeros(num_instances, 3, device=self.device)
+        self._dynamic_mesh_uppers = torch.zeros(num_instances, 3, device=self.device)
+        self._dynamic_mesh_pos_wp = wp.from_torch(self._dynamic_mesh_pos_w, dtype=wp.vec3)
+        self._dynamic_mesh_quat_wp = wp.from_torch(self._dynamic_mesh_quat_w, dtype=wp.quat)
+        # build the BVH over the world-frame bounding boxes of the instances
+        # note: the BVH keeps references to the bounds. These are updated in-place before refitting.
+        self._update_dynamic_mesh_poses()
+        self._dynamic_bvh = wp.Bvh(
+            wp.from_torch(self._dynamic_mesh_lowers, dtype=wp.vec3),
+            wp.from_torch(self._dynamic_mesh_uppers, dtype=wp.vec3),
+        )
 
     def _initialize_rays_impl(self):
         # compute ray stars and directions
@@ -228,6 +340,72 @@ class RayCaster(SensorBase):
         self._data.pos_w = torch.zeros(self._view.count, 3, device=self._device)
         self._data.quat_w = torch.zeros(self._view.count, 4, device=self._device)
         self._data.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
+        # map the persistent buffers to warp arrays for the ray-casting kernel
+        # note: the buffers are only modified in-place, so the warp arrays remain valid
+        self._ALL_INDICES_WP = wp.from_torch(
+            torch.arange(self._view.count, dtype=torch.int32, device=self._device), dtype=wp.int32
+        )
+        self._pos_w_wp = wp.from_torch(self._data.pos_w, dtype=wp.vec3)
+        self._quat_w_wp = wp.from_torch(self._data.quat_w, dtype=wp.vec4)
+        self._ray_cast_drift_wp = wp.from_torch(self.ray_cast_drift, dtype=wp.vec3)
+        self._ray_starts_wp = wp.from_torch(self.ray_starts, dtype=wp.vec3)
+        self._ray_directions_wp = wp.from_torch(self.ray_directions, dtype=wp.vec3)
+        self._ray_hits_w_wp = wp.from_torch(self._data.ray_hits_w, dtype=wp.vec3)
+        # create buffers to reuse the hits of sensors that do not move
+        self._initialize_update_threshold()
+        # compute the height map of the static meshes
+        self._initialize_height_map()
+
+    def _initialize_update_threshold(self, num_refresh_updates: int = 1):
+        """Creates the buffers to track the poses at which the sensors were last ray-cast.
+
+        Args:
+            num_refresh_updates: The number of updates that ray-cast a sensor after it moved. Defaults to 1.
+        """
+        self._num_refresh_updates = num_refresh_updates
+        self._last_pos_w = torch.zeros(self._view.count, 3, device=self._device)
+        self._last_quat_w = torch.zeros(self._view.count, 4, device=self._device)
+        self._last_quat_w[:, 0] = 1.0
+        self._num_stale_updates = torch.full((self._view.count,), num_refresh_updates, device=self._device)
+
+    def _initialize_height_map(self):
+        """Computes the height map of the static meshes to replace the ray-casting of vertical rays.
+
+        The height map is only used if all rays point downwards along the z-axis and there are no moving
+        meshes. Otherwise, the rays are ray-cast against the meshes.
+        """
+        self._height_map: torch.Tensor | None = None
+        if self.cfg.height_map_resolution is None:
+            return
+        # check that the rays can be replaced by sampling the height map
+        if self._static_mesh is None or len(self.cfg.dynamic_mesh_prim_paths) > 0:
+            omni.log.warn(
+                "The height map of the ray-caster only supports static meshes. Falling back to ray-casting against"
+                f" the meshes for the sensor: {self.cfg.prim_path}."
+            )
+            return
+        if not (torch.all(self.ray_directions[..., :2].abs() < 1e-6) and torch.all(self.ray_directions[..., 2] < 0)):
+            omni.log.warn(
+                "The height map of the ray-caster only supports rays pointing downwards. Falling back to ray-casting"
+                f" against the meshes for the sensor: {self.cfg.prim_path}."
+            )
+            return
+        # check the size of the height map
+        # note: this is exceeded by the (very large) meshes of ground planes, which are ray-cast against directly
+        points = wp.to_torch(self._static_mesh.points)
+        extent = points[:, :2].max(dim=0).values - points[:, :2].min(dim=0).values
+        num_cells = torch.prod(extent / self.cfg.height_map_resolution + 1).item()
+        if num_cells > 1e8:
+            omni.log.warn(
+                f"The height map of the ray-caster would be too large ({num_cells:.0f} cells) for the static meshes:"
+                f" {self.cfg.mesh_prim_paths}. Falling back to ray-casting against the meshes for the sensor:"
+                f" {self.cfg.prim_path}. Please increase the resolution to use the height map."
+            )
+            return
+        # compute the height map
+        self._height_map, origin = compute_elevation_map(self._static_mesh, self.cfg.height_map_resolution)
+        self._height_map_wp = wp.from_torch(self._height_map)
+        self._height_map_origin = wp.vec2(*origin.tolist())
 
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         """Fills the buffers of the sensor data."""
@@ -242,13 +420,8 @@ class RayCaster(SensorBase):
             quat_w = convert_quat(quat_w, to="wxyz")
         else:
             raise RuntimeError(f"Unsupported view type: {type(self._view)}")
-        # note: we clone here because we are read-only operations
-        pos_w = pos_w.clone()
-        quat_w = quat_w.clone()
-        # apply drift to ray starting position in world frame
-        pos_w += self.drift[env_ids]
-        # store the poses
-        self._data.pos_w[env_ids] = pos_w
+        # store the poses with the drift applied to the position in world frame
+        self._data.pos_w[env_ids] = pos_w + self.drift[env_ids]
         self._data.quat_w[env_ids] = quat_w
 
         # check if user provided attach_yaw_only flag
@@ -266,42 +439,190 @@ class RayCaster(SensorBase):
                 msg += " Setting ray_alignment to 'base'."
             # log the warning
             omni.log.warn(msg)
-        # ray cast based on the sensor poses
-        if self.cfg.ray_alignment == "world":
-            # apply horizontal drift to ray starting position in ray caster frame
-            pos_w[:, 0:2] += self.ray_cast_drift[env_ids, 0:2]
-            # no rotation is considered and directions are not rotated
-            ray_starts_w = self.ray_starts[env_ids]
-            ray_starts_w += pos_w.unsqueeze(1)
-            ray_directions_w = self.ray_directions[env_ids]
-        elif self.cfg.ray_alignment == "yaw":
-            # apply horizontal drift to ray starting position in ray caster frame
-            pos_w[:, 0:2] += quat_apply_yaw(quat_w, self.ray_cast_drift[env_ids])[:, 0:2]
-            # only yaw orientation is considered and directions are not rotated
-            ray_starts_w = quat_apply_yaw(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
-            ray_starts_w += pos_w.unsqueeze(1)
-            ray_directions_w = self.ray_directions[env_ids]
-        elif self.cfg.ray_alignment == "base":
-            # apply horizontal drift to ray starting position in ray caster frame
-            pos_w[:, 0:2] += quat_apply(quat_w, self.ray_cast_drift[env_ids])[:, 0:2]
-            # full orientation is considered
-            ray_starts_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
-            ray_starts_w += pos_w.unsqueeze(1)
-            ray_directions_w = quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
-        else:
+        if self.cfg.ray_alignment not in RAY_ALIGNMENTS:
             raise RuntimeError(f"Unsupported ray_alignment type: {self.cfg.ray_alignment}.")
 
-        # ray cast and store the hits
-        # TODO: Make this work for multiple meshes?
-        self._data.ray_hits_w[env_ids] = raycast_mesh(
-            ray_starts_w,
-            ray_directions_w,
-            max_dist=self.cfg.max_distance,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
-        )[0]
+        # select the sensors that moved since they were last ray-cast
+        # note: the other sensors keep their hits from the last update
+        if self.cfg.update_threshold is not None:
+            env_ids, _, _ = self._select_moved_sensors(env_ids, self._data.pos_w[env_ids], quat_w)
+            if len(env_ids) == 0:
+                return
+        # resolve the sensors to update
+        if len(env_ids) == self._view.count:
+            env_ids_wp = self._ALL_INDICES_WP
+        else:
+            env_ids_wp = wp.from_torch(torch.as_tensor(env_ids, dtype=torch.int32, device=self._device))
+        # sample the height map for vertical rays that are not rotated with the sensor
+        # note: on the CPU, the sensors are split into chunks that are processed in parallel
+        if self._height_map is not None and self.cfg.ray_alignment != "base":
+            launch_ray_chunks(
+                kernel=sample_height_map_sensor_kernel,
+                dim=(len(env_ids), self.num_rays),
+                inputs=[
+                    self._height_map_wp,
+                    self._height_map_origin,
+                    float(self.cfg.height_map_resolution),
+                    env_ids_wp,
+                    self._pos_w_wp,
+                    self._quat_w_wp,
+                    self._ray_cast_drift_wp,
+                    self._ray_starts_wp,
+                    self._ray_hits_w_wp,
+                    RAY_ALIGNMENTS[self.cfg.ray_alignment],
+                    float(self.cfg.max_distance),
+                ],
+                chunk_input_ids=[3],
+                device=self._device,
+            )
+            return
+        # move the dynamic meshes
+        has_dynamic_meshes = self._dynamic_bvh is not None
+        if has_dynamic_meshes:
+            self._update_dynamic_meshes()
+        # transform the rays based on the sensor poses and ray cast them
+        # note: the hits (with the vertical drift) are written directly into the data buffer
+        launch_ray_chunks(
+            kernel=raycast_sensor_kernel,
+            dim=(len(env_ids), self.num_rays),
+            inputs=[
+                self._static_mesh.id if self._static_mesh is not None else 0,
+                self._dynamic_bvh.id if has_dynamic_meshes else 0,
+                self._dynamic_mesh_ids,
+                self._dynamic_mesh_pos_wp,
+                self._dynamic_mesh_quat_wp,
+                env_ids_wp,
+                self._pos_w_wp,
+                self._quat_w_wp,
+                self._ray_cast_drift_wp,
+                self._ray_starts_wp,
+                self._ray_directions_wp,
+                self._ray_hits_w_wp,
+                RAY_ALIGNMENTS[self.cfg.ray_alignment],
+                float(self.cfg.max_distance),
+                int(self._static_mesh is not None),
+                int(has_dynamic_meshes),
+            ],
+            chunk_input_ids=[5],
+            device=self._device,
+        )
+
+    def _raycast(
+        self,
+        ray_starts_w: torch.Tensor,
+        ray_directions_w: torch.Tensor,
+        max_dist: float,
+        return_distance: bool = False,
+        return_normal: bool = False,
+    ) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None]:
+        """Ray-casts against the static and the moving meshes.
+
+        The rays are first cast against the merged static mesh. The hits are then updated in-place where
+        a moving mesh is hit closer.
+
+        Args:
+            ray_starts_w: The starting positions of the rays in the world frame. Shape is (N, B, 3).
+            ray_directions_w: The directions of the rays in the world frame. Shape is (N, B, 3).
+            max_dist: The maximum distance to ray-cast.
+            return_distance: Whether to return the distances of the hits. Defaults to False.
+            return_normal: Whether to return the normals of the hits. Defaults to False.
+
+        Returns:
+            The ray hit positions, distances and normals. The distances and normals are None if not requested.
+        """
+        has_dynamic_meshes = self._dynamic_bvh is not None
+        # ray cast against the static meshes
+        if self._static_mesh is not None:
+            ray_hits, ray_distance, ray_normal, _ = raycast_mesh(
+                ray_starts_w,
+                ray_directions_w,
+                mesh=self._static_mesh,
+                max_dist=max_dist,
+                return_distance=return_distance or has_dynamic_meshes,
+                return_normal=return_normal,
+            )
+        else:
+            ray_hits = torch.full_like(ray_starts_w, float("inf"))
+            ray_distance = torch.full(ray_starts_w.shape[:-1], float("inf"), device=ray_starts_w.device)
+            ray_normal = torch.full_like(ray_starts_w, float("inf")) if return_normal else None
+        # ray cast against the moving meshes
+        if has_dynamic_meshes:
+            self._update_dynamic_meshes()
+            raycast_dynamic_meshes(
+                ray_starts_w.contiguous(),
+                ray_directions_w.contiguous(),
+                bvh=self._dynamic_bvh,
+                mesh_ids=self._dynamic_mesh_ids,
+                mesh_positions=self._dynamic_mesh_pos_w,
+                mesh_orientations=self._dynamic_mesh_quat_w,
+                ray_hits=ray_hits,
+                ray_distance=ray_distance,
+                ray_normal=ray_normal,
+                max_dist=max_dist,
+            )
+        return ray_hits, ray_distance if return_distance else None, ray_normal
+
+    def _select_moved_sensors(
+        self, env_ids: torch.Tensor, pos_w: torch.Tensor, quat_w: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Selects the sensors that need to be ray-cast.
+
+        A sensor is ray-cast if it moved more than :attr:`RayCasterCfg.update_threshold` since it was last
+        ray-cast, or if it was ray-cast fewer than the number of refresh updates after its last motion or reset.
+
+        Args:
+            env_ids: The indices of the sensors to update.
+            pos_w: The positions of the sensors in the world frame. Shape is (len(env_ids), 3).
+            quat_w: The orientations (w, x, y, z) of the sensors in the world frame. Shape is (len(env_ids), 4).
 
-        # apply vertical drift to ray starting position in ray caster frame
-        self._data.ray_hits_w[env_ids, :, 2] += self.ray_cast_drift[env_ids, 2].unsqueeze(-1)
+        Returns:
+            The indices, positions and orientations of the sensors to ray-cast.
+        """
+        num_sensors = len(env_ids)
+        # check the motion since the last ray-casting
+        moved = torch.norm(pos_w - self._last_pos_w[env_ids], dim=-1) > self.cfg.update_threshold[0]
+        moved |= math_utils.quat_error_magnitude(quat_w, self._last_quat_w[env_ids]) > self.cfg.update_threshold[1]
+        self._num_stale_updates[env_ids[moved]] = self._num_refresh_updates
+        # select the stale sensors
+        selected = self._num_stale_updates[env_ids] > 0
+        env_ids, pos_w, quat_w = env_ids[selected], pos_w[selected], quat_w[selected]
+        # store the poses at which the sensors are ray-cast
+        self._num_stale_updates[env_ids] -= 1
+        self._last_pos_w[env_ids] = pos_w
+        self._last_quat_w[env_ids] = quat_w
+        self._skipped_ratio = 1.0 - len(env_ids) / num_sensors if num_sensors > 0 else 0.0
+        return env_ids, pos_w, quat_w
+
+    def _update_dynamic_meshes(self):
+        """Reads the poses of the moving meshes and refits the BVH over their instances."""
+        self._update_dynamic_mesh_poses()
+        self._dynamic_bvh.refit()
+
+    def _update_dynamic_mesh_poses(self):
+        """Reads the poses of the moving meshes and moves the bounding boxes of their instances in-place."""
+        start = 0
+        for view in self._dynamic_mesh_views:
+            pos_w, quat_w = self._get_dynamic_mesh_poses(view)
+            self._dynamic_mesh_pos_w[start : start + len(pos_w)] = pos_w
+            self._dynamic_mesh_quat_w[start : start + len(pos_w)] = quat_w
+            start += len(pos_w)
+        # rotate the bounding boxes of the instances
+        rot_w = math_utils.matrix_from_quat(convert_quat(self._dynamic_mesh_quat_w, to="wxyz"))
+        centers_w = torch.bmm(rot_w, self._dynamic_mesh_centers.unsqueeze(-1)).squeeze(-1) + self._dynamic_mesh_pos_w
+        half_extents_w = torch.bmm(rot_w.abs(), self._dynamic_mesh_half_extents.unsqueeze(-1)).squeeze(-1)
+        self._dynamic_mesh_lowers[:] = centers_w - half_extents_w
+        self._dynamic_mesh_uppers[:] = centers_w + half_extents_w
+
+    def _get_dynamic_mesh_poses(self, view: XFormPrim | physx.RigidBodyView) -> tuple[torch.Tensor, torch.Tensor]:
+        """Returns the positions and orientations (x, y, z, w) of the prims of a moving mesh view.
+
+        Note:
+            The orientations follow the convention of warp since they are only used in the ray-casting kernels.
+        """
+        if isinstance(view, XFormPrim):
+            pos_w, quat_w = view.get_world_poses()
+            return pos_w, convert_quat(quat_w, to="xyzw")
+        return view.get_transforms().split([3, 4], dim=-1)
 
     def _set_debug_vis_impl(self, debug_vis: bool):
         # set visibility of markers
@@ -332,3 +653,33 @@ class RayCaster(SensorBase):
         super()._invalidate_initialize_callback(event)
         # set all existing views to None to invalidate them
         self._view = None
+
+
+"""
+Helper functions.
+"""
+
+
+def _read_geometry_prim(prim: Usd.Prim) -> tuple[np.ndarray, np.ndarray]:
+    """Reads the vertices and the flattened triangle indices of a mesh, cube or sphere prim in the world frame.
+
+    Note:
+        The faces of mesh prims are expected to be triangles.
+    """
+    if prim.GetTypeName() == "Cube":
+        size = UsdGeom.Cube(prim).GetSizeAttr().Get()
+        mesh = trimesh.creation.box(extents=(size, size, size))
+        points, indices = mesh.vertices, mesh.faces
+    elif prim.GetTypeName() == "Sphere":
+        radius = UsdGeom.Sphere(prim).GetRadiusAttr().Get()
+        mesh = trimesh.creation.icosphere(subdivisions=3, radius=radius)
+        points, indices = mesh.vertices, mesh.faces
+    else:
+        mesh_prim = UsdGeom.Mesh(prim)
+        points = np.asarray(mesh_prim.GetPointsAttr().Get())
+        indices = np.asarray(mesh_prim.GetFaceVertexIndicesAttr().Get())
+    # transform the points to the world frame
+    transform_matrix = np.array(omni.usd.get_world_transform_matrix(prim)).T
+    points = np.matmul(points, transform_matrix[:3, :3].T)
+    points += transform_matrix[:3, 3]
+    return points, np.asarray(indices).reshape(-1)
@@ -15,7 +15,6 @@ from isaacsim.core.prims import XFormPrim
 
 import isaaclab.utils.math as math_utils
 from isaaclab.sensors.camera import CameraData
-from isaaclab.utils.warp import raycast_mesh
 
 from .ray_caster import RayCaster
 
@@ -39,9 +38,7 @@ class RayCasterCamera(RayCaster):
     - ``"distance_to_image_plane"``: An image containing distances of 3D points from camera plane along camera's z-axis.
     - ``"normals"``: An image containing the local surface normal vectors at each pixel.
 
-    .. note::
-        Currently, only static meshes are supported. Extending the warp mesh to support dynamic meshes
-        is a work in progress.
+    Similar to the :class:`RayCaster`, the camera ray-casts against static meshes and moving meshes.
     """
 
     cfg: RayCasterCameraCfg
@@ -138,6 +135,8 @@ class RayCasterCamera(RayCaster):
         self.ray_starts[env_ids], self.ray_directions[env_ids] = self.cfg.pattern_cfg.func(
             self.cfg.pattern_cfg, self._data.intrinsic_matrices[env_ids], self._device
         )
+        # ray-cast the complete images at the next updates
+        self._num_stale_updates[env_ids] = self._num_refresh_updates
 
     def reset(self, env_ids: Sequence[int] | None = None):
         # reset the timestamps
@@ -247,6 +246,17 @@ class RayCasterCamera(RayCaster):
         self.num_rays = self.ray_directions.shape[1]
         # create buffer to store ray hits
         self.ray_hits_w = torch.zeros(self._view.count, self.num_rays, 3, device=self._device)
+        # create the subsets of rays for strided ray-casting
+        # note: each subset contains one pixel in every block of stride x stride pixels
+        stride = self.cfg.ray_stride
+        if stride < 1:
+            raise ValueError(f"The ray stride of the ray-caster camera must be at least 1. Received: {stride}.")
+        pixel_ids = torch.arange(self.num_rays, device=self._device).view(self.image_shape)
+        self._ray_subsets = [pixel_ids[i::stride, j::stride].flatten() for i in range(stride) for j in range(stride)]
+        self._ray_subset_id = 0
+        # create buffers to reuse the images of cameras that do not move
+        # note: the complete images are ray-cast after a camera moved
+        self._initialize_update_threshold(num_refresh_updates=len(self._ray_subsets))
         # set offsets
         quat_w = math_utils.convert_camera_frame_orientation_convention(
             torch.tensor([self.cfg.offset.rot], device=self._device), origin=self.cfg.offset.convention, target="world"
@@ -256,43 +266,53 @@ class RayCasterCamera(RayCaster):
 
     def _update_buffers_impl(self, env_ids: Sequence[int]):
         """Fills the buffers of the sensor data."""
-        # increment frame count
-        self._frame[env_ids] += 1
-
         # compute poses from current view
         pos_w, quat_w = self._compute_camera_world_poses(env_ids)
         # update the data
         self._data.pos_w[env_ids] = pos_w
         self._data.quat_w_world[env_ids] = quat_w
 
+        # select the cameras and the rays to ray-cast
+        if self.cfg.update_threshold is not None:
+            env_ids, pos_w, quat_w = self._select_moved_sensors(env_ids, pos_w, quat_w)
+            if len(env_ids) == 0:
+                return
+        if len(self._ray_subsets) == 1:
+            index = (env_ids,)
+        else:
+            index = (env_ids[:, None], self._ray_subsets[self._ray_subset_id])
+            self._ray_subset_id = (self._ray_subset_id + 1) % len(self._ray_subsets)
+        # increment frame count
+        self._frame[env_ids] += 1
+
         # note: full orientation is considered
-        ray_starts_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_starts[env_ids])
+        ray_starts = self.ray_starts[index]
+        num_rays = ray_starts.shape[1]
+        ray_starts_w = math_utils.quat_apply(quat_w.repeat(1, num_rays), ray_starts)
         ray_starts_w += pos_w.unsqueeze(1)
-        ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, self.num_rays), self.ray_directions[env_ids])
+        ray_directions_w = math_utils.quat_apply(quat_w.repeat(1, num_rays), self.ray_directions[index])
 
         # ray cast and store the hits
         # note: we set max distance to 1e6 during the ray-casting. THis is because we clip the distance
         # to the image plane and distance to the camera to the maximum distance afterwards in-order to
         # match the USD camera behavior.
-
-        # TODO: Make ray-casting work for multiple meshes?
-        # necessary for regular dictionaries.
-        self.ray_hits_w, ray_depth, ray_normal, _ = raycast_mesh(
+        ray_hits, ray_depth, ray_normal = self._raycast(
             ray_starts_w,
             ray_directions_w,
-            mesh=self.meshes[self.cfg.mesh_prim_paths[0]],
             max_dist=1e6,
             return_distance=any(
                 [name in self.cfg.data_types for name in ["distance_to_image_plane", "distance_to_camera"]]
             ),
             return_normal="normals" in self.cfg.data_types,
         )
+        self.ray_hits_w[index] = ray_hits
         # update output buffers
+        # note: the images are viewed as (N, H * W, C) to write the ray-cast pixels only
         if "distance_to_image_plane" in self.cfg.data_types:
             # note: data is in camera frame so we only take the first component (z-axis of camera frame)
             distance_to_image_plane = (
                 math_utils.quat_apply(
-                    math_utils.quat_inv(quat_w).repeat(1, self.num_rays),
+                    math_utils.quat_inv(quat_w).repeat(1, num_rays),
                     (ray_depth[:, :, None] * ray_directions_w),
                 )
             )[:, :, 0]
@@ -303,19 +323,20 @@ class RayCasterCamera(RayCaster):
             elif self.cfg.depth_clipping_behavior == "zero":
                 distance_to_image_plane[distance_to_image_plane > self.cfg.max_distance] = 0.0
                 distance_to_image_plane[torch.isnan(distance_to_image_plane)] = 0.0
-            self._data.output["distance_to_image_plane"][env_ids] = distance_to_image_plane.view(
-                -1, *self.image_shape, 1
-            )
+            output = self._data.output["distance_to_image_plane"].view(self._view.count, self.num_rays, 1)
+            output[index] = distance_to_image_plane.unsqueeze(-1)
 
         if "distance_to_camera" in self.cfg.data_types:
             if self.cfg.depth_clipping_behavior == "max":
                 ray_depth = torch.clip(ray_depth, max=self.cfg.max_distance)
             elif self.cfg.depth_clipping_behavior == "zero":
                 ray_depth[ray_depth > self.cfg.max_distance] = 0.0
-            self._data.output["distance_to_camera"][env_ids] = ray_depth.view(-1, *self.image_shape, 1)
+            output = self._data.output["distance_to_camera"].view(self._view.count, self.num_rays, 1)
+            output[index] = ray_depth.unsqueeze(-1)
 
         if "normals" in self.cfg.data_types:
-            self._data.output["normals"][env_ids] = ray_normal.view(-1, *self.image_shape, 3)
+            output = self._data.output["normals"].view(self._view.count, self.num_rays, 3)
+            output[index] = ray_normal
 
     def _debug_vis_callback(self, event):
         # in case it crashes be safe
@@ -17,7 +17,11 @@ from .ray_caster_cfg import RayCasterCfg
 
 @configclass
 class RayCasterCameraCfg(RayCasterCfg):
-    """Configuration for the ray-cast sensor."""
+    """Configuration for the ray-cast sensor.
+
+    If :attr:`update_threshold` is set, the images of a camera are also refreshed while they are not complete yet
+    (see :attr:`ray_stride`), even if the camera did not move.
+    """
 
     @configclass
     class OffsetCfg:
@@ -58,6 +62,16 @@ class RayCasterCameraCfg(RayCasterCfg):
     pattern_cfg: PinholeCameraPatternCfg = MISSING
     """The pattern that defines the local ray starting positions and directions in a pinhole camera pattern."""
 
+    ray_stride: int = 1
+    """The stride between the pixels that are ray-cast at each update. Defaults to 1, in which case all
+    pixels are ray-cast.
+
+    If larger than 1, each update only ray-casts one pixel in every block of ``ray_stride x ray_stride`` pixels.
+    The position of the pixel in the block cycles over the updates, so that the complete images are refreshed
+    every ``ray_stride**2`` updates. The other pixels keep their last values. This reduces the cost of an update
+    by a factor of ``ray_stride**2`` at the cost of latency for moving cameras and scenes.
+    """
+
     def __post_init__(self):
         # for cameras, this quantity should be False always.
         self.ray_alignment = "base"
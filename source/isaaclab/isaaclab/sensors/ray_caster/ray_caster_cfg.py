@@ -34,11 +34,22 @@ class RayCasterCfg(SensorBaseCfg):
     class_type: type = RayCaster
 
     mesh_prim_paths: list[str] = MISSING
-    """The list of mesh primitive paths to ray cast against.
+    """The list of static mesh primitive paths to ray cast against.
 
-    Note:
-        Currently, only a single static mesh is supported. We are working on supporting multiple
-        static meshes and dynamic meshes.
+    The first mesh (or ground plane) found under each path is read once and all of them are merged into
+    a single warp mesh. The list can be empty if :attr:`dynamic_mesh_prim_paths` is not empty.
+    """
+
+    dynamic_mesh_prim_paths: list[str] = []
+    """The list of prim path expressions of moving meshes to ray cast against. Defaults to an empty list.
+
+    Each expression can match multiple prims (for instance, ``{ENV_REGEX_NS}/Object``), which are ray-cast
+    against as instances of their meshes. The geometry of a prim consists of all the meshes, cubes and spheres
+    under it. It is read once in the frame of the prim and the pose of the prim is tracked at every update.
+    Prims with identical geometry share the same warp mesh.
+
+    The poses are read from a rigid body view if the matched prims are rigid bodies, and from an xform view
+    otherwise.
     """
 
     offset: OffsetCfg = OffsetCfg()
@@ -78,6 +89,40 @@ class RayCasterCfg(SensorBaseCfg):
     max_distance: float = 1e6
     """Maximum distance (in meters) from the sensor to ray cast to. Defaults to 1e6."""
 
+    height_map_resolution: float | None = None
+    """The resolution (in m) of the height map of the static meshes. Defaults to None, in which case the rays
+    are always ray-cast against the meshes.
+
+    If set, the height map of the static meshes is computed once at initialization. The hits of rays pointing
+    downwards along the z-axis are then interpolated bilinearly from the height map instead of ray-casting
+    against the meshes. This is much cheaper for height scanners, for instance, with a
+    :class:`~isaaclab.sensors.ray_caster.patterns.GridPatternCfg` and :attr:`ray_alignment` set to ``"yaw"``.
+    The accuracy depends on the resolution, which should match the resolution of the terrain (for instance, the
+    horizontal scale of height-field terrains). The height map is computed with
+    :func:`~isaaclab.terrains.compute_elevation_map`.
+
+    The height map stores the top surface of the meshes. Rays that start below an overhang (for instance, under
+    a table or inside a tunnel) thus hit the overhang instead of the surface below it.
+
+    The height map is only used for the ``"world"`` and ``"yaw"`` alignment modes, when all rays point
+    downwards, there are no :attr:`dynamic_mesh_prim_paths` and the height map has at most 1e8 cells (which
+    excludes ground planes). Otherwise, a warning is logged and the rays are ray-cast against the meshes.
+    """
+
+    update_threshold: tuple[float, float] | None = None
+    """The thresholds on the motion of the sensors (in m, rad) below which their hits are reused.
+    Defaults to None, in which case all sensors are ray-cast at every update.
+
+    If set, a sensor is only ray-cast if its position (including the drift) or orientation changed more than
+    the thresholds since it was last ray-cast, or if it was reset since then. Otherwise, its hits are kept from
+    the last update. This is useful for scenes where most sensors are static, such as fixed scanners. The
+    fraction of the sensors that were not ray-cast at the last update is given by
+    :attr:`RayCaster.skipped_ratio`.
+
+    Note:
+        Only the motion of the sensors is considered. Moving meshes in the scene do not trigger an update.
+    """
+
     drift_range: tuple[float, float] = (0.0, 0.0)
     """The range of drift (in meters) to add to the ray starting positions (xyz) in world frame. Defaults to (0.0, 0.0).
 
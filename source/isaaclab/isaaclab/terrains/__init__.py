@@ -21,9 +21,10 @@ There are two main components in this package:
 """
 from .height_field import *  # noqa: F401, F403
 from .sub_terrain_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg
+from .terrain_cache import TerrainCache
 from .terrain_generator import TerrainGenerator
 from .terrain_generator_cfg import TerrainGeneratorCfg
 from .terrain_importer import TerrainImporter
 from .terrain_importer_cfg import TerrainImporterCfg
 from .trimesh import *  # noqa: F401, F403
-from .utils import color_meshes_by_height, create_prim_from_mesh
+from .utils import color_meshes_by_height, compute_elevation_map, create_prim_from_mesh, deterministic_terrain
@@ -11,6 +11,7 @@ import numpy as np
 import scipy.interpolate as interpolate
 from typing import TYPE_CHECKING
 
+from ..utils import deterministic_terrain
 from .utils import height_field_to_mesh
 
 if TYPE_CHECKING:
@@ -79,6 +80,7 @@ def random_uniform_terrain(difficulty: float, cfg: hf_terrains_cfg.HfRandomUnifo
     return np.rint(z_upsampled).astype(np.int16)
 
 
+@deterministic_terrain
 @height_field_to_mesh
 def pyramid_sloped_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidSlopedTerrainCfg) -> np.ndarray:
     """Generate a terrain with a truncated pyramid structure.
@@ -148,6 +150,7 @@ def pyramid_sloped_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidSlop
     return np.rint(hf_raw).astype(np.int16)
 
 
+@deterministic_terrain
 @height_field_to_mesh
 def pyramid_stairs_terrain(difficulty: float, cfg: hf_terrains_cfg.HfPyramidStairsTerrainCfg) -> np.ndarray:
     """Generate a terrain with a pyramid stair pattern.
@@ -288,6 +291,7 @@ def discrete_obstacles_terrain(difficulty: float, cfg: hf_terrains_cfg.HfDiscret
     return np.rint(hf_raw).astype(np.int16)
 
 
+@deterministic_terrain
 @height_field_to_mesh
 def wave_terrain(difficulty: float, cfg: hf_terrains_cfg.HfWaveTerrainCfg) -> np.ndarray:
     r"""Generate a terrain with a wave pattern.
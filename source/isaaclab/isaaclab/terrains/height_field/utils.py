@@ -10,7 +10,7 @@ import functools
 import numpy as np
 import trimesh
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from .hf_terrains_cfg import HfTerrainBaseCfg
@@ -23,6 +23,12 @@ def height_field_to_mesh(func: Callable) -> Callable:
     at a specified resolution and performing interpolation to obtain the intermediate heights.
     Additionally, it adds a border around the terrain to avoid artifacts at the edges.
 
+    The returned function takes an additional keyword argument ``output``. If set to ``"height_field"``, the
+    function skips the mesh conversion and returns the height field (in m) with the border instead of the list
+    of meshes. The height at the index ``(i, j)`` corresponds to the point ``(i, j) * horizontal_scale`` in the
+    frame of the terrain. This allows sampling the heights of the terrain directly, for instance, for height
+    scans. Note that the height field does not include the slope threshold correction of the mesh.
+
     Args:
         func: The height field function to convert. The function should return a 2D numpy array
             with the heights of the terrain.
@@ -33,7 +39,10 @@ def height_field_to_mesh(func: Callable) -> Callable:
     """
 
     @functools.wraps(func)
-    def wrapper(difficulty: float, cfg: HfTerrainBaseCfg):
+    def wrapper(difficulty: float, cfg: HfTerrainBaseCfg, output: Literal["mesh", "height_field"] = "mesh"):
+        # check valid output
+        if output not in ("mesh", "height_field"):
+            raise ValueError(f"Invalid output type: {output}. Expected 'mesh' or 'height_field'.")
         # check valid border width
         if cfg.border_width > 0 and cfg.border_width < cfg.horizontal_scale:
             raise ValueError(
@@ -58,11 +67,6 @@ def height_field_to_mesh(func: Callable) -> Callable:
         # set terrain size back to config
         cfg.size = terrain_size
 
-        # convert to trimesh
-        vertices, triangles = convert_height_field_to_mesh(
-            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold
-        )
-        mesh = trimesh.Trimesh(vertices=vertices, faces=triangles)
         # compute origin
         x1 = int((cfg.size[0] * 0.5 - 1) / cfg.horizontal_scale)
         x2 = int((cfg.size[0] * 0.5 + 1) / cfg.horizontal_scale)
@@ -70,6 +74,16 @@ def height_field_to_mesh(func: Callable) -> Callable:
         y2 = int((cfg.size[1] * 0.5 + 1) / cfg.horizontal_scale)
         origin_z = np.max(heights[x1:x2, y1:y2]) * cfg.vertical_scale
         origin = np.array([0.5 * cfg.size[0], 0.5 * cfg.size[1], origin_z])
+
+        # return the height field and origin
+        if output == "height_field":
+            return heights * cfg.vertical_scale, origin
+        # convert to trimesh
+        # note: the mesh is not processed since the vertices and triangles of the grid are already consistent
+        vertices, triangles = _convert_height_field_to_mesh(
+            heights, cfg.horizontal_scale, cfg.vertical_scale, cfg.slope_threshold
+        )
+        mesh = trimesh.Trimesh(vertices=vertices, faces=triangles, process=False)
         # return mesh and origin
         return [mesh], origin
 
@@ -102,6 +116,10 @@ def convert_height_field_to_mesh(
                   /  |
         (x_1,y_1)A---A'(x_1',y_1)
 
+    The triangles and the grid coordinates only depend on the shape of the height field (and the horizontal
+    scale). These are computed once per shape and reused, so that only the vertex heights (and the slope
+    correction) are computed for each height field.
+
     Args:
         height_field: The input height-field array.
         horizontal_scale: The discretization of the terrain along the x and y axis.
@@ -116,17 +134,35 @@ def convert_height_field_to_mesh(
         - **triangles** (np.ndarray(int)): Array of shape (num_triangles, 3).
           Each row represents the indices of the 3 vertices connected by this triangle.
     """
+    vertices, triangles = _convert_height_field_to_mesh(height_field, horizontal_scale, vertical_scale, slope_threshold)
+    # copy the shared triangles so that the caller can modify them
+    return vertices, triangles.copy()
+
+
+"""
+Helper functions.
+"""
+
+
+def _convert_height_field_to_mesh(
+    height_field: np.ndarray, horizontal_scale: float, vertical_scale: float, slope_threshold: float | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert a height-field array to a triangle mesh.
+
+    Please refer to :func:`convert_height_field_to_mesh` for more details. The returned triangles are shared
+    between all height fields of the same shape and are read-only.
+    """
     # read height field
     num_rows, num_cols = height_field.shape
-    # create a mesh grid of the height field
-    y = np.linspace(0, (num_cols - 1) * horizontal_scale, num_cols)
-    x = np.linspace(0, (num_rows - 1) * horizontal_scale, num_rows)
-    yy, xx = np.meshgrid(y, x)
-    # copy height field to avoid modifying the original array
-    hf = height_field.copy()
+    # obtain the mesh grid of the height field
+    xx, yy = _get_grid_coordinates(num_rows, num_cols, horizontal_scale)
+    # create vertices for the mesh
+    vertices = np.empty((num_rows * num_cols, 3), dtype=np.float32)
+    vertices[:, 2] = height_field.reshape(-1) * vertical_scale
 
     # correct vertical surfaces above the slope threshold
     if slope_threshold is not None:
+        hf = height_field
         # scale slope threshold based on the horizontal and vertical scale
         slope_threshold *= horizontal_scale / vertical_scale
         # allocate arrays to store the movement of the vertices
@@ -146,28 +182,44 @@ def convert_height_field_to_mesh(
         move_corners[1:num_rows, 1:num_cols] -= (
             hf[: num_rows - 1, : num_cols - 1] - hf[1:num_rows, 1:num_cols] > slope_threshold
         )
-        xx += (move_x + move_corners * (move_x == 0)) * horizontal_scale
-        yy += (move_y + move_corners * (move_y == 0)) * horizontal_scale
+        vertices[:, 0] = (xx + (move_x + move_corners * (move_x == 0)) * horizontal_scale).reshape(-1)
+        vertices[:, 1] = (yy + (move_y + move_corners * (move_y == 0)) * horizontal_scale).reshape(-1)
+    else:
+        vertices[:, 0] = xx.reshape(-1)
+        vertices[:, 1] = yy.reshape(-1)
 
-    # create vertices for the mesh
-    vertices = np.zeros((num_rows * num_cols, 3), dtype=np.float32)
-    vertices[:, 0] = xx.flatten()
-    vertices[:, 1] = yy.flatten()
-    vertices[:, 2] = hf.flatten() * vertical_scale
+    return vertices, _get_grid_triangles(num_rows, num_cols)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_grid_coordinates(num_rows: int, num_cols: int, horizontal_scale: float) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the read-only x and y coordinates of the height field grid. Shape is (num_rows, num_cols)."""
+    y = np.linspace(0, (num_cols - 1) * horizontal_scale, num_cols)
+    x = np.linspace(0, (num_rows - 1) * horizontal_scale, num_rows)
+    yy, xx = np.meshgrid(y, x)
+    xx.flags.writeable = False
+    yy.flags.writeable = False
+    return xx, yy
+
+
+@functools.lru_cache(maxsize=16)
+def _get_grid_triangles(num_rows: int, num_cols: int) -> np.ndarray:
+    """Returns the read-only triangles of the height field grid. Shape is (2 * (num_rows - 1) * (num_cols - 1), 3).
+
+    Each grid cell is split into two triangles. The triangles are ordered by the cells in row-major order.
+    """
+    # indices of the corners of each cell
+    ind0 = (np.arange(num_rows - 1)[:, None] * num_cols + np.arange(num_cols - 1)[None, :]).reshape(-1)
+    ind1 = ind0 + 1
+    ind2 = ind0 + num_cols
+    ind3 = ind2 + 1
     # create triangles for the mesh
-    triangles = -np.ones((2 * (num_rows - 1) * (num_cols - 1), 3), dtype=np.uint32)
-    for i in range(num_rows - 1):
-        ind0 = np.arange(0, num_cols - 1) + i * num_cols
-        ind1 = ind0 + 1
-        ind2 = ind0 + num_cols
-        ind3 = ind2 + 1
-        start = 2 * i * (num_cols - 1)
-        stop = start + 2 * (num_cols - 1)
-        triangles[start:stop:2, 0] = ind0
-        triangles[start:stop:2, 1] = ind3
-        triangles[start:stop:2, 2] = ind1
-        triangles[start + 1 : stop : 2, 0] = ind0
-        triangles[start + 1 : stop : 2, 1] = ind2
-        triangles[start + 1 : stop : 2, 2] = ind3
-
-    return vertices, triangles
+    triangles = np.empty((2 * len(ind0), 3), dtype=np.uint32)
+    triangles[0::2, 0] = ind0
+    triangles[0::2, 1] = ind3
+    triangles[0::2, 2] = ind1
+    triangles[1::2, 0] = ind0
+    triangles[1::2, 1] = ind2
+    triangles[1::2, 2] = ind3
+    triangles.flags.writeable = False
+    return triangles
@@ -0,0 +1,213 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import numpy as np
+import os
+import shutil
+import threading
+from typing import Any, ClassVar
+
+from isaaclab.utils.dict import dict_to_md5_hash
+from isaaclab.utils.io import dump_yaml
+
+
+class TerrainCache:
+    """Binary, content-addressed cache for generated terrains.
+
+    Each cache entry is a directory in the cache directory. The name of the directory is the MD5 hash of the
+    data that determines the terrain (for instance, the sub-terrain configuration) together with the
+    :attr:`VERSION` of the cache format. Changing the version thus invalidates all the existing entries.
+
+    There are two kinds of entries:
+
+    * Sub-terrain entries store the vertices, faces and origin of a sub-terrain as ``.npy`` files. These are
+      loaded as memory-mapped arrays. The sampled flat patches of the sub-terrain are stored in a ``.npz`` file.
+    * Terrain entries store the complete terrain of a generator in a single ``.npz`` file. This allows loading
+      a fully cached terrain with a single read.
+
+    The files are written to temporary files first and then renamed. This keeps the entries consistent when
+    multiple processes write to the same cache directory.
+
+    The cache directory can be bounded in size. In this case, the least recently used entries are removed
+    by :meth:`evict`. The last use of an entry is tracked by the modification time of its directory.
+    """
+
+    VERSION: ClassVar[int] = 1
+    """The version of the cache format. It is part of the hash of each entry."""
+
+    def __init__(self, cache_dir: str, max_size: float | None = None):
+        """Initializes the cache.
+
+        Args:
+            cache_dir: The directory where the cache entries are stored.
+            max_size: The maximum size of the cache directory (in MB). Defaults to None, in which case the
+                size is not bounded.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    """
+    Operations - Entries.
+    """
+
+    def get_entry_dir(self, data: dict[str, Any]) -> str:
+        """Returns the directory of the cache entry for the given data.
+
+        Args:
+            data: The data that determines the cached terrain. It must be JSON-serializable.
+
+        Returns:
+            The path to the directory of the cache entry.
+        """
+        entry_hash = dict_to_md5_hash({"cache_version": self.VERSION, "data": data})
+        return os.path.join(self.cache_dir, entry_hash)
+
+    def touch(self, entry_dir: str):
+        """Marks the cache entry as recently used."""
+        try:
+            os.utime(entry_dir)
+        except OSError:
+            pass
+
+    def evict(self):
+        """Removes the least recently used entries until the size of the cache directory is within the bound.
+
+        If the size of the cache is not bounded, this function does nothing.
+        """
+        if self.max_size is None or not os.path.isdir(self.cache_dir):
+            return
+        # collect the size and the last use of all entries
+        entries = list()
+        total_size = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.is_dir():
+                continue
+            entry_size = sum(file.stat().st_size for file in os.scandir(entry.path) if file.is_file())
+            entries.append((entry.stat().st_mtime, entry_size, entry.path))
+            total_size += entry_size
+        # remove the oldest entries
+        max_size = self.max_size * 1024 * 1024
+        for _, entry_size, entry_path in sorted(entries):
+            if total_size <= max_size:
+                break
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= entry_size
+
+    """
+    Operations - Sub-terrains.
+    """
+
+    def load_sub_terrain(self, entry_dir: str) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """Loads a sub-terrain from the cache.
+
+        The vertices and faces are memory-mapped in copy-on-write mode.
+
+        Args:
+            entry_dir: The directory of the cache entry.
+
+        Returns:
+            The vertices, faces and origin of the sub-terrain. None if the entry does not exist.
+        """
+        # note: the origin is written last and marks a complete entry
+        origin_filename = os.path.join(entry_dir, "origin.npy")
+        if not os.path.exists(origin_filename):
+            return None
+        vertices = np.load(os.path.join(entry_dir, "vertices.npy"), mmap_mode="c")
+        faces = np.load(os.path.join(entry_dir, "faces.npy"), mmap_mode="c")
+        origin = np.load(origin_filename)
+        self.touch(entry_dir)
+        return vertices, faces, origin
+
+    def save_sub_terrain(self, entry_dir: str, vertices: np.ndarray, faces: np.ndarray, origin: np.ndarray, cfg):
+        """Saves a sub-terrain to the cache.
+
+        Args:
+            entry_dir: The directory of the cache entry.
+            vertices: The vertices of the sub-terrain mesh. Shape is (N, 3).
+            faces: The faces of the sub-terrain mesh. Shape is (M, 3).
+            origin: The origin of the sub-terrain. Shape is (3,).
+            cfg: The configuration of the sub-terrain. It is stored for inspection.
+        """
+        os.makedirs(entry_dir, exist_ok=True)
+        dump_yaml(os.path.join(entry_dir, "cfg.yaml"), cfg)
+        self._save_array(os.path.join(entry_dir, "vertices.npy"), vertices)
+        self._save_array(os.path.join(entry_dir, "faces.npy"), faces)
+        self._save_array(os.path.join(entry_dir, "origin.npy"), origin)
+
+    def load_flat_patches(self, entry_dir: str) -> dict[str, np.ndarray] | None:
+        """Loads the flat patches of a sub-terrain from the cache.
+
+        Args:
+            entry_dir: The directory of the cache entry.
+
+        Returns:
+            The flat patches for each patch sampling configuration. None if no flat patches are stored.
+        """
+        filename = os.path.join(entry_dir, "flat_patches.npz")
+        if not os.path.exists(filename):
+            return None
+        with np.load(filename) as data:
+            return {name: data[name] for name in data.files}
+
+    def save_flat_patches(self, entry_dir: str, flat_patches: dict[str, np.ndarray]):
+        """Saves the flat patches of a sub-terrain to the cache.
+
+        Args:
+            entry_dir: The directory of the cache entry.
+            flat_patches: The flat patches for each patch sampling configuration. Shape is (num_patches, 3).
+        """
+        os.makedirs(entry_dir, exist_ok=True)
+        self._save_arrays(os.path.join(entry_dir, "flat_patches.npz"), flat_patches)
+
+    """
+    Operations - Terrains.
+    """
+
+    def load_terrain(self, entry_dir: str) -> dict[str, np.ndarray] | None:
+        """Loads a complete terrain from the cache.
+
+        Args:
+            entry_dir: The directory of the cache entry.
+
+        Returns:
+            The arrays of the terrain. None if the entry does not exist.
+        """
+        filename = os.path.join(entry_dir, "terrain.npz")
+        if not os.path.exists(filename):
+            return None
+        with np.load(filename) as data:
+            arrays = {name: data[name] for name in data.files}
+        self.touch(entry_dir)
+        return arrays
+
+    def save_terrain(self, entry_dir: str, arrays: dict[str, np.ndarray]):
+        """Saves a complete terrain to the cache.
+
+        Args:
+            entry_dir: The directory of the cache entry.
+            arrays: The arrays of the terrain.
+        """
+        os.makedirs(entry_dir, exist_ok=True)
+        self._save_arrays(os.path.join(entry_dir, "terrain.npz"), arrays)
+
+    """
+    Helper functions.
+    """
+
+    def _save_array(self, filename: str, array: np.ndarray):
+        """Saves an array to a ``.npy`` file through a temporary file."""
+        tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_filename, "wb") as f:
+            np.save(f, np.ascontiguousarray(array))
+        os.replace(tmp_filename, filename)
+
+    def _save_arrays(self, filename: str, arrays: dict[str, np.ndarray]):
+        """Saves arrays to an uncompressed ``.npz`` file through a temporary file."""
+        tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_filename, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_filename, filename)
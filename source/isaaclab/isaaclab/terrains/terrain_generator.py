@@ -9,17 +9,17 @@ import numpy as np
 import os
 import torch
 import trimesh
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import omni.log
 
-from isaaclab.utils.dict import dict_to_md5_hash
-from isaaclab.utils.io import dump_yaml
 from isaaclab.utils.timer import Timer
 from isaaclab.utils.warp import convert_to_warp_mesh
 
+from .terrain_cache import TerrainCache
 from .trimesh.utils import make_border
-from .utils import color_meshes_by_height, find_flat_patches
+from .utils import color_meshes_by_height, find_flat_patches_batched
 
 if TYPE_CHECKING:
     from .sub_terrain_cfg import FlatPatchSamplingCfg, SubTerrainBaseCfg
@@ -71,7 +71,14 @@ class TerrainGenerator:
     If the flag :attr:`~TerrainGeneratorCfg.use_cache` is set to True, the terrains are cached based on their
     sub-terrain configurations. This means that if the same sub-terrain configuration is used
     multiple times, the terrain is only generated once and then reused. This is useful when
-    generating complex sub-terrains that take a long time to generate.
+    generating complex sub-terrains that take a long time to generate. Additionally, the complete terrain
+    is cached based on the generator configuration, so that a fully cached terrain is loaded at once.
+    Please refer to :class:`TerrainCache` for more details on the cache format.
+
+    If :attr:`~TerrainGeneratorCfg.num_workers` is greater than zero, the sub-terrains of functions marked with
+    :func:`~isaaclab.terrains.utils.deterministic_terrain` are generated in a pool of worker threads. The sub-terrain
+    types and difficulties are drawn on the main thread in the same order as in the serial generation. The other
+    sub-terrains, the sampling of flat patches and the placement of the sub-terrains also happen on the main thread.
 
     .. attention::
 
@@ -84,7 +91,10 @@ class TerrainGenerator:
     terrain_mesh: trimesh.Trimesh
     """A single trimesh.Trimesh object for all the generated sub-terrains."""
     terrain_meshes: list[trimesh.Trimesh]
-    """List of trimesh.Trimesh objects for all the generated sub-terrains."""
+    """List of trimesh.Trimesh objects for all the generated sub-terrains.
+
+    The list is empty if the terrain is loaded from the cache as a whole.
+    """
     terrain_origins: np.ndarray
     """The origin of each sub-terrain. Shape is (num_rows, num_cols, 3)."""
     flat_patches: dict[str, torch.Tensor]
@@ -141,49 +151,33 @@ class TerrainGenerator:
         # note: we create a new random number generator to avoid affecting the global state
         #  in the other places where random numbers are used.
         self.np_rng = np.random.default_rng(seed)
+        self._seed = int(seed)
 
         # buffer for storing valid patches
         self.flat_patches = {}
         # create a list of all sub-terrains
         self.terrain_meshes = list()
+        # sub-terrains whose flat patches need to be sampled
+        self._flat_patch_queue = list()
         self.terrain_origins = np.zeros((self.cfg.num_rows, self.cfg.num_cols, 3))
 
-        # parse configuration and add sub-terrains
-        # create terrains based on curriculum or randomly
-        if self.cfg.curriculum:
-            with Timer("[INFO] Generating terrains based on curriculum took"):
-                self._generate_curriculum_terrains()
-        else:
-            with Timer("[INFO] Generating terrains randomly took"):
-                self._generate_random_terrains()
-        # add a border around the terrains
-        self._add_terrain_border()
-        # combine all the sub-terrains into a single mesh
-        self.terrain_mesh = trimesh.util.concatenate(self.terrain_meshes)
+        # load the complete terrain from the cache if it exists
+        self._cache = TerrainCache(self.cfg.cache_dir, self.cfg.cache_max_size) if self.cfg.use_cache else None
+        terrain_data = None
+        if self._cache is not None:
+            terrain_entry_dir = self._cache.get_entry_dir(self._get_terrain_cache_key())
+            terrain_data = self._cache.load_terrain(terrain_entry_dir)
 
-        # color the terrain mesh
-        if self.cfg.color_scheme == "height":
-            self.terrain_mesh = color_meshes_by_height(self.terrain_mesh)
-        elif self.cfg.color_scheme == "random":
-            self.terrain_mesh.visual.vertex_colors = self.np_rng.choice(
-                range(256), size=(len(self.terrain_mesh.vertices), 4)
-            )
-        elif self.cfg.color_scheme == "none":
-            pass
+        if terrain_data is not None:
+            self._load_terrain_data(terrain_data)
         else:
-            raise ValueError(f"Invalid color scheme: {self.cfg.color_scheme}.")
-
-        # offset the entire terrain and origins so that it is centered
-        # -- terrain mesh
-        transform = np.eye(4)
-        transform[:2, -1] = -self.cfg.size[0] * self.cfg.num_rows * 0.5, -self.cfg.size[1] * self.cfg.num_cols * 0.5
-        self.terrain_mesh.apply_transform(transform)
-        # -- terrain origins
-        self.terrain_origins += transform[:3, -1]
-        # -- valid patches
-        terrain_origins_torch = torch.tensor(self.terrain_origins, dtype=torch.float, device=self.device).unsqueeze(2)
-        for name, value in self.flat_patches.items():
-            self.flat_patches[name] = value + terrain_origins_torch
+            self._generate_terrain()
+            # store the complete terrain in the cache
+            if self._cache is not None:
+                self._cache.save_terrain(terrain_entry_dir, self._get_terrain_data())
+        # bound the size of the cache
+        if self._cache is not None:
+            self._cache.evict()
 
     def __str__(self):
         """Return a string representation of the terrain generator."""
@@ -196,6 +190,7 @@ class TerrainGenerator:
         msg += f"\n\tCurriculum: {self.cfg.curriculum}"
         msg += f"\n\tDifficulty range: {self.cfg.difficulty_range}"
         msg += f"\n\tColor scheme: {self.cfg.color_scheme}"
+        msg += f"\n\tNumber of workers: {self.cfg.num_workers}"
         msg += f"\n\tUse cache: {self.cfg.use_cache}"
         if self.cfg.use_cache:
             msg += f"\n\tCache directory: {self.cfg.cache_dir}"
@@ -215,6 +210,9 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # randomly sample sub-terrains
+        # note: all the random values are drawn before generating the terrains. This keeps the order of the
+        #   draws from the random number generator independent of the number of workers.
+        sub_terrains = list()
         for index in range(self.cfg.num_rows * self.cfg.num_cols):
             # coordinate index of the sub-terrain
             (sub_row, sub_col) = np.unravel_index(index, (self.cfg.num_rows, self.cfg.num_cols))
@@ -222,10 +220,10 @@ class TerrainGenerator:
             sub_index = self.np_rng.choice(len(proportions), p=proportions)
             # randomly sample difficulty parameter
             difficulty = self.np_rng.uniform(*self.cfg.difficulty_range)
-            # generate terrain
-            mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_index])
-            # add to sub-terrains
-            self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_index])
+            # store the sub-terrain to generate
+            sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_index]))
+        # generate the sub-terrains and add them to the terrain
+        self._generate_sub_terrains(sub_terrains)
 
     def _generate_curriculum_terrains(self):
         """Add terrains based on the difficulty parameter."""
@@ -244,6 +242,7 @@ class TerrainGenerator:
         sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
 
         # curriculum-based sub-terrains
+        sub_terrains = list()
         for sub_col in range(self.cfg.num_cols):
             for sub_row in range(self.cfg.num_rows):
                 # vary the difficulty parameter linearly over the number of rows
@@ -255,15 +254,175 @@ class TerrainGenerator:
                 lower, upper = self.cfg.difficulty_range
                 difficulty = (sub_row + self.np_rng.uniform()) / self.cfg.num_rows
                 difficulty = lower + (upper - lower) * difficulty
+                # store the sub-terrain to generate
+                sub_terrains.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_indices[sub_col]]))
+        # generate the sub-terrains and add them to the terrain
+        self._generate_sub_terrains(sub_terrains)
+
+    def _generate_sub_terrains(self, sub_terrains: list[tuple[int, int, float, SubTerrainBaseCfg]]):
+        """Generate the sub-terrains and add them to the list of sub-terrains.
+
+        If the number of workers is zero, the sub-terrains are generated one after another on the main thread.
+        Otherwise, the sub-terrains of functions marked with :func:`~isaaclab.terrains.utils.deterministic_terrain`
+        are generated in a pool of worker threads. The other sub-terrains sample from the global random number
+        generators and are generated on the main thread in the order they were drawn. The generated terrain is
+        thus identical to the serially generated one.
+
+        Args:
+            sub_terrains: The sub-terrains to generate. Each entry contains the row index, the column index,
+                the difficulty and the configuration of the sub-terrain.
+        """
+        num_workers = self.cfg.num_workers
+
+        # generate the sub-terrains serially
+        if num_workers == 0 or len(sub_terrains) == 0:
+            for sub_row, sub_col, difficulty, sub_cfg in sub_terrains:
                 # generate terrain
-                mesh, origin = self._get_terrain_mesh(difficulty, sub_terrains_cfgs[sub_indices[sub_col]])
+                mesh, origin = self._get_terrain_mesh(difficulty, sub_cfg)
                 # add to sub-terrains
-                self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_terrains_cfgs[sub_indices[sub_col]])
+                self._add_sub_terrain(
+                    mesh, origin, sub_row, sub_col, sub_cfg, self._get_cache_entry_dir(difficulty, sub_cfg)
+                )
+            return
+
+        # generate the deterministic sub-terrains in worker threads
+        # note: we use threads since forking is unsafe once the simulator and CUDA are initialized, and spawned
+        #   processes would re-run the main script and import the simulator modules.
+        with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="terrain_generator") as executor:
+            futures = [
+                (
+                    executor.submit(_generate_sub_terrain, difficulty, sub_cfg, self.cfg.seed, self._cache)
+                    if getattr(sub_cfg.function, "is_deterministic", False)
+                    else None
+                )
+                for _, _, difficulty, sub_cfg in sub_terrains
+            ]
+            # add the sub-terrains in the order they were drawn
+            # note: the other sub-terrains are generated here, so that they sample from the global random number
+            #   generators in the same order as in the serial generation
+            for (sub_row, sub_col, difficulty, sub_cfg), future in zip(sub_terrains, futures):
+                if future is None:
+                    mesh, origin = self._get_terrain_mesh(difficulty, sub_cfg)
+                else:
+                    mesh, origin = future.result()
+                self._add_sub_terrain(
+                    mesh, origin, sub_row, sub_col, sub_cfg, self._get_cache_entry_dir(difficulty, sub_cfg)
+                )
 
     """
     Internal helper functions.
     """
 
+    def _generate_terrain(self):
+        """Generate the terrain mesh, the origins and the flat patches of all sub-terrains."""
+        # parse configuration and add sub-terrains
+        # create terrains based on curriculum or randomly
+        if self.cfg.curriculum:
+            with Timer("[INFO] Generating terrains based on curriculum took"):
+                self._generate_curriculum_terrains()
+        else:
+            with Timer("[INFO] Generating terrains randomly took"):
+                self._generate_random_terrains()
+        # add a border around the terrains
+        self._add_terrain_border()
+        # combine all the sub-terrains into a single mesh
+        self.terrain_mesh = _concatenate_meshes(self.terrain_meshes)
+        # sample the flat patches of all sub-terrains
+        self._sample_flat_patches()
+
+        # color the terrain mesh
+        if self.cfg.color_scheme == "height":
+            self.terrain_mesh = color_meshes_by_height(self.terrain_mesh)
+        elif self.cfg.color_scheme == "random":
+            self.terrain_mesh.visual.vertex_colors = self.np_rng.choice(
+                range(256), size=(len(self.terrain_mesh.vertices), 4)
+            )
+        elif self.cfg.color_scheme == "none":
+            pass
+        else:
+            raise ValueError(f"Invalid color scheme: {self.cfg.color_scheme}.")
+
+        # offset the entire terrain and origins so that it is centered
+        # -- terrain mesh
+        transform = np.eye(4)
+        transform[:2, -1] = -self.cfg.size[0] * self.cfg.num_rows * 0.5, -self.cfg.size[1] * self.cfg.num_cols * 0.5
+        self.terrain_mesh.apply_transform(transform)
+        # -- terrain origins
+        self.terrain_origins += transform[:3, -1]
+        # -- valid patches
+        terrain_origins_torch = torch.tensor(self.terrain_origins, dtype=torch.float, device=self.device).unsqueeze(2)
+        for name, value in self.flat_patches.items():
+            self.flat_patches[name] = value + terrain_origins_torch
+
+    def _sample_flat_patches(self):
+        """Sample the flat patches of all the sub-terrains that are not loaded from the cache.
+
+        The flat patches are sampled at once on the combined terrain mesh. Please refer to
+        :func:`find_flat_patches_batched` for more details.
+        """
+        if len(self._flat_patch_queue) == 0:
+            return
+        # collect the regions to sample the flat patches in
+        patch_cfgs, origins, bounds, targets = list(), list(), list(), list()
+        for row, col, sub_terrain_cfg, sub_terrain_bounds, _ in self._flat_patch_queue:
+            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
+                patch_cfgs.append(patch_cfg)
+                origins.append(self.terrain_origins[row, col])
+                bounds.append(sub_terrain_bounds)
+                targets.append((row, col, name))
+        omni.log.info(f"Sampling flat patches for {len(self._flat_patch_queue)} sub-terrains.")
+        # sample the flat patches on the combined mesh
+        wp_mesh = convert_to_warp_mesh(self.terrain_mesh.vertices, self.terrain_mesh.faces, device=self.device)
+        flat_patches = find_flat_patches_batched(wp_mesh, patch_cfgs, np.array(origins), np.array(bounds))
+        for (row, col, name), patches in zip(targets, flat_patches):
+            self.flat_patches[name][row, col] = patches
+        # store the flat patches in the cache
+        for row, col, sub_terrain_cfg, _, cache_entry_dir in self._flat_patch_queue:
+            if cache_entry_dir is not None:
+                self._cache.save_flat_patches(
+                    cache_entry_dir,
+                    {
+                        name: self.flat_patches[name][row, col].cpu().numpy()
+                        for name in sub_terrain_cfg.flat_patch_sampling
+                    },
+                )
+        self._flat_patch_queue.clear()
+
+    def _get_terrain_cache_key(self) -> dict:
+        """Returns the data that determines the complete terrain for the cache.
+
+        The settings that do not affect the generated terrain are excluded. The resolved seed is used instead of
+        the configured seed, so that terrains generated with different global seeds do not share an entry.
+        """
+        key = self.cfg.to_dict()
+        for name in ("use_cache", "cache_dir", "cache_max_size", "num_workers"):
+            key.pop(name)
+        key["seed"] = self._seed
+        return key
+
+    def _get_terrain_data(self) -> dict[str, np.ndarray]:
+        """Returns the arrays of the generated terrain to store in the cache."""
+        data = {
+            "vertices": np.asarray(self.terrain_mesh.vertices),
+            "faces": np.asarray(self.terrain_mesh.faces),
+            "origins": self.terrain_origins,
+        }
+        if self.cfg.color_scheme != "none":
+            data["vertex_colors"] = np.asarray(self.terrain_mesh.visual.vertex_colors)
+        for name, value in self.flat_patches.items():
+            data[f"flat_patches/{name}"] = value.cpu().numpy()
+        return data
+
+    def _load_terrain_data(self, data: dict[str, np.ndarray]):
+        """Sets the terrain from the arrays stored in the cache."""
+        self.terrain_mesh = trimesh.Trimesh(vertices=data["vertices"], faces=data["faces"], process=False)
+        if "vertex_colors" in data:
+            self.terrain_mesh.visual.vertex_colors = data["vertex_colors"]
+        self.terrain_origins = data["origins"]
+        for name, value in data.items():
+            if name.startswith("flat_patches/"):
+                self.flat_patches[name.removeprefix("flat_patches/")] = torch.from_numpy(value).to(self.device)
+
     def _add_terrain_border(self):
         """Add a surrounding border over all the sub-terrains into the terrain meshes."""
         # border parameters
@@ -287,44 +446,29 @@ class TerrainGenerator:
         self.terrain_meshes.append(border)
 
     def _add_sub_terrain(
-        self, mesh: trimesh.Trimesh, origin: np.ndarray, row: int, col: int, sub_terrain_cfg: SubTerrainBaseCfg
+        self,
+        mesh: trimesh.Trimesh,
+        origin: np.ndarray,
+        row: int,
+        col: int,
+        sub_terrain_cfg: SubTerrainBaseCfg,
+        cache_entry_dir: str | None = None,
     ):
         """Add input sub-terrain to the list of sub-terrains.
 
         This function adds the input sub-terrain mesh to the list of sub-terrains and updates the origin
-        of the sub-terrain in the list of origins. It also samples flat patches if specified.
+        of the sub-terrain in the list of origins. If specified, it also queues the sub-terrain for sampling
+        flat patches, which are sampled for all sub-terrains at once on the combined terrain mesh.
 
         Args:
             mesh: The mesh of the sub-terrain.
             origin: The origin of the sub-terrain.
             row: The row index of the sub-terrain.
             col: The column index of the sub-terrain.
+            sub_terrain_cfg: The configuration of the sub-terrain.
+            cache_entry_dir: The directory of the cache entry of the sub-terrain. Defaults to None, in which case
+                the flat patches are neither loaded from nor stored in the cache.
         """
-        # sample flat patches if specified
-        if sub_terrain_cfg.flat_patch_sampling is not None:
-            omni.log.info(f"Sampling flat patches for sub-terrain at (row, col):  ({row}, {col})")
-            # convert the mesh to warp mesh
-            wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=self.device)
-            # sample flat patches based on each patch configuration for that sub-terrain
-            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
-                patch_cfg: FlatPatchSamplingCfg
-                # create the flat patches tensor (if not already created)
-                if name not in self.flat_patches:
-                    self.flat_patches[name] = torch.zeros(
-                        (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
-                    )
-                # add the flat patches to the tensor
-                self.flat_patches[name][row, col] = find_flat_patches(
-                    wp_mesh=wp_mesh,
-                    origin=origin,
-                    num_patches=patch_cfg.num_patches,
-                    patch_radius=patch_cfg.patch_radius,
-                    x_range=patch_cfg.x_range,
-                    y_range=patch_cfg.y_range,
-                    z_range=patch_cfg.z_range,
-                    max_height_diff=patch_cfg.max_height_diff,
-                )
-
         # transform the mesh to the correct position
         transform = np.eye(4)
         transform[0:2, -1] = (row + 0.5) * self.cfg.size[0], (col + 0.5) * self.cfg.size[1]
@@ -334,6 +478,29 @@ class TerrainGenerator:
         # add origin to the list
         self.terrain_origins[row, col] = origin + transform[:3, -1]
 
+        # collect the flat patches to sample if specified
+        # note: the flat patches of all sub-terrains are sampled at once on the combined terrain mesh
+        if sub_terrain_cfg.flat_patch_sampling is not None:
+            # load the flat patches from the cache if they exist
+            cached_patches = None
+            if cache_entry_dir is not None:
+                cached_patches = self._cache.load_flat_patches(cache_entry_dir)
+            if cached_patches is not None and cached_patches.keys() != sub_terrain_cfg.flat_patch_sampling.keys():
+                cached_patches = None
+            for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
+                patch_cfg: FlatPatchSamplingCfg
+                # create the flat patches tensor (if not already created)
+                if name not in self.flat_patches:
+                    self.flat_patches[name] = torch.zeros(
+                        (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
+                    )
+                if cached_patches is not None:
+                    self.flat_patches[name][row, col] = torch.from_numpy(cached_patches[name]).to(self.device)
+            # store the sub-terrain for sampling the flat patches
+            if cached_patches is None:
+                bounds = mesh.bounds[:, :2].reshape(-1)
+                self._flat_patch_queue.append((row, col, sub_terrain_cfg, bounds, cache_entry_dir))
+
     def _get_terrain_mesh(self, difficulty: float, cfg: SubTerrainBaseCfg) -> tuple[trimesh.Trimesh, np.ndarray]:
         """Generate a sub-terrain mesh based on the input difficulty parameter.
 
@@ -351,44 +518,99 @@ class TerrainGenerator:
         Returns:
             The sub-terrain mesh and origin.
         """
-        # copy the configuration
-        cfg = cfg.copy()
-        # add other parameters to the sub-terrain configuration
-        cfg.difficulty = float(difficulty)
-        cfg.seed = self.cfg.seed
-        # generate hash for the sub-terrain
-        sub_terrain_hash = dict_to_md5_hash(cfg.to_dict())
-        # generate the file name
-        sub_terrain_cache_dir = os.path.join(self.cfg.cache_dir, sub_terrain_hash)
-        sub_terrain_obj_filename = os.path.join(sub_terrain_cache_dir, "mesh.obj")
-        sub_terrain_csv_filename = os.path.join(sub_terrain_cache_dir, "origin.csv")
-        sub_terrain_meta_filename = os.path.join(sub_terrain_cache_dir, "cfg.yaml")
-
-        # check if hash exists - if true, load the mesh and origin and return
-        if self.cfg.use_cache and os.path.exists(sub_terrain_obj_filename):
-            # load existing mesh
-            mesh = trimesh.load_mesh(sub_terrain_obj_filename, process=False)
-            origin = np.loadtxt(sub_terrain_csv_filename, delimiter=",")
-            # return the generated mesh
-            return mesh, origin
-
-        # generate the terrain
-        meshes, origin = cfg.function(difficulty, cfg)
-        mesh = trimesh.util.concatenate(meshes)
-        # offset mesh such that they are in their center
-        transform = np.eye(4)
-        transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
-        mesh.apply_transform(transform)
-        # change origin to be in the center of the sub-terrain
-        origin += transform[0:3, -1]
+        return _generate_sub_terrain(difficulty, cfg, self.cfg.seed, self._cache)
 
-        # if caching is enabled, save the mesh and origin
-        if self.cfg.use_cache:
-            # create the cache directory
-            os.makedirs(sub_terrain_cache_dir, exist_ok=True)
-            # save the data
-            mesh.export(sub_terrain_obj_filename)
-            np.savetxt(sub_terrain_csv_filename, origin, delimiter=",", header="x,y,z")
-            dump_yaml(sub_terrain_meta_filename, cfg)
-        # return the generated mesh
-        return mesh, origin
+    def _get_cache_entry_dir(self, difficulty: float, cfg: SubTerrainBaseCfg) -> str | None:
+        """Returns the directory of the cache entry of a sub-terrain. None if caching is disabled."""
+        if self._cache is None:
+            return None
+        return self._cache.get_entry_dir(_get_sub_terrain_cfg(difficulty, cfg, self.cfg.seed).to_dict())
+
+
+"""
+Helper functions.
+"""
+
+
+def _get_sub_terrain_cfg(difficulty: float, cfg: SubTerrainBaseCfg, seed: int | None) -> SubTerrainBaseCfg:
+    """Returns a copy of the sub-terrain configuration with the difficulty and seed set.
+
+    The returned configuration determines the generated sub-terrain and is used as key for the cache.
+    """
+    cfg = cfg.copy()
+    cfg.difficulty = float(difficulty)
+    cfg.seed = seed
+    return cfg
+
+
+def _generate_sub_terrain(
+    difficulty: float, cfg: SubTerrainBaseCfg, seed: int | None, cache: TerrainCache | None
+) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Generate a sub-terrain mesh or load it from the cache.
+
+    Please refer to :meth:`TerrainGenerator._get_terrain_mesh` for more details.
+
+    Args:
+        difficulty: The difficulty parameter.
+        cfg: The configuration of the sub-terrain.
+        seed: The seed of the terrain generator.
+        cache: The terrain cache. None if caching is disabled.
+
+    Returns:
+        The sub-terrain mesh and origin.
+    """
+    # add other parameters to the sub-terrain configuration
+    cfg = _get_sub_terrain_cfg(difficulty, cfg, seed)
+
+    # check if the sub-terrain exists in the cache - if true, load the mesh and origin and return
+    if cache is not None:
+        entry_dir = cache.get_entry_dir(cfg.to_dict())
+        cached_data = cache.load_sub_terrain(entry_dir)
+        if cached_data is not None:
+            vertices, faces, origin = cached_data
+            return trimesh.Trimesh(vertices=vertices, faces=faces, process=False), origin
+
+    # generate the terrain
+    meshes, origin = cfg.function(difficulty, cfg)
+    mesh = trimesh.util.concatenate(meshes)
+    # offset mesh such that they are in their center
+    transform = np.eye(4)
+    transform[0:2, -1] = -cfg.size[0] * 0.5, -cfg.size[1] * 0.5
+    mesh.apply_transform(transform)
+    # change origin to be in the center of the sub-terrain
+    origin += transform[0:3, -1]
+
+    # if caching is enabled, save the mesh and origin
+    if cache is not None:
+        cache.save_sub_terrain(entry_dir, mesh.vertices, mesh.faces, origin, cfg)
+    # return the generated mesh
+    return mesh, origin
+
+
+def _concatenate_meshes(meshes: list[trimesh.Trimesh]) -> trimesh.Trimesh:
+    """Concatenate the meshes into a single mesh.
+
+    Different to :func:`trimesh.util.concatenate`, the vertex and face arrays are preallocated and filled
+    in place. The visuals of the meshes are not kept.
+
+    Args:
+        meshes: The meshes to concatenate.
+
+    Returns:
+        The concatenated mesh.
+    """
+    num_vertices = sum(len(mesh.vertices) for mesh in meshes)
+    num_faces = sum(len(mesh.faces) for mesh in meshes)
+    vertices = np.empty((num_vertices, 3), dtype=np.float64)
+    faces = np.empty((num_faces, 3), dtype=np.int64)
+    # fill the arrays and offset the face indices by the number of preceding vertices
+    vertex_offset = 0
+    face_offset = 0
+    for mesh in meshes:
+        mesh_vertices = mesh.vertices
+        mesh_faces = mesh.faces
+        vertices[vertex_offset : vertex_offset + len(mesh_vertices)] = mesh_vertices
+        np.add(mesh_faces, vertex_offset, out=faces[face_offset : face_offset + len(mesh_faces)])
+        vertex_offset += len(mesh_vertices)
+        face_offset += len(mesh_faces)
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
@@ -123,7 +123,27 @@ class TerrainGeneratorCfg:
     If enabled, the generated terrains are stored in the cache directory. When generating terrains, the cache
     is checked to see if the terrain already exists. If it does, the terrain is loaded from the cache. Otherwise,
     the terrain is generated and stored in the cache. Caching can be used to speed up terrain generation.
+
+    Both the sub-terrains (including their flat patches) and the complete terrain are cached. Please refer to
+    :class:`~isaaclab.terrains.TerrainCache` for more details.
     """
 
     cache_dir: str = "/tmp/isaaclab/terrains"
     """The directory where the terrain cache is stored. Defaults to "/tmp/isaaclab/terrains"."""
+
+    cache_max_size: float | None = None
+    """The maximum size of the cache directory (in MB). Defaults to None, in which case the size is not bounded.
+
+    If the cache directory exceeds this size after generating a terrain, the least recently used cache entries
+    are removed.
+    """
+
+    num_workers: int = 0
+    """The number of worker threads used to generate the sub-terrains. Defaults to 0.
+
+    If zero, the sub-terrains are generated serially on the main thread. Otherwise, the sub-terrains of functions
+    marked with :func:`~isaaclab.terrains.utils.deterministic_terrain` are generated in a thread pool with the given
+    number of workers, while the other sub-terrains are generated on the main thread. The generated terrain is
+    identical to the serially generated one. The speed-up depends on the share of marked sub-terrains and on how
+    much time their functions spend in numpy operations that release the GIL.
+    """
@@ -13,6 +13,7 @@ import torch
 import trimesh
 from typing import TYPE_CHECKING
 
+from ..utils import deterministic_terrain
 from .utils import *  # noqa: F401, F403
 from .utils import make_border, make_plane
 
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
     from . import mesh_terrains_cfg
 
 
+@deterministic_terrain
 def flat_terrain(
     difficulty: float, cfg: mesh_terrains_cfg.MeshPlaneTerrainCfg
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
@@ -47,6 +49,7 @@ def flat_terrain(
     return [plane_mesh], np.array(origin)
 
 
+@deterministic_terrain
 def pyramid_stairs_terrain(
     difficulty: float, cfg: mesh_terrains_cfg.MeshPyramidStairsTerrainCfg
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
@@ -147,6 +150,7 @@ def pyramid_stairs_terrain(
     return meshes_list, origin
 
 
+@deterministic_terrain
 def inverted_pyramid_stairs_terrain(
     difficulty: float, cfg: mesh_terrains_cfg.MeshInvertedPyramidStairsTerrainCfg
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
@@ -376,6 +380,7 @@ def random_grid_terrain(
     return meshes_list, origin
 
 
+@deterministic_terrain
 def rails_terrain(
     difficulty: float, cfg: mesh_terrains_cfg.MeshRailsTerrainCfg
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
@@ -430,6 +435,7 @@ def rails_terrain(
     return meshes_list, origin
 
 
+@deterministic_terrain
 def pit_terrain(
     difficulty: float, cfg: mesh_terrains_cfg.MeshPitTerrainCfg
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
@@ -493,6 +499,7 @@ def pit_terrain(
     return meshes_list, origin
 
 
+@deterministic_terrain
 def box_terrain(
     difficulty: float, cfg: mesh_terrains_cfg.MeshBoxTerrainCfg
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
@@ -555,6 +562,7 @@ def box_terrain(
     return meshes_list, origin
 
 
+@deterministic_terrain
 def gap_terrain(
     difficulty: float, cfg: mesh_terrains_cfg.MeshGapTerrainCfg
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
@@ -597,6 +605,7 @@ def gap_terrain(
     return meshes_list, origin
 
 
+@deterministic_terrain
 def floating_ring_terrain(
     difficulty: float, cfg: mesh_terrains_cfg.MeshFloatingRingTerrainCfg
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
@@ -644,6 +653,7 @@ def floating_ring_terrain(
     return meshes_list, origin
 
 
+@deterministic_terrain
 def star_terrain(
     difficulty: float, cfg: mesh_terrains_cfg.MeshStarTerrainCfg
 ) -> tuple[list[trimesh.Trimesh], np.ndarray]:
@@ -9,11 +9,16 @@ from __future__ import annotations
 import numpy as np
 import torch
 import trimesh
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 import warp as wp
 
 from isaaclab.utils.warp import raycast_mesh
 
+if TYPE_CHECKING:
+    from .sub_terrain_cfg import FlatPatchSamplingCfg
+
 
 def color_meshes_by_height(meshes: list[trimesh.Trimesh], **kwargs) -> trimesh.Trimesh:
     """
@@ -273,3 +278,218 @@ def find_flat_patches(
 
     # return the flat patches (in the mesh frame)
     return flat_patches - origin
+
+
+def find_flat_patches_batched(
+    wp_mesh: wp.Mesh,
+    patch_cfgs: list[FlatPatchSamplingCfg],
+    origins: np.ndarray | torch.Tensor,
+    bounds: np.ndarray | torch.Tensor,
+    max_iterations: int = 10000,
+) -> list[torch.Tensor]:
+    """Finds flat patches for a batch of regions of the input mesh.
+
+    This function performs the same rejection sampling as :func:`find_flat_patches`, but for multiple
+    sampling configurations and regions of a single mesh at once. For instance, these can be the flat patch
+    configurations of all the sub-terrains of the combined terrain mesh. In each iteration, the patches of all
+    regions are sampled and checked by ray-casting them with a single call. Only the invalid patches are
+    sampled again in the next iteration.
+
+    Each region is defined by its origin and its 2D bounds in the mesh frame. The sampling ranges of a patch
+    configuration are defined relative to the origin of the region and clamped to its bounds. Query points
+    outside the bounds of the region make the patch invalid. This mimics the ray-casting against the mesh of
+    the region only.
+
+    Args:
+        wp_mesh: The warp mesh to find patches in.
+        patch_cfgs: The flat patch sampling configuration for each region.
+        origins: The origin of each region in the mesh frame. Shape is (N, 3).
+        bounds: The 2D bounds of each region in the mesh frame. Shape is (N, 4), where each row is
+            (x_min, y_min, x_max, y_max).
+        max_iterations: The maximum number of sampling iterations. Defaults to 10000.
+
+    Returns:
+        A list with a tensor of shape (num_patches, 3) for each region. The patches are defined relative to
+        the origin of the region.
+
+    Raises:
+        RuntimeError: If the function fails to find valid patches for some regions within the maximum number
+            of iterations.
+    """
+    # set device to warp mesh device
+    device = wp.device_to_torch(wp_mesh.device)
+    num_regions = len(patch_cfgs)
+    if num_regions == 0:
+        return []
+    # resolve inputs to consistent type
+    origins = torch.as_tensor(origins, dtype=torch.float, device=device).view(num_regions, 3)
+    bounds = torch.as_tensor(bounds, dtype=torch.float, device=device).view(num_regions, 4)
+
+    # create the sampling ranges of each region
+    # dim: (num_regions, 7)
+    ranges = torch.tensor(
+        [[*cfg.x_range, *cfg.y_range, *cfg.z_range, cfg.max_height_diff] for cfg in patch_cfgs],
+        dtype=torch.float,
+        device=device,
+    )
+    sample_low = torch.maximum(ranges[:, [0, 2]] + origins[:, :2], bounds[:, :2])
+    sample_high = torch.minimum(ranges[:, [1, 3]] + origins[:, :2], bounds[:, 2:])
+    z_low = ranges[:, 4] + origins[:, 2]
+    z_high = ranges[:, 5] + origins[:, 2]
+    max_height_diff = ranges[:, 6]
+
+    # create a circle of points around (0, 0) for each region to query validity of the patches
+    # note: the regions may have different numbers of radii. We pad them by repeating the last radius,
+    #   which does not change the validity check.
+    patch_radii = [
+        [cfg.patch_radius] if isinstance(cfg.patch_radius, float) else cfg.patch_radius for cfg in patch_cfgs
+    ]
+    num_radii = max(len(radii) for radii in patch_radii)
+    patch_radii = torch.tensor(
+        [list(radii) + [radii[-1]] * (num_radii - len(radii)) for radii in patch_radii], device=device
+    )
+    angle = torch.linspace(0, 2 * np.pi, 10, device=device)
+    # dim: (num_regions, num_radii * 10, 2)
+    query_offsets = torch.stack(
+        [patch_radii.unsqueeze(-1) * torch.cos(angle), patch_radii.unsqueeze(-1) * torch.sin(angle)], dim=-1
+    ).view(num_regions, num_radii * 10, 2)
+
+    # create buffers
+    # -- the region of each patch
+    num_patches = [cfg.num_patches for cfg in patch_cfgs]
+    patch_regions = torch.repeat_interleave(
+        torch.arange(num_regions, device=device), torch.tensor(num_patches, device=device)
+    )
+    # -- a buffer to store indices of patches that are not valid
+    points_ids = torch.arange(len(patch_regions), device=device)
+    # -- a buffer to store the flat patches locations
+    flat_patches = torch.zeros(len(patch_regions), 3, device=device)
+
+    # sample points and raycast to find the height.
+    # 1. Reject points that are outside the z_range or have a height difference that is too large.
+    # 2. Keep sampling until all points are valid.
+    iter_count = 0
+    while len(points_ids) > 0 and iter_count < max_iterations:
+        regions = patch_regions[points_ids]
+        # sample points in the 2D region around the origin
+        low = sample_low[regions]
+        flat_patches[points_ids, :2] = low + (sample_high[regions] - low) * torch.rand(
+            len(points_ids), 2, device=device
+        )
+
+        # define the query points to check validity of the patch
+        # dim: (num_points, num_radii * 10, 3)
+        points = torch.empty(len(points_ids), num_radii * 10, 3, device=device)
+        points[..., :2] = flat_patches[points_ids, :2].unsqueeze(1) + query_offsets[regions]
+        points[..., 2] = 100.0
+        # ray-cast direction is downwards
+        dirs = torch.zeros_like(points)
+        dirs[..., 2] = -1.0
+
+        # ray-cast to find the height of the patches
+        ray_hits = raycast_mesh(points.view(-1, 3), dirs.view(-1, 3), wp_mesh)[0]
+        heights = ray_hits.view(points.shape)[..., 2]
+        # set the height of the patches
+        # note: for invalid patches, they would be overwritten in the next iteration
+        #   so it's safe to set the height to the last value
+        flat_patches[points_ids, 2] = heights[..., -1]
+
+        # check validity
+        # -- height is within the z range
+        not_valid = torch.any((heights < z_low[regions, None]) | (heights > z_high[regions, None]), dim=1)
+        # -- height difference is within the max height difference
+        not_valid |= (heights.max(dim=1)[0] - heights.min(dim=1)[0]) > max_height_diff[regions]
+        # -- query points are within the bounds of the region
+        region_bounds = bounds[regions].unsqueeze(1)
+        outside = (points[..., :2] < region_bounds[..., :2]) | (points[..., :2] > region_bounds[..., 2:])
+        not_valid |= outside.flatten(1).any(dim=1)
+
+        # remove invalid patches indices
+        points_ids = points_ids[not_valid]
+        # increment count
+        iter_count += 1
+
+    # check all patches are valid
+    if len(points_ids) > 0:
+        invalid_regions = torch.unique(patch_regions[points_ids]).tolist()
+        raise RuntimeError(
+            "Failed to find valid patches! Please check the input parameters."
+            f"\n\tMaximum number of iterations reached: {iter_count}"
+            f"\n\tNumber of invalid patches: {len(points_ids)}"
+            f"\n\tRegions with invalid patches: {invalid_regions}"
+        )
+
+    # return the flat patches (relative to the origins of the regions)
+    return list(torch.split(flat_patches - origins[patch_regions], num_patches))
+
+
+def compute_elevation_map(
+    wp_mesh: wp.Mesh, resolution: float, bounds: tuple[float, float, float, float] | None = None
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Computes the elevation map of a mesh on a regular grid.
+
+    The elevation map stores the height of the highest surface of the mesh at each point of the grid. It is
+    computed by ray-casting downwards against the mesh from above its bounding box. For terrains, this is
+    the height that a downward ray-cast from above the terrain hits.
+
+    Args:
+        wp_mesh: The warp mesh to compute the elevation map of.
+        resolution: The distance between the points of the grid (in m).
+        bounds: The region (x_min, y_min, x_max, y_max) covered by the grid. Defaults to None, in which case
+            the bounding box of the mesh is used.
+
+    Returns:
+        A tuple containing the heights and the position (x, y) of the first point of the grid. The heights have
+        the shape (X, Y), where the first index is along the x-axis. Points where the mesh is missed contain
+        :obj:`float('nan')`. The tensors are on the device of the mesh.
+
+    Raises:
+        ValueError: If the resolution is not positive.
+    """
+    if resolution <= 0.0:
+        raise ValueError(f"The resolution of the elevation map must be positive. Received: {resolution}.")
+    # set device to warp mesh device
+    device = wp.device_to_torch(wp_mesh.device)
+    # resolve the bounds of the grid
+    points = wp.to_torch(wp_mesh.points)
+    z_min, z_max = points[:, 2].min().item(), points[:, 2].max().item()
+    if bounds is None:
+        x_min, y_min = points[:, :2].min(dim=0).values.tolist()
+        x_max, y_max = points[:, :2].max(dim=0).values.tolist()
+    else:
+        x_min, y_min, x_max, y_max = bounds
+    # create the grid of rays above the mesh
+    num_x = int(np.ceil((x_max - x_min) / resolution - 1e-6)) + 1
+    num_y = int(np.ceil((y_max - y_min) / resolution - 1e-6)) + 1
+    origin = torch.tensor([x_min, y_min], device=device)
+    xx, yy = torch.meshgrid(
+        x_min + resolution * torch.arange(num_x, device=device),
+        y_min + resolution * torch.arange(num_y, device=device),
+        indexing="ij",
+    )
+    ray_starts = torch.stack([xx, yy, torch.full_like(xx, z_max + 1.0)], dim=-1).view(-1, 3)
+    ray_directions = torch.zeros_like(ray_starts)
+    ray_directions[:, 2] = -1.0
+    # ray-cast downwards against the mesh
+    ray_hits = raycast_mesh(ray_starts, ray_directions, wp_mesh, max_dist=z_max - z_min + 2.0)[0]
+    heights = ray_hits[:, 2].reshape(num_x, num_y).contiguous()
+    heights[torch.isinf(heights)] = float("nan")
+    return heights, origin
+
+
+def deterministic_terrain(func: Callable) -> Callable:
+    """Decorator to mark a terrain function that does not sample from the global random number generators.
+
+    The sub-terrains of marked functions are generated in worker threads by the
+    :class:`~isaaclab.terrains.TerrainGenerator` if :attr:`~isaaclab.terrains.TerrainGeneratorCfg.num_workers`
+    is greater than zero. The other sub-terrains are generated on the main thread, since they sample from the
+    global numpy and torch random number generators, which the threads would share.
+
+    Args:
+        func: The terrain function that does not sample from the global random number generators.
+
+    Returns:
+        The marked terrain function.
+    """
+    func.is_deterministic = True
+    return func
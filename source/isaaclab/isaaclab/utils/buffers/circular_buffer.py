@@ -16,7 +16,12 @@ class CircularBuffer:
     multi-environment settings, where each environment has its own data.
 
     The shape of the appended data is expected to be (batch_size, ...), where the first dimension is the
-    batch dimension. Correspondingly, the shape of the ring buffer is (max_len, batch_size, ...).
+    batch dimension.
+
+    Internally, the data is stored in a mirrored ring of shape (batch_size, 2 * max_len, ...). Every append
+    writes the data into two slots that are ``max_len`` apart. This makes the ``max_len`` entries ending at the
+    current head always contiguous along the history dimension, so that the oldest-to-newest history can be
+    returned as a view (see :attr:`buffer_view`) without rolling or copying the storage.
     """
 
     def __init__(self, max_len: int, batch_size: int, device: str):
@@ -37,13 +42,15 @@ class CircularBuffer:
         self._device = device
         self._ALL_INDICES = torch.arange(batch_size, device=device)
 
+        # max length as integer (avoids device synchronization when reading the property)
+        self._max_length = max_len
         # max length tensor for comparisons
         self._max_len = torch.full((batch_size,), max_len, dtype=torch.int, device=device)
         # number of data pushes passed since the last call to :meth:`reset`
         self._num_pushes = torch.zeros(batch_size, dtype=torch.long, device=device)
         # the pointer to the current head of the circular buffer (-1 means not initialized)
         self._pointer: int = -1
-        # the actual buffer for data storage
+        # the actual buffer for data storage (mirrored ring of shape (batch_size, 2 * max_len, ...))
         # note: this is initialized on the first call to :meth:`append`
         self._buffer: torch.Tensor = None  # type: ignore
 
@@ -64,7 +71,7 @@ class CircularBuffer:
     @property
     def max_length(self) -> int:
         """The maximum length of the ring buffer."""
-        return int(self._max_len[0].item())
+        return self._max_length
 
     @property
     def current_length(self) -> torch.Tensor:
@@ -78,12 +85,30 @@ class CircularBuffer:
     @property
     def buffer(self) -> torch.Tensor:
         """Complete circular buffer with most recent entry at the end and oldest entry at the beginning.
+
+        This returns a copy of :attr:`buffer_view` that is not affected by subsequent calls to :meth:`append`
+        or :meth:`reset`.
+
         Returns:
             Complete circular buffer with most recent entry at the end and oldest entry at the beginning of dimension 1. The shape is [batch_size, max_length, data.shape[1:]].
         """
-        buf = self._buffer.clone()
-        buf = torch.roll(buf, shifts=self.max_length - self._pointer - 1, dims=0)
-        return torch.transpose(buf, dim0=0, dim1=1)
+        return self.buffer_view.clone()
+
+    @property
+    def buffer_view(self) -> torch.Tensor:
+        """Zero-copy view of the circular buffer ordered from the oldest to the most recent entry.
+
+        The returned tensor aliases the internal storage. It is only valid until the next call to
+        :meth:`append` or :meth:`reset`. Use :attr:`buffer` if the data needs to outlive these calls.
+
+        Since the entries of each batch index are contiguous in memory, flattening the history dimension
+        with :meth:`torch.Tensor.reshape` does not copy the data either.
+
+        Returns:
+            A view of the buffer with the shape [batch_size, max_length, data.shape[1:]].
+        """
+        max_len = self.max_length
+        return self._buffer[:, self._pointer + 1 : self._pointer + 1 + max_len]
 
     """
     Operations.
@@ -102,7 +127,7 @@ class CircularBuffer:
         self._num_pushes[batch_ids] = 0
         if self._buffer is not None:
             # set buffer at batch_id reset indices to 0.0 so that the buffer() getter returns the cleared circular buffer after reset.
-            self._buffer[:, batch_ids, :] = 0.0
+            self._buffer[batch_ids] = 0.0
 
     def append(self, data: torch.Tensor):
         """Append the data to the circular buffer.
@@ -120,18 +145,22 @@ class CircularBuffer:
 
         # move the data to the device
         data = data.to(self._device)
+        max_len = self.max_length
         # at the first call, initialize the buffer size
         if self._buffer is None:
             self._pointer = -1
-            self._buffer = torch.empty((self.max_length, *data.shape), dtype=data.dtype, device=self._device)
+            self._buffer = torch.empty(
+                (self.batch_size, 2 * max_len, *data.shape[1:]), dtype=data.dtype, device=self._device
+            )
         # move the head to the next slot
-        self._pointer = (self._pointer + 1) % self.max_length
-        # add the new data to the last layer
-        self._buffer[self._pointer] = data
+        self._pointer = (self._pointer + 1) % max_len
+        # add the new data to the last layer and its mirrored slot
+        self._buffer[:, self._pointer] = data
+        self._buffer[:, self._pointer + max_len] = data
         # Check for batches with zero pushes and initialize all values in batch to first append
         is_first_push = self._num_pushes == 0
         if torch.any(is_first_push):
-            self._buffer[:, is_first_push] = data[is_first_push]
+            self._buffer[is_first_push] = data[is_first_push].unsqueeze(1)
         # increment number of number of pushes for all batches
         self._num_pushes += 1
 
@@ -161,7 +190,7 @@ class CircularBuffer:
 
         # admissible lag
         valid_keys = torch.minimum(key, self._num_pushes - 1)
-        # the index in the circular buffer (pointer points to the last+1 index)
-        index_in_buffer = torch.remainder(self._pointer - valid_keys, self.max_length)
+        # the index in the mirrored circular buffer (always within [pointer + 1, pointer + max_len])
+        index_in_buffer = self._pointer + self.max_length - valid_keys
         # return output
-        return self._buffer[index_in_buffer, self._ALL_INDICES]
+        return self._buffer[self._ALL_INDICES, index_in_buffer]
@@ -12,6 +12,9 @@
 Submodule for datasets classes and methods.
 """
 
+from .async_dataset_writer import AsyncDatasetWriter
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
+from .episode_data_buffer import EpisodeDataBuffer
 from .hdf5_dataset_file_handler import HDF5DatasetFileHandler
+from .memmap_dataset_file_handler import MemmapDatasetFileHandler, convert_hdf5_to_memmap
@@ -0,0 +1,221 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+import torch
+from collections.abc import Callable
+
+from .dataset_file_handler_base import DatasetFileHandlerBase
+from .episode_data import EpisodeData
+
+# note: the standard logger is used so that the module can be imported without the simulator
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatasetWriter:
+    """Background writer for exporting episodes through dataset file handlers.
+
+    The writer owns a worker thread that executes the write operations of the dataset file handlers in the
+    order in which they are submitted. Episodes are staged into (pinned) host memory with non-blocking copies
+    on the calling thread, so that the device-to-host transfer overlaps with the simulation. The serialization
+    and compression of the data then happen on the worker thread.
+
+    The number of pending operations is bounded by the queue size. If the queue is full, the submitting thread
+    blocks until the worker catches up. The time spent waiting is accumulated in :attr:`blocked_time` to report
+    the backpressure of the export.
+
+    .. note::
+        Once a file handler is used with the writer, all its operations should be submitted through the writer.
+        Otherwise, the calling thread and the worker thread may access the file concurrently.
+    """
+
+    def __init__(self, max_queue_size: int = 64, pin_memory: bool = True):
+        """Initializes the writer and starts the worker thread.
+
+        Args:
+            max_queue_size: The maximum number of pending operations. Defaults to 64.
+            pin_memory: Whether to stage device tensors into pinned host memory. Defaults to True.
+                This only has an effect if CUDA is available.
+
+        Raises:
+            ValueError: If the maximum queue size is less than one.
+        """
+        # mark as closed until the worker thread is started
+        self._is_closed = True
+        if max_queue_size < 1:
+            raise ValueError(f"The queue size should be greater than zero. However, it is set to {max_queue_size}!")
+        self._pin_memory = pin_memory and torch.cuda.is_available()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        # statistics
+        self._blocked_time = 0.0
+        self._num_completed = 0
+        self._num_dropped = 0
+        # exception raised in the worker thread (re-raised on the calling thread)
+        self._error: BaseException | None = None
+        # start the worker thread
+        # note: the thread is a daemon so that it does not block the interpreter from exiting
+        self._thread = threading.Thread(target=self._run, name="AsyncDatasetWriter", daemon=True)
+        self._thread.start()
+        self._is_closed = False
+
+    def __del__(self):
+        """Destructor for the writer.
+
+        The writer is closed if it was started and not closed yet. Errors are logged instead of raised.
+        """
+        # note: the attribute is missing if the initialization failed early
+        if getattr(self, "_is_closed", True):
+            return
+        try:
+            self.close()
+        except Exception as e:
+            logger.error(f"Failed to close the dataset writer: {e!r}.")
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_pending(self) -> int:
+        """Number of submitted operations that have not been completed yet."""
+        return self._queue.unfinished_tasks
+
+    @property
+    def num_completed(self) -> int:
+        """Number of completed operations."""
+        return self._num_completed
+
+    @property
+    def num_dropped(self) -> int:
+        """Number of operations that were dropped because a previous operation failed."""
+        return self._num_dropped
+
+    @property
+    def blocked_time(self) -> float:
+        """Total time (in seconds) that the submitting thread waited for free slots in the queue."""
+        return self._blocked_time
+
+    """
+    Operations.
+    """
+
+    def submit(self, func: Callable, *args):
+        """Submits an operation to be executed on the worker thread.
+
+        Args:
+            func: The function to call.
+            *args: The arguments to pass to the function.
+
+        Raises:
+            RuntimeError: If the writer is closed or if a previous operation failed.
+        """
+        self._put((func, args, None))
+
+    def submit_episode(self, file_handler: DatasetFileHandlerBase, episode: EpisodeData):
+        """Stages the episode data in host memory and submits it to be written by the file handler.
+
+        The tensors of the episode are replaced by host copies. The episode should not be modified afterwards.
+
+        Args:
+            file_handler: The dataset file handler to write the episode with.
+            episode: The episode data to write.
+        """
+        # copy the device tensors to host memory without blocking the calling thread
+        episode.data = self._stage_to_host(episode.data)
+        # record an event to wait for the copies on the worker thread
+        event = None
+        if self._pin_memory:
+            event = torch.cuda.Event()
+            event.record()
+        self._put((file_handler.write_episode, (episode,), event))
+
+    def wait(self):
+        """Blocks until all submitted operations are completed.
+
+        Raises:
+            RuntimeError: If an operation failed on the worker thread.
+        """
+        self._queue.join()
+        self._raise_if_failed()
+
+    def close(self):
+        """Completes all pending operations and stops the worker thread.
+
+        Raises:
+            RuntimeError: If an operation failed on the worker thread.
+        """
+        if self._is_closed:
+            return
+        self._is_closed = True
+        # signal the worker to stop after the pending operations
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_if_failed()
+
+    """
+    Helper functions.
+    """
+
+    def _put(self, item: tuple):
+        """Enqueues an operation and measures the time spent waiting for a free slot."""
+        self._raise_if_failed()
+        if self._is_closed:
+            raise RuntimeError("Cannot submit operations to a closed dataset writer.")
+        # try to enqueue without blocking first to only measure the time spent waiting
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            start_time = time.perf_counter()
+            self._queue.put(item)
+            self._blocked_time += time.perf_counter() - start_time
+
+    def _stage_to_host(self, data: dict | torch.Tensor) -> dict | torch.Tensor:
+        """Copies the (nested) tensors to host memory with non-blocking copies."""
+        if isinstance(data, dict):
+            return {key: self._stage_to_host(value) for key, value in data.items()}
+        if data.device.type == "cpu":
+            return data
+        staged = torch.empty(data.shape, dtype=data.dtype, device="cpu", pin_memory=self._pin_memory)
+        staged.copy_(data, non_blocking=self._pin_memory)
+        return staged
+
+    def _run(self):
+        """Executes the submitted operations until the stop signal is received."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            func, args, event = item
+            try:
+                # drop the remaining operations once an operation failed
+                if self._error is None:
+                    if event is not None:
+                        event.synchronize()
+                    func(*args)
+                    self._num_completed += 1
+                else:
+                    self._num_dropped += 1
+                    logger.warning(
+                        f"Dropped the operation '{getattr(func, '__qualname__', func)}' of the dataset writer since a"
+                        f" previous operation failed: {self._error!r}."
+                    )
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_if_failed(self):
+        """Raise the exception of a failed operation on the calling thread."""
+        if self._error is not None:
+            raise RuntimeError(
+                "An operation of the dataset writer failed on the worker thread."
+                f" Number of dropped operations: {self._num_dropped}."
+            ) from self._error
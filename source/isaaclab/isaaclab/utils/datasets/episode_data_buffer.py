@@ -0,0 +1,213 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import numpy as np
+import torch
+from collections.abc import Sequence
+
+from .episode_data import EpisodeData
+
+
+class EpisodeDataBuffer:
+    """Columnar storage for the episode data of a batch of environments.
+
+    Different to :class:`EpisodeData`, which stores the data of a single episode as lists of tensors, this class
+    stores the data of all environments in one preallocated tensor per key. The tensor of a key has the shape
+    (num_envs, capacity, ...), where the second dimension is the time step within the episode. When an environment
+    exceeds the capacity, the capacity of the key is doubled, so that the cost of growing the storage is amortized
+    over the episode.
+
+    The key (including the nested keys separated by "/") is resolved once when it is first added. Afterwards,
+    adding the batched values of a set of environments is a single indexed write into the storage.
+
+    The number of recorded time steps is tracked on the host for each key and environment. This avoids
+    device synchronizations when adding data.
+    """
+
+    def __init__(self, num_envs: int, device: str, initial_capacity: int = 32):
+        """Initializes the buffer.
+
+        Args:
+            num_envs: The number of environments.
+            device: The device on which the data is stored.
+            initial_capacity: The number of time steps to preallocate for each key. Defaults to 32.
+
+        Raises:
+            ValueError: If the initial capacity is less than one.
+        """
+        if initial_capacity < 1:
+            raise ValueError(f"The initial capacity should be greater than zero. Received: {initial_capacity}.")
+        self._num_envs = num_envs
+        self._device = device
+        self._initial_capacity = initial_capacity
+        # storage for each key: (num_envs, capacity, ...)
+        self._storage: dict[str, torch.Tensor] = dict()
+        # number of recorded time steps for each key and environment
+        self._lengths: dict[str, np.ndarray] = dict()
+        # resolved nested keys
+        self._key_paths: dict[str, list[str]] = dict()
+        # index tensor for all environments (used when the environment ids are not provided)
+        self._ALL_INDICES = torch.arange(num_envs, dtype=torch.long, device=device)
+
+    """
+    Properties.
+    """
+
+    @property
+    def num_envs(self) -> int:
+        """The number of environments."""
+        return self._num_envs
+
+    @property
+    def device(self) -> str:
+        """The device on which the data is stored."""
+        return self._device
+
+    @property
+    def keys(self) -> list[str]:
+        """The keys stored in the buffer."""
+        return list(self._storage.keys())
+
+    def capacity(self, key: str) -> int:
+        """The number of time steps that can be stored for the key without growing the storage."""
+        return self._storage[key].shape[1]
+
+    """
+    Operations.
+    """
+
+    def add(self, key: str, value: torch.Tensor, env_ids: Sequence[int] | None = None):
+        """Adds the batched value of a key for the given environments.
+
+        Args:
+            key: The key name. The key can be nested by using the "/" character. For example: "obs/joint_pos".
+            value: The value to add. The shape is (len(env_ids), ...).
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+
+        Raises:
+            ValueError: If the shape of the value does not match the shape of the data stored for the key.
+        """
+        # resolve environment ids
+        if env_ids is None:
+            env_ids_np = np.arange(self._num_envs)
+            env_ids_torch = self._ALL_INDICES
+        else:
+            env_ids_np = np.asarray(env_ids, dtype=np.int64)
+            env_ids_torch = torch.as_tensor(env_ids_np, device=self._device)
+        if len(env_ids_np) == 0:
+            return
+        # resolve the storage of the key
+        if key not in self._storage:
+            self._key_paths[key] = key.split("/")
+            self._storage[key] = torch.empty(
+                (self._num_envs, self._initial_capacity, *value.shape[1:]), dtype=value.dtype, device=self._device
+            )
+            self._lengths[key] = np.zeros(self._num_envs, dtype=np.int64)
+        storage = self._storage[key]
+        if value.shape[1:] != storage.shape[2:]:
+            raise ValueError(
+                f"The value for the key '{key}' has shape {tuple(value.shape[1:])}, while expecting"
+                f" {tuple(storage.shape[2:])}."
+            )
+        # grow the storage if needed
+        lengths = self._lengths[key]
+        positions = lengths[env_ids_np]
+        required_capacity = int(positions.max()) + 1
+        if required_capacity > storage.shape[1]:
+            storage = self._grow(key, max(2 * storage.shape[1], required_capacity))
+        # write the values of all environments at once
+        storage[env_ids_torch, torch.as_tensor(positions, device=self._device)] = value.to(
+            device=self._device, dtype=storage.dtype
+        )
+        lengths[env_ids_np] += 1
+
+    def length(self, key: str, env_id: int) -> int:
+        """Returns the number of recorded time steps of a key for an environment."""
+        if key not in self._lengths:
+            return 0
+        return int(self._lengths[key][env_id])
+
+    def is_empty(self, env_id: int) -> bool:
+        """Check if no data is recorded for the environment."""
+        return all(lengths[env_id] == 0 for lengths in self._lengths.values())
+
+    def get_data(self, env_id: int, clone: bool = False) -> dict:
+        """Returns the recorded data of an environment as a nested dictionary.
+
+        Args:
+            env_id: The environment id.
+            clone: Whether to copy the data. Defaults to False, in which case the tensors are views into
+                the storage. The views are only valid until the environment is reset or the storage grows.
+
+        Returns:
+            The nested dictionary of the recorded data. The shape of each tensor is (num_steps, ...).
+        """
+        data = dict()
+        for key, storage in self._storage.items():
+            length = self._lengths[key][env_id]
+            if length == 0:
+                continue
+            value = storage[env_id, :length]
+            if clone:
+                value = value.clone()
+            # add the value to the nested dictionary
+            key_path = self._key_paths[key]
+            current_dict = data
+            for sub_key in key_path[:-1]:
+                current_dict = current_dict.setdefault(sub_key, dict())
+            current_dict[key_path[-1]] = value
+        return data
+
+    def update_episode(self, episode: EpisodeData, env_id: int, clone: bool = False):
+        """Writes the recorded data of an environment into the episode data.
+
+        The keys stored in the buffer overwrite the corresponding entries in the episode data. Other entries of
+        the episode data are kept as is.
+
+        Args:
+            episode: The episode data to update.
+            env_id: The environment id.
+            clone: Whether to copy the data. Defaults to False. Please refer to :meth:`get_data` for more details.
+        """
+
+        def update_helper(episode_data: dict, data: dict):
+            for key, value in data.items():
+                if isinstance(value, dict):
+                    if not isinstance(episode_data.get(key), dict):
+                        episode_data[key] = dict()
+                    update_helper(episode_data[key], value)
+                else:
+                    episode_data[key] = value
+
+        update_helper(episode.data, self.get_data(env_id, clone=clone))
+
+    def reset(self, env_ids: Sequence[int] | None = None):
+        """Clears the recorded data of the given environments.
+
+        The storage is kept allocated to be reused by the next episodes.
+
+        Args:
+            env_ids: The environment ids. Defaults to None, in which case all environments are considered.
+        """
+        if env_ids is None:
+            env_ids = slice(None)
+        for lengths in self._lengths.values():
+            lengths[env_ids] = 0
+
+    """
+    Helper functions.
+    """
+
+    def _grow(self, key: str, capacity: int) -> torch.Tensor:
+        """Reallocates the storage of a key with the given capacity and copies the recorded data."""
+        storage = self._storage[key]
+        new_storage = torch.empty(
+            (self._num_envs, capacity, *storage.shape[2:]), dtype=storage.dtype, device=self._device
+        )
+        new_storage[:, : storage.shape[1]] = storage
+        self._storage[key] = new_storage
+        return new_storage
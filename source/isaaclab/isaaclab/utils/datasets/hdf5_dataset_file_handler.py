@@ -13,17 +13,80 @@ import json
 import numpy as np
 import os
 import torch
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 from .dataset_file_handler_base import DatasetFileHandlerBase
 from .episode_data import EpisodeData
 
 
 class HDF5DatasetFileHandler(DatasetFileHandlerBase):
-    """HDF5 dataset file handler for storing and loading episode data."""
+    """HDF5 dataset file handler for storing and loading episode data.
+
+    The compression codec and the chunk shape of the written datasets are configurable. The following codecs are
+    supported:
+
+    - ``"gzip"``: Good compression ratio at a high CPU cost. This is the default for backwards compatibility.
+    - ``"lzf"``: Fast compression with a moderate compression ratio. It is shipped with h5py.
+    - ``"blosc"``: Fast multi-threaded compression. It requires the `hdf5plugin`_ package.
+    - ``None``: No compression.
+
+    Datasets are chunked along the time dimension with :attr:`chunk_length` steps per chunk, so that slices of
+    consecutive time steps only need to decompress the chunks they touch.
+
+    .. _hdf5plugin: https://github.com/silx-kit/hdf5plugin
+    """
+
+    SUPPORTED_COMPRESSIONS = ("gzip", "lzf", "blosc", None)
+    """The supported compression codecs."""
+
+    def __init__(
+        self,
+        compression: str | None = "gzip",
+        compression_opts: int | None = None,
+        chunk_length: int | None = None,
+    ):
+        """Initializes the HDF5 dataset file handler.
+
+        Args:
+            compression: The compression codec for the written datasets. Defaults to "gzip".
+            compression_opts: The compression level. Defaults to None, in which case the default level of the
+                codec is used. This is only supported for "gzip" (0-9) and "blosc" (0-9).
+            chunk_length: The number of time steps per chunk of the written datasets. Defaults to None,
+                in which case the chunk shape is chosen by h5py.
+
+        Raises:
+            ValueError: If the compression codec is not supported.
+            ValueError: If the compression options are set for a codec that does not support them.
+            ValueError: If the chunk length is less than one.
+            ImportError: If the "blosc" codec is requested and the ``hdf5plugin`` package is not installed.
+        """
+        if compression not in self.SUPPORTED_COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported compression '{compression}'. Supported values are: {self.SUPPORTED_COMPRESSIONS}."
+            )
+        if compression_opts is not None and compression not in ("gzip", "blosc"):
+            raise ValueError(f"The compression '{compression}' does not support compression options.")
+        if chunk_length is not None and chunk_length < 1:
+            raise ValueError(f"The chunk length should be greater than zero. Received: {chunk_length}.")
+        # resolve the keyword arguments passed to h5py when creating datasets
+        if compression == "blosc":
+            try:
+                import hdf5plugin
+            except ImportError as e:
+                raise ImportError(
+                    "The 'blosc' compression requires the 'hdf5plugin' package. Please install it with:"
+                    " 'pip install hdf5plugin'."
+                ) from e
+            clevel = compression_opts if compression_opts is not None else 5
+            self._dataset_kwargs = dict(hdf5plugin.Blosc(cname="lz4", clevel=clevel, shuffle=hdf5plugin.Blosc.SHUFFLE))
+        elif compression is not None:
+            self._dataset_kwargs = {"compression": compression, "compression_opts": compression_opts}
+        else:
+            self._dataset_kwargs = {}
+        self._compression = compression
+        self._chunk_length = chunk_length
 
-    def __init__(self):
-        """Initializes the HDF5 dataset file handler."""
         self._hdf5_file_stream = None
         self._hdf5_data_group = None
         self._demo_count = 0
@@ -33,6 +96,11 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         """Open an existing dataset file."""
         if self._hdf5_file_stream is not None:
             raise RuntimeError("HDF5 dataset file stream is already in use")
+        # register the filters of the optional compression plugins to read datasets written with them
+        try:
+            import hdf5plugin  # noqa: F401
+        except ImportError:
+            pass
         self._hdf5_file_stream = h5py.File(file_path, mode)
         self._hdf5_data_group = self._hdf5_file_stream["data"]
         self._demo_count = len(self._hdf5_data_group)
@@ -78,6 +146,11 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         self._raise_if_not_initialized()
         self.add_env_args({"env_name": env_name})
 
+    def get_env_args(self) -> dict:
+        """Get the environment arguments."""
+        self._raise_if_not_initialized()
+        return json.loads(self._hdf5_data_group.attrs["env_args"])
+
     def get_env_name(self) -> str | None:
         """Get the environment name."""
         self._raise_if_not_initialized()
@@ -100,6 +173,16 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
         """The number of demos collected so far."""
         return self._demo_count
 
+    @property
+    def compression(self) -> str | None:
+        """The compression codec for the written datasets."""
+        return self._compression
+
+    @property
+    def chunk_length(self) -> int | None:
+        """The number of time steps per chunk of the written datasets."""
+        return self._chunk_length
+
     """
     Operations.
     """
@@ -136,6 +219,89 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
 
         return episode
 
+    def load_episodes(
+        self,
+        episode_names: Sequence[str],
+        device: str,
+        keys: Sequence[str] | None = None,
+        num_workers: int | None = None,
+        pin_memory: bool = True,
+    ) -> list[EpisodeData | None]:
+        """Load the data of multiple episodes from the file.
+
+        Each dataset is read directly into a preallocated host tensor, which is pinned if the data is loaded to
+        a CUDA device. The datasets are read in a thread pool, so that the host-to-device transfers and the
+        memory allocations overlap with reading and decompressing the other datasets.
+
+        Args:
+            episode_names: The names of the episodes to load.
+            device: The device to load the data to.
+            keys: The keys of the data to load. A key can be nested by using the "/" character, for example:
+                "obs/joint_pos". Selecting a group loads all the datasets within it. Defaults to None, in which
+                case all the data is loaded.
+            num_workers: The number of worker threads. Defaults to None, in which case the default of
+                :class:`concurrent.futures.ThreadPoolExecutor` is used.
+            pin_memory: Whether to read the data into pinned host memory when loading to a CUDA device.
+                Defaults to True.
+
+        Returns:
+            The loaded episodes in the order of the given names. The entry is None if the episode does not exist.
+        """
+        self._raise_if_not_initialized()
+        pin_memory = pin_memory and torch.device(device).type == "cuda"
+        env_name = self.get_env_name()
+
+        def collect_datasets_helper(group, key_path: str, data: dict, datasets: list):
+            """Helper method to collect the selected datasets of a (nested) group."""
+            for key in group:
+                sub_key_path = f"{key_path}/{key}" if key_path else key
+                if isinstance(group[key], h5py.Group):
+                    collect_datasets_helper(group[key], sub_key_path, data.setdefault(key, dict()), datasets)
+                    # remove groups without selected datasets
+                    if not data[key]:
+                        del data[key]
+                elif keys is None or any(
+                    sub_key_path == selected_key or sub_key_path.startswith(f"{selected_key}/") for selected_key in keys
+                ):
+                    datasets.append((data, key, group[key]))
+
+        # create the episodes and collect the datasets to read
+        episodes = []
+        datasets = []
+        for episode_name in episode_names:
+            if episode_name not in self._hdf5_data_group:
+                episodes.append(None)
+                continue
+            h5_episode_group = self._hdf5_data_group[episode_name]
+            episode = EpisodeData()
+            if "seed" in h5_episode_group.attrs:
+                episode.seed = h5_episode_group.attrs["seed"]
+            if "success" in h5_episode_group.attrs:
+                episode.success = h5_episode_group.attrs["success"]
+            episode.env_id = env_name
+            collect_datasets_helper(h5_episode_group, "", episode.data, datasets)
+            episodes.append(episode)
+
+        def read_dataset(dataset: h5py.Dataset) -> torch.Tensor:
+            """Read a dataset into a host tensor and move it to the device."""
+            try:
+                dtype = torch.from_numpy(np.empty(0, dtype=dataset.dtype)).dtype
+            except TypeError:
+                # fall back to a copy for data types that are not supported by torch
+                return torch.tensor(dataset[()], device=device)
+            value = torch.empty(dataset.shape, dtype=dtype, pin_memory=pin_memory)
+            if value.numel() > 0:
+                dataset.read_direct(value.numpy())
+            return value.to(device, non_blocking=pin_memory)
+
+        # read the datasets in parallel
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            values = executor.map(read_dataset, [dataset for _, _, dataset in datasets])
+            for (data, key, _), value in zip(datasets, values):
+                data[key] = value
+
+        return episodes
+
     def write_episode(self, episode: EpisodeData):
         """Add an episode to the dataset.
 
@@ -168,7 +334,12 @@ class HDF5DatasetFileHandler(DatasetFileHandlerBase):
                 for sub_key, sub_value in value.items():
                     create_dataset_helper(key_group, sub_key, sub_value)
             else:
-                group.create_dataset(key, data=value.cpu().numpy(), compression="gzip")
+                value = value.cpu().numpy()
+                # chunk the data along the time dimension
+                chunks = None
+                if self._chunk_length is not None and value.ndim > 0 and value.size > 0:
+                    chunks = (min(self._chunk_length, value.shape[0]), *value.shape[1:])
+                group.create_dataset(key, data=value, chunks=chunks, **self._dataset_kwargs)
 
         for key, value in episode.data.items():
             create_dataset_helper(h5_episode_group, key, value)
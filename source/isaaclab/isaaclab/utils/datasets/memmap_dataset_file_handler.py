@@ -0,0 +1,419 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+import h5py
+import json
+import numpy as np
+import os
+import torch
+from collections.abc import Iterable, Sequence
+
+from .dataset_file_handler_base import DatasetFileHandlerBase
+from .episode_data import EpisodeData
+from .hdf5_dataset_file_handler import HDF5DatasetFileHandler
+
+
+class MemmapDatasetFileHandler(DatasetFileHandlerBase):
+    """Memory-mapped dataset file handler for storing and loading episode data.
+
+    Different to :class:`HDF5DatasetFileHandler`, which stores each episode in its own group of (compressed)
+    datasets, this handler stores the data of all episodes of a key in one contiguous uncompressed array. The
+    dataset is a directory with the following layout:
+
+    .. code-block:: none
+
+        <dataset>.memmap/
+            meta.json                  # environment arguments, episode attributes, key data types and offsets
+            data/actions.bin           # data of the key "actions" over all episodes
+            data/obs/joint_pos.bin     # data of the nested key "obs/joint_pos" over all episodes
+            ...
+
+    Each array is stored as raw bytes in C order with the shape (total_num_steps, ...). The steps of the episode
+    with index ``i`` are in the range ``offsets[i]:offsets[i + 1]`` of the array, where the offsets of each key
+    are stored in the meta file. Since the arrays are memory-mapped, random access to the time steps of any
+    episode does not need a lookup of the episode group or decompression of the data. This makes the format
+    suited for data loaders that sample minibatches across episodes.
+
+    The format also stores the filter keys of the dataset (for example, train and validation splits), which map
+    a name to a list of episode names.
+    """
+
+    FILE_EXTENSION = ".memmap"
+    """The extension of the dataset directory."""
+
+    def __init__(self):
+        """Initializes the memory-mapped dataset file handler."""
+        self._file_path: str | None = None
+        self._mode: str | None = None
+        self._meta: dict = dict()
+        # open files for appending the data of each key
+        self._write_files: dict = dict()
+        # cached memory maps of the data of each key
+        self._arrays: dict[str, np.ndarray] = dict()
+        # map from episode name to index
+        self._episode_indices: dict[str, int] = dict()
+
+    def open(self, file_path: str, mode: str = "r"):
+        """Open an existing dataset directory.
+
+        Args:
+            file_path: The path to the dataset directory.
+            mode: The mode to open the dataset with. Either "r" (read-only) or "a" (read and append episodes).
+                Defaults to "r".
+
+        Raises:
+            RuntimeError: If the file handler is already in use.
+            ValueError: If the mode is not supported.
+            FileNotFoundError: If the dataset does not exist.
+        """
+        if self._file_path is not None:
+            raise RuntimeError("Memory-mapped dataset is already in use")
+        if mode not in ("r", "a"):
+            raise ValueError(f"Unsupported mode '{mode}'. Supported modes are: 'r', 'a'.")
+        meta_file_path = os.path.join(file_path, "meta.json")
+        if not os.path.isfile(meta_file_path):
+            raise FileNotFoundError(f"The memory-mapped dataset '{file_path}' does not exist.")
+        with open(meta_file_path) as f:
+            self._meta = json.load(f)
+        self._file_path = file_path
+        self._mode = mode
+        self._episode_indices = {episode["name"]: index for index, episode in enumerate(self._meta["episodes"])}
+
+    def create(self, file_path: str, env_name: str = None):
+        """Create a new dataset directory.
+
+        Args:
+            file_path: The path to the dataset directory. The extension ".memmap" is appended if it is missing.
+            env_name: The environment name. Defaults to None.
+
+        Raises:
+            RuntimeError: If the file handler is already in use.
+        """
+        if self._file_path is not None:
+            raise RuntimeError("Memory-mapped dataset is already in use")
+        if not file_path.endswith(self.FILE_EXTENSION):
+            file_path += self.FILE_EXTENSION
+        os.makedirs(os.path.join(file_path, "data"), exist_ok=True)
+        # remove the data of a previous dataset at the same path
+        for root, _, file_names in os.walk(os.path.join(file_path, "data")):
+            for file_name in file_names:
+                if file_name.endswith(".bin"):
+                    os.remove(os.path.join(root, file_name))
+
+        self._file_path = file_path
+        self._mode = "w"
+        self._meta = {"env_args": {}, "total": 0, "episodes": [], "keys": {}, "filter_keys": {}}
+        self._episode_indices = dict()
+
+        # set environment arguments
+        # the environment type (we use gym environment type) is set to be compatible with robomimic
+        env_name = env_name if env_name is not None else ""
+        self.add_env_args({"env_name": env_name, "type": 2})
+
+    def __del__(self):
+        """Destructor for the file handler."""
+        self.close()
+
+    """
+    Properties
+    """
+
+    @property
+    def file_path(self) -> str | None:
+        """The path to the dataset directory."""
+        return self._file_path
+
+    def add_env_args(self, env_args: dict):
+        """Add environment arguments to the dataset."""
+        self._raise_if_not_initialized()
+        self._meta["env_args"].update(env_args)
+
+    def set_env_name(self, env_name: str):
+        """Set the environment name."""
+        self._raise_if_not_initialized()
+        self.add_env_args({"env_name": env_name})
+
+    def get_env_args(self) -> dict:
+        """Get the environment arguments."""
+        self._raise_if_not_initialized()
+        return self._meta["env_args"]
+
+    def get_env_name(self) -> str | None:
+        """Get the environment name."""
+        self._raise_if_not_initialized()
+        return self._meta["env_args"].get("env_name")
+
+    def get_episode_names(self) -> Iterable[str]:
+        """Get the names of the episodes in the dataset."""
+        self._raise_if_not_initialized()
+        return self._episode_indices.keys()
+
+    def get_num_episodes(self) -> int:
+        """Get number of episodes in the dataset."""
+        return len(self._meta.get("episodes", []))
+
+    @property
+    def demo_count(self) -> int:
+        """The number of demos collected so far."""
+        return self.get_num_episodes()
+
+    def get_keys(self) -> list[str]:
+        """Get the keys of the data in the dataset. Nested keys are separated by the "/" character."""
+        self._raise_if_not_initialized()
+        return list(self._meta["keys"].keys())
+
+    def get_num_samples(self, episode_name: str) -> int:
+        """Get the number of samples (actions) of an episode."""
+        self._raise_if_not_initialized()
+        return self._meta["episodes"][self._episode_indices[episode_name]]["num_samples"]
+
+    def get_filter_key(self, name: str) -> list[str]:
+        """Get the episode names of a filter key.
+
+        Raises:
+            KeyError: If the filter key does not exist.
+        """
+        self._raise_if_not_initialized()
+        if name not in self._meta["filter_keys"]:
+            raise KeyError(f"The filter key '{name}' does not exist. Available: {list(self._meta['filter_keys'])}.")
+        return self._meta["filter_keys"][name]
+
+    def set_filter_key(self, name: str, episode_names: Sequence[str]):
+        """Set the episode names of a filter key."""
+        self._raise_if_not_initialized()
+        self._raise_if_read_only()
+        self._meta["filter_keys"][name] = list(episode_names)
+
+    """
+    Operations.
+    """
+
+    def get_array(self, key: str) -> np.ndarray:
+        """Get the memory-mapped data of a key over all episodes.
+
+        The data of the episodes can be indexed with the offsets returned by :meth:`get_episode_offsets`.
+
+        Args:
+            key: The key name. Nested keys are separated by the "/" character. For example: "obs/joint_pos".
+
+        Returns:
+            The read-only array of shape (total_num_steps, ...).
+        """
+        self._raise_if_not_initialized()
+        if key not in self._arrays:
+            key_meta = self._meta["keys"][key]
+            # flush pending writes of the key before mapping the file
+            if key in self._write_files:
+                self._write_files[key].flush()
+            shape = (key_meta["offsets"][-1], *key_meta["shape"])
+            if shape[0] == 0:
+                self._arrays[key] = np.empty(shape, dtype=key_meta["dtype"])
+            else:
+                self._arrays[key] = np.memmap(self._get_data_path(key), dtype=key_meta["dtype"], mode="r", shape=shape)
+        return self._arrays[key]
+
+    def get_episode_offsets(self, key: str) -> np.ndarray:
+        """Get the offsets of the episodes in the data of a key.
+
+        Args:
+            key: The key name.
+
+        Returns:
+            The offsets of shape (num_episodes + 1,). The data of the episode with index ``i`` is in the range
+            ``offsets[i]:offsets[i + 1]``.
+        """
+        self._raise_if_not_initialized()
+        return np.asarray(self._meta["keys"][key]["offsets"], dtype=np.int64)
+
+    def load_episode(self, episode_name: str, device: str) -> EpisodeData | None:
+        """Load episode data from the dataset."""
+        self._raise_if_not_initialized()
+        if episode_name not in self._episode_indices:
+            return None
+        episode_index = self._episode_indices[episode_name]
+        episode_meta = self._meta["episodes"][episode_index]
+
+        episode = EpisodeData()
+        for key, key_meta in self._meta["keys"].items():
+            start, end = key_meta["offsets"][episode_index], key_meta["offsets"][episode_index + 1]
+            if start == end:
+                continue
+            value = torch.from_numpy(np.array(self.get_array(key)[start:end])).to(device)
+            # add the value to the nested dictionary
+            key_path = key.split("/")
+            current_dict = episode.data
+            for sub_key in key_path[:-1]:
+                current_dict = current_dict.setdefault(sub_key, dict())
+            current_dict[key_path[-1]] = value
+
+        if "seed" in episode_meta:
+            episode.seed = episode_meta["seed"]
+        if "success" in episode_meta:
+            episode.success = episode_meta["success"]
+        episode.env_id = self.get_env_name()
+
+        return episode
+
+    def write_episode(self, episode: EpisodeData, episode_name: str | None = None):
+        """Add an episode to the dataset.
+
+        Args:
+            episode: The episode data to add. The data is expected to be exported, i.e. each key holds a tensor
+                with the time steps stacked along the first dimension.
+            episode_name: The name of the episode. Defaults to None, in which case the name is "demo_<index>".
+
+        Raises:
+            ValueError: If the data type or shape of a key does not match the data stored for the key.
+            ValueError: If an episode with the same name already exists.
+        """
+        self._raise_if_not_initialized()
+        self._raise_if_read_only()
+        if episode.is_empty():
+            return
+
+        num_episodes = self.get_num_episodes()
+        if episode_name is None:
+            episode_name = f"demo_{num_episodes}"
+        if episode_name in self._episode_indices:
+            raise ValueError(f"The episode '{episode_name}' already exists in the dataset.")
+
+        # flatten the nested data into "/" separated keys
+        values = dict()
+
+        def flatten_helper(data: dict, key_path: str):
+            for key, value in data.items():
+                sub_key_path = f"{key_path}/{key}" if key_path else key
+                if isinstance(value, dict):
+                    flatten_helper(value, sub_key_path)
+                else:
+                    value = value.cpu().numpy() if isinstance(value, torch.Tensor) else np.asarray(value)
+                    # store scalars as a single step
+                    values[sub_key_path] = np.ascontiguousarray(value.reshape(1) if value.ndim == 0 else value)
+
+        flatten_helper(episode.data, "")
+
+        # check the values before writing any data
+        for key, value in values.items():
+            if key in self._meta["keys"]:
+                key_meta = self._meta["keys"][key]
+                if np.dtype(key_meta["dtype"]) != value.dtype or tuple(key_meta["shape"]) != value.shape[1:]:
+                    raise ValueError(
+                        f"The data for the key '{key}' has data type {value.dtype} and shape {value.shape[1:]}, while"
+                        f" expecting {key_meta['dtype']} and {tuple(key_meta['shape'])}."
+                    )
+
+        # append the data of each key
+        for key, value in values.items():
+            if key not in self._meta["keys"]:
+                # keys that are added later are empty for the previous episodes
+                self._meta["keys"][key] = {
+                    "dtype": value.dtype.str,
+                    "shape": list(value.shape[1:]),
+                    "offsets": [0] * (num_episodes + 1),
+                }
+            if key not in self._write_files:
+                data_path = self._get_data_path(key)
+                os.makedirs(os.path.dirname(data_path), exist_ok=True)
+                self._write_files[key] = open(data_path, "ab")
+                # discard data that was written after the last flush of the meta file
+                key_meta = self._meta["keys"][key]
+                self._write_files[key].truncate(
+                    key_meta["offsets"][-1] * np.dtype(key_meta["dtype"]).itemsize * int(np.prod(key_meta["shape"]))
+                )
+            self._write_files[key].write(value.tobytes())
+            # invalidate the memory map of the key
+            self._arrays.pop(key, None)
+        # update the offsets of all keys
+        for key, key_meta in self._meta["keys"].items():
+            num_steps = len(values[key]) if key in values else 0
+            key_meta["offsets"].append(key_meta["offsets"][-1] + num_steps)
+
+        # store the episode attributes
+        num_samples = len(values["actions"]) if "actions" in values else 0
+        episode_meta = {"name": episode_name, "num_samples": num_samples}
+        if episode.seed is not None:
+            episode_meta["seed"] = int(episode.seed)
+        if episode.success is not None:
+            episode_meta["success"] = bool(episode.success)
+        self._meta["episodes"].append(episode_meta)
+        self._meta["total"] += num_samples
+        self._episode_indices[episode_name] = num_episodes
+
+    def flush(self):
+        """Flush the episode data and the meta file to disk."""
+        self._raise_if_not_initialized()
+        if self._mode == "r":
+            return
+        for file in self._write_files.values():
+            file.flush()
+        # write the meta file atomically so that readers never see a partial file
+        meta_file_path = os.path.join(self._file_path, "meta.json")
+        with open(meta_file_path + ".tmp", "w") as f:
+            json.dump(self._meta, f)
+        os.replace(meta_file_path + ".tmp", meta_file_path)
+
+    def close(self):
+        """Close the dataset file handler."""
+        if self._file_path is not None:
+            self.flush()
+            for file in self._write_files.values():
+                file.close()
+            self._write_files = dict()
+            self._arrays = dict()
+            self._file_path = None
+
+    """
+    Helper functions.
+    """
+
+    def _get_data_path(self, key: str) -> str:
+        """Get the path to the data file of a key."""
+        return os.path.join(self._file_path, "data", *key.split("/")) + ".bin"
+
+    def _raise_if_not_initialized(self):
+        """Raise an error if the dataset file handler is not initialized."""
+        if self._file_path is None:
+            raise RuntimeError("Memory-mapped dataset is not initialized")
+
+    def _raise_if_read_only(self):
+        """Raise an error if the dataset is opened in read-only mode."""
+        if self._mode == "r":
+            raise RuntimeError("Memory-mapped dataset is opened in read-only mode")
+
+
+def convert_hdf5_to_memmap(hdf5_file_path: str, memmap_file_path: str) -> str:
+    """Convert an HDF5 dataset to the memory-mapped dataset format.
+
+    The episodes are copied in the order of the HDF5 file and keep their names. The filter keys stored in
+    the ``mask`` group of the HDF5 file (for example, by robomimic) are copied as well.
+
+    Args:
+        hdf5_file_path: The path to the HDF5 dataset with the ``data/demo_N`` layout.
+        memmap_file_path: The path to the memory-mapped dataset to create.
+
+    Returns:
+        The path to the created memory-mapped dataset.
+    """
+    hdf5_file_handler = HDF5DatasetFileHandler()
+    hdf5_file_handler.open(hdf5_file_path)
+    memmap_file_handler = MemmapDatasetFileHandler()
+    memmap_file_handler.create(memmap_file_path)
+    memmap_file_handler.add_env_args(hdf5_file_handler.get_env_args())
+    # copy the episodes one at a time to bound the memory usage
+    for episode_name in hdf5_file_handler.get_episode_names():
+        episode = hdf5_file_handler.load_episodes([episode_name], device="cpu", num_workers=1)[0]
+        memmap_file_handler.write_episode(episode, episode_name=episode_name)
+    hdf5_file_handler.close()
+    # copy the filter keys
+    with h5py.File(hdf5_file_path, "r") as f:
+        if "mask" in f:
+            for name, episode_names in f["mask"].items():
+                episode_names = [n.decode() if isinstance(n, bytes) else str(n) for n in np.array(episode_names)]
+                memmap_file_handler.set_filter_key(name, episode_names)
+    output_path = memmap_file_handler.file_path
+    memmap_file_handler.close()
+    return output_path
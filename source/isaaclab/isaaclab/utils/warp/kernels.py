@@ -75,6 +75,378 @@ def raycast_mesh_kernel(
             ray_face_id[tid] = f
 
 
+@wp.kernel(enable_backward=False)
+def raycast_dynamic_meshes_kernel(
+    bvh: wp.uint64,
+    mesh_ids: wp.array(dtype=wp.uint64),
+    mesh_positions: wp.array(dtype=wp.vec3),
+    mesh_orientations: wp.array(dtype=wp.quat),
+    ray_starts: wp.array(dtype=wp.vec3),
+    ray_directions: wp.array(dtype=wp.vec3),
+    ray_hits: wp.array(dtype=wp.vec3),
+    ray_distance: wp.array(dtype=wp.float32),
+    ray_normal: wp.array(dtype=wp.vec3),
+    ray_face_id: wp.array(dtype=wp.int32),
+    max_dist: float = 1e6,
+    return_normal: int = False,
+    return_face_id: int = False,
+):
+    """Performs ray-casting against instances of meshes and keeps the closest hits.
+
+    Each instance is a mesh in its local frame together with the pose of the local frame in the world frame.
+    The instances are found through a bounding volume hierarchy (BVH) over their world-frame bounding boxes.
+    For each instance whose bounding box is intersected by a ray, the ray is transformed into the local frame
+    of the instance and ray-cast against its mesh.
+
+    The hit data of a ray is only overwritten if the hit is closer than the distance already stored in
+    :obj:`ray_distance`. This allows combining the hits with the ones of a previous ray-cast, for instance,
+    against static meshes. The arrays must be initialized with :obj:`float('inf')` for missed hits.
+
+    Args:
+        bvh: The BVH over the world-frame bounding boxes of the instances.
+        mesh_ids: The mesh of each instance. Shape is (M,).
+        mesh_positions: The position of each instance in the world frame. Shape is (M, 3).
+        mesh_orientations: The orientation (x, y, z, w) of each instance in the world frame. Shape is (M, 4).
+        ray_starts: The input ray start positions. Shape is (N, 3).
+        ray_directions: The input ray directions. Shape is (N, 3).
+        ray_hits: The input and output ray hit positions. Shape is (N, 3).
+        ray_distance: The input and output ray hit distances. Shape is (N,).
+        ray_normal: The input and output ray hit normals. Shape is (N, 3), if `return_normal` is True.
+            Otherwise, this array is not used.
+        ray_face_id: The input and output ray hit face ids. Shape is (N,), if `return_face_id` is True.
+            Otherwise, this array is not used.
+        max_dist: The maximum ray-cast distance. Defaults to 1e6.
+        return_normal: Whether to return the ray hit normals. Defaults to False.
+        return_face_id: Whether to return the ray hit face ids. Defaults to False.
+    """
+    # get the thread id
+    tid = wp.tid()
+
+    start = ray_starts[tid]
+    direction = ray_directions[tid]
+    # the closest hit so far
+    closest = float(max_dist)
+    if ray_distance[tid] < closest:
+        closest = ray_distance[tid]
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    # iterate over the instances whose bounding boxes are intersected by the ray
+    instance = int(0)
+    query = wp.bvh_query_ray(bvh, start, direction)
+    while wp.bvh_query_next(query, instance):
+        # transform the ray into the local frame of the instance
+        # note: the rotation preserves the distances along the ray
+        position = mesh_positions[instance]
+        orientation = mesh_orientations[instance]
+        start_local = wp.quat_rotate_inv(orientation, start - position)
+        direction_local = wp.quat_rotate_inv(orientation, direction)
+        # ray cast against the mesh and store the hit data if it is the closest
+        if wp.mesh_query_ray(mesh_ids[instance], start_local, direction_local, closest, t, u, v, sign, n, f):
+            if t < closest:
+                closest = t
+                ray_hits[tid] = start + t * direction
+                ray_distance[tid] = t
+                if return_normal == 1:
+                    ray_normal[tid] = wp.quat_rotate(orientation, n)
+                if return_face_id == 1:
+                    ray_face_id[tid] = f
+
+
+@wp.func
+def raycast_instances(
+    bvh: wp.uint64,
+    mesh_ids: wp.array(dtype=wp.uint64),
+    mesh_positions: wp.array(dtype=wp.vec3),
+    mesh_orientations: wp.array(dtype=wp.quat),
+    start: wp.vec3,
+    direction: wp.vec3,
+    max_dist: float,
+) -> float:
+    """Returns the distance to the closest hit of a ray with instances of meshes.
+
+    See :func:`raycast_dynamic_meshes_kernel` for the description of the instances.
+
+    Returns:
+        The distance to the closest hit along the ray. Equal to :obj:`max_dist` if no instance is hit.
+    """
+    closest = float(max_dist)
+
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+
+    instance = int(0)
+    query = wp.bvh_query_ray(bvh, start, direction)
+    while wp.bvh_query_next(query, instance):
+        orientation = mesh_orientations[instance]
+        start_local = wp.quat_rotate_inv(orientation, start - mesh_positions[instance])
+        direction_local = wp.quat_rotate_inv(orientation, direction)
+        if wp.mesh_query_ray(mesh_ids[instance], start_local, direction_local, closest, t, u, v, sign, n, f):
+            if t < closest:
+                closest = t
+    return closest
+
+
+@wp.func
+def get_ray_frame_rotation(q: wp.vec4, ray_alignment: int) -> wp.quat:
+    """Returns the rotation (x, y, z, w) of the frame of the rays of a ray-cast sensor.
+
+    Args:
+        q: The orientation (w, x, y, z) of the sensor in the world frame.
+        ray_alignment: The alignment mode of the rays. See :func:`raycast_sensor_kernel`.
+    """
+    rot = wp.quat_identity()
+    if ray_alignment == 1:
+        # only yaw orientation is considered
+        yaw = wp.atan2(2.0 * (q[0] * q[3] + q[1] * q[2]), 1.0 - 2.0 * (q[2] * q[2] + q[3] * q[3]))
+        rot = wp.quat_from_axis_angle(wp.vec3(0.0, 0.0, 1.0), yaw)
+    elif ray_alignment == 2:
+        # full orientation is considered
+        rot = wp.normalize(wp.quat(q[1], q[2], q[3], q[0]))
+    return rot
+
+
+@wp.func
+def get_ray_frame_position(pos: wp.vec3, rot: wp.quat, drift: wp.vec3) -> wp.vec3:
+    """Returns the position of the frame of the rays of a ray-cast sensor with the horizontal drift.
+
+    Args:
+        pos: The position of the sensor in the world frame.
+        rot: The rotation of the frame of the rays. See :func:`get_ray_frame_rotation`.
+        drift: The drift of the projected ray points in the frame of the rays.
+    """
+    drift_w = wp.quat_rotate(rot, drift)
+    return pos + wp.vec3(drift_w[0], drift_w[1], 0.0)
+
+
+@wp.kernel(enable_backward=False)
+def raycast_sensor_kernel(
+    mesh: wp.uint64,
+    bvh: wp.uint64,
+    mesh_ids: wp.array(dtype=wp.uint64),
+    mesh_positions: wp.array(dtype=wp.vec3),
+    mesh_orientations: wp.array(dtype=wp.quat),
+    env_ids: wp.array(dtype=wp.int32),
+    sensor_pos_w: wp.array(dtype=wp.vec3),
+    sensor_quat_w: wp.array(dtype=wp.vec4),
+    ray_cast_drift: wp.array(dtype=wp.vec3),
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    ray_directions: wp.array2d(dtype=wp.vec3),
+    ray_hits_w: wp.array2d(dtype=wp.vec3),
+    ray_alignment: int,
+    max_dist: float,
+    cast_mesh: int,
+    cast_instances: int,
+):
+    """Transforms the rays of ray-cast sensors into the world frame and ray-casts them.
+
+    The kernel is launched with the dimensions (number of sensors to update, number of rays per sensor). It fuses
+    the transformation of the rays with the ray-casting, so that the world-frame rays are never stored. The
+    hits are written in-place into :obj:`ray_hits_w` for the sensors in :obj:`env_ids`.
+
+    The transformation depends on :obj:`ray_alignment`:
+
+    * ``0`` (world): the rays are translated by the sensor position and the horizontal drift.
+    * ``1`` (yaw): the rays are rotated by the yaw of the sensor. The ray directions are not rotated.
+    * ``2`` (base): the rays are rotated by the full orientation of the sensor.
+
+    In the yaw and base modes, the horizontal drift is rotated in the same way as the rays. The vertical drift
+    is added to the height of the hits.
+
+    Args:
+        mesh: The static mesh to ray-cast against. Only used if :obj:`cast_mesh` is 1.
+        bvh: The BVH over the instances of meshes. Only used if :obj:`cast_instances` is 1.
+        mesh_ids: The mesh of each instance. Shape is (M,).
+        mesh_positions: The position of each instance in the world frame. Shape is (M, 3).
+        mesh_orientations: The orientation (x, y, z, w) of each instance in the world frame. Shape is (M, 4).
+        env_ids: The indices of the sensors to update. Shape is (E,).
+        sensor_pos_w: The positions of the sensors in the world frame. Shape is (N, 3).
+        sensor_quat_w: The orientations (w, x, y, z) of the sensors in the world frame. Shape is (N, 4).
+        ray_cast_drift: The drift of the projected ray points in the ray-caster frame. Shape is (N, 3).
+        ray_starts: The ray start positions in the sensor frame. Shape is (N, B, 3).
+        ray_directions: The ray directions in the sensor frame. Shape is (N, B, 3).
+        ray_hits_w: The output ray hit positions in the world frame. Shape is (N, B, 3).
+            Missed hits contain :obj:`float('inf')`.
+        ray_alignment: The alignment mode of the rays.
+        max_dist: The maximum ray-cast distance.
+        cast_mesh: Whether to ray-cast against the static mesh.
+        cast_instances: Whether to ray-cast against the instances of meshes.
+    """
+    # get the sensor and ray ids
+    i, ray_id = wp.tid()
+    env_id = env_ids[i]
+
+    pos = sensor_pos_w[env_id]
+    q = sensor_quat_w[env_id]
+    drift = ray_cast_drift[env_id]
+    start = ray_starts[env_id, ray_id]
+    direction = ray_directions[env_id, ray_id]
+    # transform the ray into the world frame
+    rot = get_ray_frame_rotation(q, ray_alignment)
+    start = wp.quat_rotate(rot, start) + get_ray_frame_position(pos, rot, drift)
+    if ray_alignment == 2:
+        direction = wp.quat_rotate(rot, direction)
+
+    # find the closest hit
+    closest = float(max_dist)
+    t = float(0.0)  # hit distance along ray
+    u = float(0.0)  # hit face barycentric u
+    v = float(0.0)  # hit face barycentric v
+    sign = float(0.0)  # hit face sign
+    n = wp.vec3()  # hit face normal
+    f = int(0)  # hit face index
+    if cast_mesh == 1:
+        if wp.mesh_query_ray(mesh, start, direction, max_dist, t, u, v, sign, n, f):
+            closest = t
+    if cast_instances == 1:
+        closest = raycast_instances(bvh, mesh_ids, mesh_positions, mesh_orientations, start, direction, closest)
+
+    # store the hit with the vertical drift
+    if closest < max_dist:
+        hit = start + closest * direction
+        ray_hits_w[env_id, ray_id] = wp.vec3(hit[0], hit[1], hit[2] + drift[2])
+    else:
+        ray_hits_w[env_id, ray_id] = wp.vec3(wp.inf, wp.inf, wp.inf)
+
+
+@wp.kernel(enable_backward=False)
+def sample_height_map_sensor_kernel(
+    height_map: wp.array2d(dtype=wp.float32),
+    height_map_origin: wp.vec2,
+    height_map_resolution: float,
+    env_ids: wp.array(dtype=wp.int32),
+    sensor_pos_w: wp.array(dtype=wp.vec3),
+    sensor_quat_w: wp.array(dtype=wp.vec4),
+    ray_cast_drift: wp.array(dtype=wp.vec3),
+    ray_starts: wp.array2d(dtype=wp.vec3),
+    ray_hits_w: wp.array2d(dtype=wp.vec3),
+    ray_alignment: int,
+    max_dist: float,
+):
+    """Computes the hits of vertical rays of ray-cast sensors by sampling a height map.
+
+    This kernel is a replacement of :func:`raycast_sensor_kernel` for rays pointing downwards along the z-axis
+    that are not rotated with the sensor (world and yaw alignment modes). Instead of ray-casting against a mesh,
+    the height at the start of each ray is interpolated bilinearly from the height map.
+
+    A ray misses if its start is outside the height map, below the height or farther than :obj:`max_dist`
+    above it. Cells of the height map that are not finite are missed as well.
+
+    Args:
+        height_map: The heights on a regular grid. Shape is (X, Y), where the first index is along the x-axis.
+        height_map_origin: The position (x, y) of the first cell of the height map.
+        height_map_resolution: The distance between the cells of the height map.
+        env_ids: The indices of the sensors to update. Shape is (E,).
+        sensor_pos_w: The positions of the sensors in the world frame. Shape is (N, 3).
+        sensor_quat_w: The orientations (w, x, y, z) of the sensors in the world frame. Shape is (N, 4).
+        ray_cast_drift: The drift of the projected ray points in the ray-caster frame. Shape is (N, 3).
+        ray_starts: The ray start positions in the sensor frame. Shape is (N, B, 3).
+        ray_hits_w: The output ray hit positions in the world frame. Shape is (N, B, 3).
+            Missed hits contain :obj:`float('inf')`.
+        ray_alignment: The alignment mode of the rays. See :func:`raycast_sensor_kernel`.
+        max_dist: The maximum ray-cast distance.
+    """
+    # get the sensor and ray ids
+    i, ray_id = wp.tid()
+    env_id = env_ids[i]
+
+    drift = ray_cast_drift[env_id]
+    # transform the ray start into the world frame
+    rot = get_ray_frame_rotation(sensor_quat_w[env_id], ray_alignment)
+    start = wp.quat_rotate(rot, ray_starts[env_id, ray_id])
+    start = start + get_ray_frame_position(sensor_pos_w[env_id], rot, drift)
+
+    # find the cell of the height map
+    x = (start[0] - height_map_origin[0]) / height_map_resolution
+    y = (start[1] - height_map_origin[1]) / height_map_resolution
+    num_x = height_map.shape[0]
+    num_y = height_map.shape[1]
+    hit = wp.vec3(wp.inf, wp.inf, wp.inf)
+    if x >= 0.0 and y >= 0.0 and x <= float(num_x - 1) and y <= float(num_y - 1):
+        ix = wp.min(int(x), num_x - 2)
+        iy = wp.min(int(y), num_y - 2)
+        tx = x - float(ix)
+        ty = y - float(iy)
+        # interpolate the height bilinearly
+        height = (1.0 - tx) * ((1.0 - ty) * height_map[ix, iy] + ty * height_map[ix, iy + 1]) + tx * (
+            (1.0 - ty) * height_map[ix + 1, iy] + ty * height_map[ix + 1, iy + 1]
+        )
+        # note: the comparisons are false for heights that are not finite
+        if height <= start[2] and start[2] - height <= max_dist:
+            hit = wp.vec3(start[0], start[1], height + drift[2])
+    ray_hits_w[env_id, ray_id] = hit
+
+
+@wp.kernel(enable_backward=False)
+def solve_dls_ik_kernel(
+    jacobian: wp.array3d(dtype=wp.float32),
+    delta_pose: wp.array2d(dtype=wp.float32),
+    lambda_sq: float,
+    chol: wp.array3d(dtype=wp.float32),
+    y: wp.array2d(dtype=wp.float32),
+    delta_joint_pos: wp.array2d(dtype=wp.float32),
+):
+    r"""Solves the damped least-squares inverse kinematics of each environment in a single thread.
+
+    The kernel computes :math:`\Delta q = J^T (J J^T + \lambda^2 I)^{-1} \Delta x` with a Cholesky
+    factorization of the small system. It is meant for Jacobians with few rows (for instance, 6 x 7).
+
+    Args:
+        jacobian: The Jacobians. Shape is (N, M, num_joints).
+        delta_pose: The desired changes in pose. Shape is (N, M).
+        lambda_sq: The squared damping coefficient.
+        chol: The scratch buffer for the Cholesky factors. Shape is (N, M, M).
+        y: The scratch buffer for the solution of the system. Shape is (N, M).
+        delta_joint_pos: The output changes in joint positions. Shape is (N, num_joints).
+    """
+    env_id = wp.tid()
+    num_rows = jacobian.shape[1]
+    num_joints = jacobian.shape[2]
+
+    # factorize J J^T + lambda^2 I = L L^T
+    for i in range(num_rows):
+        for j in range(i + 1):
+            s = float(0.0)
+            for k in range(num_joints):
+                s += jacobian[env_id, i, k] * jacobian[env_id, j, k]
+            if i == j:
+                s += lambda_sq
+            for k in range(j):
+                s -= chol[env_id, i, k] * chol[env_id, j, k]
+            if i == j:
+                chol[env_id, i, i] = wp.sqrt(wp.max(s, 1.0e-12))
+            else:
+                chol[env_id, i, j] = s / chol[env_id, j, j]
+    # solve L z = delta_pose
+    for i in range(num_rows):
+        s = delta_pose[env_id, i]
+        for k in range(i):
+            s -= chol[env_id, i, k] * y[env_id, k]
+        y[env_id, i] = s / chol[env_id, i, i]
+    # solve L^T y = z
+    for ii in range(num_rows):
+        i = num_rows - 1 - ii
+        s = y[env_id, i]
+        for k in range(i + 1, num_rows):
+            s -= chol[env_id, k, i] * y[env_id, k]
+        y[env_id, i] = s / chol[env_id, i, i]
+    # map the solution to the joint space
+    for k in range(num_joints):
+        s = float(0.0)
+        for i in range(num_rows):
+            s += jacobian[env_id, i, k] * y[env_id, i]
+        delta_joint_pos[env_id, k] = s
+
+
 @wp.kernel(enable_backward=False)
 def reshape_tiled_image(
     tiled_image_buffer: Any,
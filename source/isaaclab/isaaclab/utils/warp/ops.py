@@ -9,7 +9,10 @@
 from __future__ import annotations
 
 import numpy as np
+import os
 import torch
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import warp as wp
 
@@ -20,6 +23,18 @@ wp.init()
 
 from . import kernels
 
+CPU_MIN_RAYS_PER_THREAD = 8192
+"""The minimum number of rays that are ray-cast by a single thread on the CPU."""
+
+BUFFER_POOL_SIZE = 32
+"""The maximum number of warp arrays kept in the buffer pool."""
+
+_buffer_pool: OrderedDict[tuple, wp.array] = OrderedDict()
+"""The pool of warp arrays that are reused across calls. The keys are the shape, data type and device."""
+
+_thread_pool: ThreadPoolExecutor | None = None
+"""The thread pool used to ray-cast chunks of rays in parallel on the CPU."""
+
 
 def raycast_mesh(
     ray_starts: torch.Tensor,
@@ -29,12 +44,17 @@ def raycast_mesh(
     return_distance: bool = False,
     return_normal: bool = False,
     return_face_id: bool = False,
+    num_threads: int | None = None,
 ) -> tuple[torch.Tensor, torch.Tensor | None, torch.Tensor | None, torch.Tensor | None]:
     """Performs ray-casting against a mesh.
 
     Note that the `ray_starts` and `ray_directions`, and `ray_hits` should have compatible shapes
     and data types to ensure proper execution. Additionally, they all must be in the same frame.
 
+    Warp runs a kernel on the CPU in a single thread. For meshes on the CPU, the rays are thus split into
+    chunks of at least :data:`CPU_MIN_RAYS_PER_THREAD` rays, which are ray-cast in parallel by a thread pool.
+    The normals and face ids are only computed if they are requested.
+
     Args:
         ray_starts: The starting position of the rays. Shape (N, 3).
         ray_directions: The ray directions for each ray. Shape (N, 3).
@@ -43,6 +63,8 @@ def raycast_mesh(
         return_distance: Whether to return the distance of the ray until it hits the mesh. Defaults to False.
         return_normal: Whether to return the normal of the mesh face the ray hits. Defaults to False.
         return_face_id: Whether to return the face id of the mesh face the ray hits. Defaults to False.
+        num_threads: The maximum number of threads to ray-cast with if the mesh is on the CPU. Defaults to None,
+            in which case the number of CPUs is used. The argument is ignored for meshes on the GPU.
 
     Returns:
         The ray hit position. Shape (N, 3).
@@ -79,24 +101,26 @@ def raycast_mesh(
         ray_distance_wp = wp.from_torch(ray_distance, dtype=wp.float32)
     else:
         ray_distance = None
-        ray_distance_wp = wp.empty((1,), dtype=wp.float32, device=torch_device)
+        ray_distance_wp = _get_buffer((1,), wp.float32, mesh.device)
 
     if return_normal:
         ray_normal = torch.full((num_rays, 3), float("inf"), device=torch_device).contiguous()
         ray_normal_wp = wp.from_torch(ray_normal, dtype=wp.vec3)
     else:
         ray_normal = None
-        ray_normal_wp = wp.empty((1,), dtype=wp.vec3, device=torch_device)
+        ray_normal_wp = _get_buffer((1,), wp.vec3, mesh.device)
 
     if return_face_id:
-        ray_face_id = torch.ones((num_rays,), dtype=torch.int32, device=torch_device).contiguous() * (-1)
+        ray_face_id = torch.full((num_rays,), -1, dtype=torch.int32, device=torch_device)
         ray_face_id_wp = wp.from_torch(ray_face_id, dtype=wp.int32)
     else:
         ray_face_id = None
-        ray_face_id_wp = wp.empty((1,), dtype=wp.int32, device=torch_device)
+        ray_face_id_wp = _get_buffer((1,), wp.int32, mesh.device)
 
     # launch the warp kernel
-    wp.launch(
+    # note: the placeholders of the outputs that are not requested are shared by all chunks
+    return_flags = (return_distance, return_normal, return_face_id)
+    launch_ray_chunks(
         kernel=kernels.raycast_mesh_kernel,
         dim=num_rays,
         inputs=[
@@ -112,7 +136,9 @@ def raycast_mesh(
             int(return_normal),
             int(return_face_id),
         ],
+        chunk_input_ids=[1, 2, 3] + [i for i, flag in enumerate(return_flags, start=4) if flag],
         device=mesh.device,
+        num_threads=num_threads,
     )
     # NOTE: Synchronize is not needed anymore, but we keep it for now. Check with @dhoeller.
     wp.synchronize()
@@ -127,6 +153,123 @@ def raycast_mesh(
     return ray_hits.to(device).view(shape), ray_distance, ray_normal, ray_face_id
 
 
+def raycast_dynamic_meshes(
+    ray_starts: torch.Tensor,
+    ray_directions: torch.Tensor,
+    bvh: wp.Bvh,
+    mesh_ids: wp.array,
+    mesh_positions: torch.Tensor,
+    mesh_orientations: torch.Tensor,
+    ray_hits: torch.Tensor,
+    ray_distance: torch.Tensor,
+    ray_normal: torch.Tensor | None = None,
+    ray_face_id: torch.Tensor | None = None,
+    max_dist: float = 1e6,
+):
+    """Performs ray-casting against instances of meshes and updates the closest hits in-place.
+
+    Each instance is a warp mesh defined in its local frame. The instances are found through the given BVH,
+    which is built over the world-frame axis-aligned bounding boxes of the instances. The BVH needs to be refit
+    by the caller after the instances have moved. Since only the poses of the instances change, the same warp
+    mesh can be shared by multiple instances.
+
+    The hits are only overwritten where an instance is hit closer than the given ray distance. This allows
+    combining the hits with the ones of :func:`raycast_mesh` against static meshes. All tensors need to be on
+    the device of the BVH and contiguous.
+
+    Args:
+        ray_starts: The starting position of the rays. Shape (N, 3).
+        ray_directions: The ray directions for each ray. Shape (N, 3).
+        bvh: The BVH over the world-frame bounding boxes of the instances.
+        mesh_ids: The warp mesh ids of the instances. Shape (M,).
+        mesh_positions: The positions of the instances in the world frame. Shape (M, 3).
+        mesh_orientations: The orientations (x, y, z, w) of the instances in the world frame. Shape (M, 4).
+        ray_hits: The ray hit positions to update. Shape (N, 3).
+        ray_distance: The ray hit distances to update. Shape (N,). Missed hits contain :obj:`float('inf')`.
+        ray_normal: The ray hit normals to update. Shape (N, 3). Defaults to None, in which case the
+            normals are not computed.
+        ray_face_id: The ray hit face ids to update. Shape (N,). Defaults to None, in which case the
+            face ids are not computed.
+        max_dist: The maximum distance to ray-cast. Defaults to 1e6.
+    """
+    num_rays = ray_starts.view(-1, 3).shape[0]
+    # map the memory to warp arrays
+    ray_starts_wp = wp.from_torch(ray_starts.view(-1, 3), dtype=wp.vec3)
+    ray_directions_wp = wp.from_torch(ray_directions.view(-1, 3), dtype=wp.vec3)
+    ray_hits_wp = wp.from_torch(ray_hits.view(-1, 3), dtype=wp.vec3)
+    ray_distance_wp = wp.from_torch(ray_distance.view(-1), dtype=wp.float32)
+    if ray_normal is not None:
+        ray_normal_wp = wp.from_torch(ray_normal.view(-1, 3), dtype=wp.vec3)
+    else:
+        ray_normal_wp = _get_buffer((1,), wp.vec3, bvh.device)
+    if ray_face_id is not None:
+        ray_face_id_wp = wp.from_torch(ray_face_id.view(-1), dtype=wp.int32)
+    else:
+        ray_face_id_wp = _get_buffer((1,), wp.int32, bvh.device)
+
+    # launch the warp kernel
+    wp.launch(
+        kernel=kernels.raycast_dynamic_meshes_kernel,
+        dim=num_rays,
+        inputs=[
+            bvh.id,
+            mesh_ids,
+            wp.from_torch(mesh_positions, dtype=wp.vec3),
+            wp.from_torch(mesh_orientations, dtype=wp.quat),
+            ray_starts_wp,
+            ray_directions_wp,
+            ray_hits_wp,
+            ray_distance_wp,
+            ray_normal_wp,
+            ray_face_id_wp,
+            float(max_dist),
+            int(ray_normal is not None),
+            int(ray_face_id is not None),
+        ],
+        device=bvh.device,
+    )
+
+
+def solve_dls_ik(jacobian: torch.Tensor, delta_pose: torch.Tensor, lambda_val: float) -> torch.Tensor:
+    r"""Solves the damped least-squares inverse kinematics with one warp thread per batch element.
+
+    The function computes :math:`\Delta \mathbf{q} = \mathbf{J}^T (\mathbf{J} \mathbf{J}^T + \lambda^2
+    \mathbf{I})^{-1} \Delta \mathbf{x}` in a single kernel launch. It is faster than the batched linear algebra of
+    torch for small Jacobians, such as the 6 x 7 Jacobians of robot arms, since it avoids the launches of the
+    intermediate matrix products and the factorization.
+
+    Args:
+        jacobian: The Jacobians. Shape is (N, M, num_joints), where M is at most 6.
+        delta_pose: The desired changes in pose. Shape is (N, M).
+        lambda_val: The damping coefficient. It must be positive.
+
+    Returns:
+        The changes in joint positions. Shape is (N, num_joints).
+
+    Raises:
+        ValueError: If the Jacobians have more than 6 rows.
+    """
+    num_envs, num_rows, num_joints = jacobian.shape
+    if num_rows > 6:
+        raise ValueError(f"The warp DLS solver supports Jacobians with at most 6 rows, but got {num_rows}.")
+    device = wp.device_from_torch(jacobian.device)
+    # convert the inputs to warp
+    jacobian_wp = wp.from_torch(jacobian.float().contiguous())
+    delta_pose_wp = wp.from_torch(delta_pose.float().contiguous())
+    # create the output and the scratch buffers
+    delta_joint_pos = torch.empty((num_envs, num_joints), dtype=torch.float32, device=jacobian.device)
+    chol_wp = _get_buffer((num_envs, num_rows, num_rows), wp.float32, device)
+    y_wp = _get_buffer((num_envs, num_rows), wp.float32, device)
+    # launch the kernel
+    wp.launch(
+        kernel=kernels.solve_dls_ik_kernel,
+        dim=num_envs,
+        inputs=[jacobian_wp, delta_pose_wp, float(lambda_val**2), chol_wp, y_wp, wp.from_torch(delta_joint_pos)],
+        device=device,
+    )
+    return delta_joint_pos
+
+
 def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -> wp.Mesh:
     """Create a warp mesh object with a mesh defined from vertices and triangles.
 
@@ -143,3 +286,89 @@ def convert_to_warp_mesh(points: np.ndarray, indices: np.ndarray, device: str) -
         points=wp.array(points.astype(np.float32), dtype=wp.vec3, device=device),
         indices=wp.array(indices.astype(np.int32).flatten(), dtype=wp.int32, device=device),
     )
+
+
+def _get_buffer(shape: tuple[int, ...], dtype, device) -> wp.array:
+    """Returns a warp array from the buffer pool.
+
+    The array is allocated on the first request and reused by all later requests with the same shape, data type
+    and device. The least recently used arrays are released once the pool holds more than :data:`BUFFER_POOL_SIZE`
+    arrays. The returned array is thus only valid as a scratch or placeholder buffer within a single call.
+
+    Args:
+        shape: The shape of the array.
+        dtype: The warp data type of the array.
+        device: The warp device of the array.
+
+    Returns:
+        The warp array. Its content is undefined.
+    """
+    key = (tuple(shape), dtype, str(device))
+    buffer = _buffer_pool.get(key)
+    if buffer is None:
+        buffer = wp.empty(shape, dtype=dtype, device=device)
+        _buffer_pool[key] = buffer
+        # release the least recently used array
+        if len(_buffer_pool) > BUFFER_POOL_SIZE:
+            _buffer_pool.popitem(last=False)
+    else:
+        _buffer_pool.move_to_end(key)
+    return buffer
+
+
+def launch_ray_chunks(
+    kernel: wp.Kernel,
+    dim: int | tuple[int, int],
+    inputs: list,
+    chunk_input_ids: list[int],
+    device,
+    num_threads: int | None = None,
+):
+    """Launches a ray-casting kernel and splits its first dimension into chunks that run in parallel on the CPU.
+
+    Warp releases the GIL while a kernel runs on the CPU. The chunks are thus launched from a thread pool, where
+    each chunk gets views into the arrays that are indexed by the first dimension of the launch. A chunk has at
+    least :data:`CPU_MIN_RAYS_PER_THREAD` rays. On the GPU, the kernel is launched once over all rays.
+
+    Args:
+        kernel: The warp kernel with one thread per ray.
+        dim: The dimensions of the launch. This is either the number of rays or a tuple of the number of
+            sensors and the number of rays per sensor.
+        inputs: The inputs of the kernel.
+        chunk_input_ids: The indices of the inputs that are arrays with one element per index of the first
+            dimension of the launch.
+        device: The warp device to launch the kernel on.
+        num_threads: The maximum number of chunks on the CPU. Defaults to None, in which case the number of
+            CPUs is used.
+    """
+    global _thread_pool
+
+    device = wp.get_device(device)
+    dim = (dim,) if isinstance(dim, int) else tuple(dim)
+    # compute the number of chunks
+    num_chunks = 1
+    if device.is_cpu:
+        if num_threads is None:
+            num_threads = os.cpu_count() or 1
+        num_rays = int(np.prod(dim))
+        num_chunks = max(1, min(num_threads, dim[0], num_rays // CPU_MIN_RAYS_PER_THREAD))
+    if num_chunks == 1:
+        wp.launch(kernel, dim=dim, inputs=inputs, device=device)
+        return
+
+    # load the module before launching from multiple threads
+    wp.load_module(kernels, device=device)
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="warp_raycast")
+    # launch the chunks
+    bounds = np.linspace(0, dim[0], num_chunks + 1, dtype=np.int64)
+    futures = list()
+    for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        chunk_inputs = list(inputs)
+        for index in chunk_input_ids:
+            chunk_inputs[index] = inputs[index][start:end]
+        chunk_dim = (end - start, *dim[1:])
+        futures.append(_thread_pool.submit(wp.launch, kernel, dim=chunk_dim, inputs=chunk_inputs, device=device))
+    # wait for all chunks and re-raise their errors
+    for future in futures:
+        future.result()
@@ -0,0 +1,117 @@
+# Copyright (c) 2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from isaaclab.app import AppLauncher
+
+HEADLESS = True
+
+# if not AppLauncher.instance():
+simulation_app = AppLauncher(headless=HEADLESS).app
+
+"""Rest of imports follows"""
+
+import torch
+
+import pytest
+
+from isaaclab.actuators import ActuatorNetMLPCfg, ActuatorNetMLPGroup
+from isaaclab.utils.types import ArticulationActions
+
+INPUT_IDX = [0, 2, 4]
+
+
+@pytest.fixture
+def network_file(tmp_path):
+    """Create a TorchScript MLP with random weights."""
+    torch.manual_seed(0)
+    network = torch.nn.Sequential(torch.nn.Linear(2 * len(INPUT_IDX), 16), torch.nn.Softsign(), torch.nn.Linear(16, 1))
+    path = str(tmp_path / "actuator_net.pt")
+    torch.jit.script(network).save(path)
+    return path
+
+
+def _create_actuator(network_file: str, joint_ids: list[int], num_envs: int, device: str, input_order: str):
+    actuator_cfg = ActuatorNetMLPCfg(
+        joint_names_expr=[f"joint_{i}" for i in joint_ids],
+        network_file=network_file,
+        pos_scale=2.0,
+        vel_scale=0.5,
+        torque_scale=10.0,
+        input_order=input_order,
+        input_idx=INPUT_IDX,
+        saturation_effort=1e6,
+        effort_limit=1e6,
+        velocity_limit=1e6,
+    )
+    return actuator_cfg.class_type(
+        actuator_cfg,
+        joint_names=[f"joint_{i}" for i in joint_ids],
+        joint_ids=joint_ids,
+        num_envs=num_envs,
+        device=device,
+    )
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("input_order", ["pos_vel", "vel_pos"])
+def test_history(network_file, device, input_order):
+    """Test the ring-buffered history against shifting the complete history at every step."""
+    num_envs, num_joints = 3, 2
+    actuator = _create_actuator(network_file, list(range(num_joints)), num_envs, device, input_order)
+    network = torch.jit.load(network_file, map_location=device)
+
+    pos_error_history = torch.zeros(num_envs, max(INPUT_IDX) + 1, num_joints, device=device)
+    vel_history = torch.zeros_like(pos_error_history)
+    for step in range(12):
+        joint_pos_target = torch.randn(num_envs, num_joints, device=device)
+        joint_pos = torch.randn(num_envs, num_joints, device=device)
+        joint_vel = torch.randn(num_envs, num_joints, device=device)
+        # reset the first environment in the middle of the rollout
+        if step == 7:
+            actuator.reset([0])
+            pos_error_history[0] = 0.0
+            vel_history[0] = 0.0
+        # compute the expected torques by shifting the history
+        pos_error_history = pos_error_history.roll(1, 1)
+        pos_error_history[:, 0] = joint_pos_target - joint_pos
+        vel_history = vel_history.roll(1, 1)
+        vel_history[:, 0] = joint_vel
+        pos_input = pos_error_history[:, INPUT_IDX].transpose(1, 2).reshape(num_envs * num_joints, -1) * 2.0
+        vel_input = vel_history[:, INPUT_IDX].transpose(1, 2).reshape(num_envs * num_joints, -1) * 0.5
+        if input_order == "pos_vel":
+            network_input = torch.cat([pos_input, vel_input], dim=1)
+        else:
+            network_input = torch.cat([vel_input, pos_input], dim=1)
+        expected = network(network_input).view(num_envs, num_joints) * 10.0
+
+        control_action = ArticulationActions(joint_positions=joint_pos_target)
+        control_action = actuator.compute(control_action, joint_pos=joint_pos, joint_vel=joint_vel)
+        torch.testing.assert_close(control_action.joint_efforts, expected)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_fused_inference(network_file, device):
+    """Test that the fused inference of actuators with a shared network matches the separate inference."""
+    num_envs = 4
+    joint_ids = [[0, 2], [1], [3, 4]]
+    fused_actuators = [_create_actuator(network_file, ids, num_envs, device, "pos_vel") for ids in joint_ids]
+    actuators = [_create_actuator(network_file, ids, num_envs, device, "pos_vel") for ids in joint_ids]
+    groups = ActuatorNetMLPGroup.from_actuators(fused_actuators)
+    assert len(groups) == 1
+    assert groups[0].actuators == fused_actuators
+
+    for _ in range(6):
+        joint_pos_target = torch.randn(num_envs, 5, device=device)
+        joint_pos = torch.randn(num_envs, 5, device=device)
+        joint_vel = torch.randn(num_envs, 5, device=device)
+        groups[0].compute(joint_pos_target, joint_pos, joint_vel)
+        for fused_actuator, actuator, ids in zip(fused_actuators, actuators, joint_ids):
+            fused_action = fused_actuator.compute(
+                ArticulationActions(joint_positions=joint_pos_target[:, ids]), joint_pos[:, ids], joint_vel[:, ids]
+            )
+            action = actuator.compute(
+                ArticulationActions(joint_positions=joint_pos_target[:, ids]), joint_pos[:, ids], joint_vel[:, ids]
+            )
+            torch.testing.assert_close(fused_action.joint_efforts, action.joint_efforts, atol=1e-5, rtol=1e-5)
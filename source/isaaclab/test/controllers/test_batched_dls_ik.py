@@ -0,0 +1,105 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+# Import pinocchio in the main script to force the use of the dependencies installed by IsaacLab and not the one installed by Isaac Sim
+# pinocchio is required by the Pink IK controller
+import sys
+
+if sys.platform != "win32":
+    import pinocchio  # noqa: F401
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+
+import pytest
+from pink.tasks import DampingTask, FrameTask, PostureTask
+
+from isaaclab.controllers.pink_ik import BatchedDLSIKController, NullSpacePostureTask, PinkIKControllerCfg
+from isaaclab.utils.math import quat_from_euler_xyz
+
+JOINT_NAMES = ["joint_0", "joint_1", "joint_2"]
+
+
+def planar_arm_kinematics(joint_pos: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Computes the pose and Jacobian of the end-effector of a planar arm with unit links and z-axis joints.
+
+    Returns:
+        The position, orientation (w, x, y, z) and Jacobian of the end-effector. Shapes are (N, 1, 3), (N, 1, 4)
+        and (N, 1, 6, 3).
+    """
+    angles = torch.cumsum(joint_pos, dim=-1)
+    pos = torch.stack((torch.cos(angles).sum(-1), torch.sin(angles).sum(-1), torch.zeros_like(angles[:, 0])), dim=-1)
+    quat = quat_from_euler_xyz(torch.zeros_like(angles[:, -1]), torch.zeros_like(angles[:, -1]), angles[:, -1])
+    # the joint j moves the links j, j+1, ...
+    jacobian = torch.zeros(joint_pos.shape[0], 6, 3, device=joint_pos.device)
+    jacobian[:, 0] = -torch.flip(torch.cumsum(torch.flip(torch.sin(angles), [-1]), -1), [-1])
+    jacobian[:, 1] = torch.flip(torch.cumsum(torch.flip(torch.cos(angles), [-1]), -1), [-1])
+    jacobian[:, 5] = 1.0
+    return pos.unsqueeze(1), quat.unsqueeze(1), jacobian.unsqueeze(1)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_frame_task(device):
+    """Test that the frame task converges to reachable targets for a batch of environments."""
+    cfg = PinkIKControllerCfg(
+        variable_input_tasks=[FrameTask("ee", position_cost=1.0, orientation_cost=0.5, gain=0.5), DampingTask(0.01)],
+        fixed_input_tasks=[],
+        joint_names=JOINT_NAMES,
+    )
+    num_envs = 64
+    controller = BatchedDLSIKController(cfg, num_envs=num_envs, device=device)
+    assert controller.frame_names == ["ee"]
+
+    # sample reachable targets from random joint positions
+    generator = torch.Generator().manual_seed(0)
+    target_joint_pos = (torch.rand(num_envs, 3, generator=generator) * 2.0 - 1.0).to(device)
+    target_pos, target_quat, _ = planar_arm_kinematics(target_joint_pos)
+    controller.set_frame_targets(target_pos, target_quat)
+
+    joint_pos = torch.zeros(num_envs, 3, device=device) + 0.1
+    for _ in range(50):
+        joint_pos = controller.compute(*planar_arm_kinematics(joint_pos), joint_pos)
+    pos, _, _ = planar_arm_kinematics(joint_pos)
+    torch.testing.assert_close(pos, target_pos, atol=1e-3, rtol=0.0)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_posture_task_and_joint_limits(device):
+    """Test that the posture task converges to its target and that the joint limits are enforced."""
+    cfg = PinkIKControllerCfg(
+        variable_input_tasks=[NullSpacePostureTask(cost=1.0, controlled_joints=JOINT_NAMES[:2])],
+        fixed_input_tasks=[],
+        joint_names=JOINT_NAMES,
+    )
+    controller = BatchedDLSIKController(cfg, num_envs=2, device=device)
+    assert controller.frame_names == []
+    controller.set_posture_target(torch.tensor([[0.5, -0.5, 0.5], [0.5, -0.5, 0.5]], device=device))
+    limits = torch.tensor([[-1.0, 1.0], [-0.2, 0.2], [-1.0, 1.0]], device=device).repeat(2, 1, 1)
+    controller.set_joint_pos_limits(limits)
+
+    # there are no frames to project the posture task with
+    frame_pos = torch.zeros(2, 0, 3, device=device)
+    frame_quat = torch.zeros(2, 0, 4, device=device)
+    jacobians = torch.zeros(2, 0, 6, 3, device=device)
+    joint_pos = controller.compute(frame_pos, frame_quat, jacobians, torch.zeros(2, 3, device=device))
+    # the first joint reaches the target, the second joint is clamped and the third joint is not controlled
+    expected = torch.tensor([[0.5, -0.2, 0.0], [0.5, -0.2, 0.0]], device=device)
+    torch.testing.assert_close(joint_pos, expected, atol=1e-4, rtol=0.0)
+
+
+def test_unsupported_task():
+    """Test that unsupported tasks are rejected."""
+    cfg = PinkIKControllerCfg(
+        variable_input_tasks=[PostureTask(cost=1.0)], fixed_input_tasks=[], joint_names=JOINT_NAMES
+    )
+    with pytest.raises(ValueError):
+        BatchedDLSIKController(cfg, num_envs=1, device="cpu")
@@ -119,6 +119,44 @@ def test_ur10_ik_pose_abs(sim):
     _run_ik_controller(robot, diff_ik_controller, "ee_link", [".*"], sim_context, num_envs, ee_pose_b_des_set)
 
 
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("command_type", ["position", "pose"])
+def test_ik_solvers(device, command_type):
+    """Test the solvers of the inverse-kinematics methods against explicit pseudo-inverses."""
+    num_envs, num_joints = 64, 7
+    num_rows = 3 if command_type == "position" else 6
+    generator = torch.Generator().manual_seed(0)
+    jacobian = torch.randn(num_envs, 6, num_joints, generator=generator).to(device)
+    delta_pose = torch.randn(num_envs, num_rows, generator=generator).to(device)
+    jacobian_task = jacobian[:, :num_rows]
+    jacobian_T = jacobian_task.transpose(1, 2)
+
+    # reference solutions
+    lambda_matrix = 0.1**2 * torch.eye(num_rows, device=device)
+    expected = {
+        "pinv": torch.linalg.pinv(jacobian_task) @ delta_pose.unsqueeze(-1),
+        "svd": torch.linalg.pinv(jacobian_task) @ delta_pose.unsqueeze(-1),
+        "trans": jacobian_T @ delta_pose.unsqueeze(-1),
+        "dls": jacobian_T @ torch.inverse(jacobian_task @ jacobian_T + lambda_matrix) @ delta_pose.unsqueeze(-1),
+    }
+    for ik_method, dls_solver in [
+        ("pinv", "cholesky"),
+        ("svd", "cholesky"),
+        ("trans", "cholesky"),
+        ("dls", "cholesky"),
+        ("dls", "warp"),
+    ]:
+        cfg = DifferentialIKControllerCfg(
+            command_type=command_type,
+            ik_method=ik_method,
+            ik_params={"lambda_val": 0.1} if ik_method == "dls" else None,
+            dls_solver=dls_solver,
+        )
+        controller = DifferentialIKController(cfg, num_envs=num_envs, device=device)
+        delta_joint_pos = controller._compute_delta_joint_pos(delta_pose, jacobian_task)
+        torch.testing.assert_close(delta_joint_pos, expected[ik_method].squeeze(-1), atol=1e-3, rtol=1e-3)
+
+
 def _run_ik_controller(
     robot: Articulation,
     diff_ik_controller: DifferentialIKController,
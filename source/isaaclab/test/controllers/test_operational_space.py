@@ -1237,6 +1237,103 @@ def test_franka_taskframe_hybrid_with_nullspace_centering(sim):
     )
 
 
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("decoupling", ["none", "partial", "full"])
+def test_factorized_solves(device, decoupling):
+    """Test the factorized solves of the controller against the explicit inverses of the mass matrices."""
+    num_envs, num_DoF = 32, 7
+    osc_cfg = OperationalSpaceControllerCfg(
+        target_types=["pose_abs"],
+        impedance_mode="fixed",
+        inertial_dynamics_decoupling=decoupling != "none",
+        partial_inertial_dynamics_decoupling=decoupling == "partial",
+        gravity_compensation=False,
+        motion_stiffness_task=200.0,
+        motion_damping_ratio_task=1.0,
+        nullspace_control="position",
+    )
+    osc = OperationalSpaceController(osc_cfg, num_envs=num_envs, device=device)
+    # random inputs with symmetric positive-definite mass matrices
+    generator = torch.Generator().manual_seed(0)
+    jacobian_b = torch.randn(num_envs, 6, num_DoF, generator=generator).to(device)
+    mass_matrix = torch.randn(num_envs, num_DoF, num_DoF, generator=generator).to(device)
+    mass_matrix = mass_matrix @ mass_matrix.mT + torch.eye(num_DoF, device=device)
+    joint_pos = torch.randn(num_envs, num_DoF, generator=generator).to(device)
+    joint_vel = torch.randn(num_envs, num_DoF, generator=generator).to(device)
+    ee_pose_b = torch.tensor([[0.5, 0.0, 0.5, 1.0, 0.0, 0.0, 0.0]] * num_envs, device=device)
+    ee_vel_b = torch.randn(num_envs, 6, generator=generator).to(device)
+    command = torch.tensor([[0.4, 0.1, 0.6, 0.707, 0.0, 0.707, 0.0]] * num_envs, device=device)
+    osc.set_command(command)
+    joint_efforts = osc.compute(
+        jacobian_b=jacobian_b,
+        current_ee_pose_b=ee_pose_b,
+        current_ee_vel_b=ee_vel_b,
+        mass_matrix=mass_matrix,
+        current_joint_pos=joint_pos,
+        current_joint_vel=joint_vel,
+    )
+
+    # compute the reference efforts with explicit inverses
+    pose_error_b = torch.cat(
+        compute_pose_error(
+            ee_pose_b[:, :3], ee_pose_b[:, 3:], command[:, :3], command[:, 3:], rot_error_type="axis_angle"
+        ),
+        dim=-1,
+    )
+    des_ee_acc_b = osc._motion_p_gains_b @ pose_error_b.unsqueeze(-1) - osc._motion_d_gains_b @ ee_vel_b.unsqueeze(-1)
+    mass_matrix_inv = torch.inverse(mass_matrix)
+    os_mass_matrix_b = torch.zeros(num_envs, 6, 6, device=device)
+    if decoupling == "partial":
+        for i in (0, 3):
+            jacobian_part = jacobian_b[:, i : i + 3]
+            os_mass_matrix_b[:, i : i + 3, i : i + 3] = torch.inverse(
+                jacobian_part @ mass_matrix_inv @ jacobian_part.mT
+            )
+    elif decoupling == "full":
+        os_mass_matrix_b[:] = torch.inverse(jacobian_b @ mass_matrix_inv @ jacobian_b.mT)
+    else:
+        os_mass_matrix_b[:] = torch.eye(6, device=device)
+    expected = (jacobian_b.mT @ os_mass_matrix_b @ des_ee_acc_b).squeeze(-1)
+    if decoupling == "full":
+        jacobian_pinv_transpose = os_mass_matrix_b @ jacobian_b @ mass_matrix_inv
+    else:
+        jacobian_pinv_transpose = torch.pinverse(jacobian_b).mT
+    nullspace_jacobian_transpose = torch.eye(num_DoF, device=device) - jacobian_b.mT @ jacobian_pinv_transpose
+    joint_acc_nullspace = (osc._nullspace_p_gain * -joint_pos - osc._nullspace_d_gain * joint_vel).unsqueeze(-1)
+    expected += (nullspace_jacobian_transpose @ mass_matrix @ joint_acc_nullspace).squeeze(-1)
+
+    torch.testing.assert_close(joint_efforts, expected, atol=1e-2, rtol=1e-3)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_mass_matrix_update_period(device):
+    """Test that the factorization of the mass matrix is reused over the update period."""
+    num_envs, num_DoF = 4, 7
+    osc_cfg = OperationalSpaceControllerCfg(
+        target_types=["pose_abs"], inertial_dynamics_decoupling=True, mass_matrix_update_period=2
+    )
+    osc = OperationalSpaceController(osc_cfg, num_envs=num_envs, device=device)
+    generator = torch.Generator().manual_seed(0)
+    jacobian_b = torch.randn(num_envs, 6, num_DoF, generator=generator).to(device)
+    ee_pose_b = torch.tensor([[0.5, 0.0, 0.5, 1.0, 0.0, 0.0, 0.0]] * num_envs, device=device)
+    ee_vel_b = torch.zeros(num_envs, 6, device=device)
+    mass_matrix = torch.eye(num_DoF, device=device).repeat(num_envs, 1, 1)
+
+    def compute(mass_matrix: torch.Tensor) -> torch.Tensor:
+        osc.set_command(torch.tensor([[0.4, 0.1, 0.6, 1.0, 0.0, 0.0, 0.0]] * num_envs, device=device))
+        return osc.compute(jacobian_b, ee_pose_b, ee_vel_b, mass_matrix=mass_matrix)
+
+    # the second call reuses the factorization of the first mass matrix
+    joint_efforts = compute(mass_matrix)
+    torch.testing.assert_close(compute(2.0 * mass_matrix), joint_efforts)
+    # the third call factorizes the new mass matrix
+    torch.testing.assert_close(compute(2.0 * mass_matrix), 2.0 * joint_efforts)
+    # the reset forces a new factorization
+    compute(mass_matrix)
+    osc.reset()
+    torch.testing.assert_close(compute(2.0 * mass_matrix), 2.0 * joint_efforts)
+
+
 def _run_op_space_controller(
     robot: Articulation,
     osc: OperationalSpaceController,
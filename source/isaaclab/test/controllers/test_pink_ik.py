@@ -152,6 +152,27 @@ def test_rotation_movements(test_setup, test_cfg):
     run_movement_test(test_setup, test_cfg["tests"]["rotation_movements"], test_cfg)
 
 
+def test_batched_controller(test_setup):
+    """Test that the batched controller matches the controller of a single environment."""
+    env = test_setup["env"]
+    action_term = test_setup["action_term"]
+    ik_controller = action_term._ik_controller
+    curr_joint_pos = test_setup["articulation"].data.joint_pos[:, action_term._pink_controlled_joint_ids]
+    # perturb the joint positions so that the tasks are not satisfied
+    curr_joint_pos = curr_joint_pos + 0.05
+
+    # solve the first environment alone without warm-start
+    ik_controller.reset()
+    expected_joint_pos = ik_controller.controllers[0].compute(curr_joint_pos[0].cpu().numpy(), env.physics_dt)
+    # solve all environments as a batch
+    ik_controller.reset()
+    joint_pos = ik_controller.compute(curr_joint_pos, env.physics_dt)
+
+    assert joint_pos.shape == curr_joint_pos.shape
+    assert joint_pos.device == curr_joint_pos.device
+    torch.testing.assert_close(joint_pos[0], expected_joint_pos, atol=1e-5, rtol=1e-5)
+
+
 def run_movement_test(test_setup, test_config, test_cfg, aux_function=None):
     """Run a movement test with the given configuration."""
     env = test_setup["env"]
@@ -0,0 +1,148 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+# Import pinocchio in the main script to force the use of the dependencies installed by IsaacLab and not the one installed by Isaac Sim
+# pinocchio is required by the Pink IK controller
+import sys
+
+if sys.platform != "win32":
+    import pinocchio  # noqa: F401
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import gymnasium as gym
+import json
+import os
+import torch
+
+import pytest
+
+import isaaclab.utils.math as math_utils
+
+import isaaclab_tasks  # noqa: F401
+import isaaclab_tasks.manager_based.manipulation.pick_place  # noqa: F401
+from isaaclab_tasks.utils.parse_cfg import parse_env_cfg
+
+
+@pytest.fixture(scope="module")
+def test_cfg():
+    """Load the test configuration shared with the tests of the Pink solver."""
+    config_path = os.path.join(os.path.dirname(__file__), "test_configs", "pink_ik_gr1_test_configs.json")
+    with open(config_path) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def env_and_cfg():
+    """Create the environment with the Pink IK action term using the batched DLS solver."""
+    env_name = "Isaac-PickPlace-GR1T2-WaistEnabled-Abs-v0"
+    env_cfg = parse_env_cfg(env_name, device="cuda:0", num_envs=2)
+    # Modify scene config to not spawn the packing table to avoid collision with the robot
+    del env_cfg.scene.packing_table
+    del env_cfg.terminations.object_dropping
+    del env_cfg.terminations.time_out
+    env_cfg.actions.pink_ik_cfg.ik_solver = "dls"
+    env = gym.make(env_name, cfg=env_cfg).unwrapped
+    yield env, env_cfg
+    env.close()
+
+
+def test_frame_matching(env_and_cfg):
+    """Test that the frames of the Pink tasks are matched to the bodies whose names end the frame names."""
+    env, env_cfg = env_and_cfg
+    action_term = env.action_manager.get_term(name="pink_ik_cfg")
+    body_names = action_term._asset.data.body_names
+
+    frame_names = action_term._ik_controller.frame_names
+    assert len(action_term._frame_body_ids) == len(frame_names)
+    for frame_name, body_id in zip(frame_names, action_term._frame_body_ids):
+        assert frame_name.endswith(body_names[body_id])
+    # the frames of the wrist tasks are the end-effector links of the action
+    target_eef_link_names = env_cfg.actions.pink_ik_cfg.target_eef_link_names
+    assert [body_names[body_id] for body_id in action_term._frame_body_ids[:2]] == [
+        target_eef_link_names["left_wrist"],
+        target_eef_link_names["right_wrist"],
+    ]
+
+
+def test_jacobian_in_base_frame(env_and_cfg, test_cfg):
+    """Test that the Jacobians of the frames map the joint velocities to the frame velocities in the base frame."""
+    env, env_cfg = env_and_cfg
+    action_term = env.action_manager.get_term(name="pink_ik_cfg")
+    articulation = action_term._asset
+    num_hand_joints = env_cfg.actions.pink_ik_cfg.controller.num_hand_joints
+
+    # move the arms so that the joint velocities are not zero
+    motion = test_cfg["tests"]["vertical_movement"]
+    pose = motion["left_hand_pose"][1] + motion["right_hand_pose"][1] + [0.0] * num_hand_joints
+    actions = torch.tensor(pose, device=env.device).repeat(env.num_envs, 1)
+    with torch.inference_mode():
+        env.reset()
+        for _ in range(3):
+            env.step(actions)
+
+        _, _, jacobians = action_term._compute_frame_poses_and_jacobians()
+        joint_vel = articulation.data.joint_vel[:, action_term._pink_controlled_joint_ids]
+        # compute the velocities of the frames relative to the base link in the base link frame
+        base_pos_w = articulation.data.body_link_pos_w[:, action_term._base_link_idx].unsqueeze(1)
+        base_quat_w = articulation.data.body_link_quat_w[:, action_term._base_link_idx].unsqueeze(1)
+        base_vel_w = articulation.data.body_link_vel_w[:, action_term._base_link_idx].unsqueeze(1)
+        frame_pos_w = articulation.data.body_link_pos_w[:, action_term._frame_body_ids]
+        frame_vel_w = articulation.data.body_link_vel_w[:, action_term._frame_body_ids]
+        lin_vel_w = (
+            frame_vel_w[..., :3]
+            - base_vel_w[..., :3]
+            - torch.cross(base_vel_w[..., 3:].expand_as(frame_pos_w), frame_pos_w - base_pos_w, dim=-1)
+        )
+        ang_vel_w = frame_vel_w[..., 3:] - base_vel_w[..., 3:]
+        base_quat_w = base_quat_w.expand(-1, frame_pos_w.shape[1], -1)
+        expected_vel_b = torch.cat(
+            (
+                math_utils.quat_apply_inverse(base_quat_w, lin_vel_w),
+                math_utils.quat_apply_inverse(base_quat_w, ang_vel_w),
+            ),
+            dim=-1,
+        )
+
+    assert expected_vel_b.abs().max() > 1e-2
+    frame_vel_b = (jacobians @ joint_vel.unsqueeze(1).unsqueeze(-1)).squeeze(-1)
+    torch.testing.assert_close(frame_vel_b, expected_vel_b, atol=1e-3, rtol=1e-2)
+
+
+@pytest.mark.parametrize("motion_name", ["stay_still", "vertical_movement", "horizontal_movement"])
+def test_movement(env_and_cfg, test_cfg, motion_name):
+    """Test that the DLS solver reaches the hand poses within the tolerances of the Pink solver."""
+    env, env_cfg = env_and_cfg
+    tolerances = test_cfg["tolerances"]
+    motion = test_cfg["tests"][motion_name]
+    num_hand_joints = env_cfg.actions.pink_ik_cfg.controller.num_hand_joints
+    target_eef_link_names = env_cfg.actions.pink_ik_cfg.target_eef_link_names
+    articulation = env.scene["robot"]
+    body_ids = [
+        articulation.data.body_names.index(target_eef_link_names["left_wrist"]),
+        articulation.data.body_names.index(target_eef_link_names["right_wrist"]),
+    ]
+
+    with torch.inference_mode():
+        env.reset()
+        for left_hand_pose, right_hand_pose in zip(motion["left_hand_pose"], motion["right_hand_pose"]):
+            actions = torch.tensor(left_hand_pose + right_hand_pose + [0.0] * num_hand_joints, device=env.device)
+            actions = actions.repeat(env.num_envs, 1)
+            for _ in range(motion["allowed_steps_per_motion"]):
+                env.step(actions)
+            # compare the poses of the hands with the targets in the env origin frame
+            target_pose = torch.tensor([left_hand_pose, right_hand_pose], device=env.device)
+            hand_pos = articulation.data.body_link_pos_w[:, body_ids] - env.scene.env_origins.unsqueeze(1)
+            hand_quat = articulation.data.body_link_quat_w[:, body_ids]
+            pos_error = torch.norm(hand_pos - target_pose[:, :3], dim=-1)
+            rot_error = math_utils.quat_error_magnitude(hand_quat, target_pose[:, 3:].expand_as(hand_quat))
+            assert pos_error.max().item() < tolerances["position"]
+            assert rot_error.max().item() < tolerances["rotation"]
@@ -528,6 +528,142 @@ def test_compute_with_group_history(setup_env):
     torch.testing.assert_close(expected_obs_data_t0[reset_env_ids], obs_policy[reset_env_ids])
 
 
+def test_compute_with_fused_group_history(setup_env):
+    env = setup_env
+    """Test the observation computation with a single history buffer for all terms in a group."""
+    GROUP_HISTORY_LENGTH = 3
+
+    @configclass
+    class MyObservationManagerCfg:
+        """Test config class for observation manager."""
+
+        @configclass
+        class PolicyCfg(ObservationGroupCfg):
+            """Test config class for policy observation group."""
+
+            history_length = GROUP_HISTORY_LENGTH
+            flatten_history_dim = False
+            term_1 = ObservationTermCfg(func=grilled_chicken, scale=2.0)
+            term_2 = ObservationTermCfg(func=complex_function_class, params={"interval": 0.5})
+
+        @configclass
+        class FusedPolicyCfg(PolicyCfg):
+            """Test config class for policy observation group with fused history."""
+
+            fuse_history = True
+
+        @configclass
+        class FusedFlatPolicyCfg(FusedPolicyCfg):
+            """Test config class for policy observation group with fused and flattened history."""
+
+            flatten_history_dim = True
+
+        policy: ObservationGroupCfg = PolicyCfg()
+        fused_policy: ObservationGroupCfg = FusedPolicyCfg()
+        fused_flat_policy: ObservationGroupCfg = FusedFlatPolicyCfg()
+
+    # create observation manager
+    cfg = MyObservationManagerCfg()
+    obs_man = ObservationManager(cfg, env)
+    # check the group dimensions
+    assert obs_man.group_obs_dim["fused_policy"] == (GROUP_HISTORY_LENGTH, 5)
+    assert obs_man.group_obs_dim["fused_flat_policy"] == (GROUP_HISTORY_LENGTH * 5,)
+    # compute observations over more steps than the history length
+    previous_obs = None
+    for _ in range(GROUP_HISTORY_LENGTH + 2):
+        observations = obs_man.compute(update_history=True)
+        # the observation of the previous step should not be modified by the update of the history
+        if previous_obs is not None:
+            torch.testing.assert_close(previous_obs[0], previous_obs[1])
+        previous_obs = (observations["fused_policy"], observations["fused_policy"].clone())
+        # the fused history should match the per-term history buffers
+        torch.testing.assert_close(observations["fused_policy"], observations["policy"])
+        # the flattened fused history is ordered by time first
+        torch.testing.assert_close(observations["fused_flat_policy"], observations["policy"].reshape(env.num_envs, -1))
+    # check the history holds the latest data at the end
+    torch.testing.assert_close(
+        observations["fused_policy"][:, -1, 4], torch.full((env.num_envs,), 2.5, device=env.device)
+    )
+    # test reset of specific env ids
+    reset_env_ids = [2, 4, 16]
+    obs_man.reset(reset_env_ids)
+    observations = obs_man.compute(update_history=True)
+    torch.testing.assert_close(observations["fused_policy"], observations["policy"])
+    assert torch.all(observations["fused_policy"][reset_env_ids, :, 4] == 0.5)
+
+
+def test_invalid_fused_group_history_config(setup_env):
+    env = setup_env
+    """Test that a fused history buffer requires a group history length."""
+
+    @configclass
+    class MyObservationManagerCfg:
+        """Test config class for observation manager."""
+
+        @configclass
+        class PolicyCfg(ObservationGroupCfg):
+            """Test config class for policy observation group."""
+
+            fuse_history = True
+            term_1 = ObservationTermCfg(func=grilled_chicken)
+
+        policy: ObservationGroupCfg = PolicyCfg()
+
+    # create observation manager
+    cfg = MyObservationManagerCfg()
+    # check the invalid config
+    with pytest.raises(ValueError):
+        ObservationManager(cfg, env)
+
+
+def test_compute_with_output_buffers(setup_env):
+    env = setup_env
+    """Test the observation computation with persistent output buffers."""
+
+    @configclass
+    class MyObservationManagerCfg:
+        """Test config class for observation manager."""
+
+        @configclass
+        class PolicyCfg(ObservationGroupCfg):
+            """Test config class for policy observation group."""
+
+            term_1 = ObservationTermCfg(func=grilled_chicken, scale=10)
+            term_2 = ObservationTermCfg(func=pos_w_data, scale=2, clip=(-1.0, 1.0))
+            term_3 = ObservationTermCfg(func=complex_function_class, params={"interval": 0.5}, history_length=2)
+            term_4 = ObservationTermCfg(
+                func=lin_vel_w_data, modifiers=[modifiers.ModifierCfg(func=modifiers.bias, params={"value": 1.0})]
+            )
+
+        @configclass
+        class BufferedPolicyCfg(PolicyCfg):
+            """Test config class for policy observation group with output buffers."""
+
+            num_output_buffers = 2
+
+        policy: ObservationGroupCfg = PolicyCfg()
+        buffered_policy: ObservationGroupCfg = BufferedPolicyCfg()
+
+    # create observation manager
+    cfg = MyObservationManagerCfg()
+    obs_man = ObservationManager(cfg, env)
+    # keep a copy of the source data to check that it is not modified
+    pos_w = env.data.pos_w.clone()
+    # compute observations
+    previous_obs = None
+    for _ in range(4):
+        observations = obs_man.compute(update_history=True)
+        # check the observations are the same as with newly allocated tensors
+        torch.testing.assert_close(observations["buffered_policy"], observations["policy"])
+        # check that the buffers alternate and the previous observation is not overwritten
+        if previous_obs is not None:
+            assert observations["buffered_policy"].data_ptr() != previous_obs[0].data_ptr()
+            torch.testing.assert_close(previous_obs[0], previous_obs[1])
+        previous_obs = (observations["buffered_policy"], observations["policy"])
+    # check that the source data was not modified in-place
+    torch.testing.assert_close(env.data.pos_w, pos_w)
+
+
 def test_invalid_observation_config(setup_env):
     env = setup_env
     """Test the invalid observation config."""
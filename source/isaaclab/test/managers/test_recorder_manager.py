@@ -28,6 +28,7 @@ from isaaclab.envs import ManagerBasedEnv
 from isaaclab.managers import DatasetExportMode, RecorderManager, RecorderManagerBaseCfg, RecorderTerm, RecorderTermCfg
 from isaaclab.sim import SimulationContext
 from isaaclab.utils import configclass
+from isaaclab.utils.datasets import AsyncDatasetWriter
 
 
 class DummyResetRecorderTerm(RecorderTerm):
@@ -166,8 +167,8 @@ def test_record(dataset_dir):
         # check the recorded data
         for env_id in range(env.num_envs):
             episode = recorder_manager.get_episode(env_id)
-            assert torch.stack(episode.data["record_pre_step"]).shape == (2, 4)
-            assert torch.stack(episode.data["record_post_step"]).shape == (2, 5)
+            assert episode.data["record_pre_step"].shape == (2, 4)
+            assert episode.data["record_post_step"].shape == (2, 5)
 
         # Trigger pre-reset callbacks which then export and clean the episode data
         recorder_manager.record_pre_reset(env_ids=None)
@@ -178,4 +179,94 @@ def test_record(dataset_dir):
         recorder_manager.record_post_reset(env_ids=None)
         for env_id in range(env.num_envs):
             episode = recorder_manager.get_episode(env_id)
-            assert torch.stack(episode.data["record_post_reset"]).shape == (1, 3)
+            assert episode.data["record_post_reset"].shape == (1, 3)
+
+
+def test_get_episode_copies(dataset_dir):
+    """Test that the returned episodes own their data, unlike the episode views."""
+    for device in ("cuda:0", "cpu"):
+        env = create_dummy_env(device)
+        # create recorder manager
+        cfg = DummyRecorderManagerCfg()
+        cfg.dataset_export_dir_path = dataset_dir
+        cfg.dataset_filename = f"{uuid.uuid4()}.hdf5"
+        recorder_manager = RecorderManager(cfg, env)
+
+        recorder_manager.add_to_episodes("obs", torch.zeros(env.num_envs, 2, device=device))
+        obs = recorder_manager.get_episode(0).data["obs"]
+        obs_view = recorder_manager.get_episode_view(0).data["obs"]
+        # record the next episode into the reused storage
+        recorder_manager.reset()
+        recorder_manager.add_to_episodes("obs", torch.ones(env.num_envs, 2, device=device))
+        torch.testing.assert_close(obs, torch.zeros(1, 2, device=device))
+        torch.testing.assert_close(obs_view, torch.ones(1, 2, device=device))
+
+
+def test_record_async_export(dataset_dir):
+    """Test the export of the recorded data on a background thread."""
+    for device in ("cuda:0", "cpu"):
+        env = create_dummy_env(device)
+        # create recorder manager
+        cfg = DummyRecorderManagerCfg()
+        cfg.dataset_export_dir_path = dataset_dir
+        cfg.dataset_filename = f"{uuid.uuid4()}.hdf5"
+        cfg.export_async = True
+        cfg.export_async_queue_size = 4
+        recorder_manager = RecorderManager(cfg, env)
+        assert recorder_manager.dataset_writer is not None
+
+        # record the step data
+        recorder_manager.record_pre_step()
+        recorder_manager.record_post_step()
+
+        # Trigger pre-reset callbacks which then export and clean the episode data
+        recorder_manager.record_pre_reset(env_ids=None)
+        for env_id in range(env.num_envs):
+            episode = recorder_manager.get_episode(env_id)
+            assert episode.is_empty()
+        # the episode counts are updated without waiting for the writes
+        assert recorder_manager.exported_failed_episode_count == env.num_envs
+
+        # wait for the pending writes and check the written episodes
+        recorder_manager.dataset_writer.wait()
+        assert recorder_manager.dataset_writer.num_pending == 0
+        assert recorder_manager._dataset_file_handler.get_num_episodes() == env.num_envs
+        # close the manager to flush the file
+        del recorder_manager
+
+
+def test_async_writer_failure():
+    """Test that a failed write is raised on close and that the later operations are dropped."""
+    writer = AsyncDatasetWriter(max_queue_size=4)
+    completed = []
+
+    def failing_write():
+        raise OSError("No space left on device.")
+
+    writer.submit(failing_write)
+    writer.submit(completed.append, 1)
+    with pytest.raises(RuntimeError):
+        writer.close()
+    assert completed == []
+    assert writer.num_dropped == 1
+    # the destructor of a closed writer should not raise again
+    writer.__del__()
+
+
+def test_async_writer_destructor():
+    """Test that the destructor closes an open writer and logs the failures instead of raising them."""
+    writer = AsyncDatasetWriter(max_queue_size=4)
+    completed = []
+    writer.submit(completed.append, 1)
+    writer.__del__()
+    assert completed == [1]
+    assert writer.num_pending == 0
+
+    writer = AsyncDatasetWriter(max_queue_size=4)
+
+    def failing_write():
+        raise OSError("No space left on device.")
+
+    writer.submit(failing_write)
+    writer.__del__()
+    assert writer.num_completed == 0
@@ -129,6 +129,33 @@ def test_compute(env):
     assert tuple(rewards.shape) == (env.num_envs,)
 
 
+def test_compute_with_weight_update(env):
+    """Test the computation of reward and episodic sums after updating the term weights."""
+    cfg = {
+        "term_1": RewardTermCfg(func=grilled_chicken, weight=10),
+        "term_2": RewardTermCfg(func=grilled_chicken, weight=0.0),
+    }
+    rew_man = RewardManager(cfg, env)
+    # compute reward using manager
+    rewards = rew_man.compute(dt=env.dt)
+    torch.testing.assert_close(rewards, torch.full((env.num_envs,), 10 * env.dt))
+    # update the weights through the manager
+    term_cfg = rew_man.get_term_cfg("term_2")
+    term_cfg.weight = 2.0
+    rew_man.set_term_cfg("term_2", term_cfg)
+    rewards = rew_man.compute(dt=env.dt)
+    torch.testing.assert_close(rewards, torch.full((env.num_envs,), 12 * env.dt))
+    # update the weights directly in the configuration
+    rew_man.get_term_cfg("term_1").weight = 0.0
+    rewards = rew_man.compute(dt=env.dt)
+    torch.testing.assert_close(rewards, torch.full((env.num_envs,), 2 * env.dt))
+    # check the step rewards of the last step
+    assert rew_man.get_active_iterable_terms(0) == [("term_1", [0.0]), ("term_2", [2.0])]
+    # check the episodic sums
+    torch.testing.assert_close(rew_man._episode_sums["term_1"], torch.full((env.num_envs,), 20 * env.dt))
+    torch.testing.assert_close(rew_man._episode_sums["term_2"], torch.full((env.num_envs,), 4 * env.dt))
+
+
 def test_config_empty(env):
     """Test the creation of reward manager with empty config."""
     rew_man = RewardManager(None, env)
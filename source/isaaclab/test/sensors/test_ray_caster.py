@@ -0,0 +1,243 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+# ignore private usage of variables warning
+# pyright: reportPrivateUsage=none
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import torch
+import trimesh
+
+import isaacsim.core.utils.prims as prim_utils
+import isaacsim.core.utils.stage as stage_utils
+import pytest
+from isaacsim.core.prims import XFormPrim
+
+import isaaclab.sim as sim_utils
+from isaaclab.sensors.ray_caster import RayCaster, RayCasterCfg, patterns
+from isaaclab.terrains.trimesh.utils import make_plane
+from isaaclab.terrains.utils import create_prim_from_mesh
+from isaaclab.utils.math import quat_apply, quat_apply_yaw, quat_from_euler_xyz
+from isaaclab.utils.warp import raycast_mesh
+
+
+@pytest.fixture
+def setup_sim():
+    """Create a stage with a ground plane, a static box and two boxes that can be moved."""
+    # Create a new stage
+    stage_utils.create_new_stage()
+    # create xform because placement of the sensor directly under world is not supported
+    prim_utils.create_prim("/World/Sensor", "Xform", translation=(0.0, 0.0, 5.0))
+    # Load kit helper
+    sim = sim_utils.SimulationContext(sim_utils.SimulationCfg(dt=0.01))
+    # static meshes: ground plane and a box covering the rays with negative x-coordinates
+    create_prim_from_mesh("/World/ground", make_plane(size=(100, 100), height=0.0, center_zero=True))
+    create_prim_from_mesh("/World/box", trimesh.creation.box((2.0, 2.0, 1.0)), translation=(-1.0, 0.0, 0.5))
+    # dynamic meshes: two identical boxes outside the rays
+    for i in range(2):
+        create_prim_from_mesh(
+            f"/World/Object_{i}", trimesh.creation.box((0.4, 0.4, 0.4)), translation=(10.0 + i, 0.0, 0.2)
+        )
+    # load stage
+    stage_utils.update_stage()
+    yield sim
+    # stop simulation
+    sim._timeline.stop()
+    # clear the stage
+    sim.clear_all_callbacks()
+    sim.clear_instance()
+
+
+def _ray_caster_cfg(**kwargs) -> RayCasterCfg:
+    kwargs.setdefault("ray_alignment", "world")
+    return RayCasterCfg(
+        prim_path="/World/Sensor",
+        update_period=0,
+        pattern_cfg=patterns.GridPatternCfg(resolution=0.1, size=(1.0, 1.0)),
+        **kwargs,
+    )
+
+
+def test_multiple_static_meshes(setup_sim):
+    """Test that the hits are the closest ones among multiple static meshes."""
+    sim = setup_sim
+    ray_caster = RayCaster(_ray_caster_cfg(mesh_prim_paths=["/World/ground", "/World/box"]))
+    sim.reset()
+    sim.step()
+    ray_caster.update(0.01)
+
+    # check that both paths share the merged mesh
+    assert ray_caster.meshes["/World/ground"] is ray_caster.meshes["/World/box"]
+    # check the heights of the hits
+    ray_hits = ray_caster.data.ray_hits_w[0].cpu()
+    ray_starts_x = ray_caster.ray_starts[0, :, 0].cpu()
+    torch.testing.assert_close(ray_hits[ray_starts_x < -0.01, 2], torch.ones_like(ray_hits[ray_starts_x < -0.01, 2]))
+    torch.testing.assert_close(ray_hits[ray_starts_x > 0.01, 2], torch.zeros_like(ray_hits[ray_starts_x > 0.01, 2]))
+
+
+def test_dynamic_meshes(setup_sim):
+    """Test that the hits follow the moving meshes."""
+    sim = setup_sim
+    ray_caster = RayCaster(
+        _ray_caster_cfg(mesh_prim_paths=["/World/ground"], dynamic_mesh_prim_paths=["/World/Object_.*"])
+    )
+    sim.reset()
+    sim.step()
+    ray_caster.update(0.01)
+
+    # check that the instances share the same warp mesh
+    meshes = ray_caster.dynamic_meshes["/World/Object_.*"]
+    assert len(meshes) == 2
+    assert meshes[0] is meshes[1]
+    # the boxes are outside the rays
+    torch.testing.assert_close(ray_caster.data.ray_hits_w[0, :, 2].cpu(), torch.zeros(ray_caster.num_rays))
+
+    # move the second box below the sensor and rotate it by 45 degrees around the z-axis
+    objects = XFormPrim("/World/Object_.*", reset_xform_properties=False)
+    objects.set_world_poses(
+        positions=torch.tensor([[10.0, 0.0, 0.2], [0.0, 0.0, 1.2]]),
+        orientations=torch.tensor([[1.0, 0.0, 0.0, 0.0], [0.92387953, 0.0, 0.0, 0.38268343]]),
+    )
+    sim.step()
+    ray_caster.update(0.01)
+
+    # check the hits on the top of the box and the ground around it
+    ray_hits = ray_caster.data.ray_hits_w[0].cpu()
+    ray_starts = ray_caster.ray_starts[0].cpu()
+    # rotate the starts into the frame of the box
+    local_x = (ray_starts[:, 0] + ray_starts[:, 1]) / 2**0.5
+    local_y = (ray_starts[:, 1] - ray_starts[:, 0]) / 2**0.5
+    inside = (local_x.abs() < 0.19) & (local_y.abs() < 0.19)
+    outside = (local_x.abs() > 0.21) | (local_y.abs() > 0.21)
+    torch.testing.assert_close(ray_hits[inside, 2], torch.full_like(ray_hits[inside, 2], 1.4))
+    torch.testing.assert_close(ray_hits[outside, 2], torch.zeros_like(ray_hits[outside, 2]))
+
+
+def test_only_dynamic_meshes(setup_sim):
+    """Test ray-casting without static meshes."""
+    sim = setup_sim
+    ray_caster = RayCaster(_ray_caster_cfg(mesh_prim_paths=[], dynamic_mesh_prim_paths=["/World/Object_.*"]))
+    sim.reset()
+    sim.step()
+    ray_caster.update(0.01)
+
+    # check that the rays miss the boxes
+    assert torch.isinf(ray_caster.data.ray_hits_w).all()
+
+
+@pytest.mark.parametrize("ray_alignment", ["world", "yaw", "base"])
+def test_ray_alignment_with_drift(setup_sim, ray_alignment):
+    """Test the fused ray-casting kernel against the transformation of the rays with torch."""
+    sim = setup_sim
+    ray_caster = RayCaster(
+        _ray_caster_cfg(
+            mesh_prim_paths=["/World/ground", "/World/box"],
+            ray_alignment=ray_alignment,
+            offset=RayCasterCfg.OffsetCfg(pos=(0.1, 0.2, 0.0)),
+        )
+    )
+    # tilt and rotate the sensor
+    quat = quat_from_euler_xyz(torch.tensor([0.2]), torch.tensor([-0.1]), torch.tensor([0.5]))
+    XFormPrim("/World/Sensor", reset_xform_properties=False).set_world_poses(orientations=quat)
+    sim.reset()
+    # set the drift of the sensor
+    ray_caster.drift[:] = torch.tensor([0.05, -0.05, 0.1], device=ray_caster.device)
+    ray_caster.ray_cast_drift[:] = torch.tensor([0.2, -0.3, 0.05], device=ray_caster.device)
+    sim.step()
+    ray_caster.update(0.01)
+
+    # compute the hits by transforming the rays with torch
+    pos_w = ray_caster.data.pos_w.clone()
+    quat_w = ray_caster.data.quat_w.repeat(1, ray_caster.num_rays)
+    ray_cast_drift = ray_caster.ray_cast_drift
+    if ray_alignment == "world":
+        pos_w[:, 0:2] += ray_cast_drift[:, 0:2]
+        ray_starts_w = ray_caster.ray_starts + pos_w.unsqueeze(1)
+        ray_directions_w = ray_caster.ray_directions
+    elif ray_alignment == "yaw":
+        pos_w[:, 0:2] += quat_apply_yaw(ray_caster.data.quat_w, ray_cast_drift)[:, 0:2]
+        ray_starts_w = quat_apply_yaw(quat_w, ray_caster.ray_starts) + pos_w.unsqueeze(1)
+        ray_directions_w = ray_caster.ray_directions
+    else:
+        pos_w[:, 0:2] += quat_apply(ray_caster.data.quat_w, ray_cast_drift)[:, 0:2]
+        ray_starts_w = quat_apply(quat_w, ray_caster.ray_starts) + pos_w.unsqueeze(1)
+        ray_directions_w = quat_apply(quat_w, ray_caster.ray_directions)
+    ray_hits_w = raycast_mesh(ray_starts_w, ray_directions_w, mesh=ray_caster.meshes["/World/ground"])[0]
+    ray_hits_w[..., 2] += ray_cast_drift[:, 2].unsqueeze(-1)
+
+    torch.testing.assert_close(ray_caster.data.ray_hits_w, ray_hits_w, atol=1e-4, rtol=1e-5)
+
+
+@pytest.mark.parametrize("ray_alignment", ["world", "yaw"])
+def test_height_map(setup_sim, ray_alignment):
+    """Test that the hits sampled from the height map match the ray-casting against the meshes."""
+    sim = setup_sim
+    cfg = _ray_caster_cfg(
+        mesh_prim_paths=["/World/ground", "/World/box"],
+        ray_alignment=ray_alignment,
+        ray_cast_drift_range={"x": (-0.1, 0.1), "y": (-0.1, 0.1), "z": (-0.05, 0.05)},
+    )
+    ray_caster = RayCaster(cfg)
+    ray_caster_height_map = RayCaster(cfg.replace(height_map_resolution=0.05))
+    # rotate the sensor
+    quat = quat_from_euler_xyz(torch.tensor([0.0]), torch.tensor([0.0]), torch.tensor([0.5]))
+    XFormPrim("/World/Sensor", reset_xform_properties=False).set_world_poses(orientations=quat)
+    sim.reset()
+    assert ray_caster_height_map._height_map is not None
+    # use the same drift for both sensors
+    ray_caster_height_map.ray_cast_drift[:] = ray_caster.ray_cast_drift
+    sim.step()
+    ray_caster.update(0.01)
+    ray_caster_height_map.update(0.01)
+
+    # compare the hits away from the edge of the box
+    ray_hits = ray_caster.data.ray_hits_w[0]
+    ray_hits_height_map = ray_caster_height_map.data.ray_hits_w[0]
+    mask = ray_hits[:, 0].abs() > 0.1
+    torch.testing.assert_close(ray_hits_height_map[mask], ray_hits[mask], atol=1e-4, rtol=1e-5)
+
+
+def test_update_threshold(setup_sim):
+    """Test that the hits of static sensors are reused."""
+    sim = setup_sim
+    ray_caster = RayCaster(
+        _ray_caster_cfg(
+            mesh_prim_paths=["/World/ground"],
+            dynamic_mesh_prim_paths=["/World/Object_.*"],
+            update_threshold=(1e-3, 1e-3),
+        )
+    )
+    sim.reset()
+    sim.step()
+    ray_caster.update(0.01)
+    assert ray_caster.skipped_ratio == 0.0
+
+    # move the second box below the static sensor and check that the hits are kept
+    objects = XFormPrim("/World/Object_.*", reset_xform_properties=False)
+    objects.set_world_poses(positions=torch.tensor([[10.0, 0.0, 0.2], [0.0, 0.0, 1.2]]))
+    sim.step()
+    ray_caster.update(0.01)
+    assert ray_caster.skipped_ratio == 1.0
+    torch.testing.assert_close(ray_caster.data.ray_hits_w[0, :, 2].cpu(), torch.zeros(ray_caster.num_rays))
+
+    # move the sensor slightly and check that it is ray-cast again
+    XFormPrim("/World/Sensor", reset_xform_properties=False).set_world_poses(positions=torch.tensor([[0.0, 0.0, 5.1]]))
+    sim.step()
+    ray_caster.update(0.01)
+    assert ray_caster.skipped_ratio == 0.0
+    assert torch.isclose(ray_caster.data.ray_hits_w[0, :, 2].cpu(), torch.tensor(1.4)).any()
+    # check that the reset triggers the ray-casting
+    ray_caster.reset()
+    sim.step()
+    ray_caster.update(0.01)
+    assert ray_caster.skipped_ratio == 0.0
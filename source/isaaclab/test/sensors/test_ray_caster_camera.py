@@ -426,6 +426,65 @@ def test_camera_set_world_poses_from_view(setup_sim):
     torch.testing.assert_close(camera.data.quat_w_ros, quat_ros_gt)
 
 
+@pytest.mark.isaacsim_ci
+def test_camera_ray_stride(setup_sim):
+    """Test that strided ray-casting completes the image after cycling through all the ray subsets."""
+    sim, camera_cfg, dt = setup_sim
+    prim_utils.create_prim("/World/CameraStrided", "Xform")
+    camera = RayCasterCamera(camera_cfg)
+    camera_strided = RayCasterCamera(camera_cfg.replace(prim_path="/World/CameraStrided", ray_stride=2))
+    # play sim
+    sim.reset()
+    eyes = torch.tensor([POSITION], dtype=torch.float32, device=camera.device)
+    targets = torch.tensor([[0.0, 0.0, 0.0]], dtype=torch.float32, device=camera.device)
+    camera.set_world_poses_from_view(eyes, targets)
+    camera_strided.set_world_poses_from_view(eyes, targets)
+    sim.step()
+    camera.update(dt)
+
+    # ray-cast the subsets of the image
+    for i in range(4):
+        sim.step()
+        camera_strided.update(dt)
+        image = camera_strided.data.output["distance_to_image_plane"]
+        # check the number of pixels that are ray-cast
+        assert torch.count_nonzero(image) == (i + 1) * image.numel() // 4
+    # check the complete image against the full ray-casting
+    torch.testing.assert_close(image, camera.data.output["distance_to_image_plane"], equal_nan=True)
+
+
+@pytest.mark.isaacsim_ci
+def test_camera_update_threshold(setup_sim):
+    """Test that the images of static cameras are reused."""
+    sim, camera_cfg, dt = setup_sim
+    camera = RayCasterCamera(camera_cfg.replace(update_threshold=(1e-3, 1e-3)))
+    # play sim
+    sim.reset()
+    eyes = torch.tensor([POSITION], dtype=torch.float32, device=camera.device)
+    targets = torch.tensor([[0.0, 0.0, 0.0]], dtype=torch.float32, device=camera.device)
+    camera.set_world_poses_from_view(eyes, targets)
+
+    # check that the camera is only ray-cast once while static
+    for _ in range(3):
+        sim.step()
+        camera.update(dt)
+    assert camera.frame[0] == 1
+    assert camera.skipped_ratio == 1.0
+    image = camera.data.output["distance_to_image_plane"].clone()
+    # move the camera and check that it is ray-cast again
+    camera.set_world_poses_from_view(eyes + 0.5, targets)
+    sim.step()
+    camera.update(dt)
+    assert camera.frame[0] == 2
+    assert camera.skipped_ratio == 0.0
+    assert not torch.allclose(camera.data.output["distance_to_image_plane"], image, equal_nan=True)
+    # check that the reset triggers the ray-casting
+    camera.reset()
+    sim.step()
+    camera.update(dt)
+    assert camera.frame[0] == 1
+
+
 @pytest.mark.isaacsim_ci
 def test_intrinsic_matrix(setup_sim):
     """Checks that the camera's set and retrieve methods work for intrinsic matrix."""
@@ -0,0 +1,64 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import numpy as np
+
+import pytest
+
+from isaaclab.terrains.height_field import HfRandomUniformTerrainCfg
+from isaaclab.terrains.height_field.utils import convert_height_field_to_mesh
+
+
+@pytest.mark.parametrize("slope_threshold", [None, 0.75])
+def test_convert_height_field_to_mesh(slope_threshold):
+    """Check the vertices and triangles of the mesh against the cell layout of the height field."""
+    rng = np.random.default_rng(0)
+    height_field = rng.integers(-40, 40, size=(5, 7), dtype=np.int16)
+    vertices, triangles = convert_height_field_to_mesh(height_field, 0.1, 0.005, slope_threshold)
+
+    # check the vertices
+    assert vertices.shape == (35, 3)
+    np.testing.assert_allclose(vertices[:, 2], height_field.reshape(-1) * 0.005, rtol=1e-6)
+    if slope_threshold is None:
+        np.testing.assert_allclose(vertices[8, :2], [0.1, 0.1], rtol=1e-6)
+    # check the triangles of each cell
+    assert triangles.shape == (2 * 4 * 6, 3)
+    for row in range(4):
+        for col in range(6):
+            index = row * 7 + col
+            cell = 2 * (row * 6 + col)
+            assert triangles[cell].tolist() == [index, index + 8, index + 1]
+            assert triangles[cell + 1].tolist() == [index, index + 7, index + 8]
+    # check that the returned triangles can be modified without affecting other conversions
+    triangles[:] = 0
+    _, triangles = convert_height_field_to_mesh(height_field, 0.1, 0.005, slope_threshold)
+    assert triangles.max() == 34
+
+
+def test_height_field_output():
+    """Check that the height field output matches the heights of the mesh."""
+    cfg = HfRandomUniformTerrainCfg(size=(4.0, 4.0), noise_range=(0.0, 0.1), noise_step=0.01, border_width=0.25)
+    np.random.seed(0)
+    meshes, mesh_origin = cfg.function(0.5, cfg)
+    np.random.seed(0)
+    height_field, origin = cfg.function(0.5, cfg, output="height_field")
+
+    # check the shape of the height field
+    assert height_field.shape == (41, 41)
+    np.testing.assert_allclose(origin, mesh_origin)
+    # check the heights against the mesh vertices
+    np.testing.assert_allclose(meshes[0].vertices[:, 2], height_field.reshape(-1), atol=1e-6)
+    # check invalid output type
+    with pytest.raises(ValueError):
+        cfg.function(0.5, cfg, output="points")
@@ -20,8 +20,15 @@ import torch
 import isaacsim.core.utils.torch as torch_utils
 import pytest
 
-from isaaclab.terrains import FlatPatchSamplingCfg, TerrainGenerator, TerrainGeneratorCfg
+from isaaclab.terrains import (
+    FlatPatchSamplingCfg,
+    TerrainCache,
+    TerrainGenerator,
+    TerrainGeneratorCfg,
+    compute_elevation_map,
+)
 from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG
+from isaaclab.utils.warp import convert_to_warp_mesh
 
 
 @pytest.fixture
@@ -160,3 +167,131 @@ def test_terrain_flat_patches():
     # check that no flat patches are zero
     for _, flat_patches in terrain_generator.flat_patches.items():
         assert not torch.allclose(flat_patches, torch.zeros_like(flat_patches))
+
+
+@pytest.mark.parametrize("curriculum", [True, False])
+def test_generation_parallel(curriculum):
+    """Generate the terrain with worker threads and check that it matches the serial generation."""
+    cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+    cfg.use_cache = False
+    cfg.seed = 0
+    cfg.curriculum = curriculum
+    cfg.num_rows = 4
+    cfg.num_cols = 6
+    # generate the terrain serially
+    cfg.num_workers = 0
+    terrain_mesh = TerrainGenerator(cfg=cfg).terrain_mesh
+    # generate the terrain with different number of workers
+    for num_workers in (2, 3):
+        cfg.num_workers = num_workers
+        parallel_terrain_mesh = TerrainGenerator(cfg=cfg).terrain_mesh
+        np.testing.assert_array_equal(parallel_terrain_mesh.vertices, terrain_mesh.vertices)
+        np.testing.assert_array_equal(parallel_terrain_mesh.faces, terrain_mesh.faces)
+
+
+def test_generation_cache_flat_patches(output_dir):
+    """Check that the flat patches are restored from the complete terrain and the sub-terrain cache entries."""
+    cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+    cfg.use_cache = True
+    cfg.seed = 0
+    cfg.cache_dir = output_dir
+    cfg.num_rows = 3
+    cfg.num_cols = 4
+    patch_cfg = FlatPatchSamplingCfg(num_patches=8, patch_radius=0.5, max_height_diff=0.05)
+    cfg.sub_terrains = {
+        name: sub_terrain_cfg.replace(flat_patch_sampling={"root_spawn": patch_cfg})
+        for name, sub_terrain_cfg in cfg.sub_terrains.items()
+    }
+    terrain_generator_1 = TerrainGenerator(cfg=cfg)
+
+    # load the terrain from the complete terrain cache entry
+    terrain_generator_2 = TerrainGenerator(cfg=cfg)
+    assert len(terrain_generator_2.terrain_meshes) == 0
+    torch.testing.assert_close(
+        terrain_generator_1.flat_patches["root_spawn"], terrain_generator_2.flat_patches["root_spawn"]
+    )
+    np.testing.assert_array_equal(terrain_generator_1.terrain_origins, terrain_generator_2.terrain_origins)
+
+    # remove the complete terrain entries and load the terrain from the sub-terrain entries
+    for entry in os.listdir(output_dir):
+        terrain_filename = os.path.join(output_dir, entry, "terrain.npz")
+        if os.path.exists(terrain_filename):
+            os.remove(terrain_filename)
+    torch_utils.set_seed(12456)
+    terrain_generator_3 = TerrainGenerator(cfg=cfg)
+    assert len(terrain_generator_3.terrain_meshes) > 0
+    torch.testing.assert_close(
+        terrain_generator_1.flat_patches["root_spawn"], terrain_generator_3.flat_patches["root_spawn"]
+    )
+    np.testing.assert_array_equal(terrain_generator_1.terrain_mesh.vertices, terrain_generator_3.terrain_mesh.vertices)
+    np.testing.assert_array_equal(terrain_generator_1.terrain_mesh.faces, terrain_generator_3.terrain_mesh.faces)
+
+
+def test_terrain_cache_eviction(output_dir):
+    """Check that the least recently used entries are removed when the cache exceeds its size."""
+    cache = TerrainCache(output_dir, max_size=1.5)
+    entry_dirs = [cache.get_entry_dir({"index": index}) for index in range(3)]
+    for index, entry_dir in enumerate(entry_dirs):
+        cache.save_terrain(entry_dir, {"data": np.zeros(128 * 1024, dtype=np.float32)})
+        # set the last use of the entries to be in order
+        os.utime(entry_dir, (index, index))
+    # use the first entry
+    assert cache.load_terrain(entry_dirs[0]) is not None
+    # check that only the least recently used entry is removed
+    cache.evict()
+    assert os.path.exists(entry_dirs[0])
+    assert not os.path.exists(entry_dirs[1])
+    assert os.path.exists(entry_dirs[2])
+
+
+def test_terrain_flat_patches_within_sub_terrains():
+    """Check that the flat patches sampled on the combined mesh lie within their sub-terrains."""
+    cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+    cfg.num_rows = 3
+    cfg.num_cols = 5
+    patch_cfg = FlatPatchSamplingCfg(num_patches=16, patch_radius=[0.2, 0.5], max_height_diff=0.05)
+    cfg.sub_terrains = {
+        name: sub_terrain_cfg.replace(flat_patch_sampling={"root_spawn": patch_cfg})
+        for name, sub_terrain_cfg in cfg.sub_terrains.items()
+    }
+    terrain_generator = TerrainGenerator(cfg=cfg)
+
+    # compute the bounds of each sub-terrain in the centered terrain frame
+    rows = torch.arange(cfg.num_rows).view(-1, 1, 1)
+    cols = torch.arange(cfg.num_cols).view(1, -1, 1)
+    x_min = (rows - cfg.num_rows * 0.5) * cfg.size[0]
+    y_min = (cols - cfg.num_cols * 0.5) * cfg.size[1]
+    # check that the patches (including most of their radius) are within the bounds
+    # note: the query points of a patch are not placed exactly at the extremes of its radius
+    flat_patches = terrain_generator.flat_patches["root_spawn"].cpu()
+    assert torch.all(flat_patches[..., 0] >= x_min + 0.4)
+    assert torch.all(flat_patches[..., 0] <= x_min + cfg.size[0] - 0.4)
+    assert torch.all(flat_patches[..., 1] >= y_min + 0.4)
+    assert torch.all(flat_patches[..., 1] <= y_min + cfg.size[1] - 0.4)
+
+
+def test_elevation_map():
+    """Check the elevation map of a generated terrain against the mesh and the sub-terrain origins."""
+    cfg: TerrainGeneratorCfg = ROUGH_TERRAINS_CFG.copy()
+    cfg.use_cache = False
+    cfg.num_rows = 3
+    cfg.num_cols = 4
+    cfg.sub_terrains = {
+        name: sub_cfg for name, sub_cfg in cfg.sub_terrains.items() if name in ("pyramid_stairs", "pyramid_stairs_inv")
+    }
+    terrain_generator = TerrainGenerator(cfg=cfg)
+    terrain_mesh = terrain_generator.terrain_mesh
+    wp_mesh = convert_to_warp_mesh(terrain_mesh.vertices, terrain_mesh.faces, device=terrain_generator.device)
+    heights, origin = compute_elevation_map(wp_mesh, 0.1)
+
+    # check the extent of the elevation map
+    bounds = terrain_mesh.bounds
+    np.testing.assert_allclose(origin.cpu().numpy(), bounds[0, :2], atol=1e-5)
+    assert heights.shape == tuple(np.ceil((bounds[1, :2] - bounds[0, :2]) / 0.1 - 1e-6).astype(int) + 1)
+    # check the heights against the bounds of the mesh
+    assert not torch.isnan(heights).any()
+    assert heights.min() >= bounds[0, 2] - 1e-5 and heights.max() <= bounds[1, 2] + 1e-5
+    # check the heights at the origins of the sub-terrains
+    terrain_origins = terrain_generator.terrain_origins.reshape(-1, 3)
+    indices = np.round((terrain_origins[:, :2] - origin.cpu().numpy()) / 0.1).astype(int)
+    np.testing.assert_allclose(heights.cpu().numpy()[indices[:, 0], indices[:, 1]], terrain_origins[:, 2], atol=1e-4)
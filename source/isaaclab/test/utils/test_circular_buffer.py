@@ -181,3 +181,36 @@ def test_return_buffer_prop(circular_buffer):
     # check that it is returned oldest first
     for idx in range(circular_buffer.max_length - 1):
         assert torch.all(torch.le(retrieved_buffer[:, idx], retrieved_buffer[:, idx + 1]))
+
+
+def test_buffer_view_matches_buffer(circular_buffer):
+    """Test that the zero-copy view matches the copied buffer and aliases the internal storage."""
+    for i in range(circular_buffer.max_length + 3):
+        data = torch.tensor([[i]], device=circular_buffer.device).repeat(3, 2)
+        circular_buffer.append(data)
+        # check that view and copy are the same at every pointer position
+        torch.testing.assert_close(circular_buffer.buffer_view, circular_buffer.buffer)
+
+    view = circular_buffer.buffer_view
+    copy = circular_buffer.buffer
+    # flattening the history dimension should not copy the data
+    assert view.reshape(circular_buffer.batch_size, -1).data_ptr() == view.data_ptr()
+    # the copy is not affected by further appends while the storage is reused
+    circular_buffer.append(torch.full((3, 2), -1, device=circular_buffer.device))
+    assert torch.all(copy[:, -1] == circular_buffer.max_length + 2)
+    torch.testing.assert_close(
+        circular_buffer.buffer_view[:, -1], torch.full((3, 2), -1, device=circular_buffer.device)
+    )
+
+
+def test_buffer_view_after_reset_subset(circular_buffer):
+    """Test that the view of a reset batch index is filled with the first append after reset."""
+    for i in range(circular_buffer.max_length):
+        circular_buffer.append(torch.full((3, 2), i, device=circular_buffer.device))
+    circular_buffer.reset(batch_ids=[2])
+    circular_buffer.append(torch.full((3, 2), 10, device=circular_buffer.device))
+
+    view = circular_buffer.buffer_view
+    assert torch.all(view[2] == 10)
+    assert view[0, 0, 0].item() == 1
+    assert view[0, -1, 0].item() == 10
@@ -0,0 +1,82 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+
+import pytest
+
+from isaaclab.utils.datasets import EpisodeData, EpisodeDataBuffer
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_add_all_envs(device):
+    """Test adding batched data for all environments."""
+    buffer = EpisodeDataBuffer(num_envs=3, device=device, initial_capacity=2)
+    for step in range(5):
+        buffer.add("obs/policy", torch.full((3, 4), step, device=device))
+    # check the capacity is grown
+    assert buffer.capacity("obs/policy") == 8
+    # check the recorded data
+    for env_id in range(3):
+        assert buffer.length("obs/policy", env_id) == 5
+        data = buffer.get_data(env_id)
+        expected_data = torch.arange(5, device=device).unsqueeze(-1).repeat(1, 4).float()
+        torch.testing.assert_close(data["obs"]["policy"], expected_data)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_add_subset_and_reset(device):
+    """Test adding data for a subset of environments and resetting them."""
+    buffer = EpisodeDataBuffer(num_envs=4, device=device, initial_capacity=1)
+    assert buffer.is_empty(0)
+    buffer.add("actions", torch.ones(4, 2, device=device))
+    buffer.add("actions", torch.tensor([[2.0, 2.0], [3.0, 3.0]], device=device), env_ids=[1, 3])
+    # check the number of steps per environment
+    assert [buffer.length("actions", env_id) for env_id in range(4)] == [1, 2, 1, 2]
+    torch.testing.assert_close(buffer.get_data(3)["actions"], torch.tensor([[1.0, 1.0], [3.0, 3.0]], device=device))
+    # reset a subset of environments
+    buffer.reset([3])
+    assert buffer.is_empty(3)
+    assert not buffer.is_empty(1)
+    assert buffer.get_data(3) == {}
+    # add data after the reset
+    buffer.add("actions", torch.full((1, 2), 5.0, device=device), env_ids=[3])
+    torch.testing.assert_close(buffer.get_data(3)["actions"], torch.full((1, 2), 5.0, device=device))
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_invalid_shape(device):
+    """Test adding data with a shape that does not match the stored data."""
+    buffer = EpisodeDataBuffer(num_envs=2, device=device)
+    buffer.add("actions", torch.ones(2, 3, device=device))
+    with pytest.raises(ValueError):
+        buffer.add("actions", torch.ones(2, 4, device=device))
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_update_episode(device):
+    """Test writing the recorded data into an episode."""
+    buffer = EpisodeDataBuffer(num_envs=2, device=device)
+    buffer.add("obs/joint_pos", torch.ones(2, 3, device=device))
+    buffer.add("obs/joint_vel", torch.zeros(2, 3, device=device))
+    # add data directly to the episode
+    episode = EpisodeData()
+    episode.add("obs/annotation", torch.tensor([True], device=device))
+    # check that the data of the buffer is merged with the episode data
+    buffer.update_episode(episode, env_id=1, clone=True)
+    assert set(episode.data["obs"].keys()) == {"annotation", "joint_pos", "joint_vel"}
+    torch.testing.assert_close(episode.data["obs"]["joint_pos"], torch.ones(1, 3, device=device))
+    # check that cloned data is not affected by a reset of the buffer
+    buffer.reset()
+    buffer.add("obs/joint_pos", torch.full((2, 3), 2.0, device=device))
+    torch.testing.assert_close(episode.data["obs"]["joint_pos"], torch.ones(1, 3, device=device))
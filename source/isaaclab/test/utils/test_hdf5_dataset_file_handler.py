@@ -118,3 +118,55 @@ def test_write_and_load_episode(temp_dir, device):
             assert torch.equal(loaded_episode.get_next_action(), action)
 
     dataset_file_handler.close()
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+@pytest.mark.parametrize("compression", ["gzip", "lzf", None])
+def test_write_and_load_episodes(temp_dir, device, compression):
+    """Test writing episodes with different codecs and loading them in bulk."""
+    dataset_file_path = os.path.join(temp_dir, f"{uuid.uuid4()}.hdf5")
+    dataset_file_handler = HDF5DatasetFileHandler(compression=compression, chunk_length=2)
+    dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+    test_episode = create_test_episode(device)
+    test_episode.pre_export()
+    for _ in range(3):
+        dataset_file_handler.write_episode(test_episode)
+    dataset_file_handler.close()
+
+    # load the episodes from the dataset
+    dataset_file_handler = HDF5DatasetFileHandler()
+    dataset_file_handler.open(dataset_file_path)
+    loaded_episodes = dataset_file_handler.load_episodes(["demo_0", "demo_2", "demo_3"], device=device)
+
+    # check the missing episode
+    assert len(loaded_episodes) == 3
+    assert loaded_episodes[2] is None
+    # check the loaded episodes
+    for loaded_episode in loaded_episodes[:2]:
+        assert loaded_episode.env_id == "test_env_name"
+        assert loaded_episode.seed == test_episode.seed
+        assert loaded_episode.success == test_episode.success
+        torch.testing.assert_close(loaded_episode.data["actions"], test_episode.data["actions"])
+        torch.testing.assert_close(
+            loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"]
+        )
+
+    # load only the selected keys
+    loaded_episode = dataset_file_handler.load_episodes(["demo_1"], device=device, keys=["obs"])[0]
+    assert list(loaded_episode.data.keys()) == ["obs"]
+    torch.testing.assert_close(
+        loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"]
+    )
+
+    dataset_file_handler.close()
+
+
+def test_invalid_compression():
+    """Test creating a file handler with invalid compression settings."""
+    with pytest.raises(ValueError):
+        HDF5DatasetFileHandler(compression="zstd")
+    with pytest.raises(ValueError):
+        HDF5DatasetFileHandler(compression="lzf", compression_opts=4)
+    with pytest.raises(ValueError):
+        HDF5DatasetFileHandler(chunk_length=0)
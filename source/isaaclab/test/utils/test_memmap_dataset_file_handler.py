@@ -0,0 +1,151 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import os
+import shutil
+import tempfile
+import torch
+import uuid
+
+import pytest
+
+from isaaclab.utils.datasets import (
+    EpisodeData,
+    HDF5DatasetFileHandler,
+    MemmapDatasetFileHandler,
+    convert_hdf5_to_memmap,
+)
+
+
+def create_test_episode(device, num_steps: int = 3):
+    """create a test episode with dummy data."""
+    test_episode = EpisodeData()
+
+    test_episode.seed = 0
+    test_episode.success = True
+
+    test_episode.add("initial_state", torch.tensor([1, 2, 3], device=device))
+    for step in range(num_steps):
+        test_episode.add("actions", torch.full((3,), step, dtype=torch.float32, device=device))
+        test_episode.add("obs/policy/term1", torch.full((5,), step, dtype=torch.float32, device=device))
+
+    return test_episode
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for test datasets."""
+    temp_dir = tempfile.mkdtemp()
+    yield temp_dir
+    # cleanup after tests
+    shutil.rmtree(temp_dir)
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_write_and_load_episode(temp_dir, device):
+    """Test writing and loading episodes to and from the memory-mapped dataset."""
+    dataset_file_path = os.path.join(temp_dir, f"{uuid.uuid4()}")
+    dataset_file_handler = MemmapDatasetFileHandler()
+    dataset_file_handler.create(dataset_file_path, "test_env_name")
+
+    test_episodes = [create_test_episode(device, num_steps) for num_steps in (3, 5)]
+    for test_episode in test_episodes:
+        test_episode.pre_export()
+        dataset_file_handler.write_episode(test_episode)
+    dataset_file_handler.close()
+
+    # check if the dataset is created with the extension
+    assert os.path.isdir(dataset_file_path + ".memmap")
+
+    # load the episodes from the dataset
+    dataset_file_handler = MemmapDatasetFileHandler()
+    dataset_file_handler.open(dataset_file_path + ".memmap")
+
+    assert dataset_file_handler.get_env_name() == "test_env_name"
+    assert dataset_file_handler.get_num_episodes() == 2
+    assert list(dataset_file_handler.get_episode_names()) == ["demo_0", "demo_1"]
+
+    for episode_name, test_episode in zip(dataset_file_handler.get_episode_names(), test_episodes):
+        loaded_episode = dataset_file_handler.load_episode(episode_name, device=device)
+        assert loaded_episode.env_id == "test_env_name"
+        assert loaded_episode.seed == test_episode.seed
+        assert loaded_episode.success == test_episode.success
+        torch.testing.assert_close(loaded_episode.get_initial_state(), test_episode.get_initial_state())
+        torch.testing.assert_close(loaded_episode.data["actions"], test_episode.data["actions"])
+        torch.testing.assert_close(
+            loaded_episode.data["obs"]["policy"]["term1"], test_episode.data["obs"]["policy"]["term1"]
+        )
+
+    # check the contiguous data of a key
+    offsets = dataset_file_handler.get_episode_offsets("actions")
+    assert offsets.tolist() == [0, 3, 8]
+    assert dataset_file_handler.get_array("actions").shape == (8, 3)
+    assert dataset_file_handler.get_array("obs/policy/term1")[offsets[1] + 4, 0] == 4.0
+
+    # check that the dataset is read-only
+    with pytest.raises(RuntimeError):
+        dataset_file_handler.write_episode(test_episodes[0])
+
+    dataset_file_handler.close()
+
+
+def test_append_episode(temp_dir):
+    """Test appending episodes to an existing memory-mapped dataset."""
+    dataset_file_path = os.path.join(temp_dir, f"{uuid.uuid4()}.memmap")
+    dataset_file_handler = MemmapDatasetFileHandler()
+    dataset_file_handler.create(dataset_file_path, "test_env_name")
+    test_episode = create_test_episode("cpu")
+    test_episode.pre_export()
+    dataset_file_handler.write_episode(test_episode)
+    dataset_file_handler.close()
+
+    # append an episode with a new key and check the offsets of the keys
+    dataset_file_handler = MemmapDatasetFileHandler()
+    dataset_file_handler.open(dataset_file_path, mode="a")
+    test_episode.data["obs"]["policy"]["term2"] = torch.ones(2, 4)
+    dataset_file_handler.write_episode(test_episode)
+    assert dataset_file_handler.get_episode_offsets("actions").tolist() == [0, 3, 6]
+    assert dataset_file_handler.get_episode_offsets("obs/policy/term2").tolist() == [0, 0, 2]
+    assert dataset_file_handler.load_episode("demo_0", device="cpu").data["obs"]["policy"].keys() == {"term1"}
+
+    # check that data with a different shape is rejected
+    invalid_episode = EpisodeData()
+    invalid_episode.add("actions", torch.ones(2, 4))
+    invalid_episode.pre_export()
+    with pytest.raises(ValueError):
+        dataset_file_handler.write_episode(invalid_episode)
+    dataset_file_handler.close()
+
+
+def test_convert_hdf5_to_memmap(temp_dir):
+    """Test converting an HDF5 dataset to the memory-mapped dataset format."""
+    hdf5_file_path = os.path.join(temp_dir, f"{uuid.uuid4()}.hdf5")
+    hdf5_file_handler = HDF5DatasetFileHandler()
+    hdf5_file_handler.create(hdf5_file_path, "test_env_name")
+    test_episodes = [create_test_episode("cpu", num_steps) for num_steps in (2, 4)]
+    for test_episode in test_episodes:
+        test_episode.pre_export()
+        hdf5_file_handler.write_episode(test_episode)
+    hdf5_file_handler.close()
+
+    memmap_file_path = convert_hdf5_to_memmap(hdf5_file_path, os.path.join(temp_dir, "converted"))
+
+    dataset_file_handler = MemmapDatasetFileHandler()
+    dataset_file_handler.open(memmap_file_path)
+    assert dataset_file_handler.get_env_name() == "test_env_name"
+    assert list(dataset_file_handler.get_episode_names()) == ["demo_0", "demo_1"]
+    for episode_name, test_episode in zip(["demo_0", "demo_1"], test_episodes):
+        assert dataset_file_handler.get_num_samples(episode_name) == len(test_episode.data["actions"])
+        loaded_episode = dataset_file_handler.load_episode(episode_name, device="cpu")
+        torch.testing.assert_close(loaded_episode.data["actions"], test_episode.data["actions"])
+    dataset_file_handler.close()
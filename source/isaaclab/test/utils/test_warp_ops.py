@@ -0,0 +1,132 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers (https://github.com/isaac-sim/IsaacLab/blob/main/CONTRIBUTORS.md).
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app in headless mode
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows from here."""
+
+import torch
+import trimesh
+
+import pytest
+import warp as wp
+
+from isaaclab.utils.warp import convert_to_warp_mesh, launch_ray_chunks
+from isaaclab.utils.warp import ops as warp_ops
+from isaaclab.utils.warp import raycast_mesh
+from isaaclab.utils.warp.kernels import raycast_sensor_kernel
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_raycast_mesh_chunks(device):
+    """Test that ray-casting in chunks on multiple threads matches ray-casting on a single thread."""
+    mesh = trimesh.creation.icosphere(subdivisions=3, radius=1.0)
+    wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device)
+    # rays from random starts (in two batches) towards the center with some rays that miss the sphere
+    num_rays = 4 * warp_ops.CPU_MIN_RAYS_PER_THREAD + 17
+    generator = torch.Generator().manual_seed(0)
+    ray_starts = torch.randn(2, num_rays, 3, generator=generator)
+    ray_starts = 3.0 * ray_starts / ray_starts.norm(dim=-1, keepdim=True)
+    ray_directions = -ray_starts / 3.0 + 0.3 * torch.randn(ray_starts.shape, generator=generator)
+    ray_directions /= ray_directions.norm(dim=-1, keepdim=True)
+    ray_starts, ray_directions = ray_starts.to(device), ray_directions.to(device)
+
+    outputs_single = raycast_mesh(
+        ray_starts,
+        ray_directions,
+        wp_mesh,
+        return_distance=True,
+        return_normal=True,
+        return_face_id=True,
+        num_threads=1,
+    )
+    outputs_chunks = raycast_mesh(
+        ray_starts,
+        ray_directions,
+        wp_mesh,
+        return_distance=True,
+        return_normal=True,
+        return_face_id=True,
+        num_threads=4,
+    )
+    for output_single, output_chunks in zip(outputs_single, outputs_chunks):
+        torch.testing.assert_close(output_chunks, output_single)
+    # check that some rays hit and some rays miss
+    assert (outputs_single[3] == -1).any() and (outputs_single[3] >= 0).any()
+
+    # check that the outputs that are not requested are not returned
+    ray_hits, ray_distance, ray_normal, ray_face_id = raycast_mesh(ray_starts, ray_directions, wp_mesh, num_threads=4)
+    torch.testing.assert_close(ray_hits, outputs_single[0])
+    assert ray_distance is None and ray_normal is None and ray_face_id is None
+
+
+@pytest.mark.parametrize("device", ["cuda:0", "cpu"])
+def test_launch_ray_chunks_sensors(device):
+    """Test that launching the sensor kernel in chunks of sensors matches launching it on a single thread."""
+    mesh = trimesh.creation.icosphere(subdivisions=3, radius=1.0)
+    wp_mesh = convert_to_warp_mesh(mesh.vertices, mesh.faces, device=device)
+    # sensors with random poses around the sphere, of which only some are updated
+    num_envs, num_rays = 64, warp_ops.CPU_MIN_RAYS_PER_THREAD // 8
+    generator = torch.Generator().manual_seed(0)
+    pos_w = 3.0 * torch.randn(num_envs, 3, generator=generator)
+    quat_w = torch.randn(num_envs, 4, generator=generator)
+    quat_w /= quat_w.norm(dim=-1, keepdim=True)
+    ray_starts = 0.5 * torch.randn(num_envs, num_rays, 3, generator=generator)
+    ray_directions = -pos_w.unsqueeze(1) + torch.randn(num_envs, num_rays, 3, generator=generator)
+    ray_directions /= ray_directions.norm(dim=-1, keepdim=True)
+    env_ids = torch.arange(0, num_envs, 2, dtype=torch.int32)
+
+    ray_hits = list()
+    for num_threads in (1, 4):
+        ray_hits_w = torch.zeros(num_envs, num_rays, 3, device=device)
+        launch_ray_chunks(
+            kernel=raycast_sensor_kernel,
+            dim=(len(env_ids), num_rays),
+            inputs=[
+                wp_mesh.id,
+                0,
+                wp.empty((0,), dtype=wp.uint64, device=device),
+                wp.empty((0,), dtype=wp.vec3, device=device),
+                wp.empty((0,), dtype=wp.quat, device=device),
+                wp.from_torch(env_ids.to(device), dtype=wp.int32),
+                wp.from_torch(pos_w.to(device), dtype=wp.vec3),
+                wp.from_torch(quat_w.to(device), dtype=wp.vec4),
+                wp.zeros(num_envs, dtype=wp.vec3, device=device),
+                wp.from_torch(ray_starts.to(device), dtype=wp.vec3),
+                wp.from_torch(ray_directions.to(device), dtype=wp.vec3),
+                wp.from_torch(ray_hits_w, dtype=wp.vec3),
+                2,
+                1e6,
+                1,
+                0,
+            ],
+            chunk_input_ids=[5],
+            device=device,
+            num_threads=num_threads,
+        )
+        wp.synchronize_device(device)
+        ray_hits.append(ray_hits_w)
+    torch.testing.assert_close(ray_hits[1], ray_hits[0])
+    # check that only the selected sensors are updated and that some rays hit the sphere
+    assert torch.all(ray_hits[0][1::2] == 0.0)
+    assert torch.isfinite(ray_hits[0][::2]).any()
+
+
+def test_buffer_pool():
+    """Test that the buffers are reused by shape, data type and device and that the pool is bounded."""
+    buffer = warp_ops._get_buffer((1,), wp.float32, "cpu")
+    assert warp_ops._get_buffer((1,), wp.float32, "cpu") is buffer
+    assert warp_ops._get_buffer((1,), wp.int32, "cpu") is not buffer
+    assert warp_ops._get_buffer((2,), wp.float32, "cpu") is not buffer
+    # fill the pool with other buffers
+    for i in range(warp_ops.BUFFER_POOL_SIZE):
+        warp_ops._get_buffer((i + 3,), wp.float32, "cpu")
+    assert len(warp_ops._buffer_pool) == warp_ops.BUFFER_POOL_SIZE
+    assert warp_ops._get_buffer((1,), wp.float32, "cpu") is not buffer
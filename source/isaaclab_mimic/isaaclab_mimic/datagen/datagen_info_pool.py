@@ -218,8 +218,11 @@ class DataGenInfoPool:
         if len(episode_names) == 0:
             return
 
-        for episode_name in episode_names:
-            if select_demo_keys is not None and episode_name not in select_demo_keys:
-                continue
-            episode = dataset_file_handler.load_episode(episode_name, self.device)
+        # load the selected episodes in parallel
+        episode_names = [
+            episode_name
+            for episode_name in episode_names
+            if select_demo_keys is None or episode_name in select_demo_keys
+        ]
+        for episode in dataset_file_handler.load_episodes(episode_names, self.device):
             self._add_episode(episode)
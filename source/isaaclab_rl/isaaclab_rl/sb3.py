@@ -115,6 +115,11 @@ class Sb3VecEnvWrapper(VecEnv):
        to the one after reset. The "real" final observation is passed using the info dicts
        under the key ``terminal_observation``.
 
+    To keep the overhead of the wrapper low for a large number of environments, the observations, rewards
+    and termination signals are packed into a single buffer on the simulation device and copied to (pinned)
+    host memory with one transfer per step. The info dicts are built lazily, i.e. the dict of a sub-environment
+    is only created when it is accessed.
+
     .. warning::
 
         By the nature of physics stepping in Isaac Sim, it is not possible to forward the
@@ -163,6 +168,8 @@ class Sb3VecEnvWrapper(VecEnv):
         # add buffer for logging episodic information
         self._ep_rew_buf = np.zeros(self.num_envs)
         self._ep_len_buf = np.zeros(self.num_envs)
+        # buffers for transferring data to the host (allocated on first use for each size in bytes)
+        self._transfer_buffers: dict[int, tuple[torch.Tensor, torch.Tensor]] = dict()
 
     def __str__(self):
         """Returns the wrapper name and the :attr:`env` representation string."""
@@ -229,16 +236,18 @@ class Sb3VecEnvWrapper(VecEnv):
     def step_wait(self) -> VecEnvStepReturn:  # noqa: D102
         # record step information
         obs_dict, rew, terminated, truncated, extras = self.env.step(self._async_actions)
-        # compute reset ids
-        dones = terminated | truncated
 
         # convert data types to numpy depending on backend
         # note: ManagerBasedRLEnv uses torch backend (by default).
-        obs = self._process_obs(obs_dict)
-        rewards = rew.detach().cpu().numpy()
-        terminated = terminated.detach().cpu().numpy()
-        truncated = truncated.detach().cpu().numpy()
-        dones = dones.detach().cpu().numpy()
+        obs = self._apply_obs_processors(obs_dict)
+        if isinstance(obs, dict):
+            obs_keys = list(obs.keys())
+            *obs_values, rewards, terminated, truncated = self._to_numpy(*obs.values(), rew, terminated, truncated)
+            obs = dict(zip(obs_keys, obs_values))
+        else:
+            obs, rewards, terminated, truncated = self._to_numpy(obs, rew, terminated, truncated)
+        # compute reset ids
+        dones = terminated | truncated
 
         reset_ids = dones.nonzero()[0]
 
@@ -350,6 +359,15 @@ class Sb3VecEnvWrapper(VecEnv):
 
     def _process_obs(self, obs_dict: torch.Tensor | dict[str, torch.Tensor]) -> np.ndarray | dict[str, np.ndarray]:
         """Convert observations into NumPy data type."""
+        obs = self._apply_obs_processors(obs_dict)
+        if isinstance(obs, dict):
+            return dict(zip(obs.keys(), self._to_numpy(*obs.values())))
+        return self._to_numpy(obs)[0]
+
+    def _apply_obs_processors(
+        self, obs_dict: torch.Tensor | dict[str, torch.Tensor]
+    ) -> torch.Tensor | dict[str, torch.Tensor]:
+        """Apply the observation processors to the policy observations."""
         # Sb3 doesn't support asymmetric observation spaces, so we only use "policy"
         obs = obs_dict["policy"]
         # note: ManagerBasedRLEnv uses torch backend (by default).
@@ -357,77 +375,113 @@ class Sb3VecEnvWrapper(VecEnv):
             for key, value in obs.items():
                 if key in self.observation_processors:
                     obs[key] = self.observation_processors[key](value)
-                obs[key] = obs[key].detach().cpu().numpy()
-        elif isinstance(obs, torch.Tensor):
-            obs = obs.detach().cpu().numpy()
-        else:
+        elif not isinstance(obs, torch.Tensor):
             raise NotImplementedError(f"Unsupported data type: {type(obs)}")
         return obs
 
+    def _to_numpy(self, *tensors: torch.Tensor) -> list[np.ndarray]:
+        """Copy batched tensors to the host with a single transfer.
+
+        On a CUDA device, the bytes of all tensors are packed into one buffer on the device, which is copied
+        to pinned host memory with a non-blocking transfer. The host then waits once for the copy and unpacks
+        the arrays. The returned arrays do not share memory with the transfer buffers.
+        """
+        if torch.device(self.sim_device).type != "cuda":
+            return [tensor.detach().cpu().numpy() for tensor in tensors]
+        # view each tensor as bytes per environment
+        byte_views = [tensor.detach().reshape(self.num_envs, -1).contiguous().view(torch.uint8) for tensor in tensors]
+        num_bytes = sum(view.shape[1] for view in byte_views)
+        # allocate the transfer buffers
+        # note: the buffers are created outside inference mode since they are also used outside of it
+        if num_bytes not in self._transfer_buffers:
+            with torch.inference_mode(False):
+                self._transfer_buffers[num_bytes] = (
+                    torch.empty((self.num_envs, num_bytes), dtype=torch.uint8, device=self.sim_device),
+                    torch.empty((self.num_envs, num_bytes), dtype=torch.uint8, device="cpu", pin_memory=True),
+                )
+        device_buffer, host_buffer = self._transfer_buffers[num_bytes]
+        # pack and copy the data to the host
+        torch.cat(byte_views, dim=1, out=device_buffer)
+        host_buffer.copy_(device_buffer, non_blocking=True)
+        torch.cuda.current_stream(self.sim_device).synchronize()
+        # unpack the data
+        host_buffer = host_buffer.numpy()
+        arrays = []
+        offset = 0
+        for tensor, view in zip(tensors, byte_views):
+            dtype = torch.empty(0, dtype=tensor.dtype).numpy().dtype
+            array = host_buffer[:, offset : offset + view.shape[1]].view(dtype).reshape(tensor.shape)
+            arrays.append(array.copy())
+            offset += view.shape[1]
+        return arrays
+
     def _process_extras(
         self, obs: np.ndarray, terminated: np.ndarray, truncated: np.ndarray, extras: dict, reset_ids: np.ndarray
     ) -> list[dict[str, Any]]:
-        """Convert miscellaneous information into dictionary for each sub-environment."""
+        """Convert miscellaneous information into dictionary for each sub-environment.
+
+        The information of all sub-environments is gathered with batched operations on the host arrays, which are
+        then split into the dicts of the sub-environments.
+        """
+        # gather the information of the terminated environments
+        # note: the episodic buffers are reset after this call, so the values are copied here
+        reset_positions = np.full(self.num_envs, -1, dtype=np.int64)
+        reset_positions[reset_ids] = np.arange(len(reset_ids))
+        episode_rewards = self._ep_rew_buf[reset_ids]
+        episode_lengths = self._ep_len_buf[reset_ids]
+        time_limit_truncated = truncated & ~terminated
+        if isinstance(obs, dict):
+            terminal_obs = {key: value[reset_ids] for key, value in obs.items()}
+        else:
+            terminal_obs = obs[reset_ids]
+
+        def get_terminal_obs(position: int) -> np.ndarray | dict[str, np.ndarray]:
+            if isinstance(terminal_obs, dict):
+                return {key: value[position] for key, value in terminal_obs.items()}
+            return terminal_obs[position]
+
         # faster version: only process env that terminated and add bootstrapping info
         if self.fast_variant:
-            infos = [{} for _ in range(self.num_envs)]
 
-            for idx in reset_ids:
-                # fill-in episode monitoring info
-                infos[idx]["episode"] = {
-                    "r": self._ep_rew_buf[idx],
-                    "l": self._ep_len_buf[idx],
+            def build_info(idx: int) -> dict[str, Any]:
+                position = reset_positions[idx]
+                if position < 0:
+                    return {}
+                return {
+                    # fill-in episode monitoring info
+                    "episode": {"r": episode_rewards[position], "l": episode_lengths[position]},
+                    # fill-in bootstrap information
+                    "TimeLimit.truncated": time_limit_truncated[idx],
+                    # add information about terminal observation separately
+                    "terminal_observation": get_terminal_obs(position),
                 }
 
-                # fill-in bootstrap information
-                infos[idx]["TimeLimit.truncated"] = truncated[idx] and not terminated[idx]
-
-                # add information about terminal observation separately
-                if isinstance(obs, dict):
-                    terminal_obs = {key: value[idx] for key, value in obs.items()}
-                else:
-                    terminal_obs = obs[idx]
-                infos[idx]["terminal_observation"] = terminal_obs
+            return [build_info(idx) for idx in range(self.num_envs)]
 
-            return infos
+        # transfer the batched extras to the host once
+        extras_values = dict()
+        for key, value in extras.items():
+            if key != "log":
+                extras_values[key] = value.detach().cpu().numpy() if isinstance(value, torch.Tensor) else value
 
-        # create empty list of dictionaries to fill
-        infos: list[dict[str, Any]] = [dict.fromkeys(extras.keys()) for _ in range(self.num_envs)]
-        # fill-in information for each sub-environment
-        # note: This loop becomes slow when number of environments is large.
-        for idx in range(self.num_envs):
+        def build_info(idx: int) -> dict[str, Any]:
+            position = reset_positions[idx]
+            info: dict[str, Any] = dict.fromkeys(extras.keys())
             # fill-in episode monitoring info
-            if idx in reset_ids:
-                infos[idx]["episode"] = dict()
-                infos[idx]["episode"]["r"] = float(self._ep_rew_buf[idx])
-                infos[idx]["episode"]["l"] = float(self._ep_len_buf[idx])
+            if position >= 0:
+                info["episode"] = {"r": float(episode_rewards[position]), "l": float(episode_lengths[position])}
+                # only log the extra episodes information for episodes that are terminated
+                if "log" in extras:
+                    info["episode"].update(extras["log"])
             else:
-                infos[idx]["episode"] = None
+                info["episode"] = None
             # fill-in bootstrap information
-            infos[idx]["TimeLimit.truncated"] = truncated[idx] and not terminated[idx]
+            info["TimeLimit.truncated"] = time_limit_truncated[idx]
             # fill-in information from extras
-            for key, value in extras.items():
-                # 1. remap extra episodes information safely
-                # 2. for others just store their values
-                if key == "log":
-                    # only log this data for episodes that are terminated
-                    if infos[idx]["episode"] is not None:
-                        for sub_key, sub_value in value.items():
-                            infos[idx]["episode"][sub_key] = sub_value
-                else:
-                    infos[idx][key] = value[idx]
+            for key, value in extras_values.items():
+                info[key] = value[idx]
             # add information about terminal observation separately
-            if idx in reset_ids:
-                # extract terminal observations
-                if isinstance(obs, dict):
-                    terminal_obs = dict.fromkeys(obs.keys())
-                    for key, value in obs.items():
-                        terminal_obs[key] = value[idx]
-                else:
-                    terminal_obs = obs[idx]
-                # add info to dict
-                infos[idx]["terminal_observation"] = terminal_obs
-            else:
-                infos[idx]["terminal_observation"] = None
-        # return list of dictionaries
-        return infos
+            info["terminal_observation"] = get_terminal_obs(position) if position >= 0 else None
+            return info
+
+        return [build_info(idx) for idx in range(self.num_envs)]
@@ -98,6 +98,11 @@ def test_random_actions(registered_tasks):
                 # check signals
                 for data in transition:
                     assert _check_valid_array(data), f"Invalid data: {data}"
+                # check that the info dicts of terminated environments contain the terminal observations
+                _, _, dones, infos = transition
+                assert len(infos) == env.num_envs
+                for idx in dones.nonzero()[0]:
+                    assert infos[idx]["terminal_observation"] is not None
 
         # close the environment
         print(f">>> Closing environment: {task_name}")